@@ -36,6 +36,51 @@ Impact: Handoffs older than this are ignored/cleaned up
 Evidence: 24 hours gives full business day for pickup
 """
 
+PROMPT_ANALYSIS_DEADLINE_SECONDS = 15
+"""
+Shared deadline for per-prompt LLM analysis in UserPromptSubmit.
+
+Purpose: Context-switch detection and context discovery run concurrently
+         under one deadline instead of back to back
+Impact: Analysis still running at the deadline is dropped (hook falls back
+        to no context switch / no discovery enrichment)
+Evidence: Each headless `claude -p` call takes ~2-8s; discovery already
+          used a 10s timeout, so 15s covers both with margin
+"""
+
+STOP_HANDLER_BUDGET_SECONDS = {
+    "graph_updates": 20,
+    "km_processing": 10,
+    "handoffs": 5,
+    "workflow_completions": 5,
+    "workspace_pause": 5,
+}
+"""
+Per-handler time budgets for the Stop hook, in seconds.
+
+Purpose: Stop handlers run concurrently (see triads.hooks.handler_scheduler);
+         a slow handler must not hold up the others or the hook
+Impact: A handler over budget is reported as timed out; handlers depending
+        on it are skipped. Failed, timed-out and skipped handlers keep their
+        transcript cursor offset, so only they see the entries again on the
+        next Stop
+Evidence: Graph updates (load, apply, persist per triad) dominate; the
+          longest chain (graph updates then KM, 30s) stays well inside
+          Claude Code's 60s hook timeout
+"""
+
+STOP_HANDLER_JOIN_SECONDS = 20
+"""
+How long the Stop hook waits for handlers still running past their budget.
+
+Purpose: Graph and KM handlers write shared graphs; exiting while they run
+         would cut their writes off mid-way
+Impact: A handler finishing within this wait counts as succeeded; one still
+        running after it is abandoned at exit and retried on the next Stop
+Evidence: Longest chain (30s) plus this wait stays under Claude Code's 60s
+          hook timeout
+"""
+
 # ============================================================================
 # Confidence Thresholds
 # ============================================================================
@@ -99,6 +144,15 @@ Impact: Triggers automatic file rotation
 Evidence: 10K events balances file size and rotation frequency
 """
 
+MAX_EVENT_ARCHIVE_MB = 200
+"""
+Maximum compressed size of rotated event segments in megabytes (200 MB).
+
+Purpose: Keep rotated history queryable without unbounded disk use
+Impact: Oldest segments under .triads/events_segments/ are deleted beyond this
+Evidence: JSONL compresses ~6x, so 200 MB holds ~1.2 GB of raw events
+"""
+
 EVENT_RATE_LIMIT_PER_MINUTE = 100
 """
 Maximum events per hook per minute (100).
@@ -107,6 +161,8 @@ Purpose: Prevent event flooding DoS attacks
 Impact: Events beyond this rate are dropped
 Evidence: Normal hook execution = 1-10 events/min, 100 provides safety margin
 Security: Prevents malicious/buggy hooks from overwhelming system
+Enforced: Across hook processes, by a per-hook token bucket under .triads/
+          (bursts up to the limit, then refills at the limit per minute)
 """
 
 # ============================================================================
@@ -0,0 +1,290 @@
+"""
+Client shim for the warm hook daemon.
+
+Every hook in hooks.json is a fresh `python3` process, so hot hooks
+(PreToolUse, PostToolUse) pay the full triads import and graph parsing
+cost on every tool call. When a hook daemon is running for the project
+(see triads.hooks.daemon), this shim forwards the hook's stdin payload
+over a Unix socket and relays the daemon's stdout, stderr and exit code.
+
+Stdlib only: this module is imported before setup_paths() so a forwarded
+hook never touches triads.* in the short-lived process.
+
+Fallback: If the daemon is not running, refuses the request, or fails
+mid-flight, relay_to_daemon() restores stdin and returns so the hook
+continues down its normal in-process path.
+
+Configuration:
+- TRIADS_NO_DAEMON=1: Never contact the daemon (always run in-process)
+- TRIADS_HOOK_DAEMON=1: SessionStart launches the daemon if not running
+
+Usage:
+    from daemon_client import relay_to_daemon
+    relay_to_daemon("post_tool_use")  # Exits here if the daemon handled it
+
+    # ... normal in-process hook imports and main() ...
+"""
+
+import hashlib
+import io
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from constants import PLUGIN_VERSION
+
+CONNECT_TIMEOUT_SECONDS = 0.05
+"""
+Maximum time to wait for the daemon to accept a connection (50 ms).
+
+Purpose: A missing or wedged daemon must not slow hooks down
+Impact: On timeout the hook falls back to the in-process path
+"""
+
+RESPONSE_TIMEOUT_SECONDS = 10.0
+"""
+Maximum time to wait for the daemon to answer a forwarded hook (10 s).
+
+Purpose: Bound the hook's wall time if the daemon hangs
+Impact: On timeout the hook falls back to the in-process path
+"""
+
+FORWARDED_ENV_PREFIXES = ("TRIADS_", "CLAUDE_")
+"""
+Environment variables forwarded to the daemon with each request.
+
+Purpose: Hook behaviour is configured via TRIADS_* / CLAUDE_* variables,
+which can differ between invocations (e.g. TRIADS_NO_BLOCK=1)
+"""
+
+
+def get_socket_path(project_dir: Optional[Path] = None) -> Path:
+    """
+    Get the daemon socket path for a project.
+
+    One daemon serves one project. The path lives in the runtime directory
+    rather than the project, because Unix socket paths are limited to ~100
+    bytes and project paths can be arbitrarily long. Sockets sit in a
+    per-user directory (mode 0700, created by the daemon), never directly
+    in a shared directory such as /tmp.
+
+    Args:
+        project_dir: Project directory (default: CLAUDE_PROJECT_DIR or cwd)
+
+    Returns:
+        Path: Socket path, e.g. /tmp/triads-hookd-1000/3f2a9c1b7d4e.sock
+    """
+    if project_dir is None:
+        project_dir = Path(os.environ.get("CLAUDE_PROJECT_DIR") or os.getcwd())
+
+    digest = hashlib.sha1(str(Path(project_dir).resolve()).encode("utf-8")).hexdigest()[:12]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"triads-hookd-{os.getuid()}" / f"{digest}.sock"
+
+
+def _is_trusted_socket(socket_path: Path) -> bool:
+    """
+    Check that socket_path is our own daemon's socket, not a stand-in.
+
+    The hook payload and environment are sent to the daemon, and its answer
+    is replayed as the hook's own output and exit code. Only a socket owned
+    by this user, in a directory only this user can write to, is trusted.
+
+    Args:
+        socket_path: Daemon socket
+
+    Returns:
+        bool: True if the socket and its directory belong to this user
+    """
+    uid = os.getuid()
+    try:
+        parent = os.lstat(socket_path.parent)
+        sock = os.lstat(socket_path)
+    except OSError:
+        return False
+
+    return (
+        stat.S_ISDIR(parent.st_mode)
+        and parent.st_uid == uid
+        and not parent.st_mode & 0o077
+        and stat.S_ISSOCK(sock.st_mode)
+        and sock.st_uid == uid
+    )
+
+
+def _daemon_disabled() -> bool:
+    """Check whether daemon forwarding is disabled (TRIADS_NO_DAEMON=1)."""
+    return os.environ.get("TRIADS_NO_DAEMON") == "1"
+
+
+def request_daemon(
+    request: Dict,
+    socket_path: Optional[Path] = None,
+    timeout: float = RESPONSE_TIMEOUT_SECONDS
+) -> Optional[Dict]:
+    """
+    Send one request to the daemon and return its response.
+
+    Protocol: one JSON document per connection in each direction. The
+    client half-closes the socket after writing so the daemon reads to EOF.
+
+    Args:
+        request: JSON-serializable request
+        socket_path: Daemon socket (default: get_socket_path())
+        timeout: Response timeout in seconds
+
+    Returns:
+        dict: Daemon response, or None if the daemon is unreachable or its
+        socket is not owned by this user (see _is_trusted_socket)
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    socket_path = socket_path or get_socket_path()
+    if not _is_trusted_socket(socket_path):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+            sock.connect(str(socket_path))
+            sock.settimeout(timeout)
+            sock.sendall(json.dumps(request).encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)
+
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+
+        response = json.loads(b"".join(chunks).decode("utf-8"))
+        return response if isinstance(response, dict) else None
+
+    except (OSError, ValueError):
+        return None
+
+
+def relay_to_daemon(hook_name: str) -> None:
+    """
+    Forward this hook invocation to the daemon if one is running.
+
+    On success, writes the daemon's stdout/stderr and exits with its exit
+    code. Otherwise returns with sys.stdin rewound to the original payload
+    so the caller can continue in-process.
+
+    Args:
+        hook_name: Hook name registered in triads.hooks.daemon.HOOK_MODULES
+    """
+    if _daemon_disabled():
+        return
+
+    socket_path = get_socket_path()
+    if not socket_path.exists():
+        return
+
+    try:
+        payload = sys.stdin.read()
+    except Exception:
+        return
+
+    # From here on, stdin is consumed: always restore it before returning
+    sys.stdin = io.StringIO(payload)
+
+    response = request_daemon(
+        {
+            "command": "run",
+            "hook": hook_name,
+            "version": PLUGIN_VERSION,
+            "stdin": payload,
+            "cwd": os.getcwd(),
+            "env": {
+                key: value
+                for key, value in os.environ.items()
+                if key.startswith(FORWARDED_ENV_PREFIXES)
+            },
+        },
+        socket_path=socket_path
+    )
+
+    if not response or response.get("status") != "ok":
+        return
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stdout.flush()
+    sys.stderr.flush()
+    sys.exit(int(response.get("exit_code", 0)))
+
+
+def is_daemon_running(socket_path: Optional[Path] = None) -> bool:
+    """
+    Check whether a compatible daemon is answering on the socket.
+
+    Args:
+        socket_path: Daemon socket (default: get_socket_path())
+
+    Returns:
+        bool: True if the daemon answered a ping with our plugin version
+    """
+    response = request_daemon(
+        {"command": "ping", "version": PLUGIN_VERSION},
+        socket_path=socket_path,
+        timeout=1.0
+    )
+    return bool(response) and response.get("status") == "ok"
+
+
+def ensure_daemon_running(project_dir: Optional[Path] = None) -> bool:
+    """
+    Launch the hook daemon in the background unless one is already running.
+
+    The daemon is detached from the hook (new session, no stdio) and exits
+    on its own after an idle timeout.
+
+    Args:
+        project_dir: Project directory (default: CLAUDE_PROJECT_DIR or cwd)
+
+    Returns:
+        bool: True if a daemon was already running or has been launched
+    """
+    if _daemon_disabled():
+        return False
+
+    socket_path = get_socket_path(project_dir)
+    if is_daemon_running(socket_path):
+        return True
+
+    hooks_dir = Path(__file__).resolve().parent
+    src_dir = hooks_dir.parent / "src"
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(src_dir), env.get("PYTHONPATH", "")) if p
+    )
+
+    try:
+        subprocess.Popen(
+            [
+                sys.executable, "-m", "triads.hooks.daemon",
+                "--socket", str(socket_path),
+                "--hooks-dir", str(hooks_dir),
+            ],
+            cwd=str(project_dir or os.getcwd()),
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        return True
+    except Exception as e:
+        print(f"⚠️  Failed to start hook daemon: {e}", file=sys.stderr)
+        return False
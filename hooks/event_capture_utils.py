@@ -6,10 +6,26 @@ Provides secure event capture with:
 - Automatic file rotation (prevents unbounded growth)
 - Fail-safe execution (never crashes hooks)
 - Input validation (size limits enforced)
+- Buffered writes (one locked append per process)
 
 All functions return gracefully rather than raising exceptions.
 This ensures hooks never crash and never block tool execution.
 
+Captured events are buffered in memory and written by flush_events(), which
+runs at process exit (the hook daemon calls it after each hook it serves).
+A flush appends all buffered events with a single O_APPEND write under
+events.jsonl.lock. The line count used for rotation is kept in a sidecar,
+so deciding whether to rotate does not re-read the log:
+
+    .triads/events.jsonl          - event log
+    .triads/events.jsonl.count    - {"inode", "size", "lines"} at last flush
+    .triads/events.jsonl.lock
+
+Rate limits are shared by all hook processes through one token bucket per
+hook, stored next to the log:
+
+    .triads/rate_limits/<hook>.bucket   - 16 bytes: tokens left, last update
+
 Usage:
     from event_capture_utils import capture_hook_execution, capture_hook_error
 
@@ -21,59 +37,158 @@ Usage:
         capture_hook_error("hook_name", start_time, e)
 """
 
+import atexit
+import fcntl
 import json
 import os
+import re
+import struct
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from constants import (
     EVENTS_FILE,
+    MAX_EVENT_ARCHIVE_MB,
     MAX_EVENT_FILE_SIZE_MB,
     MAX_EVENTS_PER_FILE,
     EVENT_RATE_LIMIT_PER_MINUTE,
     PLUGIN_VERSION
 )
 
-# Rate limiting: Track event counts per hook per minute
-_rate_limit_state = {}
+# Token bucket record in a rate limit file: tokens left, time of last update
+_BUCKET = struct.Struct('<dd')
+
+# Events captured but not yet written: events file -> JSONL lines
+_pending_events: Dict[Path, List[str]] = {}
+_pending_lock = threading.Lock()
+_flush_registered = False
+
+
+def _rate_limit_file(hook_name: str) -> Path:
+    """Path of the token bucket file for a hook, next to the events file."""
+    safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', hook_name) or '_'
+    return Path(EVENTS_FILE).absolute().parent / 'rate_limits' / f'{safe_name}.bucket'
 
 
 def _check_rate_limit(hook_name: str) -> bool:
     """
     Check if hook has exceeded rate limit.
 
+    Takes one token from the hook's token bucket, which holds up to
+    EVENT_RATE_LIMIT_PER_MINUTE tokens and refills at that many per minute.
+    The bucket is a fixed-size record read and written under flock, so all
+    hook processes share it; each check costs one small read and write.
+    If the bucket file cannot be used, the event is allowed.
+
     Args:
         hook_name: Name of the hook
 
     Returns:
         bool: True if under limit, False if exceeded
     """
-    current_minute = int(time.time() / 60)
+    capacity = float(EVENT_RATE_LIMIT_PER_MINUTE)
+
+    try:
+        bucket_file = _rate_limit_file(hook_name)
+        bucket_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(bucket_file, os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError:
+        return True
 
-    # Initialize state for this hook if needed
-    if hook_name not in _rate_limit_state:
-        _rate_limit_state[hook_name] = {"minute": current_minute, "count": 0}
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        now = time.time()
+
+        record = os.pread(fd, _BUCKET.size, 0)
+        if len(record) == _BUCKET.size:
+            tokens, updated = _BUCKET.unpack(record)
+            # Refill for the time since the last check (clock going back adds nothing)
+            elapsed = max(0.0, now - updated)
+            tokens = min(capacity, tokens + elapsed * capacity / 60)
+        else:
+            # New (or damaged) bucket starts full
+            tokens = capacity
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+
+        os.pwrite(fd, _BUCKET.pack(tokens, now), 0)
+        return allowed
+    except OSError:
+        return True
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
 
-    state = _rate_limit_state[hook_name]
 
-    # Reset count if we're in a new minute
-    if state["minute"] != current_minute:
-        state["minute"] = current_minute
-        state["count"] = 0
+def _count_path(events_file: Path) -> Path:
+    """Path of the line count sidecar for events_file."""
+    return events_file.with_name(events_file.name + '.count')
 
-    # Check if under limit
-    if state["count"] >= EVENT_RATE_LIMIT_PER_MINUTE:
-        return False
 
-    # Increment count
-    state["count"] += 1
-    return True
+def _count_events(events_file: Path) -> int:
+    """
+    Count events (lines) in events file, using the count sidecar.
+
+    The sidecar holds the inode, size and line count of the file as of the
+    last flush. If the file only grew since then, just the new bytes are
+    counted; without a matching sidecar the whole file is counted.
+
+    Args:
+        events_file: Path to events file
+
+    Returns:
+        int: Number of lines in the file (0 if it does not exist)
+    """
+    try:
+        stat = events_file.stat()
+    except FileNotFoundError:
+        return 0
+
+    lines, counted = 0, 0
+    try:
+        with open(_count_path(events_file), 'r') as f:
+            saved = json.load(f)
+        if saved['inode'] == stat.st_ino and saved['size'] <= stat.st_size:
+            lines, counted = int(saved['lines']), int(saved['size'])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    if stat.st_size > counted:
+        with open(events_file, 'rb') as f:
+            f.seek(counted)
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                lines += block.count(b'\n')
+
+    return lines
+
+
+def _save_count(events_file: Path, stat: os.stat_result, lines: int) -> None:
+    """
+    Record the line count of events file at the given size in the sidecar.
+
+    Args:
+        events_file: Path to events file
+        stat: Stat of the events file that lines refers to
+        lines: Number of lines in the first stat.st_size bytes
+    """
+    count_file = _count_path(events_file)
+    temp_file = count_file.with_name(count_file.name + '.tmp')
+    try:
+        with open(temp_file, 'w') as f:
+            json.dump({'inode': stat.st_ino, 'size': stat.st_size, 'lines': lines}, f)
+        os.replace(temp_file, count_file)
+    except OSError:
+        # Only costs a recount on the next flush
+        pass
 
 
-def _should_rotate_file(events_file: Path) -> bool:
+def _should_rotate_file(events_file: Path, event_count: Optional[int] = None) -> bool:
     """
     Check if events file should be rotated.
 
@@ -83,6 +198,8 @@ def _should_rotate_file(events_file: Path) -> bool:
 
     Args:
         events_file: Path to events file
+        event_count: Events in the file, if already known (default: counted
+            via the count sidecar)
 
     Returns:
         bool: True if rotation needed
@@ -97,8 +214,8 @@ def _should_rotate_file(events_file: Path) -> bool:
 
     # Check event count
     try:
-        with open(events_file, 'r') as f:
-            event_count = sum(1 for _ in f)
+        if event_count is None:
+            event_count = _count_events(events_file)
         if event_count >= MAX_EVENTS_PER_FILE:
             return True
     except Exception:
@@ -110,13 +227,30 @@ def _should_rotate_file(events_file: Path) -> bool:
 
 def _rotate_file(events_file: Path) -> None:
     """
-    Rotate events file by renaming with timestamp.
+    Rotate events file into a compressed, queryable segment.
 
-    Creates: events.jsonl.backup_20251119_152300
+    Creates: events_segments/events-20251119_152300-0001.jsonl.gz (plus
+    manifest.json), keeping at most MAX_EVENT_ARCHIVE_MB of segments.
+    Falls back to a plain rename (events.jsonl.backup_20251119_152300) if
+    the segment store is unavailable; the next seal picks those up.
 
     Args:
         events_file: Path to events file
     """
+    try:
+        from triads.events.segments import SegmentStore
+    except ImportError as e:
+        print(f"⚠️  Event segment store unavailable: {e}", file=sys.stderr)
+    else:
+        try:
+            store = SegmentStore(events_file, max_total_bytes=MAX_EVENT_ARCHIVE_MB * 1024 * 1024)
+            entry = store.seal()
+            if entry:
+                print(f"ℹ️  Rotated events file to segment: {entry['file']}", file=sys.stderr)
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Failed to seal events file into a segment: {e}", file=sys.stderr)
+
     try:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_file = events_file.with_suffix(f'.jsonl.backup_{timestamp}')
@@ -141,6 +275,9 @@ def safe_capture_event(
     - Input validation: object_data must be a dict
     - Fail-safe: Never raises exceptions
 
+    The event is buffered and written to EVENTS_FILE by flush_events(),
+    which runs automatically at process exit.
+
     Args:
         hook_name: Name of the hook (e.g., "session_start")
         predicate: Event predicate (e.g., "executed", "failed")
@@ -148,7 +285,7 @@ def safe_capture_event(
         workspace_id: Optional workspace ID
 
     Returns:
-        bool: True if event captured successfully, False otherwise
+        bool: True if event captured (buffered) successfully, False otherwise
 
     Example:
         success = safe_capture_event(
@@ -181,13 +318,8 @@ def safe_capture_event(
 
             return False
 
-        # Prepare events file
-        events_file = Path(EVENTS_FILE)
-        events_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Check if rotation needed
-        if _should_rotate_file(events_file):
-            _rotate_file(events_file)
+        # Resolved now: the hook daemon changes directory between hooks
+        events_file = Path(EVENTS_FILE).absolute()
 
         # Build event
         event = {
@@ -205,9 +337,8 @@ def safe_capture_event(
         if workspace_id:
             event["workspace_id"] = workspace_id
 
-        # Append event to file (JSONL format)
-        with open(events_file, 'a') as f:
-            f.write(json.dumps(event) + '\n')
+        # Buffer event (JSONL format) until flush_events()
+        _buffer_event(events_file, json.dumps(event) + '\n')
 
         return True
 
@@ -217,6 +348,88 @@ def safe_capture_event(
         return False
 
 
+def _buffer_event(events_file: Path, line: str) -> None:
+    """
+    Queue an event line for events file and make sure it is flushed at exit.
+
+    Args:
+        events_file: Absolute path to events file
+        line: JSONL event line
+    """
+    global _flush_registered
+
+    with _pending_lock:
+        _pending_events.setdefault(events_file, []).append(line)
+        if not _flush_registered:
+            atexit.register(flush_events)
+            _flush_registered = True
+
+
+def _append_events(events_file: Path, lines: List[str]) -> None:
+    """
+    Append event lines to events file in one write, rotating first if due.
+
+    Runs under an exclusive lock on events.jsonl.lock, so concurrent hook
+    processes rotate at most once and keep the count sidecar accurate.
+
+    Args:
+        events_file: Path to events file
+        lines: JSONL event lines
+    """
+    events_file.parent.mkdir(parents=True, exist_ok=True)
+    data = ''.join(lines).encode('utf-8')
+
+    with open(events_file.with_name(events_file.name + '.lock'), 'a') as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+
+        event_count = _count_events(events_file)
+        if _should_rotate_file(events_file, event_count):
+            _rotate_file(events_file)
+            event_count = _count_events(events_file)
+
+        fd = os.open(events_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            before = os.fstat(fd)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            after = os.fstat(fd)
+        finally:
+            os.close(fd)
+
+        if after.st_size == before.st_size + len(data):
+            _save_count(events_file, after, event_count + len(lines))
+        else:
+            # Someone appended without the lock: count their lines next time
+            _save_count(events_file, before, event_count)
+
+
+def flush_events() -> int:
+    """
+    Write all buffered events to their events files.
+
+    Registered with atexit on the first capture; call it directly to make
+    captured events visible before the process exits. Fail-safe: events
+    that cannot be written are reported and dropped.
+
+    Returns:
+        int: Number of events written
+    """
+    with _pending_lock:
+        pending = dict(_pending_events)
+        _pending_events.clear()
+
+    written = 0
+    for events_file, lines in pending.items():
+        try:
+            _append_events(events_file, lines)
+            written += len(lines)
+        except Exception as e:
+            print(f"⚠️  Failed to write {len(lines)} event(s): {e}", file=sys.stderr)
+
+    return written
+
+
 def capture_hook_execution(
     hook_name: str,
     start_time: float,
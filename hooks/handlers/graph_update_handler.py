@@ -14,21 +14,25 @@ Usage:
 
 import glob
 import json
-import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from setup_paths import setup_import_paths
 setup_import_paths()
 
+from triads.hooks.block_scanner import Block, scan_blocks  # noqa: E402
 from triads.hooks.safe_io import safe_load_json_file, safe_save_json_file  # noqa: E402
+from triads.tools.knowledge.wal import GraphWAL  # noqa: E402
 
 
 class GraphUpdateHandler:
     """Handler for knowledge graph updates."""
 
+    # Block tags this handler reads (see triads.hooks.block_scanner)
+    BLOCK_TAGS = ('GRAPH_UPDATE', 'PRE_FLIGHT_CHECK')
+
     def __init__(self, graphs_dir: Path = None):
         """
         Initialize graph update handler.
@@ -38,7 +42,9 @@ class GraphUpdateHandler:
         """
         self.graphs_dir = graphs_dir or Path('.claude/graphs')
 
-    def extract_pre_flight_checks(self, text: str) -> List[Dict]:
+    def extract_pre_flight_checks(
+        self, text: str, blocks: Optional[Dict[str, List[Block]]] = None
+    ) -> List[Dict]:
         """
         Extract [PRE_FLIGHT_CHECK] blocks from text.
 
@@ -53,12 +59,14 @@ class GraphUpdateHandler:
 
         Args:
             text: String containing [PRE_FLIGHT_CHECK] blocks
+            blocks: Blocks already scanned from text (default: scan text)
 
         Returns:
             List of pre-flight check dictionaries
         """
-        pattern = r'\[PRE_FLIGHT_CHECK\](.*?)\[/PRE_FLIGHT_CHECK\]'
-        matches = re.findall(pattern, text, re.DOTALL)
+        if blocks is None:
+            blocks = scan_blocks(text, self.BLOCK_TAGS)
+        matches = [block.body for block in blocks.get('PRE_FLIGHT_CHECK', [])]
 
         checks = []
         for match in matches:
@@ -100,7 +108,9 @@ class GraphUpdateHandler:
 
         return checks
 
-    def extract_graph_updates(self, text: str) -> List[Dict]:
+    def extract_graph_updates(
+        self, text: str, blocks: Optional[Dict[str, List[Block]]] = None
+    ) -> List[Dict]:
         """
         Extract [GRAPH_UPDATE] blocks from text.
 
@@ -115,12 +125,14 @@ class GraphUpdateHandler:
 
         Args:
             text: String containing [GRAPH_UPDATE] blocks
+            blocks: Blocks already scanned from text (default: scan text)
 
         Returns:
             List of update dictionaries
         """
-        pattern = r'\[GRAPH_UPDATE\](.*?)\[/GRAPH_UPDATE\]'
-        matches = re.findall(pattern, text, re.DOTALL)
+        if blocks is None:
+            blocks = scan_blocks(text, self.BLOCK_TAGS)
+        matches = [block.body for block in blocks.get('GRAPH_UPDATE', [])]
 
         updates = []
         for match in matches:
@@ -153,7 +165,12 @@ class GraphUpdateHandler:
 
         return updates
 
-    def validate_pre_flight_checks(self, text: str, updates: List[Dict]) -> List[Dict]:
+    def validate_pre_flight_checks(
+        self,
+        text: str,
+        updates: List[Dict],
+        blocks: Optional[Dict[str, List[Block]]] = None
+    ) -> List[Dict]:
         """
         Validate that all graph updates have corresponding pre-flight checks.
 
@@ -166,6 +183,7 @@ class GraphUpdateHandler:
         Args:
             text: Full text to search for pre-flight checks
             updates: List of graph update dictionaries
+            blocks: Blocks already scanned from text (default: scan text)
 
         Returns:
             List of violation dictionaries (empty if all checks pass)
@@ -173,7 +191,7 @@ class GraphUpdateHandler:
         if not updates:
             return []
 
-        pre_flight_checks = self.extract_pre_flight_checks(text)
+        pre_flight_checks = self.extract_pre_flight_checks(text, blocks)
 
         # Build map of node_id -> pre-flight check
         checks_by_node = {}
@@ -351,6 +369,8 @@ class GraphUpdateHandler:
         """
         Load a triad's knowledge graph or create a new one.
 
+        Records still pending in the triad's update log are folded in.
+
         Args:
             triad_name: Name of the triad
 
@@ -363,7 +383,7 @@ class GraphUpdateHandler:
         graph_file = self.graphs_dir / f"{triad_name}_graph.json"
 
         # Use safe_load_json_file with default structure
-        return safe_load_json_file(graph_file, default={
+        graph_data = safe_load_json_file(graph_file, default={
             "directed": True,
             "nodes": [],
             "links": [],
@@ -375,6 +395,7 @@ class GraphUpdateHandler:
                 "edge_count": 0
             }
         })
+        return GraphWAL(graph_file).fold(graph_data)
 
     def save_graph(self, graph_data: Dict, triad_name: str) -> bool:
         """
@@ -399,145 +420,245 @@ class GraphUpdateHandler:
         graph_data['_meta']['node_count'] = len(graph_data['nodes'])
         graph_data['_meta']['edge_count'] = len(graph_data['links'])
 
-        # Use safe_save_json_file with atomic write
-        if not safe_save_json_file(graph_file, graph_data):
+        # Use safe_save_json_file with atomic write (supersedes the update log)
+        with GraphWAL(graph_file).superseding(graph_data):
+            saved = safe_save_json_file(graph_file, graph_data)
+        if not saved:
             print(f"❌ Failed to save {triad_name} graph", file=sys.stderr)
             return False
 
         return True
 
-    def apply_update(self, graph_data: Dict, update: Dict, agent_name: str) -> Dict:
+    def append_updates(self, graph_data: Dict, triad_name: str, ops: List[Dict]) -> bool:
         """
-        Apply a single graph update to the graph data.
+        Persist applied updates by appending them to the triad's update log.
 
-        Supported update types:
-        - add_node: Add new node (skips if exists)
-        - update_node: Update existing node (skips if not found)
-        - add_edge: Add new edge (skips if exists)
-        - update_edge: Update existing edge (skips if not found)
+        Appending costs O(update) instead of rewriting the whole graph; the log
+        is folded into the graph file once it grows past its compaction
+        threshold. A graph without a file yet is written in full.
 
         Args:
-            graph_data: The graph dictionary
-            update: The update dictionary from [GRAPH_UPDATE] block
-            agent_name: Name of the agent making the update
+            graph_data: Graph data with the updates applied
+            triad_name: Name of the triad
+            ops: Log records collected by apply_update()
 
         Returns:
-            Updated graph_data
+            bool: True if the updates were persisted, False otherwise
         """
-        update_type = update.get('type', '')
-
-        if update_type == 'add_node':
-            # Check if node already exists
-            node_id = update.get('node_id')
-            existing = [n for n in graph_data['nodes'] if n.get('id') == node_id]
-
-            if existing:
-                print(f"⚠️  Node {node_id} already exists, skipping", file=sys.stderr)
-                return graph_data
-
-            # Create new node
-            node = {
-                'id': node_id,
-                'type': update.get('node_type', 'Entity'),
-                'label': update.get('label', node_id),
-                'description': update.get('description', ''),
-                'confidence': update.get('confidence', 1.0),
-                'evidence': update.get('evidence', ''),
-                'created_by': agent_name,
-                'created_at': datetime.now().isoformat()
-            }
-
-            # Add optional fields
-            for key in ['alternatives', 'rationale', 'status', 'priority']:
-                if key in update:
-                    node[key] = update[key]
-
-            graph_data['nodes'].append(node)
-            print(f"✓ Added node: {node_id} ({node['type']})", file=sys.stderr)
-
-        elif update_type == 'update_node':
-            # Find and update existing node
-            node_id = update.get('node_id')
-            node = next((n for n in graph_data['nodes'] if n.get('id') == node_id), None)
-
-            if not node:
-                print(f"⚠️  Node {node_id} not found, skipping", file=sys.stderr)
-                return graph_data
-
-            # Update fields (preserve original created_by and created_at)
-            for key, value in update.items():
-                if key not in ['type', 'node_id']:
-                    node[key] = value
-
-            node['updated_by'] = agent_name
-            node['updated_at'] = datetime.now().isoformat()
-
-            print(f"✓ Updated node: {node_id}", file=sys.stderr)
-
-        elif update_type == 'add_edge':
-            # Create new edge
-            source = update.get('source')
-            target = update.get('target')
-            edge_type = update.get('edge_type', 'relates_to')
+        graph_file = self.graphs_dir / f"{triad_name}_graph.json"
+        if not graph_file.exists():
+            return self.save_graph(graph_data, triad_name)
+        if not ops:
+            return True
+
+        meta = {
+            'updated_at': datetime.now().isoformat(),
+            'node_count': len(graph_data['nodes']),
+            'edge_count': len(graph_data['links'])
+        }
+        graph_data.setdefault('_meta', {}).update(meta)
 
-            if not source or not target:
-                print("⚠️  Missing source or target for edge", file=sys.stderr)
-                return graph_data
+        try:
+            GraphWAL(graph_file).append(ops + [{'op': 'meta', 'fields': meta}])
+        except OSError as e:
+            print(f"❌ Failed to save {triad_name} graph: {e}", file=sys.stderr)
+            return False
 
-            # Check if edge already exists
-            existing = [
-                e for e in graph_data['links']
-                if e.get('source') == source and e.get('target') == target and e.get('key') == edge_type
-            ]
+        return True
 
-            if existing:
-                print(f"⚠️  Edge {source} -> {target} already exists", file=sys.stderr)
-                return graph_data
-
-            edge = {
-                'source': source,
-                'target': target,
-                'key': edge_type,
-                'rationale': update.get('rationale', ''),
-                'created_by': agent_name,
-                'created_at': datetime.now().isoformat()
-            }
+    def apply_update(
+        self, graph_data: Dict, update: Dict, agent_name: str, ops: List[Dict] = None
+    ) -> Dict:
+        """
+        Apply a single graph update to the graph data.
 
-            graph_data['links'].append(edge)
-            print(f"✓ Added edge: {source} -> {target} ({edge_type})", file=sys.stderr)
+        Prints the outcome to stderr; use apply_updates_batch() for many
+        updates and a structured report.
 
-        elif update_type == 'update_edge':
-            # Find and update existing edge
-            source = update.get('source')
-            target = update.get('target')
-            edge_type = update.get('edge_type', 'relates_to')
+        Args:
+            graph_data: The graph dictionary
+            update: The update dictionary from [GRAPH_UPDATE] block
+            agent_name: Name of the agent making the update
+            ops: Optional list receiving the change as update log records
 
-            edge = next(
-                (e for e in graph_data['links']
-                 if e.get('source') == source and e.get('target') == target and e.get('key') == edge_type),
-                None
-            )
+        Returns:
+            Updated graph_data
+        """
+        outcome = self.apply_updates_batch(graph_data, [update], agent_name, ops)[0]
+        marker = '✓' if outcome['status'] == 'applied' else '⚠️ '
+        print(f"{marker} {outcome['message']}", file=sys.stderr)
+        return graph_data
 
-            if not edge:
-                print(f"⚠️  Edge {source} -> {target} not found", file=sys.stderr)
-                return graph_data
+    def apply_updates_batch(
+        self, graph_data: Dict, updates: List[Dict], agent_name: str, ops: List[Dict] = None
+    ) -> List[Dict]:
+        """
+        Apply graph updates in order using id and edge-key indexes.
 
-            # Update fields
-            for key, value in update.items():
-                if key not in ['type', 'source', 'target', 'edge_type']:
-                    edge[key] = value
+        Node ids and (source, target, key) edges are indexed once per call, so
+        each update is O(1) instead of a scan of the graph.
 
-            edge['updated_by'] = agent_name
-            edge['updated_at'] = datetime.now().isoformat()
+        Supported update types:
+        - add_node: Add new node (skips if exists)
+        - update_node: Update existing node (skips if not found)
+        - add_edge: Add new edge (skips if exists)
+        - update_edge: Update existing edge (skips if not found)
 
-            print(f"✓ Updated edge: {source} -> {target}", file=sys.stderr)
+        Args:
+            graph_data: The graph dictionary (modified in place)
+            updates: Update dictionaries from [GRAPH_UPDATE] blocks
+            agent_name: Name of the agent making the updates
+            ops: Optional list receiving the changes as update log records
 
-        else:
-            print(f"⚠️  Unknown update type: {update_type}", file=sys.stderr)
+        Returns:
+            list: One outcome per update, in order
+                - type: Update type
+                - target: Node id, or "source -> target" for edges
+                - status: "applied" or "skipped"
+                - message: Human-readable description
+        """
+        nodes_by_id = {n.get('id'): n for n in graph_data['nodes']}
+        edges_by_key = {
+            (e.get('source'), e.get('target'), e.get('key')): e for e in graph_data['links']
+        }
+        outcomes = []
 
-        return graph_data
+        def outcome(update_type, target, status, message):
+            outcomes.append({
+                'type': update_type, 'target': target, 'status': status, 'message': message
+            })
 
-    def process(self, text: str, agent_name: str = "unknown") -> Dict:
+        for update in updates:
+            update_type = update.get('type', '')
+
+            if update_type in ('add_node', 'update_node'):
+                node_id = update.get('node_id')
+                node = nodes_by_id.get(node_id)
+
+                if update_type == 'add_node':
+                    if node is not None:
+                        outcome(
+                            update_type, node_id, 'skipped',
+                            f"Node {node_id} already exists, skipping"
+                        )
+                        continue
+
+                    # Create new node
+                    node = {
+                        'id': node_id,
+                        'type': update.get('node_type', 'Entity'),
+                        'label': update.get('label', node_id),
+                        'description': update.get('description', ''),
+                        'confidence': update.get('confidence', 1.0),
+                        'evidence': update.get('evidence', ''),
+                        'created_by': agent_name,
+                        'created_at': datetime.now().isoformat()
+                    }
+
+                    # Add optional fields
+                    for key in ['alternatives', 'rationale', 'status', 'priority']:
+                        if key in update:
+                            node[key] = update[key]
+
+                    graph_data['nodes'].append(node)
+                    nodes_by_id[node_id] = node
+                    if ops is not None:
+                        ops.append({'op': 'add_node', 'node': node})
+                    outcome(
+                        update_type, node_id, 'applied',
+                        f"Added node: {node_id} ({node['type']})"
+                    )
+
+                else:
+                    if node is None:
+                        outcome(
+                            update_type, node_id, 'skipped',
+                            f"Node {node_id} not found, skipping"
+                        )
+                        continue
+
+                    # Update fields (preserve original created_by and created_at)
+                    fields = {
+                        key: value for key, value in update.items()
+                        if key not in ['type', 'node_id']
+                    }
+                    fields['updated_by'] = agent_name
+                    fields['updated_at'] = datetime.now().isoformat()
+                    node.update(fields)
+                    if ops is not None:
+                        ops.append({'op': 'update_node', 'id': node_id, 'fields': fields})
+                    outcome(update_type, node_id, 'applied', f"Updated node: {node_id}")
+
+            elif update_type in ('add_edge', 'update_edge'):
+                source = update.get('source')
+                target = update.get('target')
+                edge_type = update.get('edge_type', 'relates_to')
+                edge_name = f"{source} -> {target}"
+                edge = edges_by_key.get((source, target, edge_type))
+
+                if update_type == 'add_edge':
+                    if not source or not target:
+                        outcome(
+                            update_type, edge_name, 'skipped',
+                            "Missing source or target for edge"
+                        )
+                        continue
+                    if edge is not None:
+                        outcome(
+                            update_type, edge_name, 'skipped',
+                            f"Edge {edge_name} already exists"
+                        )
+                        continue
+
+                    edge = {
+                        'source': source,
+                        'target': target,
+                        'key': edge_type,
+                        'rationale': update.get('rationale', ''),
+                        'created_by': agent_name,
+                        'created_at': datetime.now().isoformat()
+                    }
+
+                    graph_data['links'].append(edge)
+                    edges_by_key[(source, target, edge_type)] = edge
+                    if ops is not None:
+                        ops.append({'op': 'add_edge', 'edge': edge})
+                    outcome(
+                        update_type, edge_name, 'applied',
+                        f"Added edge: {edge_name} ({edge_type})"
+                    )
+
+                else:
+                    if edge is None:
+                        outcome(update_type, edge_name, 'skipped', f"Edge {edge_name} not found")
+                        continue
+
+                    # Update fields
+                    fields = {
+                        key: value for key, value in update.items()
+                        if key not in ['type', 'source', 'target', 'edge_type']
+                    }
+                    fields['updated_by'] = agent_name
+                    fields['updated_at'] = datetime.now().isoformat()
+                    edge.update(fields)
+                    if ops is not None:
+                        ops.append({
+                            'op': 'update_edge', 'source': source, 'target': target,
+                            'key': edge_type, 'fields': fields
+                        })
+                    outcome(update_type, edge_name, 'applied', f"Updated edge: {edge_name}")
+
+            else:
+                outcome(update_type, None, 'skipped', f"Unknown update type: {update_type}")
+
+        return outcomes
+
+    def process(
+        self,
+        text: str,
+        agent_name: str = "unknown",
+        blocks: Optional[Dict[str, List[Block]]] = None
+    ) -> Dict:
         """
         Main entry point: extract, validate, and apply graph updates.
 
@@ -546,14 +667,15 @@ class GraphUpdateHandler:
         2. Validate pre-flight checks (log violations)
         3. Group updates by triad
         4. For each triad:
-           a. Load graph from disk
-           b. Apply updates sequentially
-           c. Save graph back to disk
+           a. Load graph from disk (base file + update log)
+           b. Apply all updates in one indexed batch
+           c. Persist the changes once (appended to the triad's update log)
         5. Return results
 
         Args:
             text: Conversation text containing [GRAPH_UPDATE] blocks
             agent_name: Name of the agent making updates (default: "unknown")
+            blocks: Blocks already scanned from text (default: scan text)
 
         Returns:
             dict: Processing results
@@ -562,9 +684,13 @@ class GraphUpdateHandler:
                 - updates_by_triad: Dict mapping triad name to list of updates
                 - violations: List of pre-flight check violations
                 - graphs_updated: List of triad names whose graphs were updated
+                - outcomes: Per-update outcomes (see apply_updates_batch),
+                  each with its triad
         """
         # Extract updates
-        updates = self.extract_graph_updates(text)
+        if blocks is None:
+            blocks = scan_blocks(text, self.BLOCK_TAGS)
+        updates = self.extract_graph_updates(text, blocks)
 
         if not updates:
             return {
@@ -572,11 +698,12 @@ class GraphUpdateHandler:
                 'success': True,
                 'updates_by_triad': {},
                 'violations': [],
-                'graphs_updated': []
+                'graphs_updated': [],
+                'outcomes': []
             }
 
         # Validate pre-flight checks
-        violations = self.validate_pre_flight_checks(text, updates)
+        violations = self.validate_pre_flight_checks(text, updates, blocks)
 
         # Group updates by triad
         updates_by_triad = {}
@@ -588,16 +715,18 @@ class GraphUpdateHandler:
 
         # Apply updates to each triad's graph
         graphs_updated = []
+        outcomes = []
         for triad, triad_updates in updates_by_triad.items():
             # Load graph
             graph_data = self.load_graph(triad)
 
-            # Apply updates
-            for update in triad_updates:
-                graph_data = self.apply_update(graph_data, update, agent_name)
+            # Apply updates, recording them as log records
+            ops = []
+            triad_outcomes = self.apply_updates_batch(graph_data, triad_updates, agent_name, ops)
+            outcomes.extend({'triad': triad, **outcome} for outcome in triad_outcomes)
 
-            # Save graph
-            if self.save_graph(graph_data, triad):
+            # Persist once per triad, only if something changed
+            if ops and self.append_updates(graph_data, triad, ops):
                 graphs_updated.append(triad)
 
         return {
@@ -605,5 +734,6 @@ class GraphUpdateHandler:
             'success': len(violations) == 0,
             'updates_by_triad': updates_by_triad,
             'violations': violations,
-            'graphs_updated': graphs_updated
+            'graphs_updated': graphs_updated,
+            'outcomes': outcomes
         }
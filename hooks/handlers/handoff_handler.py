@@ -13,21 +13,24 @@ Usage:
 """
 
 import json
-import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from setup_paths import setup_import_paths
 setup_import_paths()
 
 from constants import HANDOFF_EXPIRY_HOURS  # noqa: E402
+from triads.hooks.block_scanner import Block, scan_blocks  # noqa: E402
 
 
 class HandoffHandler:
     """Handler for triad handoff requests."""
 
+    # Block tags this handler reads (see triads.hooks.block_scanner)
+    BLOCK_TAGS = ('HANDOFF_REQUEST',)
+
     def __init__(self, pending_dir: Path = None):
         """
         Initialize handoff handler.
@@ -38,7 +41,9 @@ class HandoffHandler:
         self.pending_dir = pending_dir or Path('.claude')
         self.pending_file = self.pending_dir / '.pending_handoff.json'
 
-    def extract_requests(self, text: str) -> List[Dict]:
+    def extract_requests(
+        self, text: str, blocks: Optional[Dict[str, List[Block]]] = None
+    ) -> List[Dict]:
         """
         Extract [HANDOFF_REQUEST] blocks from text.
 
@@ -53,12 +58,14 @@ class HandoffHandler:
 
         Args:
             text: String containing [HANDOFF_REQUEST]...[/HANDOFF_REQUEST] blocks
+            blocks: Blocks already scanned from text (default: scan text)
 
         Returns:
             List of handoff request dictionaries
         """
-        pattern = r'\[HANDOFF_REQUEST\](.*?)\[/HANDOFF_REQUEST\]'
-        matches = re.findall(pattern, text, re.DOTALL)
+        if blocks is None:
+            blocks = scan_blocks(text, self.BLOCK_TAGS)
+        matches = [block.body for block in blocks.get('HANDOFF_REQUEST', [])]
 
         requests = []
         for match in matches:
@@ -197,7 +204,7 @@ class HandoffHandler:
             )
             return False
 
-    def process(self, text: str) -> Dict:
+    def process(self, text: str, blocks: Optional[Dict[str, List[Block]]] = None) -> Dict:
         """
         Main entry point: extract, validate, and queue handoffs.
 
@@ -209,6 +216,7 @@ class HandoffHandler:
 
         Args:
             text: Conversation text containing [HANDOFF_REQUEST] blocks
+            blocks: Blocks already scanned from text (default: scan text)
 
         Returns:
             dict: Processing results
@@ -218,7 +226,7 @@ class HandoffHandler:
                 - errors: List of validation errors (if any)
         """
         # Extract handoff requests
-        requests = self.extract_requests(text)
+        requests = self.extract_requests(text, blocks)
 
         if not requests:
             return {
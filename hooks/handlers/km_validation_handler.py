@@ -19,11 +19,12 @@ Usage:
 import json
 import re
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from setup_paths import setup_import_paths
 setup_import_paths()
 
+from triads.hooks.block_scanner import Block, scan_blocks  # noqa: E402
 from triads.km.confidence import (  # noqa: E402
     calculate_initial_confidence,
     assign_status,
@@ -33,11 +34,16 @@ from triads.km.confidence import (  # noqa: E402
 class KMValidationHandler:
     """Handler for knowledge management and experience-based learning."""
 
+    # Block tags this handler reads (see triads.hooks.block_scanner)
+    BLOCK_TAGS = ('PROCESS_KNOWLEDGE',)
+
     def __init__(self):
         """Initialize KM validation handler."""
         pass
 
-    def extract_process_knowledge_blocks(self, text: str) -> List[Dict]:
+    def extract_process_knowledge_blocks(
+        self, text: str, blocks: Optional[Dict[str, List[Block]]] = None
+    ) -> List[Dict]:
         """
         Extract [PROCESS_KNOWLEDGE] blocks from conversation.
 
@@ -45,12 +51,14 @@ class KMValidationHandler:
 
         Args:
             text: Conversation text
+            blocks: Blocks already scanned from text (default: scan text)
 
         Returns:
             List of process knowledge dictionaries
         """
-        pattern = r'\[PROCESS_KNOWLEDGE\](.*?)\[/PROCESS_KNOWLEDGE\]'
-        matches = re.findall(pattern, text, re.DOTALL)
+        if blocks is None:
+            blocks = scan_blocks(text, self.BLOCK_TAGS)
+        matches = [block.body for block in blocks.get('PROCESS_KNOWLEDGE', [])]
 
         lessons = []
         for match in matches:
@@ -400,7 +408,8 @@ class KMValidationHandler:
     def extract_lessons_from_conversation(
         self,
         conversation_text: str,
-        graph_updates: List[Dict]
+        graph_updates: List[Dict],
+        blocks: Optional[Dict[str, List[Block]]] = None
     ) -> List[Dict]:
         """
         Extract all lessons from a conversation.
@@ -413,6 +422,7 @@ class KMValidationHandler:
         Args:
             conversation_text: Full conversation text
             graph_updates: List of graph updates from this conversation
+            blocks: Blocks already scanned from the text (default: scan text)
 
         Returns:
             List of process knowledge nodes to add to graphs
@@ -420,7 +430,7 @@ class KMValidationHandler:
         lessons = []
 
         # Method 1: Extract explicit [PROCESS_KNOWLEDGE] blocks
-        explicit_lessons = self.extract_process_knowledge_blocks(conversation_text)
+        explicit_lessons = self.extract_process_knowledge_blocks(conversation_text, blocks)
         for lesson_data in explicit_lessons:
             node = self.create_process_knowledge_node(lesson_data, conversation_text)
             lessons.append(node)
@@ -468,7 +478,12 @@ class KMValidationHandler:
 
         return lessons
 
-    def process(self, conversation_text: str, graph_updates: List[Dict]) -> Dict:
+    def process(
+        self,
+        conversation_text: str,
+        graph_updates: List[Dict],
+        blocks: Optional[Dict[str, List[Block]]] = None
+    ) -> Dict:
         """
         Main entry point: extract and create process knowledge nodes.
 
@@ -483,6 +498,7 @@ class KMValidationHandler:
         Args:
             conversation_text: Full conversation text
             graph_updates: List of graph updates from conversation (for repeated mistake detection)
+            blocks: Blocks already scanned from the text (default: scan text)
 
         Returns:
             dict: Processing results
@@ -494,7 +510,7 @@ class KMValidationHandler:
                 - repeated_count: Number of repeated mistakes detected
         """
         # Extract all lessons
-        lessons = self.extract_lessons_from_conversation(conversation_text, graph_updates)
+        lessons = self.extract_lessons_from_conversation(conversation_text, graph_updates, blocks)
 
         # Group lessons by triad
         lessons_by_triad = {}
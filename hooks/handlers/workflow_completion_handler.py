@@ -13,19 +13,23 @@ Usage:
 """
 
 import json
-import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from setup_paths import setup_import_paths
 setup_import_paths()
 
+from triads.hooks.block_scanner import Block, scan_blocks  # noqa: E402
+
 
 class WorkflowCompletionHandler:
     """Handler for workflow completion notifications."""
 
+    # Block tags this handler reads (see triads.hooks.block_scanner)
+    BLOCK_TAGS = ('WORKFLOW_COMPLETE',)
+
     def __init__(self, workflow_dir: Path = None, pending_handoff_file: Path = None):
         """
         Initialize workflow completion handler.
@@ -38,7 +42,9 @@ class WorkflowCompletionHandler:
         self.completion_file = self.workflow_dir / 'completed.json'
         self.pending_handoff_file = pending_handoff_file or Path('.claude/.pending_handoff.json')
 
-    def extract_completions(self, text: str) -> List[Dict]:
+    def extract_completions(
+        self, text: str, blocks: Optional[Dict[str, List[Block]]] = None
+    ) -> List[Dict]:
         """
         Extract [WORKFLOW_COMPLETE] blocks from text.
 
@@ -53,12 +59,14 @@ class WorkflowCompletionHandler:
 
         Args:
             text: String containing [WORKFLOW_COMPLETE]...[/WORKFLOW_COMPLETE] blocks
+            blocks: Blocks already scanned from text (default: scan text)
 
         Returns:
             List of workflow completion dictionaries
         """
-        pattern = r'\[WORKFLOW_COMPLETE\](.*?)\[/WORKFLOW_COMPLETE\]'
-        matches = re.findall(pattern, text, re.DOTALL)
+        if blocks is None:
+            blocks = scan_blocks(text, self.BLOCK_TAGS)
+        matches = [block.body for block in blocks.get('WORKFLOW_COMPLETE', [])]
 
         completions = []
         for match in matches:
@@ -204,7 +212,7 @@ class WorkflowCompletionHandler:
             )
             return False
 
-    def process(self, text: str) -> Dict:
+    def process(self, text: str, blocks: Optional[Dict[str, List[Block]]] = None) -> Dict:
         """
         Main entry point: extract, validate, and record completions.
 
@@ -217,6 +225,7 @@ class WorkflowCompletionHandler:
 
         Args:
             text: Conversation text containing [WORKFLOW_COMPLETE] blocks
+            blocks: Blocks already scanned from text (default: scan text)
 
         Returns:
             dict: Processing results
@@ -226,7 +235,7 @@ class WorkflowCompletionHandler:
                 - errors: List of validation errors (if any)
         """
         # Extract workflow completions
-        completions = self.extract_completions(text)
+        completions = self.extract_completions(text, blocks)
 
         if not completions:
             return {
@@ -82,8 +82,13 @@ import sys
 import time
 from pathlib import Path
 
+# Forward to the warm hook daemon if one is running (exits here when served)
+from daemon_client import relay_to_daemon
+if __name__ == "__main__":
+    relay_to_daemon("pre_experience_injection")
+
 # Setup import paths using shared utility
-from setup_paths import setup_import_paths
+from setup_paths import setup_import_paths  # noqa: E402
 setup_import_paths()
 
 from event_capture_utils import safe_capture_event, capture_hook_error  # noqa: E402
@@ -828,6 +833,55 @@ def format_knowledge_item(knowledge) -> str:
         return f"\nℹ️ **{knowledge.label}**\n{knowledge.description}\n"
 
 
+# ============================================================================
+# Query Engine Cache
+# ============================================================================
+
+# Query engines keyed by graphs directory. A one-shot hook process holds a
+# single entry; under the hook daemon (triads.hooks.daemon) parsed graphs stay
+# warm across tool calls until a graph file changes on disk.
+_ENGINE_CACHE = {}
+
+
+def _graphs_fingerprint(graphs_dir: Path) -> tuple:
+    """Fingerprint graph files by (name, mtime_ns, size) for cache validation.
+
+    Covers the base *_graph.json files and their *_graph.wal update logs,
+    which receive graph updates between compactions.
+    """
+    entries = []
+    for pattern in ("*_graph.json", "*_graph.wal"):
+        for graph_file in graphs_dir.glob(pattern):
+            try:
+                stat = graph_file.stat()
+            except OSError:
+                # Removed mid-scan (e.g. log compacted): absent from fingerprint
+                continue
+            entries.append((graph_file.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(entries))
+
+
+def get_query_engine(graphs_dir: Path):
+    """Get a query engine for graphs_dir, reusing it while graphs are unchanged.
+
+    Args:
+        graphs_dir: Path to .claude/graphs directory
+
+    Returns:
+        ExperienceQueryEngine instance
+    """
+    key = str(graphs_dir.resolve())
+    fingerprint = _graphs_fingerprint(graphs_dir)
+
+    cached = _ENGINE_CACHE.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    engine = ExperienceQueryEngine(graphs_dir=graphs_dir)
+    _ENGINE_CACHE[key] = (fingerprint, engine)
+    return engine
+
+
 # ============================================================================
 # Main Hook Logic
 # ============================================================================
@@ -889,7 +943,7 @@ def main():
         # Initialize query engine
         try:
             claude_dir = Path(cwd) / ".claude"
-            engine = ExperienceQueryEngine(graphs_dir=claude_dir / "graphs")
+            engine = get_query_engine(claude_dir / "graphs")
         except Exception as e:
             # P0: CATCH-22 PREVENTION (v0.8.0-alpha.7)
             # Hook errors must NEVER block user operations
@@ -32,6 +32,7 @@ setup_import_paths()
 
 # Import event capture utilities
 from event_capture_utils import capture_hook_execution, capture_hook_error  # noqa: E402
+from constants import STOP_HANDLER_BUDGET_SECONDS, STOP_HANDLER_JOIN_SECONDS  # noqa: E402
 
 # Import specialized handlers
 from handlers.graph_update_handler import GraphUpdateHandler  # noqa: E402
@@ -48,6 +49,18 @@ from workspace_manager import get_active_workspace  # noqa: E402
 
 # Import safe I/O for graph operations
 from triads.hooks.safe_io import safe_load_json_file, safe_save_json_file  # noqa: E402
+from triads.tools.knowledge.wal import GraphWAL  # noqa: E402
+from triads.hooks.block_scanner import scan_blocks  # noqa: E402
+from triads.hooks.handler_scheduler import HandlerScheduler  # noqa: E402
+from triads.hooks.transcript_cursor import TranscriptCursor  # noqa: E402
+
+# Block tags read by the Stop handlers, scanned once per Stop
+STOP_BLOCK_TAGS = (
+    GraphUpdateHandler.BLOCK_TAGS
+    + KMValidationHandler.BLOCK_TAGS
+    + HandoffHandler.BLOCK_TAGS
+    + WorkflowCompletionHandler.BLOCK_TAGS
+)
 
 
 def _extract_text_from_content_item(item):
@@ -113,41 +126,34 @@ def _extract_content_from_entry(entry):
     return []
 
 
-def _parse_transcript_file(transcript_path):
+def _entries_to_text(entries):
     """
-    Parse JSONL transcript file and extract all text.
+    Join the text of transcript entries.
 
     Args:
-        transcript_path: Path to transcript JSONL file
+        entries: Parsed transcript entries
 
     Returns:
         str: Joined text from all entries
     """
-    with open(transcript_path, 'r') as f:
-        transcript_lines = f.readlines()
-
     all_text = []
-    for line in transcript_lines:
-        try:
-            entry = json.loads(line)
-            texts = _extract_content_from_entry(entry)
-            all_text.extend(texts)
-        except json.JSONDecodeError:
-            continue
-
+    for entry in entries:
+        all_text.extend(_extract_content_from_entry(entry))
     return '\n'.join(all_text)
 
 
-def read_conversation_text() -> str:
+def read_conversation_text():
     """
     Read conversation text from stdin.
 
     Handles two input formats:
-    1. JSON with transcript_path: Read transcript from JSONL file
+    1. JSON with transcript_path: Read the transcript entries appended since
+       the previous Stop (see triads.hooks.transcript_cursor)
     2. Plain text: Use input directly
 
     Returns:
-        str: Full conversation text
+        tuple: (conversation text, TranscriptCursor to commit once the text
+        is processed, or None)
     """
     input_text = sys.stdin.read()
 
@@ -158,14 +164,15 @@ def read_conversation_text() -> str:
         # Check if we have a transcript_path
         transcript_path = input_data.get('transcript_path')
         if transcript_path and Path(transcript_path).exists():
-            return _parse_transcript_file(transcript_path)
+            cursor = TranscriptCursor(Path(transcript_path))
+            return _entries_to_text(cursor.read_new()), cursor
         else:
             # Use input data as text
-            return str(input_data)
+            return str(input_data), None
 
     except json.JSONDecodeError:
         # Input is plain text
-        return input_text
+        return input_text, None
 
 
 def log_violations(violations):
@@ -219,9 +226,9 @@ def _process_graph_km_issues(graphs_updated):
         graphs_updated: List of triad names that were updated
     """
     for triad in graphs_updated:
-        graph_data = safe_load_json_file(
-            Path(f'.claude/graphs/{triad}_graph.json'),
-            default={"nodes": [], "links": []}
+        graph_file = Path(f'.claude/graphs/{triad}_graph.json')
+        graph_data = GraphWAL(graph_file).fold(
+            safe_load_json_file(graph_file, default={"nodes": [], "links": []})
         )
 
         issues = detect_km_issues(graph_data, triad)
@@ -255,10 +262,12 @@ def _process_km_lessons(km_result):
         km_result: Dictionary with lessons_by_triad and other KM data
     """
     for triad, triad_lessons in km_result['lessons_by_triad'].items():
-        graph_data = safe_load_json_file(
-            Path(f'.claude/graphs/{triad}_graph.json'),
+        graph_file = Path(f'.claude/graphs/{triad}_graph.json')
+        wal = GraphWAL(graph_file)
+        graph_data = wal.fold(safe_load_json_file(
+            graph_file,
             default={"directed": True, "nodes": [], "links": [], "_meta": {}}
-        )
+        ))
 
         # Add lessons that don't already exist
         added_count = 0
@@ -273,16 +282,18 @@ def _process_km_lessons(km_result):
             # Update metadata and save
             graph_data['_meta']['updated_at'] = datetime.now().isoformat()
             graph_data['_meta']['node_count'] = len(graph_data['nodes'])
-            safe_save_json_file(Path(f'.claude/graphs/{triad}_graph.json'), graph_data)
+            with wal.superseding(graph_data):
+                safe_save_json_file(graph_file, graph_data)
             print(f"   ✓ Added {added_count} lesson(s) to {triad} graph", file=sys.stderr)
 
 
-def _handle_graph_updates(conversation_text):
+def _handle_graph_updates(conversation_text, blocks):
     """
     Process Phase 2: Graph Updates.
 
     Args:
         conversation_text: Full conversation text
+        blocks: Tagged blocks scanned from the conversation
 
     Returns:
         dict: Graph update results
@@ -290,11 +301,14 @@ def _handle_graph_updates(conversation_text):
     print("\n🔄 Processing Graph Updates...", file=sys.stderr)
 
     graph_handler = GraphUpdateHandler()
-    graph_result = graph_handler.process(conversation_text, agent_name="unknown")
+    graph_result = graph_handler.process(conversation_text, agent_name="unknown", blocks=blocks)
 
     if graph_result['count'] > 0:
         print(f"   Found {graph_result['count']} [GRAPH_UPDATE] blocks", file=sys.stderr)
         print(f"   Updated {len(graph_result['graphs_updated'])} graph(s): {', '.join(graph_result['graphs_updated'])}", file=sys.stderr)
+        skipped = [o for o in graph_result.get('outcomes', []) if o['status'] != 'applied']
+        for outcome in skipped:
+            print(f"   ⚠️  {outcome['triad']}: {outcome['message']}", file=sys.stderr)
 
         # Log and summarize constitutional violations
         if graph_result['violations']:
@@ -317,13 +331,14 @@ def _handle_graph_updates(conversation_text):
     return graph_result
 
 
-def _handle_km_processing(conversation_text, updates_by_triad):
+def _handle_km_processing(conversation_text, updates_by_triad, blocks):
     """
     Process Phase 3: Knowledge Management (Experience Learning).
 
     Args:
         conversation_text: Full conversation text
         updates_by_triad: Graph updates organized by triad
+        blocks: Tagged blocks scanned from the conversation
 
     Returns:
         dict: KM processing results
@@ -331,7 +346,7 @@ def _handle_km_processing(conversation_text, updates_by_triad):
     print("\n🧠 Processing Experience-Based Learning...", file=sys.stderr)
 
     km_handler = KMValidationHandler()
-    km_result = km_handler.process(conversation_text, updates_by_triad)
+    km_result = km_handler.process(conversation_text, updates_by_triad, blocks)
 
     if km_result['count'] > 0:
         print(f"   Found {km_result['count']} lesson(s)", file=sys.stderr)
@@ -353,12 +368,13 @@ def _handle_km_processing(conversation_text, updates_by_triad):
     return km_result
 
 
-def _handle_handoffs(conversation_text):
+def _handle_handoffs(conversation_text, blocks):
     """
     Process Phase 4: Handoff Processing.
 
     Args:
         conversation_text: Full conversation text
+        blocks: Tagged blocks scanned from the conversation
 
     Returns:
         dict: Handoff processing results
@@ -366,7 +382,7 @@ def _handle_handoffs(conversation_text):
     print("\n🔗 Processing Handoff Requests...", file=sys.stderr)
 
     handoff_handler = HandoffHandler()
-    handoff_result = handoff_handler.process(conversation_text)
+    handoff_result = handoff_handler.process(conversation_text, blocks)
 
     if handoff_result['count'] > 0:
         print(f"   Found {handoff_result['count']} handoff request(s)", file=sys.stderr)
@@ -380,12 +396,13 @@ def _handle_handoffs(conversation_text):
     return handoff_result
 
 
-def _handle_workflow_completions(conversation_text):
+def _handle_workflow_completions(conversation_text, blocks):
     """
     Process Phase 5: Workflow Completion.
 
     Args:
         conversation_text: Full conversation text
+        blocks: Tagged blocks scanned from the conversation
 
     Returns:
         dict: Workflow completion results
@@ -393,7 +410,7 @@ def _handle_workflow_completions(conversation_text):
     print("\n🏁 Processing Workflow Completions...", file=sys.stderr)
 
     completion_handler = WorkflowCompletionHandler()
-    completion_result = completion_handler.process(conversation_text)
+    completion_result = completion_handler.process(conversation_text, blocks)
 
     if completion_result['count'] > 0:
         print(f"   Found {completion_result['count']} workflow completion(s)", file=sys.stderr)
@@ -427,12 +444,93 @@ def _handle_workspace_pause():
     return pause_result
 
 
+def _handler_inputs(conversation_text, cursor):
+    """
+    Conversation text and tagged blocks for each Stop handler.
+
+    Without a transcript cursor every handler gets conversation_text. With
+    one, a handler that failed on an earlier Stop also gets the entries it
+    missed (see TranscriptCursor.entries_for); handlers starting from the
+    same entry share one scan.
+
+    Args:
+        conversation_text: Conversation text from read_conversation_text()
+        cursor: TranscriptCursor that produced it, or None
+
+    Returns:
+        dict: Handler name -> (conversation text, blocks)
+    """
+    # Entry lists are suffixes of the same read: their length identifies them
+    head = len(cursor.entries_for(None)) if cursor is not None else None
+    inputs = {}
+    scanned = {}
+    for name in STOP_HANDLER_BUDGET_SECONDS:
+        entries = cursor.entries_for(name) if cursor is not None else None
+        key = len(entries) if entries is not None else None
+        if key not in scanned:
+            text = conversation_text if key == head else _entries_to_text(entries)
+            scanned[key] = (text, scan_blocks(text, STOP_BLOCK_TAGS))
+        inputs[name] = scanned[key]
+    return inputs
+
+
+def _schedule_handlers(inputs):
+    """
+    Register the Stop handlers with their dependencies.
+
+    KM processing needs the graph update results and writes the same graphs;
+    workflow completion clears the pending handoff the handoff handler
+    queues. Everything else is independent and runs concurrently.
+
+    Args:
+        inputs: Handler name -> (conversation text, blocks), see _handler_inputs
+
+    Returns:
+        HandlerScheduler: Scheduler ready to run
+    """
+    scheduler = HandlerScheduler()
+
+    def add(name, func, depends_on=()):
+        scheduler.add(name, func, depends_on, STOP_HANDLER_BUDGET_SECONDS[name])
+
+    add('graph_updates', lambda: _handle_graph_updates(*inputs['graph_updates']))
+    km_text, km_blocks = inputs['km_processing']
+    add(
+        'km_processing',
+        lambda graph_result: _handle_km_processing(
+            km_text, graph_result.get('updates_by_triad', {}), km_blocks
+        ),
+        depends_on=('graph_updates',)
+    )
+    add('handoffs', lambda: _handle_handoffs(*inputs['handoffs']))
+    add(
+        'workflow_completions',
+        lambda handoff_result: _handle_workflow_completions(*inputs['workflow_completions']),
+        depends_on=('handoffs',)
+    )
+    add('workspace_pause', _handle_workspace_pause)
+    return scheduler
+
+
+def _print_handler_runs(runs):
+    """
+    Print each handler's output in order, then any handler that did not finish.
+
+    Args:
+        runs: Handler name -> HandlerRun from HandlerScheduler.run()
+    """
+    for run in runs.values():
+        sys.stderr.write(run.output)
+        if run.status != 'ok':
+            print(f"   ⚠️  {run.name} {run.status}: {run.error}", file=sys.stderr)
+
+
 def main():
     """
     Main orchestrator: delegates to specialized handlers.
 
     Process flow:
-    1. Read conversation text
+    1. Read conversation text (only transcript entries new since the last Stop)
     2. Graph updates (GraphUpdateHandler)
        - Extract [GRAPH_UPDATE] and [PRE_FLIGHT_CHECK] blocks
        - Validate quality gates
@@ -448,6 +546,9 @@ def main():
     6. Workflow completion (WorkflowCompletionHandler)
     7. Workspace auto-pause (WorkspacePauseHandler)
     8. Event capture
+
+    Steps 2-7 run concurrently where they don't depend on each other (see
+    _schedule_handlers), each within its own time budget.
     """
     start_time = time.time()
 
@@ -455,24 +556,42 @@ def main():
         # ====================================================================
         # Phase 1: Read Input
         # ====================================================================
-        conversation_text = read_conversation_text()
+        conversation_text, cursor = read_conversation_text()
+        # Handlers that failed last time also get the entries they missed
+        inputs = _handler_inputs(conversation_text, cursor)
 
-        if not conversation_text:
+        if not any(text for text, _ in inputs.values()):
             # No text to process - exit silently
+            if cursor is not None:
+                cursor.commit()
             return
 
         print(f"\n{'='*80}", file=sys.stderr)
         print("📊 Stop Hook Processing (Orchestrator)", file=sys.stderr)
         print(f"{'='*80}", file=sys.stderr)
+        if cursor is not None and cursor.rescanned:
+            # First Stop of the session, or the transcript was rewritten
+            print("ℹ️  Read the whole transcript (no usable cursor)", file=sys.stderr)
 
         # ====================================================================
         # Phase 2-6: Delegate to Specialized Handlers
         # ====================================================================
-        graph_result = _handle_graph_updates(conversation_text)
-        km_result = _handle_km_processing(conversation_text, graph_result.get('updates_by_triad', {}))
-        handoff_result = _handle_handoffs(conversation_text)
-        completion_result = _handle_workflow_completions(conversation_text)
-        pause_result = _handle_workspace_pause()
+        scheduler = _schedule_handlers(inputs)
+        runs = scheduler.run()
+        # Let handlers over budget (graph and KM writes) finish before exit
+        scheduler.join(STOP_HANDLER_JOIN_SECONDS)
+        _print_handler_runs(runs)
+
+        graph_result = runs['graph_updates'].result or {}
+        km_result = runs['km_processing'].result or {}
+        handoff_result = runs['handoffs'].result or {}
+        completion_result = runs['workflow_completions'].result or {}
+        pause_result = runs['workspace_pause'].result or {}
+
+        # Processed: the next Stop starts after these entries, except for
+        # handlers that failed, timed out or were skipped
+        if cursor is not None:
+            cursor.commit(failed=[name for name, run in runs.items() if run.status != 'ok'])
 
         print(f"\n{'='*80}", file=sys.stderr)
 
@@ -483,13 +602,18 @@ def main():
             hook_name="on_stop",
             start_time=start_time,
             object_data={
-                "graph_updates": graph_result['count'],
-                "graphs_updated": len(graph_result['graphs_updated']),
-                "lessons_extracted": km_result['count'],
+                "graph_updates": graph_result.get('count', 0),
+                "graphs_updated": len(graph_result.get('graphs_updated', [])),
+                "lessons_extracted": km_result.get('count', 0),
                 "handoffs_queued": handoff_result.get('queued', 0),
                 "workflows_completed": completion_result.get('recorded', 0),
-                "workspace_paused": pause_result['paused'],
-                "violations": len(graph_result['violations'])
+                "workspace_paused": pause_result.get('paused', False),
+                "violations": len(graph_result.get('violations', [])),
+                "transcript_rescanned": cursor.rescanned if cursor is not None else None,
+                "handlers": {
+                    name: {"status": run.status, "duration_ms": round(run.duration_ms, 1)}
+                    for name, run in runs.items()
+                }
             },
             workspace_id=get_active_workspace(),
             predicate="executed"
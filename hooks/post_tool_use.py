@@ -24,8 +24,13 @@ import sys
 import time
 from pathlib import Path
 
+# Forward to the warm hook daemon if one is running (exits here when served)
+from daemon_client import relay_to_daemon
+if __name__ == "__main__":
+    relay_to_daemon("post_tool_use")
+
 # Setup import paths using shared utility
-from setup_paths import setup_import_paths
+from setup_paths import setup_import_paths  # noqa: E402
 setup_import_paths()
 
 from event_capture_utils import safe_capture_event, capture_hook_error  # noqa: E402
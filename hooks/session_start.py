@@ -19,6 +19,7 @@ Current implementation: ~100 lines using KnowledgeTools + handoff + workspace re
 """
 
 import json
+import os
 import sys
 import time
 from datetime import datetime
@@ -34,6 +35,7 @@ from common import get_project_dir, output_hook_result  # noqa: E402
 from resumption_manager import should_auto_resume, generate_resumption_prompt  # noqa: E402
 from event_capture_utils import capture_hook_execution, capture_hook_error  # noqa: E402
 from constants import PLUGIN_VERSION  # noqa: E402
+from daemon_client import ensure_daemon_running  # noqa: E402
 
 
 def check_workspace_resumption():
@@ -190,6 +192,11 @@ def main():
     start_time = time.time()
 
     try:
+        # Opt-in warm hook daemon: serves PreToolUse/PostToolUse without paying
+        # interpreter start-up and graph parsing on every tool call
+        if os.environ.get("TRIADS_HOOK_DAEMON") == "1":
+            ensure_daemon_running(get_project_dir())
+
         # Priority 1: Check for paused workspace resumption
         workspace_id, resumption_prompt = check_workspace_resumption()
 
@@ -19,7 +19,9 @@ Current implementation: ~800 lines with context detection + routing
 
 import json
 import sys
+import threading
 import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from pathlib import Path
 
 # Setup import paths using shared utility
@@ -33,11 +35,17 @@ from common import output_hook_result, get_project_dir  # noqa: E402
 from triads.llm_routing import discover_context  # noqa: E402
 
 # Import workspace context detection (Phase 4 - Workspace Architecture)
-from workspace_detector import detect_and_handle_context_switch, format_context_detection_summary  # noqa: E402
+from workspace_detector import (  # noqa: E402
+    analyze_context_switch,
+    apply_context_switch,
+    format_context_detection_summary,
+)
 
 # Import event capture
 from event_capture_utils import capture_hook_execution, capture_hook_error  # noqa: E402
 
+from constants import PROMPT_ANALYSIS_DEADLINE_SECONDS  # noqa: E402
+
 
 # NOTE: detect_work_request() removed in v0.13.0
 # Q&A fast path eliminated - ALL messages now route through LLM discovery
@@ -289,7 +297,7 @@ def generate_orchestrator_instructions(
     return "\n".join(lines)
 
 
-def route_user_request_universal(user_prompt: str) -> dict:
+def route_user_request_universal(user_prompt: str, timeout: int = 10) -> dict:
     """
     Universal context discovery for ALL messages (v0.13.0).
 
@@ -298,6 +306,7 @@ def route_user_request_universal(user_prompt: str) -> dict:
 
     Args:
         user_prompt: User's message (question or work request)
+        timeout: Max seconds for the LLM call (default: 10)
 
     Returns:
         Discovery result dict with intent_type, confidence, recommended_action,
@@ -310,7 +319,7 @@ def route_user_request_universal(user_prompt: str) -> dict:
         discovery_result = discover_context(
             user_input=user_prompt,
             skills_dir=skills_dir,
-            timeout=10
+            timeout=timeout
         )
         return discovery_result
     except Exception as e:
@@ -318,6 +327,90 @@ def route_user_request_universal(user_prompt: str) -> dict:
         return None
 
 
+def _run_in_background(func, *args, **kwargs) -> Future:
+    """
+    Run func in a daemon thread and return a Future for its result.
+
+    Daemon threads (rather than a ThreadPoolExecutor) so a call still running
+    after the deadline never holds the hook process open at exit.
+    """
+    future = Future()
+
+    def runner():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=runner, daemon=True).start()
+    return future
+
+
+def _result_before(future: Future, deadline: float, label: str):
+    """
+    Wait for future until deadline (time.monotonic()); None if late or failed.
+    """
+    remaining = max(0.0, deadline - time.monotonic())
+    try:
+        return future.result(timeout=remaining)
+    except FutureTimeoutError:
+        print(f"{label} exceeded shared deadline, skipping", file=sys.stderr)
+    except Exception as e:
+        print(f"{label} failed: {e}", file=sys.stderr)
+    return None
+
+
+def analyze_prompt_concurrently(
+    user_prompt: str,
+    deadline_seconds: float = PROMPT_ANALYSIS_DEADLINE_SECONDS
+) -> tuple:
+    """
+    Run context-switch detection and context discovery concurrently.
+
+    Both make a headless `claude -p` call; running them side by side makes
+    per-prompt latency max(a, b) instead of a + b. Both share one deadline.
+
+    Only the read-only analysis runs in the background: the workspace change
+    a context switch calls for (e.g. pausing the active workspace) is applied
+    here, on the calling thread, so a straggler abandoned at the deadline
+    never dies midway through a workspace state write.
+
+    Args:
+        user_prompt: User's message
+        deadline_seconds: Shared deadline for both analyses
+
+    Returns:
+        (context_switch_result, discovery_result). discovery_result is None
+        when the context switch blocks (supervisor routing is skipped), or
+        when discovery fails or misses the deadline.
+    """
+    deadline = time.monotonic() + deadline_seconds
+
+    switch_future = _run_in_background(
+        analyze_context_switch, user_prompt, timeout=deadline_seconds
+    )
+    discovery_future = _run_in_background(
+        route_user_request_universal, user_prompt, timeout=int(deadline_seconds)
+    )
+
+    detection_result = _result_before(
+        switch_future, deadline, "Context switch detection"
+    )
+    context_switch_result = None
+    if detection_result is not None:
+        context_switch_result = apply_context_switch(user_prompt, detection_result)
+    if context_switch_result and context_switch_result.get("should_block"):
+        # Discovery result is irrelevant once the switch blocks routing
+        return context_switch_result, None
+
+    discovery_result = _result_before(
+        discovery_future, deadline, "LLM context discovery"
+    )
+    return context_switch_result, discovery_result
+
+
 def format_supervisor_instructions() -> str:
     """
     Generate Supervisor instructions for main Claude.
@@ -694,6 +787,9 @@ def main():
     2. PRIORITY 1: Universal routing with LLM analysis (v0.13.0)
     3. PRIORITY 2: Supervisor instructions with enriched context
 
+    Steps 1 and 2 run concurrently under a shared deadline (see
+    analyze_prompt_concurrently); a blocking context switch still wins.
+
     Design Change (v0.13.0):
         - Removed Q&A fast path (pattern matching eliminated)
         - Universal routing for ALL messages
@@ -754,8 +850,11 @@ def main():
                 }
             )
 
-        # PRIORITY 0: Workspace context switch detection (Phase 4)
-        context_switch_result = detect_and_handle_context_switch(user_prompt)
+        # PRIORITY 0 + 1: Context switch detection (Phase 4) and universal
+        # context discovery (v0.13.0), run concurrently
+        context_switch_result, discovery_result = analyze_prompt_concurrently(
+            user_prompt
+        )
 
         if context_switch_result and context_switch_result.get("should_block"):
             # Context switch needs user confirmation - block supervisor routing
@@ -804,9 +903,6 @@ def main():
                     file=sys.stderr
                 )
 
-        # PRIORITY 1: Universal context discovery (ALL messages)
-        discovery_result = route_user_request_universal(user_prompt)
-
         # PRIORITY 2: Format context with discovery result
         supervisor_context = format_supervisor_with_enriched_context(
             user_prompt,
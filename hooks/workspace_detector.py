@@ -197,29 +197,22 @@ def handle_context_switch(
     }
 
 
-def detect_and_handle_context_switch(user_message: str) -> Optional[Dict]:
-    """Main entry point for workspace context detection.
+def analyze_context_switch(
+    user_message: str, timeout: Optional[float] = None
+) -> Optional[Dict]:
+    """Classify a message against the active workspace, without acting on it.
 
-    Detects context switches and handles workspace lifecycle (pause/resume/create).
-    Called from UserPromptSubmit hook before supervisor routing.
+    Read-only (workspace state is only read), so it is safe to run in a
+    background thread that may be abandoned at a deadline. Pass the result
+    to apply_context_switch() to act on it.
 
     Args:
         user_message: User's input message
+        timeout: Max seconds for context detection (None: no limit)
 
     Returns:
-        {
-            "should_block": bool (whether to block supervisor routing),
-            "user_message": str (message to show user if blocking),
-            "workspace_action": str (none|pause|create),
-            "detection_result": dict (full detection result for logging)
-        }
-
-        Returns None if detection fails (allows fallback to supervisor routing).
-
-    Example:
-        >>> result = detect_and_handle_context_switch("Can you help me parse CSV files?")
-        >>> result["workspace_action"]
-        'pause'  # If active workspace exists and switching to new work
+        Detection result from detect_context_switch(), or None if detection
+        fails (allows fallback to supervisor routing)
     """
     try:
         # Get active workspace context
@@ -229,10 +222,38 @@ def detect_and_handle_context_switch(user_message: str) -> Optional[Dict]:
             workspace_context = get_workspace_context_summary(active_workspace)
 
         # Detect context switch
-        detection_result = detect_context_switch(
-            user_message=user_message, workspace_context=workspace_context
+        return detect_context_switch(
+            user_message=user_message,
+            workspace_context=workspace_context,
+            timeout=timeout,
         )
 
+    except Exception as e:
+        # Don't crash hook - log error and continue to supervisor
+        print(
+            f"Warning: Context detection failed: {e}", file=sys.stderr
+        )
+        return None
+
+
+def apply_context_switch(user_message: str, detection_result: Dict) -> Optional[Dict]:
+    """Act on a detection result (may pause the active workspace).
+
+    Args:
+        user_message: User's input message
+        detection_result: Result from analyze_context_switch()
+
+    Returns:
+        {
+            "should_block": bool (whether to block supervisor routing),
+            "user_message": str (message to show user if blocking),
+            "workspace_action": str (none|pause|create),
+            "detection_result": dict (full detection result for logging)
+        }
+
+        Returns None if handling fails (allows fallback to supervisor routing).
+    """
+    try:
         # Handle switch
         action_result = handle_context_switch(user_message, detection_result)
 
@@ -256,6 +277,32 @@ def detect_and_handle_context_switch(user_message: str) -> Optional[Dict]:
         return None
 
 
+def detect_and_handle_context_switch(
+    user_message: str, timeout: Optional[float] = None
+) -> Optional[Dict]:
+    """Main entry point for workspace context detection.
+
+    Detects context switches and handles workspace lifecycle (pause/resume/create).
+    Runs analyze_context_switch() then apply_context_switch().
+
+    Args:
+        user_message: User's input message
+        timeout: Max seconds for context detection (None: no limit)
+
+    Returns:
+        Result of apply_context_switch(), or None if detection fails
+
+    Example:
+        >>> result = detect_and_handle_context_switch("Can you help me parse CSV files?")
+        >>> result["workspace_action"]
+        'pause'  # If active workspace exists and switching to new work
+    """
+    detection_result = analyze_context_switch(user_message, timeout=timeout)
+    if detection_result is None:
+        return None
+    return apply_context_switch(user_message, detection_result)
+
+
 def format_context_detection_summary(detection_result: Dict) -> str:
     """Format detection result for logging/display.
 
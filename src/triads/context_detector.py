@@ -24,7 +24,9 @@ class ContextClassification(str, Enum):
 
 
 def detect_context_switch(
-    user_message: str, workspace_context: Optional[str]
+    user_message: str,
+    workspace_context: Optional[str],
+    timeout: Optional[float] = None,
 ) -> Dict[str, Any]:
     """Detect context switch using Claude Code headless subprocess.
 
@@ -33,6 +35,7 @@ def detect_context_switch(
     Args:
         user_message: User's input message
         workspace_context: Current workspace context (None if no active workspace)
+        timeout: Max seconds for the Claude Code call (None: no limit)
 
     Returns:
         {
@@ -46,6 +49,7 @@ def detect_context_switch(
 
     Raises:
         RuntimeError: If Claude Code returns error
+        subprocess.TimeoutExpired: If the call exceeds timeout
         json.JSONDecodeError: If response is invalid JSON
 
     Example:
@@ -99,7 +103,7 @@ Classify the message and respond with the JSON structure above."""
         ],
         capture_output=True,
         text=True,
-        # No timeout - let it complete
+        timeout=timeout,
         check=True,
     )
 
@@ -15,6 +15,8 @@ import logging
 import re
 from typing import Dict, List, Optional
 
+from triads.hooks.block_scanner import scan_blocks
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -48,20 +50,15 @@ def extract_graph_updates(agent_output: str) -> List[str]:
         return []
 
     try:
-        # Pattern matches [GRAPH_UPDATE]...[/GRAPH_UPDATE] blocks
-        # DOTALL flag makes . match newlines
-        pattern = r'\[GRAPH_UPDATE\](.*?)\[/GRAPH_UPDATE\]'
-        matches = re.findall(pattern, agent_output, re.DOTALL | re.IGNORECASE)
+        # [GRAPH_UPDATE]...[/GRAPH_UPDATE] blocks, markers in any case
+        blocks = scan_blocks(agent_output, ['GRAPH_UPDATE'], ignore_case=True)
 
-        # Strip whitespace from each match
-        updates = [match.strip() for match in matches]
+        # Strip whitespace from each block
+        updates = [block.body.strip() for block in blocks['GRAPH_UPDATE']]
 
         logger.debug(f"Extracted {len(updates)} graph update blocks")
         return updates
 
-    except re.error as e:
-        logger.error(f"Regex error in extract_graph_updates: {e}")
-        return []
     except Exception as e:
         logger.error(f"Unexpected error in extract_graph_updates: {e}")
         return []
@@ -347,11 +344,10 @@ def extract_hitl_prompt(agent_output: str) -> str:
 
     try:
         # Try to find text between [HITL_REQUIRED] and [/HITL_REQUIRED]
-        pattern = r'\[HITL_REQUIRED\](.*?)\[/HITL_REQUIRED\]'
-        match = re.search(pattern, agent_output, re.DOTALL | re.IGNORECASE)
+        blocks = scan_blocks(agent_output, ['HITL_REQUIRED'], ignore_case=True)
 
-        if match:
-            prompt = match.group(1).strip()
+        if blocks['HITL_REQUIRED']:
+            prompt = blocks['HITL_REQUIRED'][0].body.strip()
             logger.debug("Extracted HITL prompt from delimited block")
             return prompt
 
@@ -0,0 +1,312 @@
+"""Persistent decision cache for universal context discovery.
+
+discover_context() shells out to Claude Code on every user message, yet its
+output depends only on the prompt, the brief/coordination skills on disk and
+the triads in .claude/settings.json. This cache stores successful discovery
+results under .triads/ so exact repeats return in milliseconds.
+
+Cache key:
+- Hash of the normalized prompt (whitespace collapsed, case folded)
+- Fingerprint of the skill files and settings.json (name, size, mtime_ns)
+
+Editing, adding or removing a skill file (or settings.json) changes the
+fingerprint, so affected entries miss and are re-discovered. Entries expire
+after a TTL and the file is bounded by evicting least recently used entries.
+
+Lookups never rewrite the cache file: hit/miss counters live in a small
+fixed-size sidecar updated in place, and the recency of hits is kept in
+memory and written with the next put().
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import re
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from triads.utils.file_operations import FileLocker, atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path(".triads/discovery_cache.json")
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 500
+
+# Bump when the on-disk layout changes (old caches are then discarded)
+CACHE_FORMAT_VERSION = 1
+
+# Stats sidecar record: hits, misses, saved_cost_usd, saved_duration_ms
+_STATS = struct.Struct("<qqdq")
+
+# Skill files discover_context() reads
+SKILL_PATTERNS = ("*-brief.md", "coordinate-*.md")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(user_input: str) -> str:
+    """Normalize a prompt for cache keying (collapse whitespace, casefold)."""
+    return _WHITESPACE.sub(" ", user_input).strip().casefold()
+
+
+def prompt_hash(user_input: str) -> str:
+    """Hash of the normalized prompt."""
+    return hashlib.sha256(normalize_prompt(user_input).encode("utf-8")).hexdigest()
+
+
+def compute_fingerprint(
+    skills_dir: Path,
+    settings_path: Path = Path(".claude/settings.json")
+) -> str:
+    """Fingerprint the inputs discover_context() reads besides the prompt.
+
+    Uses stat() only (no file reads), so it stays cheap on the hit path.
+
+    Args:
+        skills_dir: Directory containing brief and coordination skills
+        settings_path: Workflow configuration file
+
+    Returns:
+        Hex digest that changes whenever a skill file or settings.json changes
+    """
+    digest = hashlib.sha256()
+
+    skill_files: Iterable[Path] = []
+    if skills_dir.exists():
+        skill_files = sorted(
+            {path for pattern in SKILL_PATTERNS for path in skills_dir.glob(pattern)}
+        )
+
+    for path in [*skill_files, settings_path]:
+        try:
+            stat = path.stat()
+            digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        except OSError:
+            digest.update(f"{path.name}:missing\n".encode())
+
+    return digest.hexdigest()
+
+
+class DiscoveryCache:
+    """TTL- and size-bounded discovery result cache stored as one JSON file.
+
+    Layout:
+        {
+            "format": 1,
+            "entries": {
+                "<prompt_hash>": {
+                    "fingerprint": "...",
+                    "created_at": 1730000000.0,
+                    "last_used": 1730000100.0,
+                    "result": {...discover_context() result...}
+                }
+            }
+        }
+
+    Hit/miss counters and savings are kept in "<cache file>.stats", one
+    fixed-size record read and written under flock, so get() costs a small
+    in-place write instead of a rewrite of the whole cache. last_used is
+    updated in memory on hits and persisted by the next put().
+
+    The cache is best-effort: unreadable files are treated as empty and
+    write failures are logged and ignored.
+    """
+
+    def __init__(
+        self,
+        cache_path: Path = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """Initialize cache.
+
+        Args:
+            cache_path: Cache file (default: .triads/discovery_cache.json)
+            ttl_seconds: Entry lifetime (default: 24 hours)
+            max_entries: Maximum cached prompts (default: 500)
+        """
+        self.cache_path = Path(cache_path)
+        self.lock_path = self.cache_path.with_name(self.cache_path.name + ".lock")
+        self.stats_path = self.cache_path.with_name(self.cache_path.name + ".stats")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # Prompt hash -> last hit time, not yet written to the cache file
+        self._last_used: Dict[str, float] = {}
+
+    def get(self, user_input: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Look up a discovery result and record the hit or miss.
+
+        Args:
+            user_input: User's message
+            fingerprint: compute_fingerprint() for the current skills/config
+
+        Returns:
+            Copy of the cached discovery result, or None on miss
+        """
+        key = prompt_hash(user_input)
+        now = time.time()
+
+        try:
+            # Readers need no lock: the file is only ever replaced atomically
+            entry = self._load()["entries"].get(key)
+
+            if (
+                entry is None
+                or entry.get("fingerprint") != fingerprint
+                or now - entry.get("created_at", 0) > self.ttl_seconds
+            ):
+                self._record(misses=1)
+                return None
+
+            result = entry["result"]
+            self._last_used[key] = now
+            self._record(
+                hits=1,
+                saved_cost_usd=float(result.get("cost_usd") or 0.0),
+                saved_duration_ms=int(result.get("duration_ms") or 0),
+            )
+            return dict(result)
+
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Discovery cache unavailable: {e}")
+            return None
+
+    def put(self, user_input: str, fingerprint: str, result: Dict[str, Any]) -> None:
+        """Store a discovery result, evicting expired and least recently used entries.
+
+        Args:
+            user_input: User's message
+            fingerprint: compute_fingerprint() the result was computed under
+            result: discover_context() result
+        """
+        now = time.time()
+
+        try:
+            with FileLocker(self.lock_path):
+                data = self._load()
+                entries = data["entries"]
+                for key, last_used in self._last_used.items():
+                    if key in entries:
+                        entries[key]["last_used"] = max(
+                            entries[key].get("last_used", 0), last_used
+                        )
+                self._last_used.clear()
+
+                entries[prompt_hash(user_input)] = {
+                    "fingerprint": fingerprint,
+                    "created_at": now,
+                    "last_used": now,
+                    "result": result,
+                }
+
+                for key in [
+                    key for key, entry in entries.items()
+                    if now - entry.get("created_at", 0) > self.ttl_seconds
+                ]:
+                    del entries[key]
+
+                if len(entries) > self.max_entries:
+                    by_age = sorted(entries, key=lambda k: entries[k].get("last_used", 0))
+                    for key in by_age[:len(entries) - self.max_entries]:
+                        del entries[key]
+
+                self._save(data)
+
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Failed to write discovery cache: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit rate and savings.
+
+        Returns:
+            {
+                "hits": int, "misses": int, "hit_rate": float,
+                "saved_cost_usd": float, "saved_duration_ms": int,
+                "entries": int
+            }
+        """
+        data = self._load()
+        stats = self._read_stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["entries"] = len(data["entries"])
+        return stats
+
+    def _load(self) -> Dict[str, Any]:
+        """Read the cache file (empty structure if missing or unreadable)."""
+        empty = {"format": CACHE_FORMAT_VERSION, "entries": {}}
+
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return empty
+
+        if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT_VERSION:
+            return empty
+
+        data.setdefault("entries", {})
+        return data
+
+    def _save(self, data: Dict[str, Any]) -> None:
+        """Atomically rewrite the cache file (caller holds the lock)."""
+        atomic_write_json(self.cache_path, data, lock=False, indent=None)
+
+    def _record(
+        self,
+        hits: int = 0,
+        misses: int = 0,
+        saved_cost_usd: float = 0.0,
+        saved_duration_ms: int = 0
+    ) -> None:
+        """Add to the counters in the stats sidecar (failures are ignored)."""
+        try:
+            self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.stats_path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            logger.debug(f"Discovery cache stats unavailable: {e}")
+            return
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            record = os.pread(fd, _STATS.size, 0)
+            if len(record) == _STATS.size:
+                totals = _STATS.unpack(record)
+            else:
+                totals = (0, 0, 0.0, 0)
+            os.pwrite(fd, _STATS.pack(
+                totals[0] + hits,
+                totals[1] + misses,
+                totals[2] + saved_cost_usd,
+                totals[3] + saved_duration_ms,
+            ), 0)
+        except OSError as e:
+            logger.debug(f"Failed to update discovery cache stats: {e}")
+        finally:
+            # Closing the descriptor releases the lock
+            os.close(fd)
+
+    def _read_stats(self) -> Dict[str, Any]:
+        """Read the counters from the stats sidecar (zeros if missing or damaged)."""
+        try:
+            with open(self.stats_path, "rb") as f:
+                record = f.read(_STATS.size)
+        except OSError:
+            record = b""
+
+        if len(record) == _STATS.size:
+            hits, misses, saved_cost_usd, saved_duration_ms = _STATS.unpack(record)
+        else:
+            hits, misses, saved_cost_usd, saved_duration_ms = 0, 0, 0.0, 0
+
+        return {
+            "hits": hits,
+            "misses": misses,
+            "saved_cost_usd": saved_cost_usd,
+            "saved_duration_ms": saved_duration_ms,
+        }
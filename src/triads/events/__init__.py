@@ -9,6 +9,8 @@ Core Classes:
     - AbstractEventRepository: Base class for event storage
     - InMemoryEventRepository: In-memory implementation for testing/development
     - JSONLEventRepository: JSONL file-based implementation for production
+    - IndexedJSONLEventRepository: JSONLEventRepository with a sidecar index
+    - SegmentedEventRepository: JSONLEventRepository spanning rotated, compressed segments
 
 MCP Tools:
     - capture_event(): Capture a new event to repository
@@ -33,11 +35,26 @@ from triads.events.exceptions import (
     EventStorageError,
     InvalidEventError,
 )
+from triads.events.indexed_repository import IndexedJSONLEventRepository
 from triads.events.jsonl_repository import JSONLEventRepository
 from triads.events.memory_repository import InMemoryEventRepository
 from triads.events.models import Event, EventFilters
 from triads.events.repository import AbstractEventRepository
-from triads.events.tools import capture_event, query_events
+from triads.events.segmented_repository import SegmentedEventRepository
+
+
+def __getattr__(name):
+    """Import the MCP tools on first use.
+
+    Storage modules (e.g. triads.events.segments, used by the hooks to rotate
+    the event log) must stay importable without the tools' dependencies.
+    """
+    if name in ("capture_event", "query_events"):
+        from triads.events import tools
+
+        return getattr(tools, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "Event",
@@ -48,6 +65,8 @@ __all__ = [
     "AbstractEventRepository",
     "InMemoryEventRepository",
     "JSONLEventRepository",
+    "IndexedJSONLEventRepository",
+    "SegmentedEventRepository",
     "capture_event",
     "query_events",
 ]
@@ -0,0 +1,506 @@
+"""Indexed JSONL event repository.
+
+JSONLEventRepository parses every line of the log on every get_by_id, query
+and count. IndexedJSONLEventRepository keeps the same JSONL file (so hooks can
+keep appending to it directly) plus a sidecar index next to it:
+
+    events.jsonl        - event log (unchanged format)
+    events.jsonl.idx    - append-only index, one compact JSON record per line
+    events.jsonl.idx.lock
+
+Each index record stores the byte range of one event line with its id,
+timestamp, workspace_id, subject and predicate. From these the repository
+keeps in memory:
+
+    - id -> record (get_by_id is one seek)
+    - workspace_id/subject/predicate -> records (posting lists)
+    - records ordered by timestamp (default sort, time-range bisect)
+
+The index is maintained incrementally: before each operation the repository
+indexes only the bytes appended since the last indexed offset, whoever wrote
+them. A replaced (rotated) or truncated log triggers a full rebuild, which can
+also be run explicitly:
+
+    python -m triads.events.indexed_repository rebuild-index .triads/events.jsonl
+"""
+
+import argparse
+import bisect
+import json
+import os
+import sys
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Optional, Union
+
+from triads.events.exceptions import EventQueryError
+from triads.events.jsonl_repository import JSONLEventRepository
+from triads.events.models import Event, EventFilters
+from triads.utils.file_operations import FileLocker
+
+# Bump when the index record layout changes (old indexes are then rebuilt)
+INDEX_FORMAT_VERSION = 1
+
+
+class _IndexRecord:
+    """Location and indexed fields of one event line."""
+
+    __slots__ = ("offset", "end", "event_id", "ts", "workspace_id", "subject", "predicate")
+
+    def __init__(
+        self,
+        offset: int,
+        end: int,
+        event_id: Optional[str],
+        ts: float,
+        workspace_id: Optional[str],
+        subject: str,
+        predicate: str,
+    ):
+        self.offset = offset
+        self.end = end
+        self.event_id = event_id
+        self.ts = ts
+        self.workspace_id = workspace_id
+        self.subject = subject
+        self.predicate = predicate
+
+
+class IndexedJSONLEventRepository(JSONLEventRepository):
+    """JSONL event repository with a sidecar byte-offset index.
+
+    Drop-in replacement for JSONLEventRepository: same file format, same
+    filter semantics. Queries sorted by timestamp (the default) seek only to
+    candidate lines and stop after offset + limit matches; count() without a
+    search term never reads the log at all.
+
+    Args:
+        file_path: Path to JSONL file
+        auto_migrate: If True, automatically migrates old format events (default: True)
+
+    Example:
+        >>> repo = IndexedJSONLEventRepository(".triads/events.jsonl")
+        >>> repo.query(EventFilters(subject="agent", limit=20))
+    """
+
+    def __init__(self, file_path: Union[str, Path], auto_migrate: bool = True):
+        """Initialize repository with file path.
+
+        Args:
+            file_path: Path to JSONL file
+            auto_migrate: If True, automatically migrates old format events
+        """
+        super().__init__(file_path, auto_migrate)
+
+        self._index_path = self._file_path.with_name(self._file_path.name + ".idx")
+        self._lock_path = self._file_path.with_name(self._file_path.name + ".idx.lock")
+        self._reset_memory()
+
+    # ------------------------------------------------------------------
+    # AbstractEventRepository
+    # ------------------------------------------------------------------
+
+    def save(self, event: Event) -> str:
+        """Append an event and index it.
+
+        Args:
+            event: Event to save
+
+        Returns:
+            str: Event ID of saved event
+
+        Raises:
+            InvalidEventError: If event validation fails
+            EventStorageError: If save operation fails
+        """
+        event_id = super().save(event)
+
+        try:
+            self._sync()
+        except (OSError, ValueError):
+            # Event is durable in the log; the index catches up next time
+            pass
+
+        return event_id
+
+    def get_by_id(self, event_id: str) -> Optional[Event]:
+        """Retrieve a single event by ID with one seek.
+
+        Args:
+            event_id: Unique event identifier
+
+        Returns:
+            Event if found, None otherwise
+        """
+        if not event_id:
+            return None
+
+        self._checked_sync()
+        position = self._by_id.get(event_id)
+        if position is None:
+            return None
+
+        with open(self._file_path, "rb") as f:
+            return self._read_record(f, self._records[position])
+
+    def query(self, filters: EventFilters) -> List[Event]:
+        """Query events with filters.
+
+        Args:
+            filters: Query filters
+
+        Returns:
+            List of matching events (may be empty)
+        """
+        self._checked_sync()
+
+        if filters.sort_by != "timestamp":
+            # Arbitrary sort fields need every candidate parsed
+            with open(self._file_path, "rb") as f:
+                events = [
+                    event for event in (
+                        self._read_record(f, self._records[p])
+                        for p in self._candidates(filters)
+                    )
+                    if event is not None
+                ]
+            results = self._apply_filters(events, filters)
+            results = self._apply_sorting(results, filters)
+            return self._apply_pagination(results, filters)
+
+        stop = filters.offset + filters.limit
+        matched: List[Event] = []
+        if stop <= 0:
+            return matched
+
+        with open(self._file_path, "rb") as f:
+            for position in self._ordered_candidates(filters):
+                event = self._read_record(f, self._records[position])
+                if event is None or not self._matches(event, filters):
+                    continue
+                matched.append(event)
+                if len(matched) >= stop:
+                    break
+
+        return matched[filters.offset:]
+
+    def count(self, filters: EventFilters) -> int:
+        """Count events matching filters.
+
+        Answered from the index alone unless a search term is given.
+
+        Args:
+            filters: Query filters
+
+        Returns:
+            Number of matching events
+        """
+        self._checked_sync()
+        candidates = self._candidates(filters)
+
+        if filters.search is None:
+            return len(candidates)
+
+        total = 0
+        with open(self._file_path, "rb") as f:
+            for position in candidates:
+                event = self._read_record(f, self._records[position])
+                if event is not None and self._matches(event, filters):
+                    total += 1
+        return total
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def rebuild_index(self) -> int:
+        """Discard the sidecar index and re-index the whole log.
+
+        Returns:
+            Number of indexed events
+        """
+        with FileLocker(self._lock_path):
+            self._rebuild_locked()
+        return len(self._records)
+
+    def _reset_memory(self) -> None:
+        """Forget all in-memory index state."""
+        self._records: List[_IndexRecord] = []
+        self._by_id: Dict[str, int] = {}
+        self._by_workspace: Dict[str, List[int]] = {}
+        self._by_subject: Dict[str, List[int]] = {}
+        self._by_predicate: Dict[str, List[int]] = {}
+        self._by_time: List[tuple] = []
+        self._covered = 0
+        self._index_pos = 0
+        self._index_inode: Optional[int] = None
+        self._log_inode: Optional[int] = None
+
+    def _checked_sync(self) -> None:
+        """Sync the index, surfacing failures as EventQueryError."""
+        try:
+            self._sync()
+        except (OSError, ValueError) as e:
+            raise EventQueryError(f"Failed to read event index: {e}")
+
+    def _sync(self) -> None:
+        """Bring the in-memory and sidecar index up to date with the log."""
+        with FileLocker(self._lock_path):
+            if not self._load_index_tail():
+                self._rebuild_locked()
+                return
+
+            log_stat = self._file_path.stat()
+            if log_stat.st_ino != self._log_inode or log_stat.st_size < self._covered:
+                # Log was rotated, replaced or truncated
+                self._rebuild_locked()
+                return
+
+            if log_stat.st_size > self._covered:
+                self._index_log_tail()
+
+    def _load_index_tail(self) -> bool:
+        """Load index records written since the last load (by any process).
+
+        Returns:
+            False if the sidecar index is missing, stale or unreadable
+        """
+        try:
+            index_stat = self._index_path.stat()
+        except FileNotFoundError:
+            return False
+
+        if index_stat.st_ino != self._index_inode or index_stat.st_size < self._index_pos:
+            # Index file was rebuilt elsewhere: reload from the start
+            self._reset_memory()
+            self._index_inode = index_stat.st_ino
+
+        if index_stat.st_size == self._index_pos:
+            return True
+
+        with open(self._index_path, "rb") as f:
+            f.seek(self._index_pos)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partially written record; picked up next time
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    return False
+
+                if self._index_pos == 0:
+                    if record.get("format") != INDEX_FORMAT_VERSION:
+                        return False
+                    self._log_inode = record.get("inode")
+                else:
+                    self._add_record(record)
+
+                self._index_pos += len(line)
+
+        return self._index_pos > 0
+
+    def _rebuild_locked(self) -> None:
+        """Re-index the whole log (caller holds the lock)."""
+        self._reset_memory()
+        self._log_inode = self._file_path.stat().st_ino
+
+        temp_path = self._index_path.with_name(self._index_path.name + ".tmp")
+        header = json.dumps({"format": INDEX_FORMAT_VERSION, "inode": self._log_inode}) + "\n"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(header)
+        os.replace(temp_path, self._index_path)
+
+        self._index_inode = self._index_path.stat().st_ino
+        self._index_pos = len(header.encode("utf-8"))
+        self._index_log_tail()
+
+    def _index_log_tail(self) -> None:
+        """Index complete log lines after the covered offset and persist records."""
+        new_lines = []
+
+        with open(self._file_path, "rb") as f:
+            f.seek(self._covered)
+            offset = self._covered
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Writer mid-append; index it once complete
+                end = offset + len(line)
+                record = self._index_line(line, offset, end)
+                self._add_record(record)
+                new_lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+                offset = end
+
+        if new_lines:
+            payload = "".join(new_lines).encode("utf-8")
+            with open(self._index_path, "ab") as f:
+                f.write(payload)
+            self._index_pos += len(payload)
+
+    def _index_line(self, line: bytes, offset: int, end: int) -> dict:
+        """Build the index record for one log line."""
+        record = {"o": offset, "e": end}
+
+        try:
+            data = json.loads(line)
+            has_id = isinstance(data, dict) and "id" in data
+            if self._auto_migrate:
+                data = self._migrate_event_data(data)
+            event = self._dict_to_event(data)
+        except Exception:
+            event = None
+
+        if event is None:
+            record["x"] = 1  # Blank, corrupt or invalid line
+            return record
+
+        record.update({
+            # Ids generated during migration are not stable across reads
+            "i": event.id if has_id else None,
+            "t": event.timestamp.timestamp(),
+            "w": event.workspace_id,
+            "s": event.subject,
+            "p": event.predicate,
+        })
+        return record
+
+    def _add_record(self, record: dict) -> None:
+        """Add one persisted index record to the in-memory indexes."""
+        self._covered = max(self._covered, record["e"])
+        if record.get("x"):
+            return
+
+        position = len(self._records)
+        entry = _IndexRecord(
+            offset=record["o"],
+            end=record["e"],
+            event_id=record.get("i"),
+            ts=record["t"],
+            workspace_id=record.get("w"),
+            subject=record["s"],
+            predicate=record["p"],
+        )
+        self._records.append(entry)
+
+        if entry.event_id is not None:
+            self._by_id[entry.event_id] = position
+        if entry.workspace_id is not None:
+            self._by_workspace.setdefault(entry.workspace_id, []).append(position)
+        self._by_subject.setdefault(entry.subject, []).append(position)
+        self._by_predicate.setdefault(entry.predicate, []).append(position)
+
+        # Appends are almost always in timestamp order, so this is amortized O(1)
+        key = (entry.ts, position)
+        if not self._by_time or self._by_time[-1] <= key:
+            self._by_time.append(key)
+        else:
+            bisect.insort(self._by_time, key)
+
+    # ------------------------------------------------------------------
+    # Query planning
+    # ------------------------------------------------------------------
+
+    def _candidates(self, filters: EventFilters) -> List[int]:
+        """Record positions (file order) matching all index-answerable filters."""
+        postings = []
+        if filters.workspace_id is not None:
+            postings.append(self._by_workspace.get(filters.workspace_id, []))
+        if filters.subject is not None:
+            postings.append(self._by_subject.get(filters.subject, []))
+        if filters.predicate is not None:
+            postings.append(self._by_predicate.get(filters.predicate, []))
+
+        if postings:
+            positions: Iterable[int] = min(postings, key=len)
+        else:
+            positions = range(len(self._records))
+
+        return [p for p in positions if self._record_matches(self._records[p], filters)]
+
+    def _ordered_candidates(self, filters: EventFilters) -> Iterable[int]:
+        """Candidate positions in timestamp order (sort_order aware)."""
+        descending = filters.sort_order == "desc"
+
+        if filters.workspace_id is None and filters.subject is None and filters.predicate is None:
+            lo = 0
+            hi = len(self._by_time)
+            if filters.time_from is not None:
+                lo = bisect.bisect_left(self._by_time, (filters.time_from.timestamp(), -1))
+            if filters.time_to is not None:
+                hi = bisect.bisect_right(
+                    self._by_time, (filters.time_to.timestamp(), len(self._records))
+                )
+            window = range(hi - 1, lo - 1, -1) if descending else range(lo, hi)
+            return (self._by_time[i][1] for i in window)
+
+        candidates = self._candidates(filters)
+        candidates.sort(key=lambda p: (self._records[p].ts, p), reverse=descending)
+        return candidates
+
+    @staticmethod
+    def _record_matches(record: _IndexRecord, filters: EventFilters) -> bool:
+        """Check index-answerable filters against one record."""
+        if filters.workspace_id is not None and record.workspace_id != filters.workspace_id:
+            return False
+        if filters.subject is not None and record.subject != filters.subject:
+            return False
+        if filters.predicate is not None and record.predicate != filters.predicate:
+            return False
+        if filters.time_from is not None and record.ts < filters.time_from.timestamp():
+            return False
+        if filters.time_to is not None and record.ts > filters.time_to.timestamp():
+            return False
+        return True
+
+    def _read_record(self, f: BinaryIO, record: _IndexRecord) -> Optional[Event]:
+        """Seek to and parse one indexed event line."""
+        f.seek(record.offset)
+        line = f.read(record.end - record.offset)
+
+        try:
+            data = json.loads(line)
+            if self._auto_migrate:
+                data = self._migrate_event_data(data)
+            return self._dict_to_event(data)
+        except Exception:
+            return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code (0 = success, 1 = error)
+    """
+    parser = argparse.ArgumentParser(
+        prog="triads-events",
+        description="Event log index maintenance"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = subparsers.add_parser(
+        "rebuild-index",
+        help="Rebuild the sidecar index for an events.jsonl file"
+    )
+    rebuild.add_argument(
+        "file_path",
+        nargs="?",
+        default=".triads/events.jsonl",
+        help="Event log path (default: .triads/events.jsonl)"
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        count = IndexedJSONLEventRepository(args.file_path).rebuild_index()
+    except OSError as e:
+        print(f"Error: failed to rebuild index: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Indexed {count} events in {args.file_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,12 +2,17 @@
 
 Stores events in JSON Lines format (one JSON object per line) for append-only
 persistence. Supports backward compatibility with old sessions.jsonl format.
+
+Reads are streamed: lines are parsed lazily and all filters are applied in a
+single pass, so memory stays bounded by the requested page, not the log size.
 """
 
+import heapq
 import json
-from datetime import datetime, timezone
+import os
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, BinaryIO, Iterator, List, Optional, Union
 from uuid import uuid4
 
 from triads.events.exceptions import EventStorageError, InvalidEventError
@@ -54,6 +59,15 @@ class JSONLEventRepository(AbstractEventRepository):
         if not self._file_path.exists():
             self._file_path.touch()
 
+    # Block size for reading the log backwards
+    _REVERSE_BLOCK_SIZE = 64 * 1024
+
+    # Longest an event can wait between capture and append. Hooks buffer
+    # their events and append them at exit (hooks/event_capture_utils.py),
+    # and Claude Code stops hooks after 60s, so the log is in timestamp
+    # order only up to this much.
+    _MAX_APPEND_DELAY = timedelta(seconds=60)
+
     def _read_all_events(self) -> List[Event]:
         """Read all events from JSONL file.
         
@@ -66,37 +80,80 @@ class JSONLEventRepository(AbstractEventRepository):
         Returns:
             List of Event objects
         """
-        if not self._file_path.exists():
-            return []
+        return list(self._iter_events())
+
+    def _iter_events(self, reverse: bool = False) -> Iterator[Event]:
+        """Lazily parse events from the JSONL file.
         
-        content = self._file_path.read_text(encoding="utf-8")
+        Corrupt lines and lines missing required fields are skipped.
         
-        if not content.strip():
-            return []
+        Args:
+            reverse: If True, yield events from the end of the file backwards
+
+        Yields:
+            Event objects in file order (or reverse file order)
+        """
+        for data in self._iter_records(reverse=reverse):
+            event = self._dict_to_event(data)
+            if event:
+                yield event
+
+    def _iter_records(self, reverse: bool = False) -> Iterator[dict]:
+        """Lazily parse (and migrate) raw event dictionaries from the file.
         
-        events = []
+        Args:
+            reverse: If True, read the file backwards in blocks
         
-        for line_num, line in enumerate(content.strip().split("\n"), 1):
-            try:
-                data = json.loads(line)
-                
+        Yields:
+            Event data dictionaries (corrupt lines skipped)
+        """
+        if not self._file_path.exists():
+            return
+
+        with open(self._file_path, "rb") as f:
+            lines = self._reverse_lines(f) if reverse else f
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except ValueError:
+                    # Skip corrupt lines gracefully
+                    continue
+                if not isinstance(data, dict):
+                    continue
+
                 # Migrate old format if needed
                 if self._auto_migrate:
                     data = self._migrate_event_data(data)
-                
-                # Convert to Event object
-                event = self._dict_to_event(data)
-                if event:
-                    events.append(event)
-                    
-            except json.JSONDecodeError:
-                # Skip corrupt lines gracefully
-                continue
-            except Exception:
-                # Skip any other parsing errors gracefully
-                continue
-        
-        return events
+
+                yield data
+
+    def _reverse_lines(self, f: BinaryIO) -> Iterator[bytes]:
+        """Yield lines of a binary file from last to first, reading in blocks.
+
+        Args:
+            f: File opened in binary mode
+
+        Yields:
+            Lines (without trailing newline), last line first
+        """
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+
+        while position > 0:
+            size = min(self._REVERSE_BLOCK_SIZE, position)
+            position -= size
+            f.seek(position)
+            block = f.read(size) + remainder
+
+            lines = block.split(b"\n")
+            # First piece may be the tail of a line that starts in an earlier block
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line
+
+        yield remainder
 
     def _migrate_event_data(self, data: dict) -> dict:
         """Migrate old format event data to new format.
@@ -146,21 +203,7 @@ class JSONLEventRepository(AbstractEventRepository):
             data["object_data"] = {}
         
         try:
-            # Parse timestamp if it's a string
-            timestamp = data.get("timestamp")
-            if isinstance(timestamp, str):
-                # Try parsing different ISO 8601 formats
-                try:
-                    timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                except ValueError:
-                    # If parsing fails, use current time
-                    timestamp = datetime.now(timezone.utc)
-            elif timestamp is None:
-                timestamp = datetime.now(timezone.utc)
-            
-            # Ensure timezone-aware
-            if timestamp.tzinfo is None:
-                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            timestamp = self._parse_timestamp(data.get("timestamp"))
             
             # Create Event object
             event = Event(
@@ -182,6 +225,32 @@ class JSONLEventRepository(AbstractEventRepository):
             # If Event creation fails, return None
             return None
 
+    @staticmethod
+    def _parse_timestamp(timestamp) -> datetime:
+        """Parse a stored timestamp into a timezone-aware datetime.
+
+        Args:
+            timestamp: ISO 8601 string, datetime or None
+
+        Returns:
+            Timezone-aware datetime (current time if missing or unparseable)
+        """
+        if isinstance(timestamp, str):
+            # Try parsing different ISO 8601 formats
+            try:
+                timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            except ValueError:
+                # If parsing fails, use current time
+                timestamp = datetime.now(timezone.utc)
+        elif timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+
+        # Ensure timezone-aware
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+        return timestamp
+
     def _event_to_dict(self, event: Event) -> dict:
         """Convert Event object to dictionary for JSON serialization.
         
@@ -262,62 +331,112 @@ class JSONLEventRepository(AbstractEventRepository):
         if not event_id:
             return None
         
-        # Read all events and search
-        events = self._read_all_events()
-        
-        for event in events:
+        # Stream events and stop at the first match
+        for event in self._iter_events():
             if event.id == event_id:
                 return event
         
         return None
 
-    def _apply_filters(self, events: List[Event], filters: EventFilters) -> List[Event]:
-        """Apply all query filters to a list of events.
-        
-        Reuses filtering logic from InMemoryEventRepository.
+    def _matches(self, event: Event, filters: EventFilters) -> bool:
+        """Check all query filters against one event in a single pass.
         
         Args:
-            events: List of events to filter
+            event: Event to check
             filters: Query filters to apply
         
         Returns:
-            Filtered list of events
+            True if the event satisfies every filter
         """
-        results = list(events)
+        if filters.workspace_id is not None and event.workspace_id != filters.workspace_id:
+            return False
+
+        if filters.subject is not None and event.subject != filters.subject:
+            return False
+
+        if filters.predicate is not None and event.predicate != filters.predicate:
+            return False
 
-        # Filter by workspace_id
-        if filters.workspace_id is not None:
-            results = [e for e in results if e.workspace_id == filters.workspace_id]
+        if filters.time_from is not None and event.timestamp < filters.time_from:
+            return False
 
-        # Filter by subject
-        if filters.subject is not None:
-            results = [e for e in results if e.subject == filters.subject]
+        if filters.time_to is not None and event.timestamp > filters.time_to:
+            return False
+
+        if filters.search is not None:
+            return self._search_matches(
+                filters.search, event.subject, event.predicate, event.error, event.object_data
+            )
 
-        # Filter by predicate
-        if filters.predicate is not None:
-            results = [e for e in results if e.predicate == filters.predicate]
+        return True
 
-        # Filter by time range (from)
-        if filters.time_from is not None:
-            results = [e for e in results if e.timestamp >= filters.time_from]
+    def _matches_record(self, data: dict, filters: EventFilters) -> bool:
+        """Check filters against a raw event dictionary without building an Event.
 
-        # Filter by time range (to)
-        if filters.time_to is not None:
-            results = [e for e in results if e.timestamp <= filters.time_to]
+        Mirrors _dict_to_event validity rules and _matches semantics.
+
+        Args:
+            data: Migrated event data dictionary
+            filters: Query filters to apply
+
+        Returns:
+            True if the record is a valid event satisfying every filter
+        """
+        if "subject" not in data or not data.get("predicate"):
+            return False
+
+        if filters.workspace_id is not None and data.get("workspace_id") != filters.workspace_id:
+            return False
+
+        if filters.subject is not None and data["subject"] != filters.subject:
+            return False
+
+        if filters.predicate is not None and data["predicate"] != filters.predicate:
+            return False
+
+        if filters.time_from is not None or filters.time_to is not None:
+            try:
+                timestamp = self._parse_timestamp(data.get("timestamp"))
+            except (TypeError, AttributeError):
+                return False
+            if filters.time_from is not None and timestamp < filters.time_from:
+                return False
+            if filters.time_to is not None and timestamp > filters.time_to:
+                return False
 
-        # Full-text search filter
         if filters.search is not None:
-            search_lower = filters.search.lower()
-            filtered = []
-            for e in results:
-                if (search_lower in e.subject.lower() or
-                    search_lower in e.predicate.lower() or
-                    (e.error and search_lower in e.error.lower()) or
-                    search_lower in str(e.object_data).lower()):
-                    filtered.append(e)
-            results = filtered
-
-        return results
+            return self._search_matches(
+                filters.search,
+                data["subject"],
+                data["predicate"],
+                data.get("error"),
+                data.get("object_data", {}),
+            )
+
+        return True
+
+    @staticmethod
+    def _search_matches(search: str, subject, predicate, error, object_data) -> bool:
+        """Case-insensitive full-text match over subject/predicate/error/object_data."""
+        search_lower = search.lower()
+        return (
+            search_lower in subject.lower() or
+            search_lower in predicate.lower() or
+            bool(error and search_lower in error.lower()) or
+            search_lower in str(object_data).lower()
+        )
+
+    def _apply_filters(self, events: List[Event], filters: EventFilters) -> List[Event]:
+        """Apply all query filters to a list of events.
+
+        Args:
+            events: List of events to filter
+            filters: Query filters to apply
+
+        Returns:
+            Filtered list of events
+        """
+        return [e for e in events if self._matches(e, filters)]
 
     def _apply_sorting(self, events: List[Event], filters: EventFilters) -> List[Event]:
         """Apply sorting to a list of events.
@@ -353,39 +472,115 @@ class JSONLEventRepository(AbstractEventRepository):
     def query(self, filters: EventFilters) -> List[Event]:
         """Query events with filters.
         
+        Streams the file instead of materializing it:
+        - Default sort (timestamp desc): reads the file backwards in blocks
+          and stops once no older line can be among the newest offset + limit
+          matches. Lines are appended out of timestamp order by at most
+          _MAX_APPEND_DELAY, so that is the first line this much older than
+          the oldest match kept.
+        - Any other sort: one forward pass keeping a bounded heap of
+          offset + limit events.
+
         Args:
             filters: Query filters
         
         Returns:
             List of matching events (may be empty)
         """
-        # Read all events from file
-        events = self._read_all_events()
-        
-        # Apply filters
-        results = self._apply_filters(events, filters)
-        
-        # Apply sorting
-        results = self._apply_sorting(results, filters)
-        
-        # Apply pagination
-        results = self._apply_pagination(results, filters)
-        
-        return results
+        wanted = filters.offset + filters.limit
+        if wanted <= 0:
+            return []
+
+        if self._is_reverse_scan(filters):
+            results = self._newest_matches(filters, wanted).results()
+        else:
+            matching = (e for e in self._iter_events() if self._matches(e, filters))
+            sort_field = filters.sort_by
+            if sort_field not in Event.__dataclass_fields__:
+                sort_field = "timestamp"
+            select = heapq.nlargest if filters.sort_order == "desc" else heapq.nsmallest
+            results = select(wanted, matching, key=lambda e: getattr(e, sort_field))
+
+        return results[filters.offset:wanted]
+
+    def _is_reverse_scan(self, filters: EventFilters) -> bool:
+        """Whether the query can be answered by a backward scan."""
+        return filters.sort_by == "timestamp" and filters.sort_order == "desc"
+
+    def _newest_matches(self, filters: EventFilters, wanted: int) -> "_NewestMatches":
+        """Scan the log backwards for the newest wanted matches of filters."""
+        newest = _NewestMatches(wanted, self._MAX_APPEND_DELAY)
+        for position, event in enumerate(self._iter_events(reverse=True)):
+            newest.add(event, (0, position), self._matches(event, filters))
+            if newest.done:
+                break
+        return newest
 
     def count(self, filters: EventFilters) -> int:
         """Count events matching filters.
         
+        Streams raw records without building Event objects.
+
         Args:
             filters: Query filters
         
         Returns:
             Number of matching events
         """
-        # Read all events from file
-        events = self._read_all_events()
-        
-        # Apply filters only (no sorting or pagination)
-        results = self._apply_filters(events, filters)
-        
-        return len(results)
+        return sum(1 for data in self._iter_records() if self._matches_record(data, filters))
+
+
+class _NewestMatches:
+    """Newest matches seen by a scan going backwards in append order.
+
+    Keeps the wanted newest matches by timestamp, ties going to the line
+    appended first (as a stable sort of the log would). The scan is done once
+    it has seen an event more than max_append_delay older than the oldest
+    match kept: anything appended before that event can be at most
+    max_append_delay newer than it.
+
+    Args:
+        wanted: Number of matches to keep
+        max_append_delay: Longest delay between an event's timestamp and its append
+    """
+
+    def __init__(self, wanted: int, max_append_delay: timedelta):
+        self.wanted = wanted
+        self.max_append_delay = max_append_delay
+        # Min-heap of (timestamp, age, event); larger age = appended earlier
+        self._heap: List[tuple] = []
+        self._oldest_seen: Optional[datetime] = None
+
+    def add(self, event: Event, age: Any, matches: bool) -> None:
+        """Record an event the scan read.
+
+        Args:
+            event: Event read
+            age: Position, increasing towards earlier appends (unique per event)
+            matches: Whether the event matches the query filters
+        """
+        if self._oldest_seen is None or event.timestamp < self._oldest_seen:
+            self._oldest_seen = event.timestamp
+        if not matches:
+            return
+        item = (event.timestamp, age, event)
+        if len(self._heap) < self.wanted:
+            heapq.heappush(self._heap, item)
+        else:
+            heapq.heappushpop(self._heap, item)
+
+    @property
+    def oldest_kept(self) -> Optional[datetime]:
+        """Timestamp a new match must reach to be kept (None until wanted are kept)."""
+        return self._heap[0][0] if len(self._heap) >= self.wanted else None
+
+    @property
+    def done(self) -> bool:
+        """Whether events appended before those seen can't be among the results."""
+        oldest = self.oldest_kept
+        return oldest is not None and self._oldest_seen + self.max_append_delay < oldest
+
+    def results(self) -> List[Event]:
+        """Matches kept, newest first."""
+        ranked = sorted(self._heap, key=lambda item: item[:2], reverse=True)
+        return [event for _, _, event in ranked]
@@ -0,0 +1,193 @@
+"""Segment-aware JSONL event repository.
+
+Reads the active log plus every compressed segment sealed by rotation (see
+triads.events.segments), so history beyond the active log's 10k-event window
+stays queryable. Each query fans out only to segments whose manifest entry
+(time span, workspace ids) can match the filters.
+"""
+
+import heapq
+import json
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from triads.events.jsonl_repository import JSONLEventRepository
+from triads.events.models import Event, EventFilters
+from triads.events.segments import DEFAULT_MAX_TOTAL_BYTES, SegmentStore
+
+
+class SegmentedEventRepository(JSONLEventRepository):
+    """JSONL event repository spanning the active log and rotated segments.
+
+    Writes go to the active log exactly as in JSONLEventRepository; rotate()
+    seals it into a compressed segment.
+
+    Args:
+        file_path: Active JSONL log path
+        auto_migrate: If True, automatically migrates old format events (default: True)
+        max_total_bytes: Retention budget for compressed segments (default: 200MB)
+
+    Example:
+        >>> repo = SegmentedEventRepository(".triads/events.jsonl")
+        >>> repo.query(EventFilters(workspace_id="ws-1", limit=20))
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        auto_migrate: bool = True,
+        max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES,
+    ):
+        """Initialize repository with file path.
+
+        Args:
+            file_path: Active JSONL log path
+            auto_migrate: If True, automatically migrates old format events
+            max_total_bytes: Retention budget for compressed segments
+        """
+        super().__init__(file_path, auto_migrate)
+        self.store = SegmentStore(self._file_path, max_total_bytes=max_total_bytes)
+
+    def rotate(self) -> Optional[Dict[str, Any]]:
+        """Seal the active log into a compressed segment.
+
+        Returns:
+            Manifest entry for the new segment, or None if the log was empty
+        """
+        entry = self.store.seal()
+        self._file_path.touch()
+        return entry
+
+    def get_by_id(self, event_id: str) -> Optional[Event]:
+        """Retrieve a single event by ID (active log first, then newest segments).
+
+        Args:
+            event_id: Unique event identifier
+
+        Returns:
+            Event if found, None otherwise
+        """
+        event = super().get_by_id(event_id)
+        if event is not None or not event_id:
+            return event
+
+        for entry in self.store.segments():
+            for data in self._iter_segment_records(entry):
+                if data.get("id") == event_id:
+                    return self._dict_to_event(data)
+        return None
+
+    def query(self, filters: EventFilters) -> List[Event]:
+        """Query events across the active log and matching segments.
+
+        Default sort (timestamp desc) reads the active log backwards, then
+        segments newest first, stopping once nothing older can be among the
+        newest offset + limit matches (see JSONLEventRepository.query).
+        Other sorts keep a bounded heap over all candidate sources.
+
+        Args:
+            filters: Query filters
+
+        Returns:
+            List of matching events (may be empty)
+        """
+        wanted = filters.offset + filters.limit
+        if wanted <= 0:
+            return []
+
+        segments = self.store.candidate_segments(filters)
+
+        if not self._is_reverse_scan(filters):
+            # Oldest first, so ties keep log order as in a single file
+            sources = chain(
+                *(self._iter_segment_events(entry) for entry in reversed(segments)),
+                self._iter_events(),
+            )
+            matching = (e for e in sources if self._matches(e, filters))
+            sort_field = filters.sort_by
+            if sort_field not in Event.__dataclass_fields__:
+                sort_field = "timestamp"
+            select = heapq.nlargest if filters.sort_order == "desc" else heapq.nsmallest
+            return select(wanted, matching, key=lambda e: getattr(e, sort_field))[filters.offset:]
+
+        newest = self._newest_matches(filters, wanted)
+
+        for rank, entry in enumerate(segments, start=1):
+            # Newest max_ts first: once a segment ends before the oldest match
+            # kept, so do the rest
+            oldest = newest.oldest_kept
+            if newest.done or (oldest is not None and entry["max_ts"] < oldest.timestamp()):
+                break
+            # Segments are gzip streams (forward only): read each one whole,
+            # later lines of a segment counting as appended after earlier ones
+            for position, event in enumerate(self._iter_segment_events(entry)):
+                newest.add(event, (rank, -position), self._matches(event, filters))
+
+        return newest.results()[filters.offset:wanted]
+
+    def count(self, filters: EventFilters) -> int:
+        """Count matching events across the active log and segments.
+
+        Segments entirely inside the filters' time range are counted from the
+        manifest without being opened when no other filter applies.
+
+        Args:
+            filters: Query filters
+
+        Returns:
+            Number of matching events
+        """
+        total = super().count(filters)
+        manifest_only = (
+            filters.workspace_id is None
+            and filters.subject is None
+            and filters.predicate is None
+            and filters.search is None
+        )
+
+        for entry in self.store.candidate_segments(filters):
+            if manifest_only and self._within_time_range(entry, filters):
+                total += entry["count"]
+                continue
+            total += sum(
+                1 for data in self._iter_segment_records(entry)
+                if self._matches_record(data, filters)
+            )
+        return total
+
+    @staticmethod
+    def _within_time_range(entry: Dict[str, Any], filters: EventFilters) -> bool:
+        """Whether a segment's whole time span lies inside the filter range."""
+        if filters.time_from is not None and entry["min_ts"] < filters.time_from.timestamp():
+            return False
+        if filters.time_to is not None and entry["max_ts"] > filters.time_to.timestamp():
+            return False
+        return True
+
+    def _iter_segment_records(self, entry: Dict[str, Any]) -> Iterator[dict]:
+        """Lazily parse (and migrate) raw event dictionaries from one segment."""
+        try:
+            with self.store.open_segment(entry) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        data = json.loads(line)
+                    except ValueError:
+                        continue
+                    if not isinstance(data, dict):
+                        continue
+                    if self._auto_migrate:
+                        data = self._migrate_event_data(data)
+                    yield data
+        except (OSError, EOFError):
+            # Segment removed by retention or truncated: skip it
+            return
+
+    def _iter_segment_events(self, entry: Dict[str, Any]) -> Iterator[Event]:
+        """Lazily parse events from one segment."""
+        for data in self._iter_segment_records(entry):
+            event = self._dict_to_event(data)
+            if event:
+                yield event
@@ -0,0 +1,229 @@
+"""Segmented storage for rotated event logs.
+
+The active log (.triads/events.jsonl) is rotated once it reaches its size or
+line limit. Instead of leaving an uncompressed events.jsonl.backup_<ts> that
+nothing ever reads again, rotation seals the log into a compressed segment:
+
+    .triads/events_segments/
+        manifest.json
+        events-20251119_152300-0001.jsonl.gz
+        events-20251203_081512-0002.jsonl.gz
+
+The manifest records, per segment, the min/max event timestamp, event count,
+workspace ids and compressed size, so queries only open segments that can
+contain matches. A retention policy deletes the oldest segments once the
+compressed total exceeds a byte budget.
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from triads.events.jsonl_repository import JSONLEventRepository
+from triads.events.models import EventFilters
+from triads.utils.file_operations import FileLocker, atomic_write_json
+
+# Bump when the manifest layout changes
+MANIFEST_FORMAT_VERSION = 1
+
+# Compressed bytes kept across all segments before the oldest are dropped
+DEFAULT_MAX_TOTAL_BYTES = 200 * 1024 * 1024
+
+# Sealing runs inside a hook, so favour speed over ratio (JSONL still ~6x)
+COMPRESS_LEVEL = 1
+
+SEALING_PREFIX = ".sealing-"
+
+
+class SegmentStore:
+    """Compressed, manifest-indexed segments of a rotated event log.
+
+    Args:
+        log_path: Active event log path (e.g. .triads/events.jsonl)
+        max_total_bytes: Retention budget for compressed segments
+
+    Example:
+        >>> store = SegmentStore(Path(".triads/events.jsonl"))
+        >>> store.seal()  # Rotate the active log into a new segment
+        >>> store.candidate_segments(EventFilters(workspace_id="ws-1"))
+    """
+
+    def __init__(
+        self,
+        log_path: Union[str, Path],
+        max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES,
+    ):
+        """Initialize store next to the active log.
+
+        Args:
+            log_path: Active event log path
+            max_total_bytes: Retention budget for compressed segments
+        """
+        self.log_path = Path(log_path)
+        self.segments_dir = self.log_path.with_name(f"{self.log_path.stem}_segments")
+        self.manifest_path = self.segments_dir / "manifest.json"
+        self.lock_path = self.segments_dir / "manifest.lock"
+        self.max_total_bytes = max_total_bytes
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def seal(self) -> Optional[Dict[str, Any]]:
+        """Rotate the active log into a compressed segment.
+
+        The active log is renamed away first (an atomic step), so concurrent
+        writers simply start a new active log. Legacy events.jsonl.backup_*
+        files and segments left half-sealed by a crash are sealed as well.
+
+        Returns:
+            Manifest entry for the new segment, or None if there was nothing to seal
+        """
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+
+        with FileLocker(self.lock_path):
+            manifest = self._load_manifest()
+            entry = None
+
+            # Legacy rotations (events.jsonl.backup_<ts>) become segments too
+            for backup in sorted(self.log_path.parent.glob(f"{self.log_path.name}.backup_*")):
+                sealing = self.segments_dir / f"{SEALING_PREFIX}{self._next_name(manifest)}"
+                os.replace(backup, sealing)
+
+            active = None
+            if self.log_path.exists() and self.log_path.stat().st_size > 0:
+                active = self.segments_dir / f"{SEALING_PREFIX}{self._next_name(manifest)}"
+                os.replace(self.log_path, active)
+
+            for pending in sorted(self.segments_dir.glob(f"{SEALING_PREFIX}*")):
+                sealed = self._compress(pending, manifest)
+                if pending == active:
+                    entry = sealed
+
+            self._apply_retention(manifest)
+            atomic_write_json(self.manifest_path, manifest, lock=False, indent=None)
+
+        return entry
+
+    def _next_name(self, manifest: Dict[str, Any]) -> str:
+        """Allocate the next segment file name (without .gz)."""
+        manifest["next_seq"] = manifest.get("next_seq", 0) + 1
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"events-{stamp}-{manifest['next_seq']:04d}.jsonl"
+
+    def _compress(self, pending: Path, manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """Gzip a pending log, collect its stats and add it to the manifest."""
+        name = pending.name[len(SEALING_PREFIX):] + ".gz"
+        target = self.segments_dir / name
+        temp = target.with_name(name + ".tmp")
+
+        min_ts = max_ts = None
+        count = 0
+        workspace_ids = set()
+
+        with open(pending, "rb") as src, gzip.open(temp, "wb", compresslevel=COMPRESS_LEVEL) as dst:
+            for line in src:
+                dst.write(line)
+                try:
+                    data = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(data, dict) or "subject" not in data or not data.get("predicate"):
+                    continue
+
+                count += 1
+                try:
+                    ts = JSONLEventRepository._parse_timestamp(data.get("timestamp")).timestamp()
+                except (TypeError, AttributeError):
+                    continue
+                min_ts = ts if min_ts is None else min(min_ts, ts)
+                max_ts = ts if max_ts is None else max(max_ts, ts)
+                if data.get("workspace_id") is not None:
+                    workspace_ids.add(data["workspace_id"])
+
+        os.replace(temp, target)
+        pending.unlink()
+
+        entry = {
+            "file": name,
+            "min_ts": min_ts,
+            "max_ts": max_ts,
+            "count": count,
+            "workspace_ids": sorted(workspace_ids),
+            "bytes": target.stat().st_size,
+        }
+        manifest["segments"].append(entry)
+        return entry
+
+    def _apply_retention(self, manifest: Dict[str, Any]) -> None:
+        """Drop oldest segments until the compressed total fits the budget."""
+        segments = manifest["segments"]
+        total = sum(s["bytes"] for s in segments)
+
+        while segments and total > self.max_total_bytes:
+            oldest = min(segments, key=lambda s: s["max_ts"] or 0)
+            segments.remove(oldest)
+            total -= oldest["bytes"]
+            try:
+                (self.segments_dir / oldest["file"]).unlink()
+            except FileNotFoundError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def segments(self) -> List[Dict[str, Any]]:
+        """All manifest entries, newest first."""
+        entries = list(self._load_manifest()["segments"])
+        entries.sort(key=lambda s: s["max_ts"] or 0, reverse=True)
+        return entries
+
+    def candidate_segments(self, filters: EventFilters) -> List[Dict[str, Any]]:
+        """Manifest entries (newest first) that may contain events matching filters.
+
+        Args:
+            filters: Query filters
+
+        Returns:
+            Segments whose time span and workspace ids overlap the filters
+        """
+        time_from = filters.time_from.timestamp() if filters.time_from else None
+        time_to = filters.time_to.timestamp() if filters.time_to else None
+
+        candidates = []
+        for entry in self.segments():
+            if entry["count"] == 0 or entry["min_ts"] is None:
+                continue
+            if time_from is not None and entry["max_ts"] < time_from:
+                continue
+            if time_to is not None and entry["min_ts"] > time_to:
+                continue
+            workspace_id = filters.workspace_id
+            if workspace_id is not None and workspace_id not in entry["workspace_ids"]:
+                continue
+            candidates.append(entry)
+        return candidates
+
+    def open_segment(self, entry: Dict[str, Any]):
+        """Open a segment for binary line iteration."""
+        return gzip.open(self.segments_dir / entry["file"], "rb")
+
+    def total_bytes(self) -> int:
+        """Compressed bytes across all segments."""
+        return sum(s["bytes"] for s in self._load_manifest()["segments"])
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Read the manifest (empty if missing or unreadable)."""
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            if isinstance(manifest, dict) and manifest.get("format") == MANIFEST_FORMAT_VERSION:
+                manifest.setdefault("segments", [])
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"format": MANIFEST_FORMAT_VERSION, "next_seq": 0, "segments": []}
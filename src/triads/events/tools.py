@@ -17,6 +17,7 @@ from triads.events.exceptions import EventQueryError, EventStorageError, Invalid
 from triads.events.jsonl_repository import JSONLEventRepository
 from triads.events.models import Event, EventFilters
 from triads.events.repository import AbstractEventRepository
+from triads.events.segmented_repository import SegmentedEventRepository
 
 # Constants
 MAX_PAYLOAD_SIZE = 10000
@@ -263,13 +264,14 @@ def _get_default_repository() -> JSONLEventRepository:
     """Get default event repository instance.
 
     Returns:
-        JSONLEventRepository configured with default path (.triads/events.jsonl)
+        SegmentedEventRepository over the default path (.triads/events.jsonl)
+        and its rotated segments
 
     Note:
         Path is computed dynamically based on current working directory.
     """
     default_path = Path.cwd() / ".triads" / "events.jsonl"
-    return JSONLEventRepository(default_path)
+    return SegmentedEventRepository(default_path)
 
 
 def _parse_iso_timestamp(
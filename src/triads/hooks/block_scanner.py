@@ -0,0 +1,101 @@
+"""Single-pass scanner for tagged blocks in conversation text.
+
+Agents emit structured output between bracketed markers:
+
+    [GRAPH_UPDATE]
+    type: add_node
+    node_id: node_001
+    [/GRAPH_UPDATE]
+
+The Stop handlers each need different tags ([GRAPH_UPDATE],
+[PRE_FLIGHT_CHECK], [PROCESS_KNOWLEDGE], [HANDOFF_REQUEST],
+[WORKFLOW_COMPLETE]). scan_blocks() walks the text once for all of them and
+returns the blocks by tag, with the offsets of each block in the text, so
+on_stop.py scans the conversation once and hands every handler the blocks
+it declares in BLOCK_TAGS.
+
+Pairing is the same as re.findall(r'\\[TAG\\](.*?)\\[/TAG\\]', text, re.DOTALL)
+run separately for each tag:
+- An opening marker pairs with the first closing marker of the same tag
+  after it
+- Markers of other tags, and repeated opening markers, inside a block are
+  part of its body
+- An opening marker that is never closed yields no block
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+# Any [TAG] or [/TAG] marker
+_MARKER = re.compile(r"\[(/?)([A-Za-z0-9_]+)\]")
+
+
+@dataclass(frozen=True)
+class Block:
+    """One tagged block.
+
+    Attributes:
+        tag: Block tag (e.g. "GRAPH_UPDATE"; uppercased when scanned with
+            ignore_case)
+        body: Text between the markers, unstripped
+        start: Offset of the opening marker in the scanned text
+        end: Offset just past the closing marker
+    """
+
+    tag: str
+    body: str
+    start: int
+    end: int
+
+
+def scan_blocks(
+    text: str,
+    tags: Optional[Iterable[str]] = None,
+    ignore_case: bool = False,
+) -> dict[str, list[Block]]:
+    """Find the tagged blocks in text in one pass.
+
+    Args:
+        text: Text to scan
+        tags: Tags to collect (default: every tag found)
+        ignore_case: Match markers case-insensitively
+
+    Returns:
+        Tag -> blocks in order of appearance; every requested tag is present
+
+    Example:
+        >>> blocks = scan_blocks(text, ["GRAPH_UPDATE", "PRE_FLIGHT_CHECK"])
+        >>> [block.body.strip() for block in blocks["GRAPH_UPDATE"]]
+        ['type: add_node\\nnode_id: node_001']
+    """
+    if tags is None:
+        blocks: dict[str, list[Block]] = {}
+        wanted = None
+    else:
+        blocks = {tag.upper() if ignore_case else tag: [] for tag in tags}
+        wanted = set(blocks)
+
+    # Tag -> (opening marker start, body start) of the block being read
+    open_blocks: dict[str, tuple[int, int]] = {}
+
+    for marker in _MARKER.finditer(text):
+        closing, tag = marker.groups()
+        if ignore_case:
+            tag = tag.upper()
+        if wanted is not None and tag not in wanted:
+            continue
+
+        if not closing:
+            open_blocks.setdefault(tag, (marker.start(), marker.end()))
+            continue
+
+        opened = open_blocks.pop(tag, None)
+        if opened is not None:
+            start, body_start = opened
+            block = Block(tag, text[body_start:marker.start()], start, marker.end())
+            blocks.setdefault(tag, []).append(block)
+
+    return blocks
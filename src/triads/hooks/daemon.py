@@ -0,0 +1,405 @@
+"""Warm hook daemon - serves hot hooks from a long-lived process.
+
+Every hook in hooks.json is launched as a fresh `python3` process, so hooks
+that fire on every tool call re-import triads, rebuild ExperienceQueryEngine
+and re-parse every *_graph.json each time. The daemon imports the hook
+modules once and keeps their module-level state (query engines, parsed
+graphs, workspace state) warm between calls.
+
+Clients (hooks/daemon_client.py) connect over a Unix socket and send one
+JSON request per connection:
+
+    {"command": "run", "hook": "post_tool_use", "version": "0.16.3",
+     "stdin": "...", "cwd": "/path/to/project", "env": {"TRIADS_...": "..."}}
+
+The daemon runs the hook's main() with stdin/stdout/stderr redirected, the
+request's working directory and TRIADS_*/CLAUDE_* environment applied, and
+answers with:
+
+    {"status": "ok", "exit_code": 0, "stdout": "...", "stderr": "..."}
+
+Any other status tells the client to fall back to running in-process.
+
+Requests are handled one at a time: hook main() functions rely on process
+globals (cwd, environment, sys.stdout), and Claude Code runs hooks for one
+session sequentially anyway.
+
+Security:
+- Socket is created with 0600 permissions (owner-only), in a directory only
+  its owner can access (bind() refuses any other)
+- Only hooks registered in HOOK_MODULES can be run
+- Requests larger than MAX_REQUEST_BYTES are rejected
+
+Usage:
+    python -m triads.hooks.daemon --socket /tmp/x.sock --hooks-dir hooks/
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import logging
+import os
+import socket
+import stat
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Hook name (as sent by daemon_client.relay_to_daemon) -> module in hooks/
+HOOK_MODULES = {
+    "pre_experience_injection": "on_pre_experience_injection",
+    "post_tool_use": "post_tool_use",
+}
+
+# Environment prefixes a request may set (mirrors daemon_client)
+FORWARDED_ENV_PREFIXES = ("TRIADS_", "CLAUDE_")
+
+# Exit after this long without requests (sessions end, daemons shouldn't linger)
+DEFAULT_IDLE_TIMEOUT_SECONDS = 1800.0
+
+# Tool inputs (e.g. Write content) can be large, but not unbounded
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+
+class HookDaemon:
+    """Unix socket server that runs registered hooks in a warm process.
+
+    Example:
+        >>> daemon = HookDaemon(Path("/tmp/hookd.sock"), Path("hooks"))
+        >>> daemon.serve_forever()  # Until idle timeout or shutdown request
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        hooks_dir: Path,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        hook_modules: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize daemon.
+
+        Args:
+            socket_path: Unix socket path to listen on
+            hooks_dir: Directory containing hook modules (added to sys.path)
+            idle_timeout: Seconds without requests before exiting
+            hook_modules: Hook name -> module name registry (default: HOOK_MODULES)
+        """
+        self.socket_path = Path(socket_path)
+        self.hooks_dir = Path(hooks_dir)
+        self.idle_timeout = idle_timeout
+        self.hook_modules = hook_modules if hook_modules is not None else dict(HOOK_MODULES)
+        self.requests_served = 0
+        self._modules: dict[str, ModuleType] = {}
+        self._server: socket.socket | None = None
+        self._running = False
+
+        hooks_path = str(self.hooks_dir)
+        if hooks_path not in sys.path:
+            sys.path.insert(0, hooks_path)
+
+        self.version = self._load_plugin_version()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def bind(self) -> bool:
+        """Bind the listening socket.
+
+        Removes a stale socket file left by a dead daemon, but never steals
+        the socket from a live one.
+
+        Returns:
+            True if bound, False if another daemon is already serving
+
+        Raises:
+            PermissionError: If the socket directory is not private to this
+                user (another user could replace the socket)
+        """
+        self._check_socket_dir()
+
+        if self.socket_path.exists():
+            if self._socket_is_live():
+                return False
+            self.socket_path.unlink()
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            server.bind(str(self.socket_path))
+        finally:
+            os.umask(old_umask)
+        server.listen(16)
+        server.settimeout(self.idle_timeout)
+        self._server = server
+        return True
+
+    def _check_socket_dir(self) -> None:
+        """Create the socket directory (0700) and make sure only we can access it."""
+        parent = self.socket_path.parent
+        parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = os.lstat(parent)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+            raise PermissionError(
+                f"Socket directory must be owned by uid {os.getuid()} with mode 0700: {parent}"
+            )
+
+    def serve_forever(self) -> None:
+        """Serve requests until idle timeout or a shutdown request."""
+        if self._server is None and not self.bind():
+            logger.info("Hook daemon already running", extra={"socket": str(self.socket_path)})
+            return
+
+        assert self._server is not None
+        self._running = True
+        try:
+            while self._running:
+                try:
+                    conn, _ = self._server.accept()
+                except socket.timeout:
+                    logger.info("Hook daemon idle, exiting", extra={"served": self.requests_served})
+                    break
+                except OSError:
+                    if not self._running:
+                        break
+                    raise
+
+                with conn:
+                    self._handle_connection(conn)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop serving and remove the socket file."""
+        self._running = False
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        with contextlib.suppress(OSError):
+            self.socket_path.unlink()
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Dispatch one decoded request.
+
+        Args:
+            request: Request dict (see module docstring)
+
+        Returns:
+            Response dict; status "ok" on success
+        """
+        if request.get("version") != self.version:
+            # Plugin upgraded under us: refuse and exit so a fresh daemon starts
+            self._running = False
+            return {"status": "version_mismatch", "version": self.version}
+
+        command = request.get("command")
+
+        if command == "ping":
+            return {"status": "ok", "pid": os.getpid(), "served": self.requests_served}
+
+        if command == "shutdown":
+            self._running = False
+            return {"status": "ok"}
+
+        if command == "run":
+            hook_name = request.get("hook")
+            if hook_name not in self.hook_modules:
+                return {"status": "unknown_hook", "hook": hook_name}
+            return self._run_hook(
+                hook_name,
+                stdin_text=str(request.get("stdin", "")),
+                cwd=str(request.get("cwd") or os.getcwd()),
+                env=request.get("env") or {},
+            )
+
+        return {"status": "unknown_command", "command": command}
+
+    def _handle_connection(self, conn: socket.socket) -> None:
+        """Read one request from a connection and write the response."""
+        try:
+            conn.settimeout(5.0)
+            chunks = []
+            size = 0
+            while True:
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > MAX_REQUEST_BYTES:
+                    raise ValueError(f"Request exceeds {MAX_REQUEST_BYTES} bytes")
+                chunks.append(chunk)
+
+            request = json.loads(b"".join(chunks).decode("utf-8"))
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+
+            response = self.handle_request(request)
+
+        except (OSError, ValueError) as e:
+            response = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+
+        with contextlib.suppress(OSError):
+            conn.sendall(json.dumps(response).encode("utf-8"))
+
+    def _run_hook(
+        self, hook_name: str, stdin_text: str, cwd: str, env: dict[str, str]
+    ) -> dict[str, Any]:
+        """Run a hook's main() with the caller's stdio, cwd and environment.
+
+        Args:
+            hook_name: Registered hook name
+            stdin_text: Raw stdin payload from the hook process
+            cwd: Hook process working directory
+            env: TRIADS_*/CLAUDE_* environment of the hook process
+
+        Returns:
+            Response dict with exit_code, stdout and stderr
+        """
+        try:
+            module = self._load_hook(hook_name)
+        except Exception as e:
+            # Import failure: let the client run in-process and report it there
+            return {"status": "error", "error": f"{type(e).__name__}: {e}"}
+
+        start_time = time.time()
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        exit_code = 0
+
+        saved_cwd = os.getcwd()
+        saved_env = {k: v for k, v in os.environ.items() if k.startswith(FORWARDED_ENV_PREFIXES)}
+        saved_stdin = sys.stdin
+
+        try:
+            os.chdir(cwd)
+            self._apply_env(env)
+            sys.stdin = io.StringIO(stdin_text)
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    module.main()
+                except SystemExit as e:
+                    if e.code is None:
+                        exit_code = 0
+                    elif isinstance(e.code, int):
+                        exit_code = e.code
+                    else:
+                        print(e.code, file=sys.stderr)
+                        exit_code = 1
+                except Exception as e:
+                    # Hooks must never block tools on internal errors
+                    print(f"⚠️  Hook daemon: {hook_name} failed: {e}", file=sys.stderr)
+                    exit_code = 0
+                finally:
+                    self._flush_events()
+        except OSError as e:
+            return {"status": "error", "error": f"{type(e).__name__}: {e}"}
+        finally:
+            sys.stdin = saved_stdin
+            self._apply_env(saved_env)
+            with contextlib.suppress(OSError):
+                os.chdir(saved_cwd)
+
+        self.requests_served += 1
+        logger.debug(
+            "Hook served",
+            extra={
+                "hook": hook_name,
+                "exit_code": exit_code,
+                "duration_ms": (time.time() - start_time) * 1000,
+            },
+        )
+
+        return {
+            "status": "ok",
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _flush_events() -> None:
+        """Write events the hook buffered (hooks flush at exit; the daemon doesn't exit)."""
+        event_capture = sys.modules.get("event_capture_utils")
+        flush = getattr(event_capture, "flush_events", None)
+        if callable(flush):
+            flush()
+
+    def _load_hook(self, hook_name: str) -> ModuleType:
+        """Import (once) and return the module implementing a hook."""
+        if hook_name not in self._modules:
+            module = importlib.import_module(self.hook_modules[hook_name])
+            if not callable(getattr(module, "main", None)):
+                raise AttributeError(f"Hook module for '{hook_name}' has no main()")
+            self._modules[hook_name] = module
+        return self._modules[hook_name]
+
+    def _apply_env(self, env: dict[str, str]) -> None:
+        """Replace TRIADS_*/CLAUDE_* environment with the given values."""
+        for key in [k for k in os.environ if k.startswith(FORWARDED_ENV_PREFIXES)]:
+            if key not in env:
+                del os.environ[key]
+        for key, value in env.items():
+            if isinstance(key, str) and key.startswith(FORWARDED_ENV_PREFIXES):
+                os.environ[key] = str(value)
+
+    def _load_plugin_version(self) -> str:
+        """Read PLUGIN_VERSION from the hooks' constants module."""
+        try:
+            constants = importlib.import_module("constants")
+            return str(getattr(constants, "PLUGIN_VERSION", "unknown"))
+        except ImportError:
+            return "unknown"
+
+    def _socket_is_live(self) -> bool:
+        """Check whether something is accepting connections on socket_path."""
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        probe.settimeout(0.2)
+        try:
+            probe.connect(str(self.socket_path))
+            return True
+        except OSError:
+            return False
+        finally:
+            probe.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point: python -m triads.hooks.daemon."""
+    parser = argparse.ArgumentParser(description="Warm hook daemon for triads hooks")
+    parser.add_argument("--socket", required=True, type=Path, help="Unix socket path")
+    parser.add_argument("--hooks-dir", required=True, type=Path, help="Plugin hooks directory")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT_SECONDS,
+        help="Exit after this many idle seconds",
+    )
+    args = parser.parse_args(argv)
+
+    daemon = HookDaemon(args.socket, args.hooks_dir, idle_timeout=args.idle_timeout)
+    try:
+        daemon.serve_forever()
+    except PermissionError as e:
+        logger.error("Hook daemon not started", extra={"error": str(e)})
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+"""Concurrent execution of hook handlers with dependencies and time budgets.
+
+The Stop hook runs several handlers that mostly touch different state
+(knowledge graphs, pending handoffs, workspace state). Running them one after
+another makes the hook as slow as their sum. HandlerScheduler runs every
+handler as soon as the handlers it depends on have finished, each in its own
+thread, so the hook takes about as long as its slowest dependency chain:
+
+    scheduler = HandlerScheduler()
+    scheduler.add("graph", process_graph, budget_seconds=20)
+    scheduler.add("km", process_km, depends_on=("graph",))   # km(graph_result)
+    scheduler.add("pause", pause_workspace)
+    runs = scheduler.run()
+    runs["km"].status    # "ok" | "error" | "timeout" | "skipped"
+
+Each handler has its own time budget, counted from its start. A handler
+still running when its budget is spent is reported as "timeout" and left
+behind; handlers depending on a failed or timed-out handler are "skipped".
+Handlers run in daemon threads (rather than a ThreadPoolExecutor) so one
+left behind never holds the hook process open at exit. Handlers that write
+shared state should not be cut off mid-write by that exit: join() waits a
+bounded time for them and records how they finished:
+
+    runs = scheduler.run()
+    scheduler.join(timeout=30)   # runs["graph"].status: "timeout" -> "ok"
+
+While run() executes, sys.stderr is routed per thread: what each handler
+prints is kept in its HandlerRun.output instead of interleaving with the
+output of the handlers running alongside it.
+"""
+
+from __future__ import annotations
+
+import io
+import queue
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+DEFAULT_BUDGET_SECONDS = 10.0
+
+
+@dataclass
+class HandlerRun:
+    """Outcome of one handler.
+
+    Attributes:
+        name: Handler name
+        status: "ok", "error", "timeout" or "skipped" ("pending" before run())
+        result: Handler return value (None unless status is "ok")
+        error: Why the handler did not succeed
+        duration_ms: Time from start to finish (or to the end of its budget)
+        output: What the handler wrote to stderr
+    """
+
+    name: str
+    status: str = "pending"
+    result: Any = None
+    error: Optional[str] = None
+    duration_ms: float = 0.0
+    output: str = ""
+
+
+@dataclass
+class _Handler:
+    name: str
+    func: Callable[..., Any]
+    depends_on: tuple[str, ...]
+    budget_seconds: float
+
+
+class _ThreadRoutedStream:
+    """Stand-in for sys.stderr that sends each capturing thread's writes to its buffer."""
+
+    def __init__(self, stream: Any) -> None:
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self) -> io.StringIO:
+        """Buffer the calling thread's writes from now on."""
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, "buffer", None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+class HandlerScheduler:
+    """Run handlers concurrently, respecting declared dependencies.
+
+    Args:
+        default_budget_seconds: Budget for handlers added without one
+    """
+
+    def __init__(self, default_budget_seconds: float = DEFAULT_BUDGET_SECONDS) -> None:
+        """Initialize an empty scheduler.
+
+        Args:
+            default_budget_seconds: Budget for handlers added without one
+        """
+        self.default_budget_seconds = default_budget_seconds
+        self._handlers: dict[str, _Handler] = {}
+        # State of the last run(), for join()
+        self._runs: dict[str, HandlerRun] = {}
+        self._finished: queue.Queue = queue.Queue()
+        self._routed: Optional[_ThreadRoutedStream] = None
+        # Timed-out handler name -> (start, output buffer holder)
+        self._overrun: dict[str, tuple[float, list]] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        depends_on: tuple[str, ...] = (),
+        budget_seconds: Optional[float] = None,
+    ) -> None:
+        """Register a handler.
+
+        Args:
+            name: Unique handler name
+            func: Called with the results of depends_on, in that order
+            depends_on: Handlers that must finish successfully first
+            budget_seconds: Time allowed from start (default: scheduler default)
+
+        Raises:
+            ValueError: If name is taken or a dependency is not yet registered
+        """
+        if name in self._handlers:
+            raise ValueError(f"Handler already registered: {name}")
+        for dependency in depends_on:
+            # Registering dependencies first also rules out cycles
+            if dependency not in self._handlers:
+                raise ValueError(f"Handler {name} depends on unknown handler: {dependency}")
+        if budget_seconds is None:
+            budget_seconds = self.default_budget_seconds
+        self._handlers[name] = _Handler(name, func, tuple(depends_on), budget_seconds)
+
+    def run(self) -> dict[str, HandlerRun]:
+        """Run all handlers and wait until each has finished or spent its budget.
+
+        Returns:
+            Handler name -> HandlerRun, in registration order
+        """
+        runs = {name: HandlerRun(name) for name in self._handlers}
+        pending = list(self._handlers)
+        # Handler name -> (deadline, start, output buffer holder)
+        running: dict[str, tuple[float, float, list]] = {}
+        finished: queue.Queue = queue.Queue()
+
+        stderr = sys.stderr
+        routed = _ThreadRoutedStream(stderr)
+        self._runs, self._finished, self._routed = runs, finished, routed
+        self._overrun = {}
+        sys.stderr = routed
+        try:
+            while True:
+                for name in list(pending):
+                    handler = self._handlers[name]
+                    dependencies = [runs[d] for d in handler.depends_on]
+                    if any(d.status in ("pending", "running") for d in dependencies):
+                        continue
+                    pending.remove(name)
+
+                    failed = [d for d in dependencies if d.status != "ok"]
+                    if failed:
+                        runs[name].status = "skipped"
+                        runs[name].error = f"dependency {failed[0].name} {failed[0].status}"
+                        continue
+
+                    runs[name].status = "running"
+                    args = [d.result for d in dependencies]
+                    start = time.monotonic()
+                    holder: list = []
+                    running[name] = (start + handler.budget_seconds, start, holder)
+                    self._start(handler, args, routed, holder, finished)
+
+                if not running:
+                    break
+
+                next_deadline = min(deadline for deadline, _, _ in running.values())
+                try:
+                    name, result, error = finished.get(
+                        timeout=max(0.0, next_deadline - time.monotonic())
+                    )
+                except queue.Empty:
+                    name = None
+
+                if name in running:
+                    _, start, holder = running.pop(name)
+                    self._record(runs[name], start, holder, result, error)
+
+                now = time.monotonic()
+                for name, (deadline, start, holder) in list(running.items()):
+                    if now >= deadline:
+                        del running[name]
+                        run = runs[name]
+                        run.status = "timeout"
+                        run.error = f"exceeded {self._handlers[name].budget_seconds}s budget"
+                        run.duration_ms = (now - start) * 1000
+                        run.output = holder[0].getvalue() if holder else ""
+                        self._overrun[name] = (start, holder)
+        finally:
+            sys.stderr = stderr
+
+        return runs
+
+    def join(self, timeout: float) -> list[str]:
+        """Wait for handlers the last run() left behind to finish.
+
+        A handler that finishes in time gets its HandlerRun (as returned by
+        run()) updated in place to "ok" or "error". Handlers skipped because
+        of it stay skipped.
+
+        Args:
+            timeout: Seconds to wait in total
+
+        Returns:
+            Names of handlers still running
+        """
+        deadline = time.monotonic() + timeout
+        stderr = sys.stderr
+        if self._routed is not None:
+            sys.stderr = self._routed
+        try:
+            while self._overrun:
+                try:
+                    name, result, error = self._finished.get(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                except queue.Empty:
+                    break
+                if name in self._overrun:
+                    start, holder = self._overrun.pop(name)
+                    self._record(self._runs[name], start, holder, result, error)
+        finally:
+            sys.stderr = stderr
+        return list(self._overrun)
+
+    @staticmethod
+    def _record(
+        run: HandlerRun, start: float, holder: list, result: Any, error: Optional[str]
+    ) -> None:
+        """Fill in run for a handler that finished."""
+        run.duration_ms = (time.monotonic() - start) * 1000
+        run.output = holder[0].getvalue() if holder else ""
+        if error is None:
+            run.status, run.result, run.error = "ok", result, None
+        else:
+            run.status, run.error = "error", error
+
+    @staticmethod
+    def _start(
+        handler: _Handler,
+        args: list,
+        routed: _ThreadRoutedStream,
+        holder: list,
+        finished: queue.Queue,
+    ) -> None:
+        """Start handler in a daemon thread that reports to finished."""
+
+        def runner() -> None:
+            holder.append(routed.capture())
+            try:
+                result = handler.func(*args)
+            except BaseException as e:
+                traceback.print_exc(file=sys.stderr)
+                finished.put((handler.name, None, f"{type(e).__name__}: {e}"))
+            else:
+                finished.put((handler.name, result, None))
+
+        threading.Thread(target=runner, name=f"handler-{handler.name}", daemon=True).start()
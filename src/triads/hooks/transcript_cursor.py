@@ -0,0 +1,211 @@
+"""Incremental reading of Claude Code transcripts for the Stop hook.
+
+The Stop hook fires after every response with the path of the session's
+JSONL transcript. Re-reading the whole transcript each time makes every
+Stop slower than the last and re-dispatches old blocks ([GRAPH_UPDATE],
+[HANDOFF_REQUEST], ...) that were already processed. A cursor per transcript
+remembers how far the previous Stop got:
+
+    .triads/transcript_cursors/<sha1 of transcript path>.json
+        {"path": ..., "inode": ..., "offset": ..., "last_line_length": ...,
+         "last_line_sha256": ..., "lagging": {"<handler>": <offset>, ...}}
+
+read_new() returns only the complete lines appended since the cursor.
+It rescans from the start if the transcript was replaced (new inode),
+truncated (shorter than the cursor), or rewritten (the line before the
+cursor no longer hashes the same). A partially written last line is left
+for the next Stop.
+
+The cursor only advances when commit() is called. Handlers that failed are
+passed to commit() and keep their own, older offset under "lagging":
+entries_for(handler) returns the entries from there, so the next Stop
+retries only the failed handlers on the entries they missed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+from triads.utils.file_operations import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CURSOR_DIR = Path(".triads/transcript_cursors")
+
+# Cursors of transcripts untouched this long are deleted on commit()
+CURSOR_MAX_AGE_SECONDS = 30 * 24 * 3600
+
+
+class TranscriptCursor:
+    """Read position in one transcript, persisted between hook runs.
+
+    Args:
+        transcript_path: The session's JSONL transcript
+        cursor_dir: Directory holding cursor files
+
+    Example:
+        >>> cursor = TranscriptCursor(Path(input_data["transcript_path"]))
+        >>> entries = cursor.read_new()
+        >>> process(entries)
+        >>> cursor.commit()
+
+        >>> cursor.read_new()
+        >>> ok = {name: run(cursor.entries_for(name)) for name in handlers}
+        >>> cursor.commit(failed=[name for name in ok if not ok[name]])
+    """
+
+    def __init__(self, transcript_path: Path, cursor_dir: Path = DEFAULT_CURSOR_DIR) -> None:
+        """Initialize cursor for a transcript.
+
+        Args:
+            transcript_path: The session's JSONL transcript
+            cursor_dir: Directory holding cursor files
+        """
+        self.transcript_path = Path(transcript_path)
+        self.cursor_dir = Path(cursor_dir)
+        key = hashlib.sha1(str(self.transcript_path.resolve()).encode("utf-8")).hexdigest()
+        self.cursor_path = self.cursor_dir / f"{key}.json"
+        self.rescanned = False
+        self._pending: dict[str, Any] | None = None
+        # Cursor file content when it fits the transcript
+        self._saved: dict[str, Any] | None = None
+        # Offsets read from: the cursor, and handlers behind it
+        self._head = 0
+        self._lagging: dict[str, int] = {}
+        # (offset of the line, entry) for every entry read
+        self._entries: list[tuple[int, dict[str, Any]]] = []
+
+    def read_new(self) -> list[dict[str, Any]]:
+        """Entries appended since the last commit (all entries on rescan).
+
+        Returns:
+            Parsed transcript entries in file order (malformed lines skipped)
+
+        Raises:
+            OSError: If the transcript cannot be read
+        """
+        with open(self.transcript_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self._head = self._resume_offset(f, stat)
+            self.rescanned = self._head == 0
+            self._lagging = {}
+            if self._saved is not None:
+                for name, offset in (self._saved.get("lagging") or {}).items():
+                    if isinstance(offset, int) and 0 <= offset <= self._head:
+                        self._lagging[name] = offset
+            start = min([self._head, *self._lagging.values()])
+            f.seek(start)
+            data = f.read()
+
+        # Leave a line still being written for the next run
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].splitlines(keepends=True)
+
+        if start + end > self._head:
+            self._pending = self._state(stat, start + end, lines[-1])
+        elif self._head == 0:
+            self._pending = self._state(stat, 0, b"")
+        else:
+            # Nothing new: keep the current cursor
+            self._pending = None
+
+        self._entries = []
+        offset = start
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except (ValueError, UnicodeDecodeError):
+                entry = None
+            if isinstance(entry, dict):
+                self._entries.append((offset, entry))
+            offset += len(line)
+        return self.entries_for(None)
+
+    def entries_for(self, name: str | None) -> list[dict[str, Any]]:
+        """Entries read by read_new() that a handler has not processed yet.
+
+        Args:
+            name: Handler name (None: entries since the cursor)
+
+        Returns:
+            Entries since the handler's offset if it lags, else since the cursor
+        """
+        start = self._lagging.get(name, self._head) if name is not None else self._head
+        return [entry for offset, entry in self._entries if offset >= start]
+
+    def commit(self, failed: Iterable[str] = ()) -> None:
+        """Persist the position reached by the last read_new().
+
+        Args:
+            failed: Handlers that did not process their entries; they keep
+                their offset and get the same entries again next time
+        """
+        lagging = {name: self._lagging.get(name, self._head) for name in failed}
+        if self._pending is not None:
+            state = dict(self._pending)
+        elif self._saved is not None and lagging != self._lagging:
+            # Only which handlers lag changed
+            state = dict(self._saved)
+        else:
+            return
+        state.pop("lagging", None)
+        if lagging:
+            state["lagging"] = lagging
+
+        try:
+            atomic_write_json(self.cursor_path, state, lock=False, indent=None)
+        except OSError as e:
+            # Only costs a full rescan next time
+            logger.debug(
+                "Failed to save transcript cursor",
+                extra={"file": str(self.cursor_path), "error": str(e)},
+            )
+            return
+        self._pending = None
+        self._saved = state
+        self._lagging = lagging
+        self._prune_stale()
+
+    def _resume_offset(self, f: Any, stat: os.stat_result) -> int:
+        """Offset to continue from, or 0 if the cursor doesn't fit the file."""
+        self._saved = None
+        try:
+            with open(self.cursor_path, "r", encoding="utf-8") as cursor_file:
+                cursor = json.load(cursor_file)
+            offset = int(cursor["offset"])
+            length = int(cursor["last_line_length"])
+            if cursor["inode"] != stat.st_ino or offset > stat.st_size or length > offset:
+                return 0
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
+
+        f.seek(offset - length)
+        if hashlib.sha256(f.read(length)).hexdigest() != cursor.get("last_line_sha256"):
+            return 0
+        self._saved = cursor
+        return offset
+
+    def _state(self, stat: os.stat_result, offset: int, last_line: bytes) -> dict[str, Any]:
+        return {
+            "path": str(self.transcript_path),
+            "inode": stat.st_ino,
+            "offset": offset,
+            "last_line_length": len(last_line),
+            "last_line_sha256": hashlib.sha256(last_line).hexdigest(),
+        }
+
+    def _prune_stale(self) -> None:
+        """Delete cursors of transcripts not read for CURSOR_MAX_AGE_SECONDS."""
+        cutoff = time.time() - CURSOR_MAX_AGE_SECONDS
+        try:
+            for path in self.cursor_dir.glob("*.json"):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+        except OSError:
+            pass
@@ -29,6 +29,7 @@ from pathlib import Path
 from triads.km.confidence import update_confidence, check_deprecation
 from triads.km.graph_access import GraphLoader
 from triads.hooks.safe_io import safe_load_json_file, safe_save_json_file
+from triads.tools.knowledge.wal import GraphWAL
 
 
 # ============================================================================
@@ -61,38 +62,12 @@ def _find_node_by_label_or_id(
     except Exception:
         pass
 
-    # Fall back to label search
-    all_graphs = loader.load_all_graphs()
-
-    if triad:
-        # Search only specified triad
-        if triad not in all_graphs:
-            return None
-        all_graphs = {triad: all_graphs[triad]}
-
-    identifier_lower = identifier.lower()
-    matches = []
-
-    for triad_name, graph_data in all_graphs.items():
-        for node in graph_data.get('nodes', []):
-            # Only search Concept nodes with process_type (knowledge nodes)
-            if node.get('type') != 'Concept' or 'process_type' not in node:
-                continue
-
-            label = node.get('label', '').lower()
-            node_id = node.get('id', '').lower()
-
-            # Exact match on label or ID
-            if label == identifier_lower or node_id == identifier_lower:
-                return (node, triad_name, graph_data)
-
-            # Fuzzy match on label
-            if identifier_lower in label:
-                matches.append((node, triad_name, graph_data))
-
-    # Return best fuzzy match if found
-    if matches:
-        return matches[0]
+    # Fall back to label search (node index: only matching graphs are read)
+    for partial in (False, True):
+        for node, triad_name in loader.find_nodes(identifier, triad=triad, partial=partial):
+            # Only match Concept nodes with process_type (knowledge nodes)
+            if node.get('type') == 'Concept' and 'process_type' in node:
+                return (node, triad_name, loader.load_graph(triad_name))
 
     return None
 
@@ -157,7 +132,8 @@ def validate_lesson(
 
     # Save graph
     graph_file = base_dir / ".claude" / "graphs" / f"{found_triad}_graph.json"
-    safe_save_json_file(graph_file, graph_data)
+    with GraphWAL(graph_file).superseding(graph_data):
+        safe_save_json_file(graph_file, graph_data)
 
     # Format output
     confidence_change = new_confidence - current_confidence
@@ -255,7 +231,8 @@ def contradict_lesson(
 
     # Save graph
     graph_file = base_dir / ".claude" / "graphs" / f"{found_triad}_graph.json"
-    safe_save_json_file(graph_file, graph_data)
+    with GraphWAL(graph_file).superseding(graph_data):
+        safe_save_json_file(graph_file, graph_data)
 
     # Format output
     confidence_change = new_confidence - current_confidence
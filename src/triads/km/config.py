@@ -18,6 +18,11 @@ RELEVANCE_SCORE_LABEL_MATCH = 1.0
 RELEVANCE_SCORE_DESCRIPTION_MATCH = 0.7
 RELEVANCE_SCORE_ID_MATCH = 0.5
 
+# Semantic (hybrid) search
+SEMANTIC_TOP_K = 50  # Vector candidates considered per query
+SEMANTIC_WEIGHT = 0.6  # Share of the hybrid score from cosine similarity
+SEMANTIC_MIN_SIMILARITY = 0.3  # Vector-only matches below this are dropped
+
 # Confidence thresholds
 DEFAULT_MIN_CONFIDENCE = 0.0
 WELL_VERIFIED_THRESHOLD = 0.85
@@ -19,7 +19,8 @@ Performance:
 - Target: P95 < 100ms (called on EVERY tool use)
 - Cached graph loading (load once per session)
 - Early exit on irrelevant tools
-- Simple matching (no regex in hot path)
+- Trigger index (tool names, compiled file globs, keyword automaton) built
+  once per loaded graph set, so only nodes with a fired trigger are scored
 
 Usage:
     engine = ExperienceQueryEngine()
@@ -49,6 +50,15 @@ from pathlib import Path
 from typing import Any
 
 from triads.km.graph_access import GraphLoader
+from triads.km.trigger_index import (
+    ACTION_KEYWORD,
+    CONTEXT_KEYWORD,
+    FILE,
+    TOOL_EXACT,
+    TOOL_WILDCARD,
+    TriggerIndex,
+    possible_triggers,
+)
 
 # Initialize module logger
 logger = logging.getLogger(__name__)
@@ -132,12 +142,13 @@ class ExperienceQueryEngine:
 
     Performance:
         - Target: P95 < 100ms (called on every tool use)
-        - Achieves speed via caching, early exits, simple matching
+        - Achieves speed via caching, early exits and a trigger index
         - Monitors and logs slow queries (> 100ms)
 
     Architecture:
         - Loads all graphs once, caches in memory
         - Filters by process_type (Concept nodes only)
+        - Indexes trigger conditions once per cache (see trigger_index)
         - Calculates relevance using structured scoring
         - Applies priority multipliers for CRITICAL/HIGH items
         - Returns top-N most relevant items
@@ -166,6 +177,10 @@ class ExperienceQueryEngine:
         self._loader = GraphLoader(graphs_dir=graphs_dir)
         self._cache: dict[str, list[dict[str, Any]]] | None = None
         self._graphs_dir = graphs_dir or Path(".claude/graphs")
+        # Trigger index over self._cache (rebuilt if the cache is replaced)
+        self._index: TriggerIndex | None = None
+        self._index_nodes: list[tuple[str, dict[str, Any]]] = []
+        self._index_source: dict[str, list[dict[str, Any]]] | None = None
 
     def query_for_tool_use(
         self,
@@ -230,24 +245,34 @@ class ExperienceQueryEngine:
                     # Invalid path, use as-is
                     pass
 
+            index = self._get_trigger_index()
+
             # Convert tool_input to string for keyword matching
-            tool_input_str = json.dumps(tool_input, default=str).lower()
+            tool_input_str = (
+                json.dumps(tool_input, default=str).lower() if index.needs_text else ""
+            )
 
-            # Calculate relevance for all process knowledge nodes
+            # Score only nodes with a fired trigger (all others score zero),
+            # in cache order so ties sort as before
+            hits = index.match(tool_name, file_path, tool_input_str)
+            unindexed = set(index.unindexed)
             results: list[tuple[dict[str, Any], str, float]] = []
 
-            for triad_name, nodes in self._cache.items():
-                for node in nodes:
+            for position in sorted(hits.keys() | unindexed):
+                triad_name, node = self._index_nodes[position]
+                if position in unindexed:
                     relevance = self._calculate_relevance(
                         node=node,
                         tool_name=tool_name,
                         file_path=file_path,
                         tool_input_str=tool_input_str,
                     )
+                else:
+                    relevance = self._score_triggers(node, hits[position])
 
-                    # Apply threshold
-                    if relevance >= RELEVANCE_THRESHOLD:
-                        results.append((node, triad_name, relevance))
+                # Apply threshold
+                if relevance >= RELEVANCE_THRESHOLD:
+                    results.append((node, triad_name, relevance))
 
             # Sort by priority (CRITICAL first), then by relevance
             results.sort(
@@ -324,6 +349,34 @@ class ExperienceQueryEngine:
 
         return critical_items
 
+    def _get_trigger_index(self) -> TriggerIndex:
+        """Trigger index over the cached nodes, built once per cache.
+
+        Nodes that cannot reach RELEVANCE_THRESHOLD even with every trigger
+        they declare firing are left out.
+
+        Returns:
+            TriggerIndex whose positions refer to self._index_nodes
+        """
+        if self._index is None or self._index_source is not self._cache:
+            self._index_nodes = []
+            for triad_name, nodes in (self._cache or {}).items():
+                for node in nodes:
+                    if self._can_reach_threshold(node):
+                        self._index_nodes.append((triad_name, node))
+            self._index = TriggerIndex([node for _, node in self._index_nodes])
+            self._index_source = self._cache
+        return self._index
+
+    def _can_reach_threshold(self, node: dict[str, Any]) -> bool:
+        """Whether node's best possible score reaches RELEVANCE_THRESHOLD."""
+        try:
+            best = possible_triggers(node.get("trigger_conditions", {}))
+            return self._score_triggers(node, best) >= RELEVANCE_THRESHOLD
+        except (AttributeError, TypeError):
+            # Malformed node: keep it so scoring behaves as without the index
+            return True
+
     def _load_process_knowledge(self) -> dict[str, list[dict[str, Any]]]:
         """Load all process knowledge nodes from all graphs.
 
@@ -389,33 +442,32 @@ class ExperienceQueryEngine:
         """
         trigger_conditions = node.get("trigger_conditions", {})
 
-        base_score = 0.0
+        triggers = 0
 
-        # 1. Tool name matching (40% weight)
+        # 1. Tool name matching
         tool_names = trigger_conditions.get("tool_names", [])
         if tool_name in tool_names:
-            base_score += WEIGHT_TOOL
+            triggers |= TOOL_EXACT
         elif "*" in tool_names or "**" in tool_names:
-            # Wildcard match (lower weight)
-            base_score += WEIGHT_TOOL * 0.5
+            triggers |= TOOL_WILDCARD
 
-        # 2. File pattern matching (40% weight)
+        # 2. File pattern matching
         if file_path:
             file_patterns = trigger_conditions.get("file_patterns", [])
             for pattern in file_patterns:
                 if self._match_file_pattern(file_path, pattern):
-                    base_score += WEIGHT_FILE
+                    triggers |= FILE
                     break  # Only count once
 
-        # 3. Action keywords (10% weight)
+        # 3. Action keywords
         action_keywords = trigger_conditions.get("action_keywords", [])
         if action_keywords and tool_input_str:
             for keyword in action_keywords:
                 if keyword.lower() in tool_input_str:
-                    base_score += WEIGHT_ACTION_KEYWORDS
+                    triggers |= ACTION_KEYWORD
                     break  # Only count once
 
-        # 4. Context keywords (10% weight)
+        # 4. Context keywords
         # Note: In full implementation, this would check recent conversation context
         # For now, check description field as proxy
         context_keywords = trigger_conditions.get("context_keywords", [])
@@ -423,9 +475,42 @@ class ExperienceQueryEngine:
             description = node.get("description", "").lower()
             for keyword in context_keywords:
                 if keyword.lower() in description or keyword.lower() in tool_input_str:
-                    base_score += WEIGHT_CONTEXT_KEYWORDS
+                    triggers |= CONTEXT_KEYWORD
                     break  # Only count once
 
+        return self._score_triggers(node, triggers)
+
+    def _score_triggers(self, node: dict[str, Any], triggers: int) -> float:
+        """Relevance score of a node given which of its triggers fired.
+
+        Args:
+            node: Process knowledge node dictionary
+            triggers: trigger_index flags (TOOL_EXACT, FILE, ...)
+
+        Returns:
+            Relevance score (see _calculate_relevance)
+        """
+        base_score = 0.0
+
+        # 1. Tool name (40% exact, 20% wildcard)
+        if triggers & TOOL_EXACT:
+            base_score += WEIGHT_TOOL
+        elif triggers & TOOL_WILDCARD:
+            # Wildcard match (lower weight)
+            base_score += WEIGHT_TOOL * 0.5
+
+        # 2. File pattern (40%)
+        if triggers & FILE:
+            base_score += WEIGHT_FILE
+
+        # 3. Action keywords (10%)
+        if triggers & ACTION_KEYWORD:
+            base_score += WEIGHT_ACTION_KEYWORDS
+
+        # 4. Context keywords (10%)
+        if triggers & CONTEXT_KEYWORD:
+            base_score += WEIGHT_CONTEXT_KEYWORDS
+
         # 5. Apply priority multiplier
         priority = node.get("priority", "MEDIUM")
         multiplier = PRIORITY_MULTIPLIERS.get(priority, 1.0)
@@ -92,6 +92,7 @@ def search_knowledge(
     triad: str | None = None,
     node_type: str | None = None,
     min_confidence: float | None = None,
+    semantic: bool = False,
 ) -> str:
     """Search knowledge graphs (for /knowledge-search command).
 
@@ -100,6 +101,7 @@ def search_knowledge(
         triad: Optional triad name to limit search
         node_type: Optional node type filter
         min_confidence: Optional minimum confidence (0.0-1.0)
+        semantic: Also rank by embedding similarity (hybrid search)
 
     Returns:
         Markdown formatted search results
@@ -115,11 +117,14 @@ def search_knowledge(
             node_type="Decision",
             min_confidence=0.85
         ))
+
+        # Related wording, not just literal matches
+        print(search_knowledge("token refresh", semantic=True))
     """
     searcher = _get_searcher()
 
     try:
-        results = searcher.search(query, triad, node_type, min_confidence)
+        results = searcher.search(query, triad, node_type, min_confidence, semantic=semantic)
         return _formatter.format_search_results(results, query)
     except GraphNotFoundError as e:
         available_str = ", ".join(sorted(e.available)) if e.available else "none"
@@ -242,12 +247,16 @@ search_knowledge(
     node_type="Decision",     # Filter by type
     min_confidence=0.85       # High confidence only
 )
+
+# Hybrid: also match related wording ("token refresh" -> "OAuth renewal")
+search_knowledge("token refresh", semantic=True)
 ```
 
 **Search Fields:**
 - Node labels (highest priority)
 - Descriptions (medium priority)
 - Node IDs (lowest priority)
+- With `semantic=True`: embedding similarity of label + description
 
 **Output:**
 - Results grouped by triad
@@ -74,15 +74,25 @@ class GraphLoader(_NewFileSystemGraphRepository):
         repo = FileSystemGraphRepository()
     """
 
-    def __init__(self, graphs_dir: Path | None = None, max_backups: int = 5) -> None:
+    def __init__(
+        self,
+        graphs_dir: Path | None = None,
+        max_backups: int = 5,
+        snapshot_cache: bool | None = None,
+    ) -> None:
         """Initialize loader with optional custom graphs directory.
 
         Args:
             graphs_dir: Path to graphs directory. Defaults to .claude/graphs/
             max_backups: Maximum number of backups to keep per graph (default: 5)
+            snapshot_cache: Use parsed-graph snapshots (default: TRIADS_GRAPH_SNAPSHOTS)
         """
         # Initialize parent (FileSystemGraphRepository)
-        super().__init__(graphs_dir=graphs_dir, max_backups=max_backups)
+        super().__init__(
+            graphs_dir=graphs_dir,
+            max_backups=max_backups,
+            snapshot_cache=snapshot_cache,
+        )
 
         # Maintain backward compatibility for _graphs_dir attribute
         self._graphs_dir = self.graphs_dir
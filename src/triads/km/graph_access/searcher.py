@@ -7,16 +7,17 @@ This module handles:
 - Results ranking
 
 Performance:
-- Typical search: < 100ms for 10-100 node graphs
-- Case-insensitive substring matching
-- Results ranked by relevance (label > description > ID)
+- Inverted index per graph (built once, dropped on save_graph)
+- Sub-millisecond lookups for thousands of nodes
+- Results ranked by BM25F score (label > description > ID field weights)
+- Optional hybrid mode merging cosine similarity from the vector index
 """
 
 from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterator
 
 from triads.km import config
 from triads.km.graph_access.loader import GraphLoader, GraphNotFoundError, InvalidTriadNameError
@@ -24,6 +25,13 @@ from triads.km.graph_access.loader import GraphLoader, GraphNotFoundError, Inval
 # Initialize module logger
 logger = logging.getLogger(__name__)
 
+# BM25F field weights; also reported as SearchResult.relevance_score
+_FIELD_WEIGHTS = {
+    "label": config.RELEVANCE_SCORE_LABEL_MATCH,
+    "description": config.RELEVANCE_SCORE_DESCRIPTION_MATCH,
+    "id": config.RELEVANCE_SCORE_ID_MATCH,
+}
+
 
 # ============================================================================
 # Data Classes
@@ -39,9 +47,10 @@ class SearchResult:
     label: str
     node_type: str
     confidence: float
-    matched_field: str  # "label", "description", or "id"
+    matched_field: str  # "label", "description", "id", or "semantic"
     snippet: str  # Context snippet showing the match
-    relevance_score: float  # 0-1, higher = more relevant
+    relevance_score: float  # 0-1, weight of matched_field (similarity for "semantic")
+    score: float = 0.0  # BM25F (or hybrid) ranking score, higher = more relevant
 
 
 # ============================================================================
@@ -52,15 +61,19 @@ class SearchResult:
 class GraphSearcher:
     """Search functionality for knowledge graphs.
 
-    Provides case-insensitive substring search with filtering by:
+    Provides case-insensitive full-text search (AND terms, OR alternatives,
+    prefix matching) over each graph's inverted index, with filtering by:
     - Triad (search specific graph)
     - Node type (Entity, Concept, Decision, etc.)
     - Minimum confidence threshold
 
-    Results are ranked by relevance:
-    - Label matches (highest priority)
-    - Description matches (medium priority)
-    - ID matches (lowest priority)
+    Results are ranked by BM25F score, with fields weighted as:
+    - Label (config.RELEVANCE_SCORE_LABEL_MATCH)
+    - Description (config.RELEVANCE_SCORE_DESCRIPTION_MATCH)
+    - ID (config.RELEVANCE_SCORE_ID_MATCH)
+
+    With semantic=True, nodes are also ranked by embedding similarity of
+    their label and description, so "token refresh" can find "OAuth renewal".
 
     Example:
         searcher = GraphSearcher(loader)
@@ -88,20 +101,29 @@ class GraphSearcher:
         triad: str | None = None,
         node_type: str | None = None,
         min_confidence: float | None = None,
+        semantic: bool = False,
     ) -> list[SearchResult]:
-        """Case-insensitive substring search with filters.
+        """Case-insensitive full-text search with filters.
+
+        Searches in node label, description, and ID fields. Terms are
+        ANDed and matched as prefixes; "OR" separates alternatives.
+        An empty query returns every node passing the filters.
 
-        Searches in node label, description, and ID fields.
-        Results are ranked by relevance and sorted.
+        With semantic=True the score is a hybrid: config.SEMANTIC_WEIGHT of
+        cosine similarity plus the rest of the BM25F score (normalized to the
+        best lexical match). Nodes found only by similarity are included at
+        config.SEMANTIC_MIN_SIMILARITY or above. Falls back to lexical search
+        if sentence-transformers is not installed.
 
         Args:
             query: Search query string (case-insensitive)
             triad: Optional triad name to limit search
             node_type: Optional node type filter (Entity, Concept, etc.)
             min_confidence: Optional minimum confidence threshold (0.0-1.0)
+            semantic: Merge vector similarity into the ranking (hybrid mode)
 
         Returns:
-            List of SearchResult objects, sorted by relevance (highest first)
+            List of SearchResult objects, sorted by score (highest first)
 
         Example:
             # Search all graphs for "OAuth"
@@ -114,8 +136,13 @@ class GraphSearcher:
                 node_type="Decision",
                 min_confidence=0.85
             )
+
+            # Either term
+            results = searcher.search("jwt OR oauth")
+
+            # Related wording too
+            results = searcher.search("token refresh", semantic=True)
         """
-        query_lower = query.lower()
         results: list[SearchResult] = []
 
         # Determine which graphs to search
@@ -144,43 +171,159 @@ class GraphSearcher:
         for triad_name, graph in graphs_to_search.items():
             nodes = graph.get("nodes", [])
 
-            for node in nodes:
-                # Apply filters
-                if node_type and node.get("type") != node_type:
-                    continue
+            for node, score, match_info in self._find_matches(triad_name, nodes, query):
+                result = self._make_result(
+                    triad_name, node, score, match_info, node_type, min_confidence
+                )
+                if result is not None:
+                    results.append(result)
 
-                confidence = self._get_confidence(node)
-                if min_confidence is not None and confidence < min_confidence:
-                    continue
+        if semantic and query:
+            results = self._merge_semantic(
+                results, query, graphs_to_search, node_type, min_confidence
+            )
 
-                # Search in fields
-                node_id = node.get("id", "")
-                label = node.get("label", node_id)
-                description = node.get("description", "")
+        # Sort by score (highest first), then by field relevance and confidence
+        results.sort(key=lambda r: (-r.score, -r.relevance_score, -r.confidence))
+        return results
 
-                # Check for matches
-                match_info = self._find_best_match(
-                    query_lower, node_id, label, description
-                )
+    def _make_result(
+        self,
+        triad: str,
+        node: dict[str, Any],
+        score: float,
+        match_info: tuple[str, str, float],
+        node_type: str | None,
+        min_confidence: float | None,
+    ) -> SearchResult | None:
+        """Build a SearchResult, or None if the node fails the filters."""
+        if node_type and node.get("type") != node_type:
+            return None
+
+        confidence = self._get_confidence(node)
+        if min_confidence is not None and confidence < min_confidence:
+            return None
+
+        node_id = node.get("id", "")
+        matched_field, snippet, relevance = match_info
+        return SearchResult(
+            node_id=node_id,
+            triad=triad,
+            label=node.get("label", node_id),
+            node_type=node.get("type", "Unknown"),
+            confidence=confidence,
+            matched_field=matched_field,
+            snippet=snippet,
+            relevance_score=relevance,
+            score=score,
+        )
 
-                if match_info:
-                    matched_field, snippet, relevance = match_info
-                    results.append(
-                        SearchResult(
-                            node_id=node_id,
-                            triad=triad_name,
-                            label=label,
-                            node_type=node.get("type", "Unknown"),
-                            confidence=confidence,
-                            matched_field=matched_field,
-                            snippet=snippet,
-                            relevance_score=relevance,
-                        )
-                    )
+    def _merge_semantic(
+        self,
+        results: list[SearchResult],
+        query: str,
+        graphs: dict[str, dict[str, Any]],
+        node_type: str | None,
+        min_confidence: float | None,
+    ) -> list[SearchResult]:
+        """Combine lexical results with vector index hits into hybrid scores.
 
-        # Sort by relevance (highest first), then by confidence
-        results.sort(key=lambda r: (-r.relevance_score, -r.confidence))
-        return results
+        Args:
+            results: Lexical results (scores are rescaled in place)
+            query: Raw query string
+            graphs: Searched graphs by triad
+            node_type: Optional node type filter
+            min_confidence: Optional minimum confidence threshold
+
+        Returns:
+            Lexical and vector-only results with hybrid scores
+        """
+        try:
+            hits = self.loader.vector_index().search(
+                query, k=config.SEMANTIC_TOP_K, triads=list(graphs)
+            )
+        except ImportError as e:
+            logger.warning(
+                "Semantic search unavailable, using lexical ranking",
+                extra={"error": str(e)}
+            )
+            return results
+
+        lexical_weight = 1.0 - config.SEMANTIC_WEIGHT
+        best_lexical = max((r.score for r in results), default=0.0) or 1.0
+        merged = {}
+        for result in results:
+            result.score = lexical_weight * result.score / best_lexical
+            merged[(result.triad, result.node_id)] = result
+
+        nodes_by_id: dict[str, dict[str, dict[str, Any]]] = {}
+        for triad, node_id, similarity in hits:
+            result = merged.get((triad, node_id))
+            if result is not None:
+                result.score += config.SEMANTIC_WEIGHT * similarity
+                continue
+            if similarity < config.SEMANTIC_MIN_SIMILARITY:
+                continue
+
+            if triad not in nodes_by_id:
+                nodes_by_id[triad] = {n.get("id"): n for n in graphs[triad].get("nodes", [])}
+            node = nodes_by_id[triad].get(node_id)
+            if node is None:
+                continue
+
+            text = node.get("description") or node.get("label", node_id)
+            max_len = config.SEARCH_SNIPPET_LENGTH_DESCRIPTION
+            snippet = text[:max_len] + ("..." if len(text) > max_len else "")
+            result = self._make_result(
+                triad, node, config.SEMANTIC_WEIGHT * similarity,
+                ("semantic", snippet, similarity), node_type, min_confidence,
+            )
+            if result is not None:
+                merged[(triad, node_id)] = result
+
+        return list(merged.values())
+
+    def _find_matches(
+        self, triad: str, nodes: list[dict[str, Any]], query: str
+    ) -> Iterator[tuple[dict[str, Any], float, tuple[str, str, float]]]:
+        """Yield (node, score, match_info) for nodes matching query.
+
+        Args:
+            triad: Triad name (selects the graph's search index)
+            nodes: The graph's node list
+            query: Raw query string
+
+        Yields:
+            Matching node, its BM25F score, and (field, snippet, relevance)
+        """
+        if not query:
+            for node in nodes:
+                node_id = node.get("id", "")
+                label = node.get("label", node_id)
+                match = self._find_best_match("", node_id, label, node.get("description", ""))
+                yield node, 0.0, match
+            return
+
+        index = self.loader.search_index(triad)
+        if index is None:
+            return
+
+        for hit in index.search(query, _FIELD_WEIGHTS):
+            node = nodes[hit.doc]
+            node_id = node.get("id", "")
+            if hit.matched_field == "label":
+                snippet = self._create_snippet(
+                    node.get("label", node_id), hit.matched_term,
+                    max_len=config.SEARCH_SNIPPET_LENGTH_LABEL,
+                )
+            elif hit.matched_field == "description":
+                snippet = self._create_snippet(
+                    node.get("description", ""), hit.matched_term,
+                    max_len=config.SEARCH_SNIPPET_LENGTH_DESCRIPTION,
+                )
+            else:
+                snippet = node_id
+            yield node, hit.score, (hit.matched_field, snippet, _FIELD_WEIGHTS[hit.matched_field])
 
     def _get_confidence(self, node: dict[str, Any]) -> float:
         """Extract confidence value from node, handling various formats.
@@ -0,0 +1,341 @@
+"""Trigger index for process knowledge lookups.
+
+ExperienceQueryEngine runs on every PreToolUse. Scoring every process
+knowledge node against every call (one fnmatch per file pattern and one
+substring scan of the tool input per keyword) grows linearly with the
+number of lessons. The index is built once per loaded graph set and answers
+"which nodes can this call trigger?" in one pass per trigger kind:
+
+- Tool names: dict of tool name -> nodes, plus the "*"/"**" wildcard nodes
+- File patterns: every distinct glob keyed by its longest literal run; one
+  automaton pass over the path selects the globs whose literal occurs, and
+  only those are matched (as regexes compiled on first use)
+- Keywords: one Aho-Corasick automaton over all action and context keywords,
+  so the tool input is scanned once regardless of the number of keywords
+
+match() reports which triggers fired for each candidate node as bit flags;
+nodes not returned have no trigger that fired and score zero.
+
+Nodes whose trigger_conditions are not in the documented shape (lists of
+strings) are reported in `unindexed` so callers can score them directly.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from collections import deque
+from pathlib import Path
+from typing import Any, Iterable
+
+# Trigger flags reported by TriggerIndex.match()
+TOOL_EXACT = 1
+TOOL_WILDCARD = 2
+FILE = 4
+ACTION_KEYWORD = 8
+CONTEXT_KEYWORD = 16
+
+_TRIGGER_KEYS = ("tool_names", "file_patterns", "action_keywords", "context_keywords")
+
+
+def possible_triggers(trigger_conditions: dict[str, Any]) -> int:
+    """Flags a node's trigger conditions could ever fire (exact tool at best)."""
+    flags = 0
+    if trigger_conditions.get("tool_names"):
+        flags |= TOOL_EXACT
+    if trigger_conditions.get("file_patterns"):
+        flags |= FILE
+    if trigger_conditions.get("action_keywords"):
+        flags |= ACTION_KEYWORD
+    if trigger_conditions.get("context_keywords"):
+        flags |= CONTEXT_KEYWORD
+    return flags
+
+
+def file_pattern_regexes(pattern: str) -> tuple[str | None, str | None]:
+    """Regexes equivalent to ExperienceQueryEngine._match_file_pattern.
+
+    A "**" pattern matches if its suffix (after "**", leading "/" removed)
+    matches the file name or, with "*" prepended, the whole path; a bare
+    "**" suffix matches everything. Any pattern also matches as a plain
+    fnmatch glob against the whole path.
+
+    Args:
+        pattern: Glob pattern (e.g. "**/plugin.json")
+
+    Returns:
+        (file name regex or None, full path regex); both None means the
+        pattern matches every path
+    """
+    pattern = os.path.normcase(pattern)
+    parts = pattern.split("**")
+    path_regexes = []
+    name_regex = None
+
+    if len(parts) == 2:
+        suffix = parts[1].lstrip("/")
+        if not suffix:
+            return None, None
+        name_regex = fnmatch.translate(suffix)
+        path_regexes.append(fnmatch.translate(f"*{suffix}"))
+
+    path_regexes.append(fnmatch.translate(pattern))
+    return name_regex, _alternation(path_regexes)
+
+
+def required_literal(pattern: str) -> str:
+    """Longest wildcard-free run every path matching pattern must contain.
+
+    Taken from the part after "**" when that is what gets matched (see
+    file_pattern_regexes), so it occurs in the path for every kind of match.
+
+    Args:
+        pattern: Glob pattern
+
+    Returns:
+        Literal substring, or "" if none is guaranteed
+    """
+    pattern = os.path.normcase(pattern)
+    parts = pattern.split("**")
+    if len(parts) == 2:
+        pattern = parts[1].lstrip("/")
+    # Ignore everything from the first character class on
+    runs = re.split(r"[*?]", pattern.split("[", 1)[0])
+    return max(runs, key=len)
+
+
+def _alternation(regexes: Iterable[str]) -> str:
+    return "|".join(f"(?:{regex})" for regex in regexes)
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton reporting which keywords occur in a text.
+
+    Example:
+        >>> KeywordAutomaton(["version", "bump version"]).find_all("bump version now")
+        {'version', 'bump version'}
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """Build the automaton.
+
+        Args:
+            keywords: Keywords to find (matched case-sensitively; lowercase
+                both sides for case-insensitive matching)
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        self._count = 0
+
+        for keyword in set(keywords):
+            if keyword:
+                self._insert(keyword)
+                self._count += 1
+        self._link()
+
+    def __len__(self) -> int:
+        """Number of distinct keywords."""
+        return self._count
+
+    def find_all(self, text: str) -> set[str]:
+        """Keywords occurring anywhere in text (one pass over text)."""
+        found: set[str] = set()
+        if not self._count:
+            return found
+
+        goto, fail, out = self._goto, self._fail, self._out
+        root = goto[0]
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0) if state else root.get(char, 0)
+            if out[state]:
+                found.update(out[state])
+                if len(found) == self._count:
+                    break
+        return found
+
+    def _insert(self, keyword: str) -> None:
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[state][char] = next_state
+            state = next_state
+        self._out[state] = (keyword,)
+
+    def _link(self) -> None:
+        """Set failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+
+class TriggerIndex:
+    """Trigger lookup over a list of process knowledge nodes.
+
+    Args:
+        nodes: Process knowledge nodes; results refer to positions in this list
+
+    Example:
+        >>> index = TriggerIndex(nodes)
+        >>> index.match("Write", "/repo/plugin.json", '{"file_path": ...}')
+        {3: 5, 7: 2}   # node 3: exact tool + file, node 7: wildcard tool
+    """
+
+    def __init__(self, nodes: list[dict[str, Any]]) -> None:
+        """Index the trigger conditions of nodes.
+
+        Args:
+            nodes: Process knowledge nodes
+        """
+        self.unindexed: list[int] = []
+        self._tools: dict[str, list[int]] = {}
+        self._wildcard_tools: list[int] = []
+        self._patterns: dict[str, list[int]] = {}
+        self._action_keywords: dict[str, list[int]] = {}
+        self._context_keywords: dict[str, list[int]] = {}
+        # Nodes whose keyword trigger always fires ("" keyword, or a context
+        # keyword found in their own description)
+        self._static: dict[int, int] = {}
+
+        for position, node in enumerate(nodes):
+            if not self._add(position, node):
+                self.unindexed.append(position)
+
+        self._keywords = KeywordAutomaton(
+            list(self._action_keywords) + list(self._context_keywords)
+        )
+        self._compile_patterns()
+
+    @property
+    def needs_text(self) -> bool:
+        """Whether match() uses the tool input text (keywords or unindexed nodes)."""
+        return bool(len(self._keywords) or self.unindexed)
+
+    def match(self, tool_name: str, file_path: str, text: str) -> dict[int, int]:
+        """Nodes with at least one fired trigger.
+
+        Args:
+            tool_name: Tool being executed
+            file_path: Normalized file path ("" if none)
+            text: Lowercased tool input text for keyword matching
+
+        Returns:
+            Node position -> trigger flags (TOOL_EXACT, FILE, ...)
+        """
+        hits = dict(self._static)
+
+        for position in self._tools.get(tool_name, ()):
+            hits[position] = hits.get(position, 0) | TOOL_EXACT
+        for position in self._wildcard_tools:
+            hits[position] = hits.get(position, 0) | TOOL_WILDCARD
+
+        if file_path:
+            for position in self._match_file(file_path):
+                hits[position] = hits.get(position, 0) | FILE
+
+        if text:
+            for keyword in self._keywords.find_all(text):
+                for position in self._action_keywords.get(keyword, ()):
+                    hits[position] = hits.get(position, 0) | ACTION_KEYWORD
+                for position in self._context_keywords.get(keyword, ()):
+                    hits[position] = hits.get(position, 0) | CONTEXT_KEYWORD
+
+        return hits
+
+    def _add(self, position: int, node: dict[str, Any]) -> bool:
+        """Index one node; False if its triggers are not lists of strings."""
+        triggers = node.get("trigger_conditions", {})
+        if not isinstance(triggers, dict):
+            return False
+        values = {key: triggers.get(key, []) for key in _TRIGGER_KEYS}
+        for value in values.values():
+            if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+                return False
+        description = node.get("description", "")
+        if values["context_keywords"] and not isinstance(description, str):
+            return False
+
+        tool_names = values["tool_names"]
+        for tool in set(tool_names):
+            self._tools.setdefault(tool, []).append(position)
+        if "*" in tool_names or "**" in tool_names:
+            self._wildcard_tools.append(position)
+
+        for pattern in set(values["file_patterns"]):
+            self._patterns.setdefault(pattern, []).append(position)
+
+        static = 0
+        for keyword in {k.lower() for k in values["action_keywords"]}:
+            if not keyword:
+                static |= ACTION_KEYWORD
+            self._action_keywords.setdefault(keyword, []).append(position)
+
+        description = description.lower()
+        for keyword in {k.lower() for k in values["context_keywords"]}:
+            if keyword in description:
+                static |= CONTEXT_KEYWORD
+            self._context_keywords.setdefault(keyword, []).append(position)
+
+        if static:
+            self._static[position] = static
+        return True
+
+    def _compile_patterns(self) -> None:
+        """Key file patterns by a literal any matching path must contain."""
+        self._by_literal: dict[str, list[str]] = {}
+        self._unkeyed: list[str] = []
+        self._regexes: dict[str, tuple[re.Pattern | None, re.Pattern | None]] = {}
+
+        for pattern in self._patterns:
+            literal = required_literal(pattern)
+            if literal:
+                self._by_literal.setdefault(literal, []).append(pattern)
+            else:
+                self._unkeyed.append(pattern)
+
+        self._literals = KeywordAutomaton(self._by_literal)
+
+    def _match_file(self, file_path: str) -> list[int]:
+        """Positions of nodes with a file pattern matching file_path."""
+        path = os.path.normcase(file_path)
+        name = os.path.normcase(Path(file_path).name)
+
+        candidates = list(self._unkeyed)
+        for literal in self._literals.find_all(path):
+            candidates.extend(self._by_literal[literal])
+
+        positions = []
+        for pattern in candidates:
+            regexes = self._regexes.get(pattern)
+            if regexes is None:
+                name_regex, path_regex = file_pattern_regexes(pattern)
+                regexes = (
+                    re.compile(name_regex) if name_regex else None,
+                    re.compile(path_regex) if path_regex else None,
+                )
+                self._regexes[pattern] = regexes
+            name_regex, path_regex = regexes
+            if (
+                path_regex is None
+                or (name_regex is not None and name_regex.match(name))
+                or path_regex.match(path)
+            ):
+                positions.extend(self._patterns[pattern])
+        return positions
@@ -14,9 +14,12 @@ Reference: ADR-001 (.claude/graphs/adr_001_claude_code_headless_20251028.md)
 import json
 import logging
 import subprocess
+import time
 from pathlib import Path
 from typing import Dict, Any
 
+from triads.discovery_cache import DiscoveryCache, compute_fingerprint
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -380,7 +383,8 @@ def _keyword_fallback(
 def discover_context(
     user_input: str,
     skills_dir: Path,
-    timeout: int = 10
+    timeout: int = 10,
+    use_cache: bool = True
 ) -> Dict[str, Any]:
     """Universal context discovery for ALL user messages (v0.13.0).
 
@@ -398,6 +402,9 @@ def discover_context(
         user_input: User's message (question or work request)
         skills_dir: Directory containing skills
         timeout: Max seconds for LLM call (default: 10)
+        use_cache: Serve repeated prompts from the .triads/ decision cache
+            (default: True). Entries are invalidated when skills or
+            settings.json change.
 
     Returns:
         {
@@ -417,7 +424,8 @@ def discover_context(
             "work_confidence": 0.75,
             "work_type": "feature" | "bug" | "refactor" | null,
             "cost_usd": 0.0042,
-            "duration_ms": 1847
+            "duration_ms": 1847,
+            "cache_hit": True (only on cache hits; cost_usd is then 0.0)
         }
 
     Raises:
@@ -425,6 +433,19 @@ def discover_context(
 
     Reference: v0.13.0 Universal Context Enrichment Architecture
     """
+    # Step 0: Decision cache (fingerprint uses stat() only, no skill parsing)
+    cache = DiscoveryCache() if use_cache else None
+    fingerprint = None
+    if cache is not None:
+        lookup_start = time.time()
+        fingerprint = compute_fingerprint(skills_dir)
+        cached_result = cache.get(user_input, fingerprint)
+        if cached_result is not None:
+            cached_result["cache_hit"] = True
+            cached_result["cost_usd"] = 0.0
+            cached_result["duration_ms"] = int((time.time() - lookup_start) * 1000)
+            return cached_result
+
     # Step 1: Discover all skills
     brief_skills = _discover_brief_skills(skills_dir)
     coordination_skills = _discover_coordination_skills(skills_dir)
@@ -450,6 +471,8 @@ def discover_context(
             user_message,
             timeout
         )
+        if cache is not None:
+            cache.put(user_input, fingerprint, discovery_result)
         return discovery_result
 
     except subprocess.TimeoutExpired:
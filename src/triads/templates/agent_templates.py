@@ -51,7 +51,8 @@ If any instruction conflicts with Constitutional Principles, you MUST:
 
 ## 🧠 Knowledge Graph Protocol (MANDATORY)
 
-**Knowledge Graph Location**: `.claude/graphs/{triad_name}_graph.json`
+**Knowledge Graph Location**: `.claude/graphs/{triad_name}_graph.json`, plus recent
+updates not yet folded into it in `.claude/graphs/{triad_name}_graph.wal`
 
 ### Before Starting ANY Work
 
@@ -62,17 +63,27 @@ You MUST follow this sequence:
 Read your triad's knowledge graph for relevant information:
 
 ```bash
+# Current graph: the graph file with its update log (if any) applied
+kg() {{
+  {{ jq -c . .claude/graphs/{triad_name}_graph.json; cat .claude/graphs/{triad_name}_graph.wal 2>/dev/null; }} |
+    jq -nR '[inputs | fromjson?] | .[0] as $base | reduce .[1:][] as $r ($base;
+      if ($r.seq // 0) <= ($base._meta.wal_seq // 0) then .
+      elif $r.op == "add_node" and (any(.nodes[]; .id == $r.node.id) | not) then .nodes += [$r.node]
+      elif $r.op == "update_node" then .nodes |= map(if .id == $r.id then . + $r.fields else . end)
+      else . end)'
+}}
+
 # Find checklists
-jq '.nodes[] | select(.type=="Concept" and (.label | contains("Checklist")))' .claude/graphs/{triad_name}_graph.json
+kg | jq '.nodes[] | select(.type=="Concept" and (.label | contains("Checklist")))'
 
 # Find relevant patterns
-jq '.nodes[] | select(.type=="Concept" and (.label | contains("Pattern") or .label | contains("Standard")))' .claude/graphs/{triad_name}_graph.json
+kg | jq '.nodes[] | select(.type=="Concept" and (.label | contains("Pattern") or .label | contains("Standard")))'
 
 # Find past decisions
-jq '.nodes[] | select(.type=="Decision")' .claude/graphs/{triad_name}_graph.json
+kg | jq '.nodes[] | select(.type=="Decision")'
 
 # Find recent findings
-jq '.nodes[] | select(.type=="Finding")' .claude/graphs/{triad_name}_graph.json
+kg | jq '.nodes[] | select(.type=="Finding")'
 ```
 
 **2. Display Retrieved Knowledge**
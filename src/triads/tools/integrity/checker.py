@@ -17,6 +17,7 @@ from typing import Any
 
 from triads.tools.knowledge.backup import BackupManager
 from triads.tools.knowledge.validation import ValidationError, validate_graph
+from triads.tools.knowledge.wal import GraphWAL
 
 logger = logging.getLogger(__name__)
 
@@ -125,7 +126,7 @@ class IntegrityChecker:
         return self.graphs_dir / f"{triad}_graph.json"
 
     def _load_graph(self, triad: str) -> dict[str, Any] | None:
-        """Load graph data from file.
+        """Load graph data from file, with its update log applied.
 
         Args:
             triad: Triad name
@@ -140,7 +141,7 @@ class IntegrityChecker:
 
         try:
             with open(graph_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+                return GraphWAL(graph_file).fold(json.load(f))
         except (json.JSONDecodeError, OSError, IOError) as e:
             logger.error(
                 f"Failed to load graph: {type(e).__name__}",
@@ -151,6 +152,10 @@ class IntegrityChecker:
     def _save_graph(self, triad: str, graph_data: dict[str, Any]) -> bool:
         """Save graph data to file.
 
+        graph_data comes from _load_graph, so its _meta.wal_seq marks the
+        log records it already holds; later folds skip those and apply only
+        records appended since.
+
         Args:
             triad: Triad name
             graph_data: Graph data to save
@@ -2,28 +2,101 @@
 
 Provides automatic backup before writes and auto-restore on failure.
 Moved from triads.km.backup_manager as part of DDD refactoring.
+
+Backups are content-addressed: a graph file is split into line-aligned,
+content-defined chunks stored once (zlib-compressed, named by SHA-256), and
+each backup is a small manifest listing its chunks:
+
+    .claude/graphs/backups/design_graph_20251119_120000_000000.json.backup
+    .claude/graphs/backups/objects/3f/3fa2...          # shared chunks
+
+Chunk boundaries depend only on nearby content, so a save that touches a
+few nodes adds only the chunks around them, and a save identical to the
+latest backup adds only its manifest. Restores rebuild the exact original bytes.
+Backups written as full copies by older versions are still readable.
+
+A graph with pending records in its update log (<triad>_graph.wal, see
+wal.py) is backed up with the log applied, so a backup always holds the
+graph as readers saw it.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-import shutil
+import os
+import time
+import zlib
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from triads.tools.knowledge.wal import GraphWAL
+
 logger = logging.getLogger(__name__)
 
+# Marks a backup file as a chunk manifest (older backups are full copies)
+MANIFEST_FORMAT = "triads-chunked-backup/1"
+
+# A line ends a chunk when its CRC matches this mask (~1 in 256 lines)...
+_BOUNDARY_MASK = 0xFF
+
+# ...once the chunk holds at least this many bytes; chunks never exceed the max
+_MIN_CHUNK_BYTES = 4 * 1024
+_MAX_CHUNK_BYTES = 256 * 1024
+
+
+def split_chunks(data: bytes) -> list[bytes]:
+    """Split data into content-defined, line-aligned chunks.
+
+    Args:
+        data: File content
+
+    Returns:
+        Chunks whose concatenation is data
+    """
+    chunks = []
+    start = 0
+    end = 0
+    for line in data.splitlines(keepends=True):
+        end += len(line)
+        size = end - start
+        if size >= _MAX_CHUNK_BYTES or (
+            size >= _MIN_CHUNK_BYTES and zlib.crc32(line) & _BOUNDARY_MASK == 0
+        ):
+            chunks.append(data[start:end])
+            start = end
+    if start < len(data):
+        chunks.append(data[start:])
+    return chunks
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write bytes via temp file + fsync + rename."""
+    temp = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        with open(temp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, path)
+    except BaseException:
+        try:
+            temp.unlink()
+        except OSError:
+            pass
+        raise
+
 
 class BackupManager:
     """Manage backups and recovery for knowledge graphs.
 
     Features:
         - Auto-backup before writes
-        - Timestamped backup files
-        - Rotation (keep last N backups)
-        - Auto-restore on failure
+        - Timestamped backup manifests over deduplicated chunks
+        - Rotation (keep last N backups), unreferenced chunks collected
+        - Auto-restore on failure (byte-exact)
 
     Example:
         backup_mgr = BackupManager(graphs_dir=Path(".claude/graphs"), max_backups=5)
@@ -31,6 +104,10 @@ class BackupManager:
         backup_mgr.restore_backup("design", backups[0])
     """
 
+    # Unreferenced chunks younger than this survive pruning: a concurrent
+    # create_backup may have stored them but not yet written its manifest
+    GC_GRACE_SECONDS = 300
+
     def __init__(self, graphs_dir: Path | str, max_backups: int = 5) -> None:
         """Initialize backup manager.
 
@@ -41,13 +118,16 @@ class BackupManager:
         self.graphs_dir = Path(graphs_dir)
         self.max_backups = max_backups
         self.backups_dir = self.graphs_dir / "backups"
+        self.objects_dir = self.backups_dir / "objects"
         self._config_file = self.backups_dir / ".backup_config.json"
 
         # Save config
         self._save_config()
 
     def _save_config(self) -> None:
-        """Save backup configuration to file."""
+        """Save backup configuration to file (only if it changed)."""
+        if self._config_file.exists() and self.load_config(self.graphs_dir) == self.max_backups:
+            return
         try:
             self.backups_dir.mkdir(parents=True, exist_ok=True)
             with open(self._config_file, "w", encoding="utf-8") as f:
@@ -92,9 +172,12 @@ class BackupManager:
     def create_backup(self, triad: str) -> Path | None:
         """Create a timestamped backup of a graph file.
 
-        Creates backup in .claude/graphs/backups/ with format:
+        Creates a manifest in .claude/graphs/backups/ with format:
         {triad}_graph_YYYYMMDD_HHMMSS_microseconds.json.backup
 
+        and stores chunks not already present. If the graph is unchanged since
+        the latest backup, the new manifest reuses its chunk list as is.
+
         Args:
             triad: Triad name
 
@@ -110,14 +193,30 @@ class BackupManager:
             )
             return None
 
-        self.backups_dir.mkdir(parents=True, exist_ok=True)
-
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         backup_name = f"{triad}_graph_{timestamp}.json.backup"
         backup_path = self.backups_dir / backup_name
 
         try:
-            shutil.copy2(graph_file, backup_path)
+            data = self._with_log_applied(graph_file, graph_file.read_bytes())
+            digest = hashlib.sha256(data).hexdigest()
+
+            # Identical consecutive states share every chunk: skip chunking
+            backups = self.list_backups(triad)
+            latest = self._read_manifest(self.backups_dir / backups[0]) if backups else None
+            if latest is not None and latest["sha256"] == digest:
+                chunks = latest["chunks"]
+            else:
+                chunks = [self._store_chunk(chunk) for chunk in split_chunks(data)]
+            manifest = {
+                "format": MANIFEST_FORMAT,
+                "triad": triad,
+                "size": len(data),
+                "sha256": digest,
+                "chunks": chunks,
+            }
+            self.backups_dir.mkdir(parents=True, exist_ok=True)
+            _write_bytes_atomic(backup_path, json.dumps(manifest).encode("utf-8"))
             logger.info(
                 "Created backup",
                 extra={"triad": triad, "backup": backup_name}
@@ -131,6 +230,29 @@ class BackupManager:
             )
             return None
 
+    @staticmethod
+    def _with_log_applied(graph_file: Path, data: bytes) -> bytes:
+        """Graph file content with its update log folded in (as is without a log)."""
+        wal = GraphWAL(graph_file)
+        if not wal.wal_path.exists():
+            return data
+
+        try:
+            graph = json.loads(data)
+        except ValueError:
+            # Back up a corrupt base as it is
+            return data
+        if not isinstance(graph, dict):
+            return data
+
+        folded_seq = (graph.get("_meta") or {}).get("wal_seq", 0)
+        wal.fold(graph)
+        if graph.get("_meta", {}).get("wal_seq", 0) == folded_seq:
+            return data
+        # Same layout as atomic_write_json(indent=2), so a later compaction of
+        # the same state shares this backup's chunks
+        return json.dumps(graph, indent=2).encode("utf-8")
+
     def list_backups(self, triad: str) -> list[str]:
         """List all backups for a triad graph.
 
@@ -166,14 +288,8 @@ class BackupManager:
             FileNotFoundError: If backup doesn't exist
             json.JSONDecodeError: If backup is corrupted
         """
-        backup_path = self.backups_dir / backup_name
-
-        if not backup_path.exists():
-            raise FileNotFoundError(f"Backup not found: {backup_name}")
-
         try:
-            with open(backup_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return json.loads(self.read_backup_bytes(backup_name))
         except json.JSONDecodeError as e:
             logger.error(
                 "Corrupted backup file",
@@ -181,9 +297,39 @@ class BackupManager:
             )
             raise
 
+    def read_backup_bytes(self, backup_name: str) -> bytes:
+        """Rebuild the exact graph file content stored in a backup.
+
+        Args:
+            backup_name: Backup filename
+
+        Returns:
+            Original file bytes
+
+        Raises:
+            FileNotFoundError: If the backup or one of its chunks is missing
+            ValueError: If a chunk or the rebuilt content fails verification
+        """
+        backup_path = self.backups_dir / backup_name
+
+        if not backup_path.exists():
+            raise FileNotFoundError(f"Backup not found: {backup_name}")
+
+        manifest = self._read_manifest(backup_path)
+        if manifest is None:
+            # Full copy written before chunked backups
+            return backup_path.read_bytes()
+
+        data = b"".join(self._load_chunk(digest) for digest in manifest["chunks"])
+        if hashlib.sha256(data).hexdigest() != manifest["sha256"]:
+            raise ValueError(f"Backup content does not match its checksum: {backup_name}")
+        return data
+
     def restore_backup(self, triad: str, backup_name: str) -> bool:
         """Restore a graph from a backup.
 
+        The graph file is replaced atomically with the backup's exact bytes.
+
         Args:
             triad: Triad name
             backup_name: Backup filename to restore from
@@ -192,11 +338,11 @@ class BackupManager:
             True on success, False on failure
         """
         try:
-            backup_data = self.load_backup(triad, backup_name)
+            data = self.read_backup_bytes(backup_name)
+            # Refuse to "restore" a backup that is not a graph
+            json.loads(data)
 
-            graph_file = self._get_graph_file(triad)
-            with open(graph_file, "w", encoding="utf-8") as f:
-                json.dump(backup_data, f, indent=2)
+            _write_bytes_atomic(self._get_graph_file(triad), data)
 
             logger.info(
                 "Restored graph from backup",
@@ -204,7 +350,7 @@ class BackupManager:
             )
             return True
 
-        except (FileNotFoundError, json.JSONDecodeError, OSError, IOError) as e:
+        except (FileNotFoundError, ValueError, OSError, IOError) as e:
             logger.error(
                 f"Failed to restore backup: {type(e).__name__}",
                 extra={"triad": triad, "backup": backup_name, "error": str(e)}
@@ -234,6 +380,8 @@ class BackupManager:
     def prune_backups(self, triad: str, keep: int) -> None:
         """Prune old backups, keeping only newest N.
 
+        Chunks no longer referenced by any backup are then deleted.
+
         Args:
             triad: Triad name
             keep: Number of backups to keep
@@ -255,6 +403,80 @@ class BackupManager:
                         f"Failed to delete backup: {type(e).__name__}",
                         extra={"triad": triad, "backup": backup_name, "error": str(e)}
                     )
+            self.collect_garbage()
+
+    def collect_garbage(self) -> int:
+        """Delete chunks not referenced by any backup manifest.
+
+        Chunks modified within GC_GRACE_SECONDS are kept.
+
+        Returns:
+            Number of chunks deleted
+        """
+        if not self.objects_dir.exists():
+            return 0
+
+        referenced: set[str] = set()
+        for backup_path in self.backups_dir.glob("*_graph_*.json.backup"):
+            manifest = self._read_manifest(backup_path)
+            if manifest is not None:
+                referenced.update(manifest["chunks"])
+
+        cutoff = time.time() - self.GC_GRACE_SECONDS
+        deleted = 0
+        for chunk_path in self.objects_dir.glob("*/*"):
+            if chunk_path.name in referenced:
+                continue
+            try:
+                if chunk_path.stat().st_mtime <= cutoff:
+                    chunk_path.unlink()
+                    deleted += 1
+            except OSError:
+                pass
+        return deleted
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _store_chunk(self, chunk: bytes) -> str:
+        """Store a chunk unless present; returns its SHA-256."""
+        digest = hashlib.sha256(chunk).hexdigest()
+        chunk_path = self._chunk_path(digest)
+        if chunk_path.exists():
+            # Refresh mtime so a concurrent collect_garbage() keeps it
+            os.utime(chunk_path)
+            return digest
+        chunk_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_bytes_atomic(chunk_path, zlib.compress(chunk))
+        return digest
+
+    def _load_chunk(self, digest: str) -> bytes:
+        """Read and verify one chunk."""
+        try:
+            chunk = zlib.decompress(self._chunk_path(digest).read_bytes())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Backup chunk missing: {digest}") from None
+        except zlib.error as e:
+            raise ValueError(f"Backup chunk corrupted: {digest}") from e
+        if hashlib.sha256(chunk).hexdigest() != digest:
+            raise ValueError(f"Backup chunk corrupted: {digest}")
+        return chunk
+
+    @staticmethod
+    def _read_manifest(backup_path: Path) -> dict[str, Any] | None:
+        """Manifest of a chunked backup, or None for full-copy/unreadable files."""
+        try:
+            with open(backup_path, "rb") as f:
+                head = f.read(len(MANIFEST_FORMAT) + 32)
+                # Skip parsing full-copy backups (graph JSON) entirely
+                if MANIFEST_FORMAT.encode("utf-8") not in head:
+                    return None
+                manifest = json.loads(head + f.read())
+        except (OSError, ValueError):
+            return None
+        if isinstance(manifest, dict) and manifest.get("format") == MANIFEST_FORMAT:
+            return manifest
+        return None
 
     def get_backup_info(self, triad: str, backup_name: str) -> dict[str, Any]:
         """Get metadata about a backup.
@@ -279,12 +501,13 @@ class BackupManager:
         else:
             timestamp = "unknown"
 
-        size_bytes = backup_path.stat().st_size
+        manifest = self._read_manifest(backup_path)
+        size_bytes = manifest["size"] if manifest is not None else backup_path.stat().st_size
 
         try:
             backup_data = self.load_backup(triad, backup_name)
             nodes_count = len(backup_data.get("nodes", []))
-        except (json.JSONDecodeError, OSError):
+        except (ValueError, OSError):
             nodes_count = None
 
         return {
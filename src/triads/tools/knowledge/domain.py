@@ -1,18 +1,65 @@
 """Domain models for knowledge tools.
 
 Provides Node, Edge, and KnowledgeGraph domain models with business logic.
+
+Node and Edge use __slots__, and Node.metadata built from graph JSON is a
+NodeMetadata view over the node's dict rather than a copy, so large graphs
+cost one small object per node.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional
+
+from triads.tools.knowledge.search_index import NodeSearchIndex
 
 logger = logging.getLogger(__name__)
 
+# BM25F field weights for KnowledgeGraph.search()
+SEARCH_FIELD_WEIGHTS = {"label": 1.0, "content": 0.7}
+
+# Node JSON fields mapped to Node attributes (everything else is metadata)
+NODE_FIELDS = frozenset(
+    {"id", "label", "type", "confidence", "content", "description", "evidence"}
+)
+
+
+class NodeMetadata(Mapping):
+    """Read-only view of a node dict's fields outside NODE_FIELDS.
+
+    Reads through to the underlying graph data, so building a Node copies
+    nothing.
+
+    Example:
+        >>> meta = NodeMetadata({"id": "n1", "label": "N", "created_by": "qa"})
+        >>> dict(meta)
+        {'created_by': 'qa'}
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        if key in NODE_FIELDS:
+            raise KeyError(key)
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self._data if key not in NODE_FIELDS)
 
-@dataclass(frozen=True)
+    def __len__(self) -> int:
+        return sum(1 for key in self._data if key not in NODE_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"NodeMetadata({dict(self)!r})"
+
+
+@dataclass(frozen=True, slots=True)
 class Node:
     """Knowledge graph node.
 
@@ -25,7 +72,8 @@ class Node:
         confidence: Confidence score (0.0-1.0)
         content: Optional node content/description
         evidence: Optional list of evidence sources
-        metadata: Optional metadata dictionary
+        metadata: Optional metadata mapping (a NodeMetadata view when loaded
+            from graph JSON)
     """
 
     id: str
@@ -34,10 +82,10 @@ class Node:
     confidence: float
     content: Optional[str] = None
     evidence: Optional[list[str]] = None
-    metadata: Optional[dict] = None
+    metadata: Optional[Mapping[str, Any]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Edge:
     """Knowledge graph edge.
 
@@ -69,11 +117,16 @@ class KnowledgeGraph:
     triad: str
     nodes: list[Node]
     edges: list[Edge]
+    _index: Optional[tuple[list[Node], NodeSearchIndex]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def search(self, query: str, min_confidence: float = 0.0) -> list[Node]:
         """Search nodes by label/content, filter by confidence.
 
-        Case-insensitive substring search in label and content fields.
+        Case-insensitive full-text search in label and content fields using
+        an inverted index built on first search. Terms are ANDed and matched
+        as prefixes; "OR" separates alternatives.
         Empty query returns all nodes matching confidence filter.
 
         Args:
@@ -81,7 +134,8 @@ class KnowledgeGraph:
             min_confidence: Minimum confidence threshold (0.0-1.0)
 
         Returns:
-            List of matching nodes, sorted by confidence (highest first)
+            List of matching nodes, sorted by BM25F score then confidence
+            (empty query: by confidence, highest first)
 
         Example:
             >>> graph = KnowledgeGraph(triad="design", nodes=[...], edges=[])
@@ -89,31 +143,33 @@ class KnowledgeGraph:
             >>> for node in results:
             ...     print(f"{node.label}: {node.confidence}")
         """
-        query_lower = query.lower()
-        results = []
-
-        for node in self.nodes:
-            # Filter by confidence
-            if node.confidence < min_confidence:
-                continue
-
-            # Empty query = return all (after confidence filter)
-            if not query:
-                results.append(node)
-                continue
-
-            # Search in label and content
-            if query_lower in node.label.lower():
-                results.append(node)
-                continue
-
-            if node.content and query_lower in node.content.lower():
-                results.append(node)
-                continue
-
-        # Sort by confidence (highest first)
-        results.sort(key=lambda n: n.confidence, reverse=True)
-        return results
+        if not query:
+            results = [node for node in self.nodes if node.confidence >= min_confidence]
+            results.sort(key=lambda n: n.confidence, reverse=True)
+            return results
+
+        scored = [
+            (hit.score, self.nodes[hit.doc])
+            for hit in self._search_index().search(query, SEARCH_FIELD_WEIGHTS)
+            if self.nodes[hit.doc].confidence >= min_confidence
+        ]
+        scored.sort(key=lambda item: (-item[0], -item[1].confidence))
+        return [node for _, node in scored]
+
+    def _search_index(self) -> NodeSearchIndex:
+        """Inverted index over node label/content, rebuilt if nodes were replaced."""
+        stale = (
+            self._index is None
+            or self._index[0] is not self.nodes
+            or len(self._index[1]) != len(self.nodes)
+        )
+        if stale:
+            index = NodeSearchIndex.from_nodes(
+                ({"label": node.label, "content": node.content} for node in self.nodes),
+                SEARCH_FIELD_WEIGHTS,
+            )
+            self._index = (self.nodes, index)
+        return self._index[1]
 
     def validate(self) -> tuple[bool, Optional[str]]:
         """Validate graph structure (edges reference valid nodes).
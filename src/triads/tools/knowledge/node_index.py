@@ -0,0 +1,244 @@
+"""Persistent node id and label index across knowledge graphs.
+
+Maps node ids and lowercased labels to (triad, position in graph["nodes"])
+so lookups load only the graphs that contain a match, instead of parsing
+and scanning every graph:
+
+    .claude/graphs/.cache/node_index.json
+
+Each triad's entry records the (mtime_ns, size) of the graph file and its
+update log (*_graph.wal) and is rebuilt when either changes. The index is a
+cache: if it cannot be written the in-memory copy is still used, and callers
+verify positions before use.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from triads.utils.file_operations import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# Bump when the index layout changes
+INDEX_FORMAT_VERSION = 1
+
+
+def graph_signature(graphs_dir: Path, triad: str) -> list[int] | None:
+    """(mtime_ns, size) of a triad's graph file and its update log.
+
+    Args:
+        graphs_dir: Directory containing *_graph.json files
+        triad: Triad name
+
+    Returns:
+        [mtime_ns, size, log mtime_ns, log size], or None if the graph file
+        is missing
+    """
+    try:
+        stat = (graphs_dir / f"{triad}_graph.json").stat()
+    except OSError:
+        return None
+    try:
+        wal_stat = (graphs_dir / f"{triad}_graph.wal").stat()
+        wal_signature = [wal_stat.st_mtime_ns, wal_stat.st_size]
+    except OSError:
+        wal_signature = [0, 0]
+    return [stat.st_mtime_ns, stat.st_size] + wal_signature
+
+
+class NodeIndex:
+    """Id/label -> (triad, position) index, invalidated per graph file.
+
+    Args:
+        graphs_dir: Directory containing *_graph.json files
+        index_path: Index file (defaults to graphs_dir/.cache/node_index.json)
+
+    Example:
+        >>> index = NodeIndex(Path(".claude/graphs"))
+        >>> index.refresh(repo.list_triads(), repo.load_graph)
+        >>> index.find_id("oauth_decision")
+        [('design', 0)]
+    """
+
+    def __init__(self, graphs_dir: Path, index_path: Path | None = None) -> None:
+        """Initialize index for a graphs directory.
+
+        Args:
+            graphs_dir: Directory containing *_graph.json files
+            index_path: Index file location
+        """
+        self.graphs_dir = graphs_dir
+        self.index_path = index_path or graphs_dir / ".cache" / "node_index.json"
+        self._entries: dict[str, dict[str, Any]] | None = None
+        # triad -> {lowercased id: [positions]} (derived, not persisted)
+        self._lower_ids: dict[str, dict[str, list[int]]] = {}
+
+    def refresh(
+        self,
+        triads: Iterable[str],
+        load_graph: Callable[[str], dict[str, Any] | None],
+    ) -> None:
+        """Rebuild entries whose graph file changed and drop removed graphs.
+
+        Args:
+            triads: Triad names currently present
+            load_graph: Callable returning a triad's graph data (or None)
+        """
+        entries = self._load()
+        triads = list(triads)
+        changed = False
+
+        for triad in triads:
+            signature = graph_signature(self.graphs_dir, triad)
+            entry = entries.get(triad)
+            if entry is not None and signature is not None and entry["signature"] == signature:
+                continue
+            entries[triad] = self._build_entry(load_graph(triad), signature)
+            self._lower_ids.pop(triad, None)
+            changed = True
+
+        for triad in set(entries) - set(triads):
+            del entries[triad]
+            self._lower_ids.pop(triad, None)
+            changed = True
+
+        if changed:
+            self._save()
+
+    def invalidate(self, triad: str) -> None:
+        """Force the triad's entry to be rebuilt on the next refresh."""
+        if self._entries is not None and triad in self._entries:
+            self._entries[triad]["signature"] = None
+        self._lower_ids.pop(triad, None)
+
+    def find_id(self, node_id: str, triads: Iterable[str] | None = None) -> list[tuple[str, int]]:
+        """Locations of nodes with exactly this id, in triad order.
+
+        Args:
+            node_id: Node identifier
+            triads: Optional triads to restrict to
+
+        Returns:
+            List of (triad, position)
+        """
+        return [
+            (triad, position)
+            for triad, entry in self._iter_entries(triads)
+            for position in entry["ids"].get(node_id, ())
+        ]
+
+    def find_label_or_id(
+        self, text: str, triads: Iterable[str] | None = None
+    ) -> list[tuple[str, int]]:
+        """Locations of nodes whose lowercased label or id equals text.
+
+        Args:
+            text: Label or id (compared case-insensitively)
+            triads: Optional triads to restrict to
+
+        Returns:
+            List of (triad, position) in triad then node order
+        """
+        key = text.lower()
+        locations = []
+        for triad, entry in self._iter_entries(triads):
+            positions = set(entry["labels"].get(key, ()))
+            positions.update(self._lower_id_map(triad, entry).get(key, ()))
+            locations.extend((triad, position) for position in sorted(positions))
+        return locations
+
+    def find_label_containing(
+        self, text: str, triads: Iterable[str] | None = None
+    ) -> list[tuple[str, int]]:
+        """Locations of nodes whose lowercased label contains text.
+
+        Scans label keys only; no graph data is read.
+
+        Args:
+            text: Substring (compared case-insensitively)
+            triads: Optional triads to restrict to
+
+        Returns:
+            List of (triad, position) in triad then node order
+        """
+        key = text.lower()
+        locations = []
+        for triad, entry in self._iter_entries(triads):
+            positions = sorted(
+                position
+                for label, label_positions in entry["labels"].items()
+                if key in label
+                for position in label_positions
+            )
+            locations.extend((triad, position) for position in positions)
+        return locations
+
+    def _iter_entries(self, triads: Iterable[str] | None):
+        """Yield (triad, entry) in sorted triad order."""
+        entries = self._load()
+        names = sorted(entries) if triads is None else sorted(t for t in triads if t in entries)
+        for triad in names:
+            yield triad, entries[triad]
+
+    def _lower_id_map(self, triad: str, entry: dict[str, Any]) -> dict[str, list[int]]:
+        """Lowercased id -> positions for one triad (built on demand)."""
+        lower_ids = self._lower_ids.get(triad)
+        if lower_ids is None:
+            lower_ids = {}
+            for node_id, positions in entry["ids"].items():
+                lower_ids.setdefault(node_id.lower(), []).extend(positions)
+            self._lower_ids[triad] = lower_ids
+        return lower_ids
+
+    @staticmethod
+    def _build_entry(graph: dict[str, Any] | None, signature: list[int] | None) -> dict[str, Any]:
+        """Index one graph's node ids and labels."""
+        ids: dict[str, list[int]] = {}
+        labels: dict[str, list[int]] = {}
+        nodes = graph.get("nodes", []) if isinstance(graph, dict) else []
+
+        for position, node in enumerate(nodes):
+            if not isinstance(node, dict):
+                continue
+            node_id = node.get("id")
+            if isinstance(node_id, str):
+                ids.setdefault(node_id, []).append(position)
+            label = node.get("label")
+            if isinstance(label, str):
+                labels.setdefault(label.lower(), []).append(position)
+
+        return {"signature": signature, "ids": ids, "labels": labels}
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Entries from memory, else from the index file (empty if unusable)."""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("format") == INDEX_FORMAT_VERSION:
+                self._entries = data.get("graphs", {})
+        except (OSError, ValueError):
+            pass
+        return self._entries
+
+    def _save(self) -> None:
+        """Persist entries; failures only cost a rebuild next session."""
+        try:
+            atomic_write_json(
+                self.index_path,
+                {"format": INDEX_FORMAT_VERSION, "graphs": self._entries},
+                lock=False,
+                indent=None,
+            )
+        except OSError as e:
+            logger.debug(
+                "Failed to persist node index",
+                extra={"file": str(self.index_path), "error": str(e)}
+            )
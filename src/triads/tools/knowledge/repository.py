@@ -1,8 +1,10 @@
 """Repository layer for knowledge tools.
 
-Provides AbstractGraphRepository interface and two implementations:
+Provides AbstractGraphRepository interface and implementations:
 - InMemoryGraphRepository: For testing with seeded data
 - FileSystemGraphRepository: Production implementation with caching, validation, and backup
+- SQLiteGraphRepository (sqlite_repository.py): Indexed SQLite store with
+  JSON import/export
 
 Refactored from triads.km.graph_access.loader.GraphLoader to proper DDD repository pattern.
 """
@@ -11,18 +13,30 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
+import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict
 
 from triads.tools.knowledge.backup import BackupManager
-from triads.tools.knowledge.domain import Node, Edge, KnowledgeGraph
+from triads.tools.knowledge.domain import Node, NodeMetadata, Edge, KnowledgeGraph
+from triads.tools.knowledge.node_index import NodeIndex
+from triads.tools.knowledge.search_index import NodeSearchIndex
+from triads.tools.knowledge.snapshot import GraphSnapshotCache, snapshots_enabled_by_env
 from triads.tools.knowledge.validation import ValidationError, validate_graph
+from triads.tools.knowledge.wal import GraphWAL
 from triads.utils.file_operations import atomic_write_json
 
+if TYPE_CHECKING:
+    from triads.tools.knowledge.vector_index import NodeVectorIndex
+
 logger = logging.getLogger(__name__)
 
+# Node fields covered by FileSystemGraphRepository.search_index()
+SEARCH_FIELDS = ("label", "description", "id")
+
 
 class GraphNotFoundError(Exception):
     """Raised when requested graph doesn't exist."""
@@ -59,6 +73,55 @@ class AmbiguousNodeError(Exception):
         )
 
 
+def _intern(value: Any) -> Any:
+    """sys.intern() strings (values repeated across nodes and edges)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def graph_to_domain(triad: str, data: dict) -> KnowledgeGraph:
+    """Transform graph data from JSON format to domain model.
+
+    Ids, types, relationships and created_by values are interned, and node
+    metadata is a read-only view over the node's dict (not a copy).
+
+    Args:
+        triad: Triad name
+        data: Graph data (NetworkX JSON format)
+
+    Returns:
+        KnowledgeGraph domain model
+    """
+    # Transform nodes
+    nodes = []
+    for node_data in data.get("nodes", []):
+        created_by = node_data.get("created_by")
+        if isinstance(created_by, str):
+            node_data["created_by"] = sys.intern(created_by)
+        node_id = _intern(node_data.get("id", ""))
+        node = Node(
+            id=node_id,
+            label=node_data.get("label", node_id),
+            type=_intern(node_data.get("type", "Unknown")),
+            confidence=float(node_data.get("confidence", 0.0)),
+            content=node_data.get("content") or node_data.get("description"),
+            evidence=node_data.get("evidence"),
+            metadata=NodeMetadata(node_data),
+        )
+        nodes.append(node)
+
+    # Transform edges
+    edges = []
+    for edge_data in data.get("links", []) or data.get("edges", []):
+        edge = Edge(
+            source=_intern(edge_data.get("source", "")),
+            target=_intern(edge_data.get("target", "")),
+            relationship=_intern(edge_data.get("key", "") or edge_data.get("relationship", "")),
+        )
+        edges.append(edge)
+
+    return KnowledgeGraph(triad=triad, nodes=nodes, edges=edges)
+
+
 class AbstractGraphRepository(ABC):
     """Abstract repository for knowledge graphs.
 
@@ -151,6 +214,12 @@ class FileSystemGraphRepository(AbstractGraphRepository):
         - Per-session caching (load once, reuse)
         - Lazy loading (only load when needed)
         - Fast lookups via in-memory cache
+        - Domain models cached per loaded graph (rebuilt when it is saved or reloaded)
+        - Per-graph inverted search index (built on first search, dropped on save)
+        - Persistent node id/label index (see node_index.py) for get_node()
+        - Optional cross-process parsed-graph snapshots (see snapshot.py)
+        - Pending write-ahead log records folded in on load (see wal.py)
+        - Optional semantic vector index over node text (see vector_index.py)
 
     Example:
         >>> from pathlib import Path
@@ -158,16 +227,32 @@ class FileSystemGraphRepository(AbstractGraphRepository):
         >>> graph = repo.get("design")
     """
 
-    def __init__(self, graphs_dir: Path | None = None, max_backups: int = 5) -> None:
+    def __init__(
+        self,
+        graphs_dir: Path | None = None,
+        max_backups: int = 5,
+        snapshot_cache: bool | None = None,
+    ) -> None:
         """Initialize repository with graphs directory.
 
         Args:
             graphs_dir: Path to graphs directory (defaults to .claude/graphs)
             max_backups: Maximum number of backups to keep per graph (default: 5)
+            snapshot_cache: Use parsed-graph snapshots under graphs_dir/.cache
+                (default: enabled by TRIADS_GRAPH_SNAPSHOTS=1)
         """
         self.graphs_dir = graphs_dir or Path(".claude/graphs")
         self._max_backups = max_backups
+        if snapshot_cache is None:
+            snapshot_cache = snapshots_enabled_by_env()
+        self._snapshots = GraphSnapshotCache(self.graphs_dir / ".cache") if snapshot_cache else None
         self._cache: dict[str, dict[str, Any]] = {}
+        # triad -> (graph data it was built from, node count, domain model)
+        self._domain_cache: dict[str, tuple[dict[str, Any], int, KnowledgeGraph]] = {}
+        # triad -> (indexed nodes list, index)
+        self._search_indexes: dict[str, tuple[list, NodeSearchIndex]] = {}
+        self._node_index: NodeIndex | None = None
+        self._vector_index: NodeVectorIndex | None = None
 
     def get(self, triad: str) -> KnowledgeGraph:
         """Get graph by triad name.
@@ -263,9 +348,18 @@ class FileSystemGraphRepository(AbstractGraphRepository):
         if not graph_file.exists():
             return None
 
+        # Pre-parsed snapshot from an earlier process, if the file is unchanged
+        if self._snapshots is not None:
+            graph_data = self._snapshots.load(graph_file)
+            if graph_data is not None:
+                graph_data = GraphWAL(graph_file).fold(graph_data)
+                self._cache[triad] = graph_data
+                return graph_data
+
         try:
             with open(graph_file, "r", encoding="utf-8") as f:
                 graph_data = json.load(f)
+                source_stat = os.fstat(f.fileno())
 
             # Validate basic structure
             if not isinstance(graph_data, dict):
@@ -275,6 +369,11 @@ class FileSystemGraphRepository(AbstractGraphRepository):
                 )
                 return None
 
+            # Snapshot the base file, then apply records appended since
+            if self._snapshots is not None:
+                self._snapshots.store(graph_file, graph_data, source_stat)
+            graph_data = GraphWAL(graph_file).fold(graph_data)
+
             # Cache and return
             self._cache[triad] = graph_data
             return graph_data
@@ -400,11 +499,21 @@ class FileSystemGraphRepository(AbstractGraphRepository):
         backup_mgr = BackupManager(graphs_dir=self.graphs_dir, max_backups=effective_max)
         backup_created = backup_mgr.create_backup(triad)
 
-        # Save using atomic write with file locking
+        # Save using atomic write with file locking; a full write supersedes the update log
         try:
-            atomic_write_json(graph_file, graph_data, lock=True, indent=2)
+            with GraphWAL(graph_file).superseding(graph_data):
+                written = atomic_write_json(graph_file, graph_data, lock=True, indent=2)
+            # Stamp the snapshot with the file just written
+            if self._snapshots is not None:
+                self._snapshots.store(graph_file, graph_data, written)
             # Update cache with new data
             self._cache[triad] = graph_data
+            self._domain_cache.pop(triad, None)
+            self._search_indexes.pop(triad, None)
+            if self._node_index is not None:
+                self._node_index.invalidate(triad)
+            if self._vector_index is not None:
+                self._vector_index.invalidate(triad)
 
             # Prune old backups after successful write
             if backup_created:
@@ -432,6 +541,44 @@ class FileSystemGraphRepository(AbstractGraphRepository):
 
             return False
 
+    def search_index(self, triad: str) -> NodeSearchIndex | None:
+        """Inverted index over a graph's node label, description and id.
+
+        Built from the cached graph on first use and reused until the graph
+        is saved or reloaded. Document ids are positions in graph["nodes"].
+
+        Args:
+            triad: Triad name
+
+        Returns:
+            NodeSearchIndex for the graph, or None if the graph doesn't exist
+
+        Raises:
+            InvalidTriadNameError: If triad name contains invalid characters
+        """
+        graph = self.load_graph(triad)
+        if graph is None:
+            return None
+
+        nodes = graph.get("nodes", [])
+        cached = self._search_indexes.get(triad)
+        if cached is not None and cached[0] is nodes and len(cached[1]) == len(nodes):
+            return cached[1]
+
+        index = NodeSearchIndex.from_nodes(
+            (
+                {
+                    "label": node.get("label", node.get("id")),
+                    "description": node.get("description"),
+                    "id": node.get("id"),
+                }
+                for node in nodes
+            ),
+            SEARCH_FIELDS,
+        )
+        self._search_indexes[triad] = (nodes, index)
+        return index
+
     def get_node(
         self, node_id: str, triad: str | None = None
     ) -> tuple[dict[str, Any], str] | None:
@@ -471,18 +618,11 @@ class FileSystemGraphRepository(AbstractGraphRepository):
             )
             return None
 
-        # Search all triads
-        found_nodes: list[tuple[dict[str, Any], str]] = []
-
-        for triad_name in self.list_triads():
-            graph = self.load_graph(triad_name)
-            if not graph:
-                continue
-
-            nodes = graph.get("nodes", [])
-            for node in nodes:
-                if node.get("id") == node_id:
-                    found_nodes.append((node, triad_name))
+        # Search all triads via the id index (loads only graphs containing the id)
+        found_nodes = self._resolve_locations(
+            lambda index: index.find_id(node_id),
+            lambda node: node.get("id") == node_id,
+        )
 
         if not found_nodes:
             logger.debug(
@@ -502,6 +642,99 @@ class FileSystemGraphRepository(AbstractGraphRepository):
 
         return found_nodes[0]
 
+    def find_nodes(
+        self, identifier: str, triad: str | None = None, partial: bool = False
+    ) -> list[tuple[dict[str, Any], str]]:
+        """Find nodes by label or ID, case-insensitively, using the node index.
+
+        Args:
+            identifier: Label or ID to match
+            triad: Optional triad name to limit search
+            partial: If True, match labels containing identifier instead of
+                labels or IDs equal to it
+
+        Returns:
+            List of (node_dict, triad_name) in triad then node order
+        """
+        key = identifier.lower()
+        triads = [triad] if triad else None
+
+        if partial:
+            return self._resolve_locations(
+                lambda index: index.find_label_containing(key, triads),
+                lambda node: key in str(node.get("label", "")).lower(),
+            )
+        return self._resolve_locations(
+            lambda index: index.find_label_or_id(key, triads),
+            lambda node: key in (str(node.get("label", "")).lower(), str(node.get("id", "")).lower()),
+        )
+
+    def node_index(self) -> NodeIndex:
+        """Node id/label index, refreshed against the current graph files.
+
+        Returns:
+            NodeIndex covering every triad in list_triads()
+        """
+        if self._node_index is None:
+            self._node_index = NodeIndex(self.graphs_dir)
+        self._node_index.refresh(self.list_triads(), self.load_graph)
+        return self._node_index
+
+    def vector_index(
+        self, embed_batch: Callable[[list[str]], Any] | None = None
+    ) -> NodeVectorIndex:
+        """Semantic vector index, refreshed against the current graph files.
+
+        Nodes of changed graphs whose text changed are (re-)embedded, which
+        loads the embedding model on first use.
+
+        Args:
+            embed_batch: Embedding callable used when the index is created
+                (default: RouterEmbedder)
+
+        Returns:
+            NodeVectorIndex covering every triad in list_triads()
+
+        Raises:
+            ImportError: If sentence-transformers is needed but not installed
+        """
+        if self._vector_index is None:
+            # Deferred: numpy is only needed for semantic search
+            from triads.tools.knowledge.vector_index import NodeVectorIndex
+
+            self._vector_index = NodeVectorIndex(self.graphs_dir, embed_batch=embed_batch)
+        self._vector_index.refresh(self.list_triads(), self.load_graph)
+        return self._vector_index
+
+    def _resolve_locations(
+        self,
+        lookup: Callable[[NodeIndex], list[tuple[str, int]]],
+        matches: Callable[[dict[str, Any]], bool],
+    ) -> list[tuple[dict[str, Any], str]]:
+        """Turn index locations into (node, triad) pairs, verifying each one.
+
+        If a location no longer holds a matching node (e.g. a cached graph was
+        replaced in memory), the affected triads are re-indexed once.
+        """
+        for attempt in range(2):
+            index = self.node_index()
+            found = []
+            stale = set()
+
+            for triad_name, position in lookup(index):
+                graph = self.load_graph(triad_name)
+                nodes = graph.get("nodes", []) if graph else []
+                if position < len(nodes) and matches(nodes[position]):
+                    found.append((nodes[position], triad_name))
+                else:
+                    stale.add(triad_name)
+
+            if not stale or attempt:
+                return found
+            for triad_name in stale:
+                index.invalidate(triad_name)
+        return found
+
     def _validate_graph_path(
         self, graph_file: Path, triad: str, operation: str
     ) -> bool:
@@ -556,7 +789,7 @@ class FileSystemGraphRepository(AbstractGraphRepository):
         return bool(re.match(pattern, triad))
 
     def _to_domain(self, triad: str, data: dict) -> KnowledgeGraph:
-        """Transform graph data from JSON format to domain model.
+        """Domain model for a loaded graph, reused while the graph is unchanged.
 
         Args:
             triad: Triad name
@@ -565,32 +798,11 @@ class FileSystemGraphRepository(AbstractGraphRepository):
         Returns:
             KnowledgeGraph domain model
         """
-        # Transform nodes
-        nodes = []
-        for node_data in data.get("nodes", []):
-            node = Node(
-                id=node_data.get("id", ""),
-                label=node_data.get("label", node_data.get("id", "")),
-                type=node_data.get("type", "Unknown"),
-                confidence=float(node_data.get("confidence", 0.0)),
-                content=node_data.get("content") or node_data.get("description"),
-                evidence=node_data.get("evidence"),
-                metadata={
-                    k: v
-                    for k, v in node_data.items()
-                    if k not in ["id", "label", "type", "confidence", "content", "description", "evidence"]
-                },
-            )
-            nodes.append(node)
-
-        # Transform edges
-        edges = []
-        for edge_data in data.get("links", []) or data.get("edges", []):
-            edge = Edge(
-                source=edge_data.get("source", ""),
-                target=edge_data.get("target", ""),
-                relationship=edge_data.get("key", "") or edge_data.get("relationship", ""),
-            )
-            edges.append(edge)
-
-        return KnowledgeGraph(triad=triad, nodes=nodes, edges=edges)
+        nodes = data.get("nodes", [])
+        cached = self._domain_cache.get(triad)
+        if cached is not None and cached[0] is data and cached[1] == len(nodes):
+            return cached[2]
+
+        graph = graph_to_domain(triad, data)
+        self._domain_cache[triad] = (data, len(nodes), graph)
+        return graph
@@ -0,0 +1,248 @@
+"""Inverted full-text index for knowledge graph nodes.
+
+Replaces per-query substring scans over every node with a term -> postings
+lookup. Scoring is BM25F: per-field term frequencies are length-normalized,
+weighted per field at query time, then saturated with BM25's k1.
+
+Query syntax:
+    - Terms are ANDed: "oauth token" matches nodes containing both
+    - OR (or "|") separates alternatives: "jwt OR oauth"
+    - Every term is a prefix: "auth" matches "authentication"
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterable, Mapping
+
+# BM25 term-frequency saturation and length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+OR_OPERATORS = frozenset({"OR", "|"})
+
+# Split on anything that is not a letter or digit (underscores included)
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Lowercase text and split it into alphanumeric tokens."""
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def parse_query(query: str) -> list[list[str]]:
+    """Parse a query into OR-separated groups of ANDed terms.
+
+    Args:
+        query: Raw query string
+
+    Returns:
+        List of term groups (empty if the query has no terms)
+
+    Example:
+        >>> parse_query("OAuth2 tokens OR jwt")
+        [['oauth2', 'tokens'], ['jwt']]
+    """
+    groups: list[list[str]] = []
+    current: list[str] = []
+    for word in query.split():
+        if word in OR_OPERATORS:
+            if current:
+                groups.append(current)
+            current = []
+            continue
+        current.extend(tokenize(word))
+    if current:
+        groups.append(current)
+    return groups
+
+
+@dataclass
+class SearchHit:
+    """A document matched by NodeSearchIndex.search()."""
+
+    doc: int  # Position of the node in the indexed sequence
+    score: float  # BM25F score, higher = more relevant
+    matched_field: str  # Highest-weight field containing every query term
+    matched_term: str  # Query term to center snippets on
+
+
+class NodeSearchIndex:
+    """Inverted index over the text fields of a sequence of nodes.
+
+    Documents are identified by their position in the indexed sequence.
+    Field weights are supplied per query, so one index can serve callers
+    that rank fields differently.
+
+    Args:
+        fields: Names of the indexed text fields
+
+    Example:
+        >>> index = NodeSearchIndex(("label", "description"))
+        >>> index.add(0, {"label": "OAuth2 Authentication", "description": "..."})
+        >>> index.search("auth", {"label": 1.0, "description": 0.7})
+        [SearchHit(doc=0, score=..., matched_field='label', matched_term='auth')]
+    """
+
+    def __init__(self, fields: Iterable[str]) -> None:
+        """Initialize an empty index.
+
+        Args:
+            fields: Names of the indexed text fields
+        """
+        self.fields = tuple(fields)
+        # term -> {doc: {field: term frequency}}
+        self._postings: dict[str, dict[int, dict[str, int]]] = {}
+        # doc -> {field: token count}
+        self._lengths: dict[int, dict[str, int]] = {}
+        self._total_lengths = dict.fromkeys(self.fields, 0)
+        self._vocabulary: list[str] | None = None
+
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return len(self._lengths)
+
+    @classmethod
+    def from_nodes(
+        cls, nodes: Iterable[Mapping[str, str | None]], fields: Iterable[str]
+    ) -> NodeSearchIndex:
+        """Build an index with one document per node.
+
+        Args:
+            nodes: Node mappings (text is read with .get(field))
+            fields: Names of the indexed text fields
+
+        Returns:
+            Populated NodeSearchIndex
+        """
+        index = cls(fields)
+        for doc, node in enumerate(nodes):
+            index.add(doc, node)
+        return index
+
+    def add(self, doc: int, values: Mapping[str, str | None]) -> None:
+        """Index one document.
+
+        Args:
+            doc: Document identifier (node position)
+            values: Mapping of field name to text (missing/None = empty)
+        """
+        lengths = {}
+        for field in self.fields:
+            value = values.get(field)
+            tokens = tokenize(value if isinstance(value, str) else None)
+            lengths[field] = len(tokens)
+            self._total_lengths[field] += len(tokens)
+            for token in tokens:
+                fields = self._postings.setdefault(token, {}).setdefault(doc, {})
+                fields[field] = fields.get(field, 0) + 1
+        self._lengths[doc] = lengths
+        self._vocabulary = None
+
+    def search(self, query: str, field_weights: Mapping[str, float]) -> list[SearchHit]:
+        """Find documents matching the query, best first.
+
+        Args:
+            query: Query string (see module docstring for syntax)
+            field_weights: Weight per field; fields absent or weighted 0 are ignored
+
+        Returns:
+            Matching documents sorted by score (highest first); empty for
+            queries without terms
+        """
+        groups = parse_query(query)
+        if not groups or not self._lengths:
+            return []
+
+        weights = {f: w for f, w in field_weights.items() if w > 0 and f in self._total_lengths}
+        priority = sorted(weights, key=lambda f: -weights[f])
+        doc_count = len(self._lengths)
+        average = {f: (self._total_lengths[f] / doc_count) or 1.0 for f in weights}
+
+        best: dict[int, SearchHit] = {}
+        for group in groups:
+            for doc, (score, matched_field, matched_term) in self._score_group(
+                group, weights, priority, average, doc_count
+            ).items():
+                if doc not in best or score > best[doc].score:
+                    best[doc] = SearchHit(doc, score, matched_field, matched_term)
+
+        return sorted(best.values(), key=lambda hit: (-hit.score, hit.doc))
+
+    def _score_group(
+        self,
+        terms: list[str],
+        weights: dict[str, float],
+        priority: list[str],
+        average: dict[str, float],
+        doc_count: int,
+    ) -> dict[int, tuple[float, str, str]]:
+        """Score the documents containing every term of an AND group."""
+        scores: dict[int, float] | None = None
+        # doc -> {field: number of group terms found in that field}
+        term_fields: dict[int, dict[str, int]] = {}
+        # doc -> {field: weighted contribution}
+        contributions: dict[int, dict[str, float]] = {}
+        first_term: dict[int, dict[str, str]] = {}
+
+        for term in terms:
+            term_scores: dict[int, float] = {}
+            term_seen: dict[int, set[str]] = {}
+            for token in self._expand(term):
+                postings = self._postings[token]
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc, frequencies in postings.items():
+                    if scores is not None and doc not in scores:
+                        continue
+                    weighted = 0.0
+                    for field, tf in frequencies.items():
+                        if field not in weights:
+                            continue
+                        norm = 1 - BM25_B + BM25_B * self._lengths[doc][field] / average[field]
+                        part = weights[field] * tf / norm
+                        weighted += part
+                        term_seen.setdefault(doc, set()).add(field)
+                        doc_parts = contributions.setdefault(doc, {})
+                        doc_parts[field] = doc_parts.get(field, 0.0) + part
+                        first_term.setdefault(doc, {}).setdefault(field, term)
+                    if weighted:
+                        # Prefix expansions compete: keep the best-scoring one
+                        score = idf * weighted * (BM25_K1 + 1) / (weighted + BM25_K1)
+                        term_scores[doc] = max(term_scores.get(doc, 0.0), score)
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {doc: scores[doc] + s for doc, s in term_scores.items() if doc in scores}
+            for doc, fields in term_seen.items():
+                doc_fields = term_fields.setdefault(doc, {})
+                for field in fields:
+                    doc_fields[field] = doc_fields.get(field, 0) + 1
+            if not scores:
+                return {}
+
+        results = {}
+        for doc, score in scores.items():
+            complete = [f for f in priority if term_fields[doc].get(f, 0) == len(terms)]
+            if complete:
+                matched_field = complete[0]
+            else:
+                matched_field = max(contributions[doc], key=contributions[doc].get)
+            results[doc] = (score, matched_field, first_term[doc][matched_field])
+        return results
+
+    def _expand(self, prefix: str) -> list[str]:
+        """Indexed terms starting with prefix (exact term included)."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, prefix)
+        end = start
+        while end < len(vocabulary) and vocabulary[end].startswith(prefix):
+            end += 1
+        return vocabulary[start:end]
@@ -0,0 +1,163 @@
+"""Cross-process snapshot cache of parsed knowledge graphs.
+
+Every hook runs in a fresh process, so FileSystemGraphRepository's in-memory
+cache never survives between hooks and each one re-parses every graph's JSON.
+Snapshots keep a marshal-encoded copy of each parsed graph:
+
+    .claude/graphs/.cache/design_graph.snapshot
+
+A snapshot is used only while its recorded (mtime_ns, size, inode) still
+matches the source *_graph.json, so any rewrite of the graph (including an
+atomic rename by another tool) invalidates it. marshal decodes JSON-shaped
+data faster than json.load (~2.5x on a 20k-node graph) and, unlike pickle,
+cannot run code while loading. Snapshots are tagged with the interpreter's
+marshal version and ignored by other Python versions.
+
+Opt-in: FileSystemGraphRepository(snapshot_cache=True), or set
+TRIADS_GRAPH_SNAPSHOTS=1 to enable it for every repository (hooks included).
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import marshal
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot layout changes
+SNAPSHOT_FORMAT_VERSION = 1
+
+SNAPSHOT_ENV_VAR = "TRIADS_GRAPH_SNAPSHOTS"
+
+# Length prefix of the marshalled header
+_HEADER_LENGTH = struct.Struct("<I")
+
+# Snapshots are only readable by the interpreter that wrote them
+_INTERPRETER_TAG = f"{sys.implementation.cache_tag}-marshal{marshal.version}"
+
+
+def snapshots_enabled_by_env() -> bool:
+    """Whether TRIADS_GRAPH_SNAPSHOTS opts every repository in."""
+    return os.environ.get(SNAPSHOT_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class GraphSnapshotCache:
+    """Pre-parsed graph snapshots validated against the source file's stat.
+
+    Args:
+        cache_dir: Snapshot directory (e.g. .claude/graphs/.cache)
+
+    Example:
+        >>> snapshots = GraphSnapshotCache(Path(".claude/graphs/.cache"))
+        >>> graph_file = Path(".claude/graphs/design_graph.json")
+        >>> graph = snapshots.load(graph_file)
+        >>> if graph is None:
+        ...     with open(graph_file) as f:
+        ...         graph = json.load(f)
+        ...         snapshots.store(graph_file, graph, os.fstat(f.fileno()))
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize cache in a directory (created on first store).
+
+        Args:
+            cache_dir: Snapshot directory
+        """
+        self.cache_dir = cache_dir
+
+    def snapshot_path(self, graph_file: Path) -> Path:
+        """Snapshot location for a graph file."""
+        return self.cache_dir / f"{graph_file.stem}.snapshot"
+
+    def load(self, graph_file: Path) -> dict[str, Any] | None:
+        """Return the snapshot of graph_file if it is still current.
+
+        Args:
+            graph_file: Source *_graph.json file
+
+        Returns:
+            Parsed graph data, or None if missing, stale or unreadable
+        """
+        signature = self._signature(graph_file)
+        if signature is None:
+            return None
+
+        try:
+            with open(self.snapshot_path(graph_file), "rb") as f:
+                (length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+                header = marshal.loads(f.read(length))
+                # Check the header before decoding the (possibly large) body
+                if header != (SNAPSHOT_FORMAT_VERSION, _INTERPRETER_TAG, signature):
+                    return None
+                body = f.read()
+            # Decoding allocates only acyclic containers: skip GC passes meanwhile
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                data = marshal.loads(body)
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+        except (OSError, EOFError, ValueError, TypeError, struct.error):
+            return None
+
+        return data if isinstance(data, dict) else None
+
+    def store(
+        self, graph_file: Path, graph_data: dict[str, Any], source_stat: os.stat_result
+    ) -> bool:
+        """Write a snapshot of graph_data stamped with the stat it was read or written at.
+
+        source_stat must come from the descriptor graph_data was read from
+        or written to (os.fstat), not from a later stat of graph_file: the
+        file may have been replaced in between, and the snapshot would then
+        vouch for content it does not hold.
+
+        Args:
+            graph_file: Source *_graph.json file
+            graph_data: Parsed content of graph_file
+            source_stat: os.fstat() of the file graph_data was read or written as
+
+        Returns:
+            True if the snapshot was written
+        """
+        signature = (source_stat.st_mtime_ns, source_stat.st_size, source_stat.st_ino)
+
+        target = self.snapshot_path(graph_file)
+        temp = target.with_name(f"{target.name}.tmp.{os.getpid()}")
+        try:
+            header = marshal.dumps((SNAPSHOT_FORMAT_VERSION, _INTERPRETER_TAG, signature))
+            body = marshal.dumps(graph_data)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp, "wb") as f:
+                f.write(_HEADER_LENGTH.pack(len(header)))
+                f.write(header)
+                f.write(body)
+            os.replace(temp, target)
+            return True
+        except (OSError, ValueError) as e:
+            # ValueError: graph holds values marshal cannot encode
+            logger.debug(
+                "Failed to write graph snapshot",
+                extra={"file": str(target), "error": str(e)}
+            )
+            try:
+                temp.unlink()
+            except OSError:
+                pass
+            return False
+
+    @staticmethod
+    def _signature(graph_file: Path) -> tuple[int, int, int] | None:
+        """(mtime_ns, size, inode) of the source file, or None if missing."""
+        try:
+            stat = graph_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
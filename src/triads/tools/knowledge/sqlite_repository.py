@@ -0,0 +1,681 @@
+"""SQLite storage backend for knowledge graphs.
+
+FileSystemGraphRepository keeps each triad in one NetworkX node-link JSON
+document, so every read parses the whole graph and every write rewrites it.
+SQLiteGraphRepository stores the same graphs as rows in one database:
+
+    .claude/graphs/graphs.db
+        graphs     triad -> top-level graph fields (directed, graph, _meta, ...)
+        nodes      one row per node, indexed by (triad, id), id, type, confidence
+        edges      one row per edge, indexed by (triad, source) and (triad, target)
+        nodes_fts  FTS5 index over node label and description
+
+Point lookups, filtered queries and single-node updates are B-tree
+operations (O(log n)) instead of whole-graph parses and rewrites. Each row
+keeps the node or edge verbatim as JSON, so load_graph() returns exactly
+what was saved and export_json() writes *_graph.json files that
+IntegrityChecker, BackupManager and FileSystemGraphRepository read as usual.
+
+Concurrency:
+    - The database runs in WAL mode: readers see a consistent snapshot and
+      never block the writer
+    - Every write is one BEGIN IMMEDIATE transaction, so concurrent hook
+      processes serialize (waiting up to BUSY_TIMEOUT_SECONDS) instead of
+      interleaving partial updates
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from triads.tools.knowledge.domain import SEARCH_FIELD_WEIGHTS, KnowledgeGraph
+from triads.tools.knowledge.repository import (
+    AbstractGraphRepository,
+    AmbiguousNodeError,
+    FileSystemGraphRepository,
+    GraphNotFoundError,
+    InvalidTriadNameError,
+    graph_to_domain,
+)
+from triads.tools.knowledge.validation import (
+    ValidationError,
+    validate_edge,
+    validate_graph,
+    validate_node,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the schema changes
+SCHEMA_VERSION = 1
+
+# Default database file inside the graphs directory
+DEFAULT_DB_NAME = "graphs.db"
+
+# How long a writer waits for another process's transaction
+BUSY_TIMEOUT_SECONDS = 10.0
+
+_TRIAD_NAME = re.compile(r"^[a-zA-Z0-9_-]+$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS graphs (
+    triad TEXT PRIMARY KEY,
+    attrs TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS nodes (
+    pk INTEGER PRIMARY KEY,
+    triad TEXT NOT NULL REFERENCES graphs(triad) ON DELETE CASCADE,
+    id TEXT,
+    type TEXT,
+    confidence REAL,
+    label TEXT NOT NULL,
+    description TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS nodes_triad_id ON nodes(triad, id);
+CREATE INDEX IF NOT EXISTS nodes_id ON nodes(id);
+CREATE INDEX IF NOT EXISTS nodes_type ON nodes(type, confidence);
+CREATE INDEX IF NOT EXISTS nodes_confidence ON nodes(confidence);
+
+CREATE TABLE IF NOT EXISTS edges (
+    pk INTEGER PRIMARY KEY,
+    triad TEXT NOT NULL REFERENCES graphs(triad) ON DELETE CASCADE,
+    source TEXT,
+    target TEXT,
+    key TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS edges_source ON edges(triad, source, target);
+CREATE INDEX IF NOT EXISTS edges_target ON edges(triad, target);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS nodes_fts USING fts5(
+    label, description, content='nodes', content_rowid='pk'
+);
+CREATE TRIGGER IF NOT EXISTS nodes_fts_insert AFTER INSERT ON nodes BEGIN
+    INSERT INTO nodes_fts(rowid, label, description)
+    VALUES (new.pk, new.label, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS nodes_fts_delete AFTER DELETE ON nodes BEGIN
+    INSERT INTO nodes_fts(nodes_fts, rowid, label, description)
+    VALUES ('delete', old.pk, old.label, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS nodes_fts_update AFTER UPDATE ON nodes BEGIN
+    INSERT INTO nodes_fts(nodes_fts, rowid, label, description)
+    VALUES ('delete', old.pk, old.label, old.description);
+    INSERT INTO nodes_fts(rowid, label, description)
+    VALUES (new.pk, new.label, new.description);
+END;
+"""
+
+
+def _edges_key(graph: dict[str, Any]) -> str:
+    """Key holding the graph's edge list ("links" unless only "edges" exists)."""
+    return "edges" if "edges" in graph and "links" not in graph else "links"
+
+
+def _node_row(triad: str, node: dict[str, Any]) -> tuple:
+    """(triad, id, type, confidence, label, description, data) for a node."""
+    confidence = node.get("confidence")
+    if not isinstance(confidence, (int, float)) or isinstance(confidence, bool):
+        confidence = None
+    node_id = node.get("id")
+    return (
+        triad,
+        node_id if isinstance(node_id, str) else None,
+        node.get("type") if isinstance(node.get("type"), str) else None,
+        confidence,
+        str(node.get("label", node_id) or ""),
+        str(node.get("description") or ""),
+        json.dumps(node),
+    )
+
+
+def _edge_row(triad: str, edge: dict[str, Any]) -> tuple:
+    """(triad, source, target, key, data) for an edge."""
+    return (
+        triad,
+        edge.get("source"),
+        edge.get("target"),
+        json.dumps(edge.get("key")),
+        json.dumps(edge),
+    )
+
+
+def _fts_query(query: str) -> str:
+    """FTS5 expression for a search string: prefix terms, ANDed, "OR" kept.
+
+    Args:
+        query: Free-text query (e.g. "oauth OR jwt token")
+
+    Returns:
+        FTS5 MATCH expression, or "" if the query has no terms
+    """
+    parts: list[str] = []
+    for word in re.findall(r"\w+", query):
+        if word == "OR":
+            if parts and parts[-1] != "OR":
+                parts.append("OR")
+        else:
+            parts.append(f'"{word.lower()}"*')
+    if parts and parts[-1] == "OR":
+        parts.pop()
+    return " ".join(parts)
+
+
+class SQLiteGraphRepository(AbstractGraphRepository):
+    """Knowledge graphs stored in an indexed SQLite database.
+
+    Offers the graph-level interface of FileSystemGraphRepository (get,
+    list_all, list_triads, load_graph, save_graph, get_node) plus row-level
+    operations that avoid touching the rest of the graph.
+
+    Args:
+        db_path: Database file (defaults to .claude/graphs/graphs.db)
+
+    Example:
+        >>> repo = SQLiteGraphRepository(Path(".claude/graphs/graphs.db"))
+        >>> repo.import_json(Path(".claude/graphs"))
+        ['design', 'implementation']
+        >>> repo.upsert_node("design", {"id": "n1", "label": "N1", "type": "Concept"})
+        >>> repo.search("oauth", node_type="Decision")
+        [({'id': 'oauth_decision', ...}, 'design', 4.2)]
+        >>> repo.export_json(Path(".claude/graphs"))
+    """
+
+    def __init__(self, db_path: Path | None = None) -> None:
+        """Open (and create if needed) the database.
+
+        Args:
+            db_path: Database file (defaults to .claude/graphs/graphs.db)
+        """
+        self.db_path = db_path or Path(".claude/graphs") / DEFAULT_DB_NAME
+        self._conn: sqlite3.Connection | None = None
+
+    def __enter__(self) -> SQLiteGraphRepository:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ------------------------------------------------------------------
+    # AbstractGraphRepository
+    # ------------------------------------------------------------------
+
+    def get(self, triad: str) -> KnowledgeGraph:
+        """Get graph by triad name.
+
+        Args:
+            triad: Triad name
+
+        Returns:
+            KnowledgeGraph domain model
+
+        Raises:
+            GraphNotFoundError: If graph doesn't exist
+            InvalidTriadNameError: If triad name contains invalid characters
+        """
+        graph_data = self.load_graph(triad)
+        if graph_data is None:
+            raise GraphNotFoundError(triad, self.list_triads())
+        return graph_to_domain(triad, graph_data)
+
+    def list_all(self) -> list[KnowledgeGraph]:
+        """List all stored graphs.
+
+        Returns:
+            List of KnowledgeGraph domain models
+        """
+        with self._transaction() as conn:
+            triads = self._triads(conn)
+            graphs = [(triad, self._read_graph(conn, triad)) for triad in triads]
+        return [graph_to_domain(triad, data) for triad, data in graphs if data is not None]
+
+    # ------------------------------------------------------------------
+    # Graph-level operations
+    # ------------------------------------------------------------------
+
+    def list_triads(self) -> list[str]:
+        """Return sorted list of stored triad names."""
+        with self._transaction() as conn:
+            return self._triads(conn)
+
+    def load_graph(self, triad: str) -> dict[str, Any] | None:
+        """Graph data in NetworkX node-link format, as last saved.
+
+        Args:
+            triad: Triad name
+
+        Returns:
+            Graph data dictionary, or None if not stored
+
+        Raises:
+            InvalidTriadNameError: If triad name contains invalid characters
+        """
+        self._check_triad(triad)
+        with self._transaction() as conn:
+            return self._read_graph(conn, triad)
+
+    def save_graph(self, triad: str, graph_data: dict[str, Any]) -> bool:
+        """Replace a graph in one transaction.
+
+        Args:
+            triad: Triad name
+            graph_data: Graph data dictionary to save
+
+        Returns:
+            True on success, False if the graph fails validation
+
+        Raises:
+            InvalidTriadNameError: If triad name contains invalid characters
+        """
+        self._check_triad(triad)
+        try:
+            validate_graph(graph_data)
+        except ValidationError as e:
+            logger.error(
+                f"Graph validation failed: {e.message}",
+                extra={"triad": triad, "field": e.field, "error": e.message},
+            )
+            return False
+
+        with self._transaction(write=True) as conn:
+            self._write_graph(conn, triad, graph_data)
+        return True
+
+    def delete_graph(self, triad: str) -> bool:
+        """Remove a graph with its nodes and edges.
+
+        Args:
+            triad: Triad name
+
+        Returns:
+            True if the graph existed
+        """
+        self._check_triad(triad)
+        with self._transaction(write=True) as conn:
+            return conn.execute("DELETE FROM graphs WHERE triad = ?", (triad,)).rowcount > 0
+
+    # ------------------------------------------------------------------
+    # Row-level operations
+    # ------------------------------------------------------------------
+
+    def get_node(
+        self, node_id: str, triad: str | None = None
+    ) -> tuple[dict[str, Any], str] | None:
+        """Find node by ID. Return (node_data, triad_name) or None.
+
+        Args:
+            node_id: Node identifier to find
+            triad: Optional triad name to limit search
+
+        Returns:
+            Tuple of (node_dict, triad_name) if found, None otherwise
+
+        Raises:
+            AmbiguousNodeError: If node exists in multiple triads without clarification
+        """
+        with self._transaction() as conn:
+            if triad:
+                self._check_triad(triad)
+                rows = conn.execute(
+                    "SELECT data, triad FROM nodes WHERE triad = ? AND id = ? ORDER BY pk LIMIT 1",
+                    (triad, node_id),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT data, triad FROM nodes WHERE id = ? ORDER BY triad, pk",
+                    (node_id,),
+                ).fetchall()
+
+        triads = sorted({row[1] for row in rows})
+        if len(triads) > 1:
+            raise AmbiguousNodeError(node_id, triads)
+        return (json.loads(rows[0][0]), rows[0][1]) if rows else None
+
+    def filter_nodes(
+        self,
+        triad: str | None = None,
+        node_type: str | None = None,
+        min_confidence: float | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[dict[str, Any], str]]:
+        """Nodes matching all given filters, using the column indexes.
+
+        Args:
+            triad: Optional triad name
+            node_type: Optional node type (exact match)
+            min_confidence: Optional minimum confidence
+            limit: Optional maximum number of results
+
+        Returns:
+            List of (node_dict, triad_name) in triad then node order
+        """
+        where, params = self._filters(triad, node_type, min_confidence)
+        sql = f"SELECT data, triad FROM nodes {where} ORDER BY triad, pk"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._transaction() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [(json.loads(data), triad_name) for data, triad_name in rows]
+
+    def search(
+        self,
+        query: str,
+        triad: str | None = None,
+        node_type: str | None = None,
+        min_confidence: float | None = None,
+        limit: int = 20,
+    ) -> list[tuple[dict[str, Any], str, float]]:
+        """Full-text search over node label and description (FTS5, BM25).
+
+        Terms are ANDed and matched as prefixes; "OR" separates alternatives.
+
+        Args:
+            query: Search query string (case-insensitive)
+            triad: Optional triad name
+            node_type: Optional node type (exact match)
+            min_confidence: Optional minimum confidence
+            limit: Maximum number of results
+
+        Returns:
+            List of (node_dict, triad_name, score), best match first
+        """
+        expression = _fts_query(query)
+        if not expression:
+            return []
+
+        where, params = self._filters(triad, node_type, min_confidence, prefix="n.")
+        where = f"{where} AND" if where else "WHERE"
+        sql = (
+            "SELECT n.data, n.triad, bm25(nodes_fts, ?, ?) AS rank "
+            "FROM nodes_fts JOIN nodes n ON n.pk = nodes_fts.rowid "
+            f"{where} nodes_fts MATCH ? ORDER BY rank LIMIT ?"
+        )
+        weights = [SEARCH_FIELD_WEIGHTS["label"], SEARCH_FIELD_WEIGHTS["content"]]
+        with self._transaction() as conn:
+            rows = conn.execute(sql, weights + params + [expression, limit]).fetchall()
+        # bm25() is lower-is-better; report higher-is-better like other searchers
+        return [(json.loads(data), triad_name, -rank) for data, triad_name, rank in rows]
+
+    def upsert_node(self, triad: str, node: dict[str, Any]) -> bool:
+        """Insert a node, or replace every node of the triad with its id.
+
+        Creates the graph if it doesn't exist yet.
+
+        Args:
+            triad: Triad name
+            node: Node data (must have id, label and type)
+
+        Returns:
+            True on success, False if the node fails validation
+
+        Raises:
+            InvalidTriadNameError: If triad name contains invalid characters
+        """
+        self._check_triad(triad)
+        try:
+            validate_node(node, 0)
+        except ValidationError as e:
+            logger.error(
+                f"Node validation failed: {e.message}",
+                extra={"triad": triad, "field": e.field, "error": e.message},
+            )
+            return False
+
+        row = _node_row(triad, node)
+        with self._transaction(write=True) as conn:
+            self._ensure_graph(conn, triad)
+            updated = conn.execute(
+                "UPDATE nodes SET type = ?, confidence = ?, label = ?, description = ?, data = ? "
+                "WHERE triad = ? AND id = ?",
+                row[2:] + (triad, node["id"]),
+            ).rowcount
+            if not updated:
+                conn.execute(
+                    "INSERT INTO nodes (triad, id, type, confidence, label, description, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    row,
+                )
+        return True
+
+    def add_edge(self, triad: str, edge: dict[str, Any]) -> bool:
+        """Add an edge unless one with the same source, target and key exists.
+
+        Args:
+            triad: Triad name
+            edge: Edge data (source and target must be nodes of the triad)
+
+        Returns:
+            True if the edge was added, False if it exists or is invalid
+
+        Raises:
+            InvalidTriadNameError: If triad name contains invalid characters
+        """
+        self._check_triad(triad)
+        row = _edge_row(triad, edge) if isinstance(edge, dict) else None
+        with self._transaction(write=True) as conn:
+            try:
+                endpoints = set()
+                if row is not None:
+                    for node_id in {row[1], row[2]}:
+                        if conn.execute(
+                            "SELECT 1 FROM nodes WHERE triad = ? AND id = ? LIMIT 1",
+                            (triad, node_id),
+                        ).fetchone():
+                            endpoints.add(node_id)
+                validate_edge(edge, 0, endpoints)
+            except ValidationError as e:
+                logger.error(
+                    f"Edge validation failed: {e.message}",
+                    extra={"triad": triad, "field": e.field, "error": e.message},
+                )
+                return False
+
+            if conn.execute(
+                "SELECT 1 FROM edges WHERE triad = ? AND source = ? AND target = ? AND key = ?",
+                row[:4],
+            ).fetchone():
+                return False
+            conn.execute(
+                "INSERT INTO edges (triad, source, target, key, data) VALUES (?, ?, ?, ?, ?)", row
+            )
+        return True
+
+    # ------------------------------------------------------------------
+    # JSON import/export
+    # ------------------------------------------------------------------
+
+    def import_json(self, graphs_dir: Path, triads: Iterable[str] | None = None) -> list[str]:
+        """Load *_graph.json files (with pending update logs) into the database.
+
+        Each graph replaces the stored one in its own transaction. Graphs are
+        imported as they are on disk, without schema validation.
+
+        Args:
+            graphs_dir: Directory containing *_graph.json files
+            triads: Triads to import (default: every graph in graphs_dir)
+
+        Returns:
+            Names of imported triads
+        """
+        source = FileSystemGraphRepository(graphs_dir)
+        imported = []
+        for triad in triads if triads is not None else source.list_triads():
+            graph_data = source.load_graph(triad)
+            if graph_data is None:
+                continue
+            self._check_triad(triad)
+            with self._transaction(write=True) as conn:
+                self._write_graph(conn, triad, graph_data)
+            imported.append(triad)
+        return imported
+
+    def export_json(
+        self,
+        graphs_dir: Path,
+        triads: Iterable[str] | None = None,
+        max_backups: int | None = None,
+    ) -> list[str]:
+        """Write stored graphs as *_graph.json files.
+
+        Uses FileSystemGraphRepository.save_graph, so each file is validated,
+        backed up and written atomically like any other graph save.
+
+        Args:
+            graphs_dir: Directory to write *_graph.json files to
+            triads: Triads to export (default: every stored graph)
+            max_backups: Number of backups to keep (default: backup config)
+
+        Returns:
+            Names of exported triads
+        """
+        target = FileSystemGraphRepository(graphs_dir)
+        exported = []
+        for triad in triads if triads is not None else self.list_triads():
+            graph_data = self.load_graph(triad)
+            if graph_data is None:
+                continue
+            if target.save_graph(triad, graph_data, max_backups=max_backups):
+                exported.append(triad)
+        return exported
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection and create the schema on first use."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit mode: transactions are begun explicitly
+            conn = sqlite3.connect(
+                str(self.db_path), timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                # One script so the schema is created in a single transaction
+                conn.executescript(
+                    f"BEGIN IMMEDIATE; {_SCHEMA} PRAGMA user_version = {SCHEMA_VERSION}; COMMIT;"
+                )
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def _transaction(self, write: bool = False) -> Iterator[sqlite3.Connection]:
+        """Run a block in one transaction (writers take the write lock up front)."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _check_triad(triad: str) -> None:
+        if not _TRIAD_NAME.match(triad):
+            raise InvalidTriadNameError(triad)
+
+    @staticmethod
+    def _triads(conn: sqlite3.Connection) -> list[str]:
+        return [row[0] for row in conn.execute("SELECT triad FROM graphs ORDER BY triad")]
+
+    @staticmethod
+    def _filters(
+        triad: str | None,
+        node_type: str | None,
+        min_confidence: float | None,
+        prefix: str = "",
+    ) -> tuple[str, list[Any]]:
+        """WHERE clause and parameters for the node filters."""
+        clauses, params = [], []
+        if triad:
+            SQLiteGraphRepository._check_triad(triad)
+            clauses.append(f"{prefix}triad = ?")
+            params.append(triad)
+        if node_type:
+            clauses.append(f"{prefix}type = ?")
+            params.append(node_type)
+        if min_confidence is not None:
+            clauses.append(f"{prefix}confidence >= ?")
+            params.append(min_confidence)
+        return ("WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    @staticmethod
+    def _ensure_graph(conn: sqlite3.Connection, triad: str) -> None:
+        """Create an empty graph row for triad if there is none."""
+        attrs = {"directed": True, "multigraph": False, "graph": {}, "nodes": None, "links": None}
+        conn.execute(
+            "INSERT OR IGNORE INTO graphs (triad, attrs) VALUES (?, ?)", (triad, json.dumps(attrs))
+        )
+
+    @staticmethod
+    def _read_graph(conn: sqlite3.Connection, triad: str) -> dict[str, Any] | None:
+        """Reassemble a graph's JSON document (inside a transaction)."""
+        row = conn.execute("SELECT attrs FROM graphs WHERE triad = ?", (triad,)).fetchone()
+        if row is None:
+            return None
+
+        # attrs keeps every top-level field in order, with placeholders for lists
+        graph = json.loads(row[0])
+        graph["nodes"] = [
+            json.loads(data)
+            for (data,) in conn.execute(
+                "SELECT data FROM nodes WHERE triad = ? ORDER BY pk", (triad,)
+            )
+        ]
+        graph[_edges_key(graph)] = [
+            json.loads(data)
+            for (data,) in conn.execute(
+                "SELECT data FROM edges WHERE triad = ? ORDER BY pk", (triad,)
+            )
+        ]
+        return graph
+
+    @staticmethod
+    def _write_graph(conn: sqlite3.Connection, triad: str, graph_data: dict[str, Any]) -> None:
+        """Replace a graph's rows (inside a write transaction)."""
+        edges_key = _edges_key(graph_data)
+        attrs = {
+            key: None if key in ("nodes", edges_key) else value
+            for key, value in graph_data.items()
+        }
+        attrs.setdefault("nodes", None)
+        attrs.setdefault(edges_key, None)
+
+        conn.execute("DELETE FROM graphs WHERE triad = ?", (triad,))
+        conn.execute("INSERT INTO graphs (triad, attrs) VALUES (?, ?)", (triad, json.dumps(attrs)))
+        conn.executemany(
+            "INSERT INTO nodes (triad, id, type, confidence, label, description, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                _node_row(triad, node)
+                for node in graph_data.get("nodes", [])
+                if isinstance(node, dict)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO edges (triad, source, target, key, data) VALUES (?, ?, ?, ?, ?)",
+            (
+                _edge_row(triad, edge)
+                for edge in graph_data.get(edges_key, [])
+                if isinstance(edge, dict)
+            ),
+        )
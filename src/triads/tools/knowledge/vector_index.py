@@ -0,0 +1,367 @@
+"""Semantic vector index over knowledge graph nodes.
+
+Embeds each node's label and description (all-MiniLM-L6-v2 via
+RouterEmbedder) into one unit-norm float32 row of a memory-mapped matrix
+shared by every graph:
+
+    .claude/graphs/.cache/vectors-<generation>.f32   # N x 384 float32
+    .claude/graphs/.cache/vectors.json               # row -> [triad, node id, text hash]
+
+Top-k for a query is a single matrix-vector product over the mapped matrix,
+so searching tens of thousands of nodes costs milliseconds and reads no
+graph JSON.
+
+Updates are incremental: when a graph file (or its update log) changes,
+only nodes whose label/description text changed are re-embedded. The matrix
+is append-only, so a crash between writing rows and the row map leaves the
+previous row map valid; dead rows are dropped by rewriting the matrix under
+a new generation once they outnumber live ones.
+
+Updates hold .cache/vectors.lock from re-reading the row map on disk to
+saving it, so hooks refreshing the index concurrently never append to the
+matrix past rows another process has mapped, or overwrite its row map.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+from triads.tools.knowledge.node_index import graph_signature
+from triads.utils.file_operations import FileLocker, atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# Bump when the row map layout changes
+INDEX_FORMAT_VERSION = 1
+
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+
+# Rewrite the matrix once dead rows exceed live rows and this count
+_COMPACT_MIN_DEAD_ROWS = 1024
+
+
+def node_text(node: dict[str, Any]) -> str:
+    """Text embedded for a node: its label and description."""
+    label = str(node.get("label") or node.get("id") or "")
+    description = str(node.get("description") or "")
+    return f"{label}. {description}" if description else label
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (zero rows stay zero)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+class NodeVectorIndex:
+    """Embedding matrix of every node, refreshed per changed graph.
+
+    Args:
+        graphs_dir: Directory containing *_graph.json files
+        embed_batch: Callable mapping texts to an (N, dim) array
+            (default: RouterEmbedder, created on first embedding)
+        model_name: Embedding model (a different model invalidates the index)
+        dim: Embedding dimensionality
+
+    Example:
+        >>> index = NodeVectorIndex(Path(".claude/graphs"))
+        >>> index.refresh(repo.list_triads(), repo.load_graph)
+        >>> index.search("token refresh", k=5)
+        [('design', 'oauth_renewal', 0.61), ...]
+    """
+
+    def __init__(
+        self,
+        graphs_dir: Path,
+        embed_batch: Callable[[list[str]], np.ndarray] | None = None,
+        model_name: str = DEFAULT_MODEL,
+        dim: int = EMBEDDING_DIM,
+    ) -> None:
+        """Initialize index for a graphs directory.
+
+        Args:
+            graphs_dir: Directory containing *_graph.json files
+            embed_batch: Callable mapping texts to an (N, dim) array
+            model_name: Embedding model name
+            dim: Embedding dimensionality
+        """
+        self.graphs_dir = graphs_dir
+        self.cache_dir = graphs_dir / ".cache"
+        self.map_path = self.cache_dir / "vectors.json"
+        self.lock_path = self.cache_dir / "vectors.lock"
+        self.model_name = model_name
+        self.dim = dim
+        self._embed_batch = embed_batch
+        self._state: dict[str, Any] | None = None
+        self._matrix: np.ndarray | None = None
+        # Live-row masks per triad filter (cleared whenever rows change)
+        self._masks: dict[frozenset[str] | None, np.ndarray] = {}
+        # Triads to re-check even if their signature is unchanged
+        self._invalidated: set[str] = set()
+
+    def refresh(
+        self,
+        triads: Iterable[str],
+        load_graph: Callable[[str], dict[str, Any] | None],
+    ) -> int:
+        """Re-embed changed nodes of changed graphs and drop removed graphs.
+
+        Args:
+            triads: Triad names currently present
+            load_graph: Callable returning a triad's graph data (or None)
+
+        Returns:
+            Number of nodes embedded
+        """
+        triads = list(triads)
+        if not self._changed_triads(triads):
+            return 0
+
+        with FileLocker(self.lock_path):
+            # The row map may have been updated by another process since it
+            # was loaded; rows are only ever appended to the one on disk
+            self._state = None
+            self._matrix = None
+            self._masks.clear()
+            state = self._load()
+            for triad in self._invalidated:
+                state["signatures"].pop(triad, None)
+            self._invalidated.clear()
+
+            embedded = 0
+            changed = self._changed_triads(triads)
+            for triad in changed:
+                if triad in triads:
+                    # Taken before loading, so a write in between is seen next time
+                    signature = graph_signature(self.graphs_dir, triad)
+                    graph = load_graph(triad)
+                    nodes = graph.get("nodes", []) if isinstance(graph, dict) else []
+                    embedded += self._update_triad(triad, nodes)
+                    state["signatures"][triad] = signature
+                else:
+                    self._update_triad(triad, [])
+                    del state["signatures"][triad]
+
+            if changed:
+                self._compact_if_sparse()
+                self._save()
+        return embedded
+
+    def invalidate(self, triad: str) -> None:
+        """Force the triad to be re-checked on the next refresh."""
+        self._invalidated.add(triad)
+        if self._state is not None:
+            self._state["signatures"].pop(triad, None)
+
+    def search(
+        self, query: str, k: int = 20, triads: Iterable[str] | None = None
+    ) -> list[tuple[str, str, float]]:
+        """Nodes most similar to query by cosine similarity.
+
+        Args:
+            query: Free-text query
+            k: Maximum results
+            triads: Optional triads to restrict to
+
+        Returns:
+            List of (triad, node_id, similarity), most similar first
+        """
+        state = self._load()
+        rows = state["rows"]
+        if not rows or k <= 0:
+            return []
+
+        live = self._live_mask(None if triads is None else frozenset(triads))
+        live_count = int(live.sum())
+        if live_count == 0:
+            return []
+
+        query_vector = _normalize(self._embed([query]))[0]
+        scores = self._open_matrix() @ query_vector
+        scores = np.where(live, scores, -np.inf)
+
+        k = min(k, live_count)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(rows[i][0], rows[i][1], float(scores[i])) for i in top]
+
+    def _changed_triads(self, triads: list[str]) -> list[str]:
+        """Triads whose rows are out of date: changed graphs, then removed ones."""
+        signatures = self._load()["signatures"]
+        changed = []
+        for triad in triads:
+            signature = graph_signature(self.graphs_dir, triad)
+            if signature is None or signatures.get(triad) != signature:
+                changed.append(triad)
+        changed.extend(sorted(set(signatures) - set(triads)))
+        return changed
+
+    def __len__(self) -> int:
+        """Number of indexed nodes."""
+        return sum(1 for row in self._load()["rows"] if row is not None)
+
+    def _live_mask(self, triads: frozenset[str] | None) -> np.ndarray:
+        """Boolean mask of rows holding a node of one of triads (None: any)."""
+        mask = self._masks.get(triads)
+        if mask is None:
+            rows = self._load()["rows"]
+            mask = np.fromiter(
+                (row is not None and (triads is None or row[0] in triads) for row in rows),
+                dtype=bool,
+                count=len(rows),
+            )
+            self._masks[triads] = mask
+        return mask
+
+    def _update_triad(self, triad: str, nodes: list[dict[str, Any]]) -> int:
+        """Sync one triad's rows with its nodes; returns nodes embedded."""
+        state = self._load()
+        rows = state["rows"]
+        self._masks.clear()
+
+        current: dict[str, tuple[int, str]] = {
+            row[1]: (i, row[2]) for i, row in enumerate(rows) if row is not None and row[0] == triad
+        }
+        wanted: dict[str, str] = {}
+        for node in nodes:
+            if isinstance(node, dict) and isinstance(node.get("id"), str):
+                wanted[node["id"]] = node_text(node)
+
+        stale = []
+        for node_id, text in wanted.items():
+            existing = current.get(node_id)
+            if existing is None or existing[1] != _text_hash(text):
+                stale.append(node_id)
+        for node_id, (i, text_hash) in current.items():
+            if node_id not in wanted or node_id in stale:
+                rows[i] = None
+
+        if stale:
+            vectors = _normalize(self._embed([wanted[node_id] for node_id in stale]))
+            self._append_rows(vectors)
+            rows.extend([triad, node_id, _text_hash(wanted[node_id])] for node_id in stale)
+        return len(stale)
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        if self._embed_batch is None:
+            # Deferred: loads sentence-transformers (and torch)
+            from triads.tools.router._embedder import RouterEmbedder
+
+            self._embed_batch = RouterEmbedder(self.model_name).embed_batch
+        vectors = np.asarray(self._embed_batch(texts), dtype=np.float32)
+        if vectors.shape != (len(texts), self.dim):
+            raise ValueError(f"Expected shape {(len(texts), self.dim)}, got {vectors.shape}")
+        return vectors
+
+    def _matrix_path(self) -> Path:
+        return self.cache_dir / f"vectors-{self._load()['generation']}.f32"
+
+    def _open_matrix(self) -> np.ndarray:
+        """Memory-mapped (rows, dim) matrix matching the row map."""
+        if self._matrix is None:
+            count = len(self._load()["rows"])
+            if count == 0:
+                self._matrix = np.zeros((0, self.dim), dtype=np.float32)
+            else:
+                self._matrix = np.memmap(
+                    self._matrix_path(), dtype=np.float32, mode="r", shape=(count, self.dim)
+                )
+        return self._matrix
+
+    def _append_rows(self, vectors: np.ndarray) -> None:
+        """Append rows after the last mapped row (caller holds the lock).
+
+        Anything past the mapped rows is a torn tail from a crashed update
+        and is discarded.
+        """
+        path = self._matrix_path()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._matrix = None
+        with open(path, "ab") as f:
+            f.truncate(len(self._load()["rows"]) * self.dim * 4)
+            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _compact_if_sparse(self) -> None:
+        """Rewrite live rows into a new matrix generation if mostly dead."""
+        state = self._load()
+        rows = state["rows"]
+        live = [i for i, row in enumerate(rows) if row is not None]
+        dead = len(rows) - len(live)
+        if dead <= len(live) or dead < _COMPACT_MIN_DEAD_ROWS:
+            return
+
+        if live:
+            matrix = np.array(self._open_matrix()[live])
+        else:
+            matrix = np.zeros((0, self.dim), np.float32)
+        old_path = self._matrix_path()
+        state["generation"] += 1
+        state["rows"] = [rows[i] for i in live]
+        self._matrix = None
+        self._masks.clear()
+        with open(self._matrix_path(), "wb") as f:
+            f.write(matrix.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        self._save()
+        try:
+            old_path.unlink()
+        except OSError:
+            pass
+
+    def _load(self) -> dict[str, Any]:
+        """Row map from memory, else from disk (empty if unusable)."""
+        if self._state is not None:
+            return self._state
+
+        self._state = {
+            "format": INDEX_FORMAT_VERSION,
+            "model": self.model_name,
+            "dim": self.dim,
+            "generation": 0,
+            "rows": [],
+            "signatures": {},
+        }
+        try:
+            with open(self.map_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if (
+                isinstance(data, dict)
+                and data.get("format") == INDEX_FORMAT_VERSION
+                and data.get("model") == self.model_name
+                and data.get("dim") == self.dim
+            ):
+                matrix_file = self.cache_dir / f"vectors-{data['generation']}.f32"
+                if matrix_file.stat().st_size >= len(data["rows"]) * self.dim * 4:
+                    self._state = data
+        except (OSError, ValueError, KeyError):
+            pass
+        return self._state
+
+    def _save(self) -> None:
+        """Persist the row map (caller holds the lock).
+
+        Failures only cost re-embedding next session.
+        """
+        try:
+            atomic_write_json(self.map_path, self._state, lock=False, indent=None)
+        except OSError as e:
+            logger.debug(
+                "Failed to persist vector index",
+                extra={"file": str(self.map_path), "error": str(e)}
+            )
@@ -0,0 +1,279 @@
+"""Write-ahead log for knowledge graph mutations.
+
+Rewriting a whole *_graph.json (indented, fsynced, after a full backup copy)
+for a one-node change costs O(graph) I/O. Mutations are instead appended as
+small JSON lines to a per-triad log next to the graph:
+
+    .claude/graphs/design_graph.json   # base
+    .claude/graphs/design_graph.wal    # {"seq": ..., "op": "add_node", ...} per line
+
+Readers fold the log into the base (fold()). Once the log passes a record or
+byte threshold, compaction rewrites the base with the log applied and
+removes the log.
+
+Consistency:
+    - seq is a nanosecond timestamp, strictly increasing per log
+    - A base records the last folded seq in _meta.wal_seq; records at or below
+      it are skipped, so a full write of a folded graph (save_graph, lesson
+      commands) is never overridden by older log records
+    - Records are idempotent (add = insert if absent, update = set fields), so
+      replaying a log after a crash mid-compaction is harmless
+    - A torn trailing line (crash mid-append) is ignored
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from triads.utils.file_operations import FileLocker, atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# Compact once the log holds this many records...
+DEFAULT_COMPACT_RECORDS = 256
+
+# ...or this many bytes
+DEFAULT_COMPACT_BYTES = 256 * 1024
+
+# Record types understood by apply_records()
+OPERATIONS = ("add_node", "update_node", "add_edge", "update_edge", "meta")
+
+
+def _edges_key(graph: dict[str, Any]) -> str:
+    """Key holding the graph's edge list ("links" unless only "edges" exists)."""
+    return "edges" if "edges" in graph and "links" not in graph else "links"
+
+
+def _edge_key(edge: dict[str, Any]) -> tuple:
+    return (edge.get("source"), edge.get("target"), edge.get("key"))
+
+
+def apply_records(graph: dict[str, Any], records: Iterable[dict[str, Any]]) -> int:
+    """Apply log records to a graph in place.
+
+    Args:
+        graph: Graph data (NetworkX node-link JSON)
+        records: Log records in append order
+
+    Returns:
+        seq of the last record applied (0 if none)
+    """
+    nodes = graph.setdefault("nodes", [])
+    edges = graph.setdefault(_edges_key(graph), [])
+    nodes_by_id = None
+    edges_by_key = None
+    last_seq = 0
+
+    for record in records:
+        op = record.get("op")
+        if op in ("add_node", "update_node") and nodes_by_id is None:
+            nodes_by_id = {n.get("id"): n for n in nodes if isinstance(n, dict)}
+        if op in ("add_edge", "update_edge") and edges_by_key is None:
+            edges_by_key = {_edge_key(e): e for e in edges if isinstance(e, dict)}
+
+        if op == "add_node":
+            node = record.get("node") or {}
+            if node.get("id") not in nodes_by_id:
+                node = dict(node)
+                nodes.append(node)
+                nodes_by_id[node.get("id")] = node
+        elif op == "update_node":
+            node = nodes_by_id.get(record.get("id"))
+            if node is not None:
+                node.update(record.get("fields") or {})
+        elif op == "add_edge":
+            edge = record.get("edge") or {}
+            if _edge_key(edge) not in edges_by_key:
+                edge = dict(edge)
+                edges.append(edge)
+                edges_by_key[_edge_key(edge)] = edge
+        elif op == "update_edge":
+            edge = edges_by_key.get((record.get("source"), record.get("target"), record.get("key")))
+            if edge is not None:
+                edge.update(record.get("fields") or {})
+        elif op == "meta":
+            graph.setdefault("_meta", {}).update(record.get("fields") or {})
+        else:
+            logger.debug("Skipping unknown graph log record", extra={"op": op})
+
+        last_seq = max(last_seq, record.get("seq", 0))
+
+    return last_seq
+
+
+class GraphWAL:
+    """Append-only mutation log for one triad's graph file.
+
+    Args:
+        graph_file: The triad's *_graph.json
+        compact_records: Record count that triggers compaction
+        compact_bytes: Log size that triggers compaction
+
+    Example:
+        >>> wal = GraphWAL(Path(".claude/graphs/design_graph.json"))
+        >>> wal.append([{"op": "add_node", "node": {"id": "n1", "label": "N1"}}])
+        >>> graph = wal.fold(json.load(open(wal.graph_file)))
+    """
+
+    def __init__(
+        self,
+        graph_file: Path,
+        compact_records: int = DEFAULT_COMPACT_RECORDS,
+        compact_bytes: int = DEFAULT_COMPACT_BYTES,
+    ) -> None:
+        """Initialize log for a graph file.
+
+        Args:
+            graph_file: The triad's *_graph.json
+            compact_records: Record count that triggers compaction
+            compact_bytes: Log size that triggers compaction
+        """
+        self.graph_file = Path(graph_file)
+        self.wal_path = self.graph_file.with_suffix(".wal")
+        self.lock_path = self.graph_file.with_suffix(".wal.lock")
+        self.compact_records = compact_records
+        self.compact_bytes = compact_bytes
+
+    def records(self) -> list[dict[str, Any]]:
+        """All complete records in append order (empty if no log)."""
+        try:
+            with open(self.wal_path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+
+        records = []
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Torn write from a crash mid-append
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+        return records
+
+    def fold(self, graph: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Apply records newer than graph["_meta"]["wal_seq"] to graph in place.
+
+        Args:
+            graph: Base graph data (None passes through)
+
+        Returns:
+            The same graph, with _meta.wal_seq advanced if records were applied
+        """
+        if not isinstance(graph, dict) or not self.wal_path.exists():
+            return graph
+
+        folded_seq = (graph.get("_meta") or {}).get("wal_seq", 0)
+        pending = [r for r in self.records() if r.get("seq", 0) > folded_seq]
+        if pending:
+            graph.setdefault("_meta", {})["wal_seq"] = apply_records(graph, pending)
+        return graph
+
+    def append(self, ops: list[dict[str, Any]]) -> int:
+        """Durably append mutation records, compacting if over threshold.
+
+        Args:
+            ops: Records without seq (e.g. {"op": "add_node", "node": {...}})
+
+        Returns:
+            seq of the last appended record
+        """
+        with FileLocker(self.lock_path):
+            existing = self.records()
+            seq = max([time.time_ns()] + [r.get("seq", 0) + 1 for r in existing[-1:]])
+
+            lines = []
+            for op in ops:
+                lines.append(json.dumps({"seq": seq, **op}) + "\n")
+                seq += 1
+
+            with open(self.wal_path, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+
+            if (
+                len(existing) + len(ops) >= self.compact_records
+                or self.wal_path.stat().st_size >= self.compact_bytes
+            ):
+                self._compact_locked()
+
+        return seq - 1
+
+    def compact(self) -> bool:
+        """Fold the log into the base file and remove it.
+
+        Returns:
+            True if the base was rewritten
+        """
+        with FileLocker(self.lock_path):
+            return self._compact_locked()
+
+    @contextmanager
+    def superseding(self, graph: dict[str, Any]) -> Iterator[None]:
+        """Context for a full write of graph over the base file.
+
+        graph was folded when its writer loaded it; records appended since
+        (above its _meta.wal_seq) are folded into it before the write. Then
+        graph holds every logged record and the log is removed after the
+        write. Both happen under the log lock, so no append is lost.
+
+        Example:
+            >>> with wal.superseding(graph):
+            ...     atomic_write_json(wal.graph_file, graph)
+        """
+        if not self.wal_path.exists():
+            yield
+            return
+        with FileLocker(self.lock_path):
+            self.fold(graph)
+            yield
+            self.clear()
+
+    def clear(self) -> None:
+        """Remove the log (after its records reached the base file)."""
+        try:
+            self.wal_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _compact_locked(self) -> bool:
+        """Rewrite base with the log applied; caller holds the lock."""
+        try:
+            with open(self.graph_file, "r", encoding="utf-8") as f:
+                graph = json.load(f)
+        except FileNotFoundError:
+            graph = {"directed": True, "nodes": [], "links": []}
+        except (OSError, ValueError) as e:
+            # Never fold into a corrupt base: keep the log until it is restored
+            logger.warning(
+                "Graph log compaction skipped: unreadable base",
+                extra={"file": str(self.graph_file), "error": str(e)}
+            )
+            return False
+
+        self.fold(graph)
+
+        # Local import: backup imports this module
+        from triads.tools.knowledge.backup import BackupManager
+
+        graphs_dir = self.graph_file.parent
+        triad = self.graph_file.name[: -len("_graph.json")]
+        max_backups = BackupManager.load_config(graphs_dir)
+        backup_mgr = BackupManager(graphs_dir=graphs_dir, max_backups=max_backups)
+        backup_created = backup_mgr.create_backup(triad)
+
+        atomic_write_json(self.graph_file, graph, lock=False, indent=2)
+        self.clear()
+
+        if backup_created:
+            backup_mgr.prune_backups(triad, keep=max_backups)
+        return True
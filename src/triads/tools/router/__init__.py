@@ -8,13 +8,15 @@ Also includes workflow matching and classification functionality
 moved from workflow_matching module as part of Phase 9 DDD refactoring.
 """
 
+import importlib
+
 from .classification import (
     HeadlessClassificationResult,
     classify_workflow_headless,
     WORKFLOW_DEFINITIONS,
 )
 from .config import RouterConfig
-from .domain import RoutingDecision, RouterState
+from .domain import RouterState
 from .keywords import WORKFLOW_KEYWORDS, get_all_workflow_types, get_keywords
 from .matching import MatchResult, WorkflowMatcher
 from .repository import (
@@ -23,20 +25,44 @@ from .repository import (
     InMemoryRouterRepository,
     RouterRepositoryError,
 )
-from .router import TriadRouter
 from ._notifications import NotificationBuilder
-from ._semantic_router import SemanticRouter, TriadRoute, RoutingDecision
-from ._llm_disambiguator import LLMDisambiguator, DisambiguationError
 from ._state_manager import _RouterStateManager as RouterStateManager
 from ._telemetry import TelemetryLogger
 from ._grace_period import GracePeriodChecker
 from ._manual_selector import ManualSelector
-from ._embedder import RouterEmbedder
-
-# Import CLI and training mode (now migrated to tools/router)
-from .cli import RouterCLI
 from .training_mode import TrainingModeHandler
 
+# Names resolved on first access (PEP 562). These modules pull in numpy,
+# sentence-transformers/torch or anthropic, which cost seconds to import;
+# keyword matching, config and the hooks must not pay for them.
+_LAZY_IMPORTS = {
+    "TriadRouter": (".router", "TriadRouter"),
+    "SemanticRouter": ("._semantic_router", "SemanticRouter"),
+    "TriadRoute": ("._semantic_router", "TriadRoute"),
+    "RoutingDecision": ("._semantic_router", "RoutingDecision"),
+    "LLMDisambiguator": ("._llm_disambiguator", "LLMDisambiguator"),
+    "DisambiguationError": ("._llm_disambiguator", "DisambiguationError"),
+    "RouterEmbedder": ("._embedder", "RouterEmbedder"),
+    "RouterCLI": (".cli", "RouterCLI"),
+}
+
+
+def __getattr__(name: str):
+    """Import heavy router components on first access."""
+    if name in _LAZY_IMPORTS:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr_name)
+        globals()[name] = value  # Cache: later lookups skip __getattr__
+        return value
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    """Include lazy names in dir() for introspection and completion."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     # Core orchestrator
     "TriadRouter",
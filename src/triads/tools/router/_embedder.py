@@ -4,18 +4,16 @@ Text embedding for semantic routing.
 Uses sentence-transformers for fast, high-quality embeddings.
 """
 
-from typing import List
+from pathlib import Path
+from typing import Dict, List, Optional
 
 import numpy as np
 
-# Type checking for sentence_transformers (installed as dependency)
-try:
-    from sentence_transformers import SentenceTransformer
-except ImportError:
-    raise ImportError(
-        "sentence-transformers not installed. "
-        "Install with: pip install sentence-transformers"
-    )
+from ._embedding_cache import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    PromptEmbeddingCache,
+)
 
 
 class RouterEmbedder:
@@ -27,26 +25,56 @@ class RouterEmbedder:
     - ~80MB model size
     - <10ms inference for typical prompts
     - Pretrained on 1B+ sentence pairs
+
+    Repeated prompts are served from a PromptEmbeddingCache (in-process LRU,
+    optionally backed by a memory-mapped file shared across hook processes).
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        cache_size: int = DEFAULT_MAX_ENTRIES,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        cache_path: Optional[Path] = None,
+    ):
         """
         Initialize embedder.
 
         Args:
             model_name: Sentence-transformers model name
                        (default: all-MiniLM-L6-v2)
+            cache_size: Maximum cached prompt embeddings (0 disables caching)
+            cache_max_bytes: Maximum bytes of cached embeddings
+            cache_path: Memory-mapped cache file shared across processes
+                       (default: None, in-process cache only)
         """
+        # Deferred import: sentence-transformers pulls in torch (seconds of
+        # start-up), so only pay for it when an embedder is actually built
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError(
+                "sentence-transformers not installed. "
+                "Install with: pip install sentence-transformers"
+            )
+
         # Model will be cached at ~/.cache/torch by sentence-transformers
         self.model = SentenceTransformer(model_name)
         self.embedding_dim = 384
         self.model_name = model_name
+        self.cache = PromptEmbeddingCache(
+            model_name,
+            self.embedding_dim,
+            max_entries=cache_size,
+            max_bytes=cache_max_bytes,
+            persist_path=cache_path,
+        )
 
     def embed(self, text: str) -> np.ndarray:
         """
         Embed text to 384-dimensional vector.
 
-        Performance: <10ms for typical prompts
+        Performance: <10ms for typical prompts, ~0ms for cached prompts
 
         Args:
             text: Text to embed
@@ -54,6 +82,10 @@ class RouterEmbedder:
         Returns:
             384-dimensional numpy array
         """
+        cached = self.cache.get(text)
+        if cached is not None:
+            return cached
+
         embedding = self.model.encode(text, convert_to_numpy=True)
 
         # Validate shape
@@ -63,28 +95,53 @@ class RouterEmbedder:
                 f"got shape {embedding.shape}"
             )
 
+        self.cache.put(text, embedding)
         return embedding
 
     def embed_batch(self, texts: List[str]) -> np.ndarray:
         """
         Embed multiple texts efficiently.
 
+        Cached texts are served from the prompt cache; the rest are encoded
+        in a single model call.
+
         Args:
             texts: List of texts to embed
 
         Returns:
             (N, 384) numpy array where N is number of texts
         """
-        embeddings = self.model.encode(texts, convert_to_numpy=True)
+        cached = [self.cache.get(text) for text in texts]
+        missing = [i for i, vector in enumerate(cached) if vector is None]
 
-        # Validate shape
-        expected_shape = (len(texts), self.embedding_dim)
-        if embeddings.shape != expected_shape:
-            raise ValueError(
-                f"Expected shape {expected_shape}, got {embeddings.shape}"
+        if missing:
+            encoded = self.model.encode(
+                [texts[i] for i in missing], convert_to_numpy=True
             )
 
-        return embeddings
+            # Validate shape
+            expected_shape = (len(missing), self.embedding_dim)
+            if encoded.shape != expected_shape:
+                raise ValueError(
+                    f"Expected shape {expected_shape}, got {encoded.shape}"
+                )
+
+            for i, embedding in zip(missing, encoded):
+                self.cache.put(texts[i], embedding)
+                cached[i] = embedding
+
+        if not texts:
+            return np.zeros((0, self.embedding_dim), dtype=np.float32)
+        return np.stack(cached)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Get prompt embedding cache counters.
+
+        Returns:
+            Dictionary with hits, misses, entries and bytes
+        """
+        return self.cache.stats()
 
     def __repr__(self) -> str:
         """String representation."""
@@ -0,0 +1,263 @@
+"""
+Prompt embedding cache for RouterEmbedder.
+
+Users repeat short prompts constantly ("continue", "yes", "run the tests"),
+and each one would otherwise go through SentenceTransformer.encode again.
+
+Two layers, both keyed by a hash of the normalized prompt text:
+- In-process LRU bounded by entry count and bytes
+- Optional memory-mapped slot file shared by every hook process, so a
+  repeat hits even when it arrives in a new process
+
+The slot file is a fixed-size open-addressing table: each key hashes to a
+short probe window, and a full window evicts its least recently used slot.
+Lookups and inserts are O(1) and never read the whole file.
+"""
+
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from triads.utils.file_operations import FileLocker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+# Slots examined per key in the persistent table before evicting
+PROBE_WINDOW = 8
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(text: str) -> str:
+    """
+    Normalize prompt text for cache keying.
+
+    Collapses whitespace runs and strips the ends. Case is preserved: cased
+    models embed "Yes" and "yes" differently.
+
+    Args:
+        text: Raw prompt text
+
+    Returns:
+        Normalized text
+    """
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class PromptEmbeddingCache:
+    """
+    Bounded LRU of prompt embeddings with optional mmap persistence.
+
+    Attributes:
+        hits: Lookups answered from either layer
+        misses: Lookups that required encoding
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        embedding_dim: int,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        persist_path: Optional[Path] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            model_name: Embedding model name (part of every key)
+            embedding_dim: Embedding dimensionality
+            max_entries: Maximum cached prompts (memory and persistent file)
+            max_bytes: Maximum bytes of cached vectors (memory and persistent file)
+            persist_path: Slot file for cross-process persistence (None: memory only)
+        """
+        self.model_name = model_name
+        self.embedding_dim = embedding_dim
+        self.entry_bytes = embedding_dim * 4
+        self.max_entries = max(0, min(max_entries, max_bytes // self.entry_bytes))
+        self.hits = 0
+        self.misses = 0
+
+        self._memory: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._table: Optional[np.memmap] = None
+        self._lock_path: Optional[Path] = None
+        self._clock = 0
+
+        if persist_path is not None and self.max_entries > 0:
+            self._open_table(Path(persist_path))
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def key(self, text: str) -> bytes:
+        """Compute the 16-byte cache key for a prompt."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.model_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(normalize_prompt(text).encode("utf-8"))
+        return digest.digest()
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """
+        Look up a prompt embedding.
+
+        Args:
+            text: Prompt text
+
+        Returns:
+            Copy of the cached embedding, or None on miss
+        """
+        if self.max_entries == 0:
+            self.misses += 1
+            return None
+
+        key = self.key(text)
+
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return vector.copy()
+
+        vector = self._table_get(key)
+        if vector is not None:
+            self._remember(key, vector)
+            self.hits += 1
+            return vector.copy()
+
+        self.misses += 1
+        return None
+
+    def put(self, text: str, embedding: np.ndarray) -> None:
+        """
+        Store a prompt embedding in both layers.
+
+        Args:
+            text: Prompt text
+            embedding: Embedding vector of shape (embedding_dim,)
+        """
+        if self.max_entries == 0:
+            return
+
+        vector = np.array(embedding, dtype=np.float32).reshape(self.embedding_dim)
+        key = self.key(text)
+        self._remember(key, vector)
+        self._table_put(key, vector)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, entries and bytes held in memory
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._memory),
+            "bytes": len(self._memory) * self.entry_bytes,
+        }
+
+    # ------------------------------------------------------------------
+    # In-memory LRU
+    # ------------------------------------------------------------------
+
+    def _remember(self, key: bytes, vector: np.ndarray) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entries."""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Persistent slot table
+    # ------------------------------------------------------------------
+
+    def _slot_dtype(self) -> np.dtype:
+        return np.dtype(
+            [
+                ("key", "V16"),
+                ("stamp", "<u8"),
+                ("vec", "<f4", (self.embedding_dim,)),
+            ]
+        )
+
+    def _open_table(self, path: Path) -> None:
+        """Open (creating or resizing if needed) the memory-mapped slot file."""
+        dtype = self._slot_dtype()
+        expected_size = dtype.itemsize * self.max_entries
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._lock_path = path.with_name(path.name + ".lock")
+
+            with FileLocker(self._lock_path):
+                if not path.exists() or path.stat().st_size != expected_size:
+                    # New file, or limits/model dimension changed: start empty
+                    with open(path, "wb") as f:
+                        f.truncate(expected_size)
+
+            self._table = np.memmap(path, dtype=dtype, mode="r+", shape=(self.max_entries,))
+            self._clock = int(self._table["stamp"].max()) if self.max_entries else 0
+
+        except (OSError, ValueError) as e:
+            logger.debug(f"Prompt embedding cache file unavailable, memory only: {e}")
+            self._table = None
+
+    def _probe(self, key: bytes):
+        """Slot indices a key may occupy."""
+        start = int.from_bytes(key[:8], "little") % self.max_entries
+        return [(start + i) % self.max_entries for i in range(min(PROBE_WINDOW, self.max_entries))]
+
+    def _table_get(self, key: bytes) -> Optional[np.ndarray]:
+        """Read a key from the slot file (lock-free; re-checks key after copy)."""
+        if self._table is None:
+            return None
+
+        try:
+            for slot in self._probe(key):
+                if self._table[slot]["key"].tobytes() != key:
+                    continue
+                vector = np.array(self._table[slot]["vec"], dtype=np.float32)
+                # A concurrent writer clears the key before touching the vector
+                if self._table[slot]["key"].tobytes() == key:
+                    return vector
+        except (OSError, ValueError) as e:
+            logger.debug(f"Prompt embedding cache read failed: {e}")
+        return None
+
+    def _table_put(self, key: bytes, vector: np.ndarray) -> None:
+        """Write a key into its probe window, evicting the least recently used slot."""
+        if self._table is None:
+            return
+
+        try:
+            with FileLocker(self._lock_path):
+                slots = self._probe(key)
+                stamps = self._table["stamp"][slots]
+
+                target = next(
+                    (s for s in slots if self._table[s]["key"].tobytes() == key),
+                    slots[int(np.argmin(stamps))],
+                )
+
+                self._clock = max(self._clock, int(self._table["stamp"][slots].max())) + 1
+                empty_key = np.void(bytes(16))
+
+                # Clear key first so lock-free readers never pair it with a torn vector
+                self._table["key"][target] = empty_key
+                self._table["vec"][target] = vector
+                self._table["stamp"][target] = self._clock
+                self._table["key"][target] = np.void(key)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Prompt embedding cache write failed: {e}")
+
@@ -8,8 +8,6 @@ import os
 import time
 from typing import List, Optional, Tuple
 
-import anthropic
-
 
 class LLMDisambiguator:
     """
@@ -34,6 +32,10 @@ class LLMDisambiguator:
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable not set")
 
+        # Deferred import: the anthropic SDK is slow to import and only
+        # needed once disambiguation is actually configured
+        import anthropic
+
         self.client = anthropic.Anthropic(api_key=api_key)
         self.timeout_ms = timeout_ms
         self.model = "claude-3-5-sonnet-20241022"
@@ -59,6 +61,8 @@ class LLMDisambiguator:
             TimeoutError: If LLM call exceeds timeout_ms
             anthropic.APIError: If API call fails
         """
+        import anthropic
+
         start_time = time.time()
 
         # Build disambiguation prompt
@@ -205,6 +209,8 @@ The user wants to write code for a specific feature."""
             anthropic.RateLimitError: If rate limited after retries
             anthropic.AuthenticationError: If API key is invalid
         """
+        import anthropic
+
         for attempt in range(max_retries + 1):
             try:
                 return self.disambiguate(prompt, candidates, context)
@@ -0,0 +1,176 @@
+"""
+On-disk cache for pre-computed triad route embeddings.
+
+SemanticRouter embeds every route (description + example prompts) at
+construction time. Route text rarely changes, so the embeddings are persisted
+next to triad_routes.json:
+
+- triad_routes.embeddings.npy: (N, 384) float32 matrix, memory-mapped on load
+- triad_routes.embeddings.json: manifest mapping row -> route key
+
+Each route key is a hash of the model name plus the route text, so switching
+models or editing a route re-encodes only the affected routes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from triads.utils.file_operations import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes (old caches are then ignored)
+CACHE_FORMAT_VERSION = 1
+
+
+class RouteEmbeddingCache:
+    """
+    Persistent route embedding cache keyed by model + route text hash.
+
+    The cache is best-effort: unreadable, stale or mismatched files are
+    treated as misses, and write failures are logged and ignored.
+    """
+
+    def __init__(self, routes_path: Path):
+        """
+        Initialize cache for a routes file.
+
+        Args:
+            routes_path: Path to triad_routes.json
+        """
+        routes_path = Path(routes_path)
+        self.matrix_path = routes_path.with_name(f"{routes_path.stem}.embeddings.npy")
+        self.manifest_path = routes_path.with_name(f"{routes_path.stem}.embeddings.json")
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def route_key(model_name: str, text: str) -> str:
+        """
+        Compute the cache key for one route.
+
+        Args:
+            model_name: Embedding model name
+            text: Combined route text that gets embedded
+
+        Returns:
+            Hex digest identifying (model, text)
+        """
+        digest = hashlib.sha256()
+        digest.update(model_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_embeddings(self, embedder, texts: List[str]) -> np.ndarray:
+        """
+        Return embeddings for texts, encoding only those not already cached.
+
+        Misses are encoded in a single embed_batch() call, then the cache is
+        rewritten to hold exactly the current routes.
+
+        Args:
+            embedder: RouterEmbedder (needs model_name, embed_batch)
+            texts: Route texts in route order
+
+        Returns:
+            (len(texts), dim) float32 matrix
+        """
+        model_name = embedder.model_name
+        keys = [self.route_key(model_name, text) for text in texts]
+        cached = self._load(model_name)
+
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+
+        if not missing:
+            if not texts:
+                return np.zeros((0, embedder.embedding_dim), dtype=np.float32)
+            return np.stack([cached[key] for key in keys]).astype(np.float32, copy=False)
+
+        encoded = np.asarray(
+            embedder.embed_batch([texts[i] for i in missing]), dtype=np.float32
+        )
+        fresh = dict(zip((keys[i] for i in missing), encoded))
+
+        matrix = np.stack(
+            [fresh[key] if key in fresh else cached[key] for key in keys]
+        ).astype(np.float32, copy=False)
+
+        self._save(model_name, keys, matrix)
+        return matrix
+
+    def _load(self, model_name: str) -> Dict[str, np.ndarray]:
+        """
+        Load cached rows for model_name as {route_key: embedding}.
+
+        Returns:
+            Mapping of route key to embedding (empty on any mismatch or error)
+        """
+        try:
+            if not self.manifest_path.exists() or not self.matrix_path.exists():
+                return {}
+
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            if not isinstance(manifest, dict) or (
+                manifest.get("format") != CACHE_FORMAT_VERSION
+                or manifest.get("model") != model_name
+            ):
+                return {}
+
+            # Guard against a matrix replaced without its manifest
+            stat = self.matrix_path.stat()
+            if [stat.st_size, stat.st_mtime_ns] != manifest.get("matrix_stat"):
+                return {}
+
+            matrix = np.load(self.matrix_path, mmap_mode="r")
+            keys = manifest.get("keys", [])
+            if matrix.ndim != 2 or matrix.shape[0] != len(keys):
+                return {}
+
+            return {key: matrix[row] for row, key in enumerate(keys)}
+
+        except (OSError, ValueError) as e:
+            logger.debug(f"Route embedding cache unreadable, re-encoding: {e}")
+            return {}
+
+    def _save(self, model_name: str, keys: List[str], matrix: np.ndarray) -> None:
+        """Atomically replace the cache with the given rows."""
+        temp_path: Optional[str] = None
+        try:
+            self.matrix_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.matrix_path.parent, suffix=".npy.tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, matrix)
+            os.replace(temp_path, self.matrix_path)
+            temp_path = None
+
+            stat = self.matrix_path.stat()
+            atomic_write_json(
+                self.manifest_path,
+                {
+                    "format": CACHE_FORMAT_VERSION,
+                    "model": model_name,
+                    "dim": int(matrix.shape[1]) if matrix.ndim == 2 else 0,
+                    "keys": keys,
+                    "matrix_stat": [stat.st_size, stat.st_mtime_ns],
+                },
+                lock=False,
+                indent=None,
+            )
+        except OSError as e:
+            logger.debug(f"Failed to write route embedding cache: {e}")
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
@@ -53,6 +53,11 @@ class RouterPaths:
         """Triad routes file (~/.claude/router/triad_routes.json)."""
         return self.router_dir / "triad_routes.json"
     
+    @property
+    def prompt_cache_file(self) -> Path:
+        """Prompt embedding cache (~/.claude/router/prompt_embeddings.mmap)."""
+        return self.router_dir / "prompt_embeddings.mmap"
+    
     @property
     def logs_dir(self) -> Path:
         """Logs directory (~/.claude/router/logs)."""
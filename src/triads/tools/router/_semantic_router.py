@@ -12,6 +12,7 @@ from typing import List, Optional, Tuple
 import numpy as np
 
 from ._embedder import RouterEmbedder
+from ._route_cache import RouteEmbeddingCache
 from ._router_paths import DEFAULT_PATHS
 
 
@@ -75,6 +76,7 @@ class SemanticRouter:
         self,
         embedder: RouterEmbedder,
         routes_path: Optional[Path] = None,
+        use_cache: bool = True,
     ):
         """
         Initialize semantic router.
@@ -83,12 +85,22 @@ class SemanticRouter:
             embedder: RouterEmbedder instance
             routes_path: Path to triad_routes.json.
                         Defaults to ~/.claude/router/triad_routes.json
+            use_cache: Reuse route embeddings persisted next to routes_path
+                       (only changed routes are re-encoded)
         """
         if routes_path is None:
             routes_path = DEFAULT_PATHS.routes_file
 
         self.embedder = embedder
         self.routes: List[TriadRoute] = []
+        # (n_routes, dim) float32, rows L2-normalized once so scoring a prompt
+        # is a single matrix-vector product
+        self._route_matrix = np.zeros((0, 0), dtype=np.float32)
+        self.route_cache: Optional[RouteEmbeddingCache] = (
+            RouteEmbeddingCache(routes_path)
+            if use_cache and isinstance(getattr(embedder, "model_name", None), str)
+            else None
+        )
 
         # Load and pre-compute route embeddings
         self._load_routes(routes_path)
@@ -103,17 +115,21 @@ class SemanticRouter:
         with open(routes_path) as f:
             data = json.load(f)
 
-        for route_data in data["routes"]:
-            # Combine description + examples for richer embedding
-            # This gives the model more context to understand the triad's purpose
-            combined_text = (
-                f"{route_data['description']} "
-                + " ".join(route_data["example_prompts"])
-            )
-
-            # Pre-compute embedding (done once at initialization)
-            embedding = self.embedder.embed(combined_text)
-
+        # Combine description + examples for richer embedding
+        # This gives the model more context to understand the triad's purpose
+        texts = [
+            f"{route_data['description']} " + " ".join(route_data["example_prompts"])
+            for route_data in data["routes"]
+        ]
+
+        # Pre-compute embeddings (done once at initialization; cached on disk
+        # so only new or edited routes go through the model)
+        if self.route_cache is not None:
+            embeddings = list(self.route_cache.get_embeddings(self.embedder, texts))
+        else:
+            embeddings = [self.embedder.embed(text) for text in texts]
+
+        for route_data, embedding in zip(data["routes"], embeddings):
             route = TriadRoute(
                 name=route_data["name"],
                 description=route_data["description"],
@@ -123,7 +139,41 @@ class SemanticRouter:
             )
             self.routes.append(route)
 
-    def route(self, prompt: str) -> List[Tuple[str, float]]:
+        self._build_route_matrix()
+
+    def _build_route_matrix(self) -> None:
+        """Stack route embeddings into one pre-normalized float32 matrix."""
+        if not self.routes:
+            self._route_matrix = np.zeros((0, 0), dtype=np.float32)
+            return
+
+        matrix = np.stack([route.embedding for route in self.routes]).astype(np.float32)
+        self._route_matrix = self._normalize_rows(matrix)
+
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """L2-normalize rows; zero rows stay zero (cosine similarity 0.0)."""
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+    def _ranked(self, scores: np.ndarray, top_k: Optional[int]) -> List[Tuple[str, float]]:
+        """
+        Turn one row of scores into (triad_name, score) sorted descending.
+
+        With top_k, argpartition selects the k best before sorting them.
+        """
+        n_routes = scores.shape[0]
+        if top_k is not None and 0 < top_k < n_routes:
+            candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+            order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        else:
+            order = np.argsort(-scores, kind="stable")
+
+        return [(self.routes[i].name, float(scores[i])) for i in order]
+
+    def route(
+        self, prompt: str, top_k: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
         """
         Route prompt to triads using semantic similarity.
 
@@ -133,23 +183,52 @@ class SemanticRouter:
 
         Args:
             prompt: User prompt to route
+            top_k: Only return the k best routes (default: all routes)
 
         Returns:
             List of (triad_name, confidence) tuples sorted by confidence descending
         """
+        if not self.routes:
+            return []
+        if self._route_matrix.shape[0] != len(self.routes):
+            self._build_route_matrix()
+
         # Embed user prompt
-        prompt_embedding = self.embedder.embed(prompt)
+        prompt_embedding = np.asarray(self.embedder.embed(prompt), dtype=np.float32)
+
+        # Cosine similarity with all routes in one product
+        query = self._normalize_rows(prompt_embedding.reshape(1, -1))[0]
+        scores = self._route_matrix @ query
+
+        return self._ranked(scores, top_k)
+
+    def route_batch(
+        self, prompts: List[str], top_k: Optional[int] = None
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Route many prompts at once (e.g. replaying history to tune thresholds).
 
-        # Compute cosine similarity with all routes
-        scores = []
-        for route in self.routes:
-            similarity = self._cosine_similarity(prompt_embedding, route.embedding)
-            scores.append((route.name, float(similarity)))
+        Embeds all prompts with one embed_batch() call and scores them with a
+        single (n_prompts, dim) x (dim, n_routes) matrix product.
+
+        Args:
+            prompts: User prompts to route
+            top_k: Only return the k best routes per prompt (default: all routes)
+
+        Returns:
+            One route() result per prompt, in input order
+        """
+        if not prompts:
+            return []
+        if not self.routes:
+            return [[] for _ in prompts]
+        if self._route_matrix.shape[0] != len(self.routes):
+            self._build_route_matrix()
 
-        # Sort by confidence descending
-        scores.sort(key=lambda x: x[1], reverse=True)
+        embeddings = np.asarray(self.embedder.embed_batch(prompts), dtype=np.float32)
+        scores = self._normalize_rows(embeddings) @ self._route_matrix.T
 
-        return scores
+        return [self._ranked(row, top_k) for row in scores]
 
     @staticmethod
     def _cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
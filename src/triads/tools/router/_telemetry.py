@@ -185,6 +185,32 @@ class TelemetryLogger:
             },
         )
 
+    def log_embedding_cache(
+        self,
+        hit: bool,
+        hits: int,
+        misses: int,
+        entries: int,
+    ) -> None:
+        """
+        Log prompt embedding cache outcome.
+
+        Args:
+            hit: Whether this prompt's embedding came from the cache
+            hits: Cumulative cache hits for this embedder
+            misses: Cumulative cache misses for this embedder
+            entries: Prompts currently held in memory
+        """
+        self.log_event(
+            "embedding_cache",
+            {
+                "hit": hit,
+                "hits": hits,
+                "misses": misses,
+                "entries": entries,
+            },
+        )
+
     def log_error(
         self,
         error_type: str,
@@ -264,6 +290,8 @@ class TelemetryLogger:
             "manual_routes": 0,
             "avg_latency_ms": 0.0,
             "errors": 0,
+            "embedding_cache_hits": 0,
+            "embedding_cache_misses": 0,
         }
 
         latencies = []
@@ -291,6 +319,12 @@ class TelemetryLogger:
                     elif event["event_type"] == "error":
                         stats["errors"] += 1
 
+                    elif event["event_type"] == "embedding_cache":
+                        if event.get("hit"):
+                            stats["embedding_cache_hits"] += 1
+                        else:
+                            stats["embedding_cache_misses"] += 1
+
                 except json.JSONDecodeError:
                     continue
 
@@ -17,6 +17,7 @@ from ._embedder import RouterEmbedder
 from ._grace_period import GracePeriodChecker
 from ._llm_disambiguator import LLMDisambiguator
 from ._manual_selector import ManualSelector
+from ._router_paths import DEFAULT_PATHS
 from ._semantic_router import RoutingDecision, SemanticRouter
 from ._state_manager import _RouterStateManager as RouterStateManager
 from ._telemetry import TelemetryLogger
@@ -71,7 +72,7 @@ class TriadRouter:
         self.telemetry = TelemetryLogger(enabled=self.config.telemetry_enabled)
 
         # Initialize embedder and semantic router
-        self.embedder = RouterEmbedder()
+        self.embedder = RouterEmbedder(cache_path=DEFAULT_PATHS.prompt_cache_file)
         self.semantic_router = SemanticRouter(self.embedder)
 
         # Initialize grace period checker
@@ -208,7 +209,9 @@ class TriadRouter:
             Routing result dictionary
         """
         # Step 1: Semantic routing
+        hits_before = self.embedder.cache.hits if self.telemetry.enabled else 0
         semantic_scores = self.semantic_router.route(prompt)
+        self._log_embedding_cache(hits_before)
         decision, candidates = self.semantic_router.threshold_check(
             semantic_scores,
             confidence_threshold=self.config.confidence_threshold,
@@ -314,6 +317,24 @@ class TriadRouter:
                 "latency_ms": latency_ms,
             }
 
+    def _log_embedding_cache(self, hits_before: int) -> None:
+        """
+        Log prompt embedding cache counters after semantic routing.
+
+        Args:
+            hits_before: Cache hit count before the prompt was embedded
+        """
+        if not self.telemetry.enabled:
+            return
+
+        cache_stats = self.embedder.cache_stats()
+        self.telemetry.log_embedding_cache(
+            hit=cache_stats["hits"] > hits_before,
+            hits=cache_stats["hits"],
+            misses=cache_stats["misses"],
+            entries=cache_stats["entries"],
+        )
+
     def _update_state_for_grace_period(self, state: RouterState) -> None:
         """
         Increment turn count and update activity timestamp.
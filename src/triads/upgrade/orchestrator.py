@@ -685,7 +685,8 @@ class UpgradeOrchestrator:
             # Replace template variables with placeholders
             # The triad_name will vary per agent
             section = section.replace('{triad_name}', '{triad_name}')
-            return section
+            # Unescape literal braces (the template is a str.format string)
+            return section.replace('{{', '{').replace('}}', '}')
 
         # Fallback if not found (should not happen)
         return """## 🧠 Knowledge Graph Protocol (MANDATORY)
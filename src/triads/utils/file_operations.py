@@ -127,7 +127,7 @@ def atomic_write_json(
     data: dict[str, Any],
     lock: bool = True,
     indent: int = 2,
-) -> None:
+) -> os.stat_result:
     """Write JSON file atomically with optional file locking.
 
     Uses write-to-temp-then-rename pattern for atomicity.
@@ -138,6 +138,10 @@ def atomic_write_json(
         lock: If True, acquire exclusive lock during write (default: True)
         indent: JSON indentation (default: 2)
 
+    Returns:
+        Stat of the file as written (unlike a later stat of file_path, not
+        affected by another writer replacing the file meanwhile)
+
     Raises:
         OSError: If file operations fail
 
@@ -162,6 +166,7 @@ def atomic_write_json(
                     json.dump(data, f, indent=indent)
                     f.flush()
                     os.fsync(f.fileno())  # Ensure data written to disk
+                    written = os.fstat(f.fileno())
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)
         else:
@@ -170,9 +175,11 @@ def atomic_write_json(
                 json.dump(data, f, indent=indent)
                 f.flush()
                 os.fsync(f.fileno())
+                written = os.fstat(f.fileno())
 
-        # Atomic rename (overwrites existing file)
+        # Atomic rename (overwrites existing file; keeps inode, size and mtime)
         temp_file.replace(file_path)
+        return written
 
     except Exception as e:
         # Clean up temp file on failure
@@ -0,0 +1,156 @@
+"""Tests for IndexedJSONLEventRepository - JSONL storage with a sidecar index."""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from triads.events.indexed_repository import IndexedJSONLEventRepository, main
+from triads.events.jsonl_repository import JSONLEventRepository
+from triads.events.models import Event, EventFilters
+
+
+BASE_TIME = datetime(2025, 10, 30, 14, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def indexed_repo(temp_jsonl_file, multiple_events):
+    """Indexed repository populated with multiple_events."""
+    repo = IndexedJSONLEventRepository(temp_jsonl_file)
+    for event in multiple_events:
+        repo.save(event)
+    return repo
+
+
+def _ids(events):
+    return [e.id for e in events]
+
+
+class TestIndexedParity:
+    """Indexed queries return the same results as the full-scan repository."""
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            EventFilters(),
+            EventFilters(subject="agent"),
+            EventFilters(predicate="started"),
+            EventFilters(workspace_id="workspace-1", subject="agent"),
+            EventFilters(time_from=BASE_TIME + timedelta(minutes=2)),
+            EventFilters(time_to=BASE_TIME + timedelta(minutes=11)),
+            EventFilters(search="timeout"),
+            EventFilters(sort_order="asc", limit=3, offset=1),
+            EventFilters(subject="agent", limit=2, offset=1),
+            EventFilters(sort_by="subject", sort_order="asc"),
+        ],
+    )
+    def test_query_and_count_match_full_scan(self, indexed_repo, temp_jsonl_file, filters):
+        """Query and count agree with JSONLEventRepository."""
+        full_scan = JSONLEventRepository(temp_jsonl_file)
+
+        assert _ids(indexed_repo.query(filters)) == _ids(full_scan.query(filters))
+        assert indexed_repo.count(filters) == full_scan.count(filters)
+
+
+class TestIndexMaintenance:
+    """Tests for incremental and full index maintenance."""
+
+    def test_save_writes_sidecar_index(self, indexed_repo, temp_jsonl_file, multiple_events):
+        """Each saved event gets one index record after the header."""
+        index_path = temp_jsonl_file.with_name(temp_jsonl_file.name + ".idx")
+        lines = index_path.read_text().splitlines()
+
+        assert json.loads(lines[0])["format"] == 1
+        assert len(lines) == 1 + len(multiple_events)
+
+    def test_get_by_id(self, indexed_repo, multiple_events):
+        """Events are found by id; unknown ids return None."""
+        target = multiple_events[3]
+
+        assert indexed_repo.get_by_id(target.id).subject == target.subject
+        assert indexed_repo.get_by_id("missing") is None
+        assert indexed_repo.get_by_id("") is None
+
+    def test_external_appends_are_indexed(self, indexed_repo, temp_jsonl_file):
+        """Lines appended by other writers (e.g. hooks) are picked up."""
+        with open(temp_jsonl_file, "a") as f:
+            f.write(json.dumps({
+                "id": "external-1",
+                "subject": "hook",
+                "predicate": "executed",
+                "object_data": {},
+                "timestamp": (BASE_TIME + timedelta(hours=1)).isoformat(),
+            }) + "\n")
+
+        assert indexed_repo.get_by_id("external-1") is not None
+        assert indexed_repo.query(EventFilters(limit=1))[0].id == "external-1"
+
+    def test_partial_trailing_line_deferred(self, indexed_repo, temp_jsonl_file, multiple_events):
+        """A line still being written is not indexed until complete."""
+        with open(temp_jsonl_file, "a") as f:
+            f.write('{"id": "partial", "subject": "hook"')
+
+        assert indexed_repo.count(EventFilters()) == len(multiple_events)
+
+        with open(temp_jsonl_file, "a") as f:
+            f.write(', "predicate": "executed", "object_data": {}}\n')
+
+        assert indexed_repo.get_by_id("partial") is not None
+
+    def test_new_instance_reuses_index(self, indexed_repo, temp_jsonl_file, multiple_events):
+        """A fresh repository loads the sidecar instead of re-indexing."""
+        index_path = temp_jsonl_file.with_name(temp_jsonl_file.name + ".idx")
+        size_before = index_path.stat().st_size
+
+        repo = IndexedJSONLEventRepository(temp_jsonl_file)
+
+        assert repo.count(EventFilters()) == len(multiple_events)
+        assert index_path.stat().st_size == size_before
+
+    def test_rotated_log_triggers_rebuild(self, indexed_repo, temp_jsonl_file):
+        """Replacing the log (rotation) rebuilds the index."""
+        os.replace(temp_jsonl_file, temp_jsonl_file.with_name("rotated.jsonl"))
+        temp_jsonl_file.write_text(json.dumps({
+            "id": "fresh", "subject": "agent", "predicate": "started", "object_data": {}
+        }) + "\n")
+
+        assert indexed_repo.count(EventFilters()) == 1
+        assert indexed_repo.get_by_id("fresh") is not None
+
+    def test_corrupt_lines_skipped(self, temp_jsonl_file, sample_event):
+        """Corrupt lines are indexed as skipped, not returned."""
+        temp_jsonl_file.write_text("{not json\n\n")
+        repo = IndexedJSONLEventRepository(temp_jsonl_file)
+        repo.save(sample_event)
+
+        assert _ids(repo.query(EventFilters())) == [sample_event.id]
+
+    def test_old_format_events_readable(self, sample_mixed_format_file):
+        """Old-format lines are migrated the same way as the full scan."""
+        repo = IndexedJSONLEventRepository(sample_mixed_format_file)
+
+        assert repo.count(EventFilters()) == 5
+        assert repo.get_by_id("123e4567-e89b-12d3-a456-426614174000") is not None
+
+    def test_query_stops_after_offset_plus_limit(self, temp_jsonl_file, monkeypatch):
+        """Timestamp-sorted queries parse only as many lines as they return."""
+        repo = IndexedJSONLEventRepository(temp_jsonl_file)
+        for i in range(50):
+            repo.save(Event("agent", "completed", {"i": i}, timestamp=BASE_TIME + timedelta(seconds=i)))
+
+        reads = []
+        original = repo._read_record
+        monkeypatch.setattr(repo, "_read_record", lambda f, r: reads.append(r) or original(f, r))
+
+        results = repo.query(EventFilters(limit=5, offset=2))
+
+        assert [e.object_data["i"] for e in results] == [47, 46, 45, 44, 43]
+        assert len(reads) == 7
+
+    def test_rebuild_index_cli(self, indexed_repo, temp_jsonl_file, multiple_events, capsys):
+        """rebuild-index recreates a deleted sidecar index."""
+        temp_jsonl_file.with_name(temp_jsonl_file.name + ".idx").unlink()
+
+        assert main(["rebuild-index", str(temp_jsonl_file)]) == 0
+        assert f"Indexed {len(multiple_events)} events" in capsys.readouterr().out
@@ -730,3 +730,85 @@ class TestJSONLRepositoryEdgeCases:
         
         # Document: If disk were full, should raise EventStorageError
         # (actual simulation requires mocking or disk quota tools)
+
+
+class TestJSONLRepositoryStreaming:
+    """Tests for streaming, early-terminating reads."""
+
+    @pytest.fixture
+    def large_repo(self, temp_jsonl_file):
+        """Repository with 200 events appended in timestamp order."""
+        base = datetime(2025, 10, 30, 14, 0, 0, tzinfo=timezone.utc)
+        repo = JSONLEventRepository(temp_jsonl_file)
+        for i in range(200):
+            repo.save(Event(
+                subject="agent" if i % 2 else "hook",
+                predicate="completed",
+                object_data={"i": i},
+                timestamp=base + timedelta(seconds=i),
+            ))
+        return repo
+
+    def test_default_sort_stops_early(self, large_repo, monkeypatch):
+        """Timestamp-desc queries parse only the tail of the file."""
+        parsed = []
+        original = large_repo._dict_to_event
+        monkeypatch.setattr(
+            large_repo, "_dict_to_event", lambda data: parsed.append(data) or original(data)
+        )
+
+        results = large_repo.query(EventFilters(limit=5, offset=5))
+
+        assert [e.object_data["i"] for e in results] == [194, 193, 192, 191, 190]
+        # The 10 newest, then up to the first event over 60s older than them
+        assert len(parsed) == 10 + 61
+
+    def test_default_sort_tolerates_late_appends(self, temp_jsonl_file):
+        """Events appended late (buffered by a hook until exit) still sort newest first."""
+        base = datetime(2025, 10, 30, 14, 0, 0, tzinfo=timezone.utc)
+        repo = JSONLEventRepository(temp_jsonl_file)
+        # i=1 was captured first but appended after i=2..4, as at hook exit
+        for i in (0, 2, 3, 4, 1):
+            repo.save(Event("hook", "executed", {"i": i}, timestamp=base + timedelta(seconds=i)))
+
+        results = repo.query(EventFilters(limit=2))
+
+        assert [e.object_data["i"] for e in results] == [4, 3]
+
+    def test_reverse_read_across_block_boundaries(self, large_repo):
+        """Backward block reads reassemble lines split across blocks."""
+        large_repo._REVERSE_BLOCK_SIZE = 37
+
+        results = large_repo.query(EventFilters(subject="agent", limit=3))
+
+        assert [e.object_data["i"] for e in results] == [199, 197, 195]
+
+    def test_bounded_heap_for_ascending_sort(self, large_repo):
+        """Ascending and non-timestamp sorts return the same page as a full sort."""
+        results = large_repo.query(EventFilters(sort_order="asc", limit=3, offset=2))
+        assert [e.object_data["i"] for e in results] == [2, 3, 4]
+
+        results = large_repo.query(EventFilters(sort_by="subject", sort_order="asc", limit=1))
+        assert results[0].subject == "agent"
+
+    def test_count_streams_without_events(self, large_repo, monkeypatch):
+        """count() never builds Event objects."""
+        monkeypatch.setattr(
+            large_repo, "_dict_to_event", lambda data: pytest.fail("Event built during count")
+        )
+
+        assert large_repo.count(EventFilters(subject="agent")) == 100
+        assert large_repo.count(EventFilters(search="hook")) == 100
+
+    def test_count_skips_invalid_records(self, temp_jsonl_file, sample_event):
+        """count() applies the same validity rules as query()."""
+        temp_jsonl_file.write_text(
+            '{"subject": "x"}\n'
+            '{"subject": "x", "predicate": ""}\n'
+            'not json\n'
+            '[1, 2]\n'
+        )
+        repo = JSONLEventRepository(temp_jsonl_file)
+        repo.save(sample_event)
+
+        assert repo.count(EventFilters()) == len(repo.query(EventFilters())) == 1
@@ -0,0 +1,155 @@
+"""Tests for SegmentedEventRepository - queries across rotated, compressed segments."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from triads.events.jsonl_repository import JSONLEventRepository
+from triads.events.models import Event, EventFilters
+from triads.events.segmented_repository import SegmentedEventRepository
+from triads.events.segments import SegmentStore
+
+
+BASE_TIME = datetime(2025, 10, 30, 14, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def segmented_repo(tmp_path, multiple_events):
+    """Repository whose events are spread over two segments and the active log."""
+    repo = SegmentedEventRepository(tmp_path / "events.jsonl")
+    for i, event in enumerate(multiple_events):
+        repo.save(event)
+        if i in (2, 5):
+            repo.rotate()
+    return repo
+
+
+@pytest.fixture
+def full_scan(tmp_path, multiple_events):
+    """Single-file repository holding the same events."""
+    repo = JSONLEventRepository(tmp_path / "all.jsonl")
+    for event in multiple_events:
+        repo.save(event)
+    return repo
+
+
+def _ids(events):
+    return [e.id for e in events]
+
+
+class TestSegmentedParity:
+    """Queries span segments and agree with a single-file repository."""
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            EventFilters(),
+            EventFilters(subject="agent"),
+            EventFilters(workspace_id="workspace-2"),
+            EventFilters(time_from=BASE_TIME + timedelta(minutes=2)),
+            EventFilters(time_to=BASE_TIME + timedelta(minutes=11)),
+            EventFilters(search="timeout"),
+            EventFilters(limit=3, offset=2),
+            EventFilters(sort_order="asc", limit=3, offset=1),
+            EventFilters(sort_by="subject", sort_order="asc"),
+        ],
+    )
+    def test_query_and_count_match_full_scan(self, segmented_repo, full_scan, filters):
+        """Query and count agree with JSONLEventRepository over all events."""
+        assert _ids(segmented_repo.query(filters)) == _ids(full_scan.query(filters))
+        assert segmented_repo.count(filters) == full_scan.count(filters)
+
+    def test_get_by_id_finds_sealed_events(self, segmented_repo, multiple_events):
+        """Events moved into segments are still found by id."""
+        assert segmented_repo.get_by_id(multiple_events[0].id) is not None
+        assert segmented_repo.get_by_id("missing") is None
+
+
+class TestSegmentStore:
+    """Tests for sealing, manifest pruning and retention."""
+
+    def test_seal_compresses_and_records_manifest(self, segmented_repo, tmp_path):
+        """Each rotation writes a gzip segment with manifest stats."""
+        store = segmented_repo.store
+        segments = store.segments()
+
+        assert len(segments) == 2
+        assert all(s["file"].endswith(".jsonl.gz") for s in segments)
+        assert sorted(s["count"] for s in segments) == [3, 3]
+        assert segments[0]["max_ts"] >= segments[1]["max_ts"]
+        assert not list(tmp_path.glob("events.jsonl.backup_*"))
+
+    def test_candidates_pruned_by_manifest(self, segmented_repo, monkeypatch):
+        """Segments outside the filter's time range or workspaces are not opened."""
+        opened = []
+        original = segmented_repo.store.open_segment
+        monkeypatch.setattr(
+            segmented_repo.store, "open_segment", lambda entry: opened.append(entry) or original(entry)
+        )
+
+        segmented_repo.query(EventFilters(workspace_id="workspace-2"))
+        segmented_repo.query(EventFilters(time_from=BASE_TIME + timedelta(minutes=25)))
+
+        assert [entry["workspace_ids"] for entry in opened] == [["workspace-1", "workspace-2"]]
+
+    def test_default_query_stops_before_older_segments(self, segmented_repo, monkeypatch):
+        """Newest-first queries satisfied by the active log open no segments."""
+        monkeypatch.setattr(segmented_repo.store, "open_segment", pytest.fail)
+
+        assert len(segmented_repo.query(EventFilters(limit=1))) == 1
+
+    def test_default_query_reads_segments_appended_late(self, tmp_path):
+        """Segment events newer than active-log events (late appends) are found."""
+        repo = SegmentedEventRepository(tmp_path / "events.jsonl")
+        repo.save(Event("hook", "executed", {"i": 2}, timestamp=BASE_TIME + timedelta(seconds=2)))
+        repo.rotate()
+        for i in (1, 0):
+            repo.save(Event("hook", "executed", {"i": i}, timestamp=BASE_TIME + timedelta(seconds=i)))
+
+        results = repo.query(EventFilters(limit=2))
+
+        assert [e.object_data["i"] for e in results] == [2, 1]
+
+    def test_unfiltered_count_uses_manifest(self, segmented_repo, monkeypatch, multiple_events):
+        """Counting without content filters reads no segment data."""
+        monkeypatch.setattr(segmented_repo.store, "open_segment", pytest.fail)
+
+        assert segmented_repo.count(EventFilters()) == len(multiple_events)
+
+    def test_retention_drops_oldest_segments(self, tmp_path):
+        """Segments beyond the byte budget are deleted oldest first."""
+        repo = SegmentedEventRepository(tmp_path / "events.jsonl")
+        for i in range(3):
+            repo.save(Event("agent", "completed", {"i": i}, timestamp=BASE_TIME + timedelta(minutes=i)))
+            entry = repo.rotate()
+            # Budget for two segments of this size
+            repo.store.max_total_bytes = entry["bytes"] * 2 + entry["bytes"] // 2
+
+        remaining = repo.store.segments()
+        assert len(remaining) == 2
+        assert len(list(repo.store.segments_dir.glob("*.gz"))) == 2
+        assert [e.object_data["i"] for e in repo.query(EventFilters())] == [2, 1]
+
+    def test_legacy_backups_are_sealed(self, tmp_path):
+        """events.jsonl.backup_* files from older rotations become segments."""
+        log_path = tmp_path / "events.jsonl"
+        backup = tmp_path / "events.jsonl.backup_20251030_140000"
+        backup.write_text(json.dumps({
+            "id": "legacy-1",
+            "subject": "hook",
+            "predicate": "executed",
+            "object_data": {},
+            "timestamp": BASE_TIME.isoformat(),
+        }) + "\n")
+
+        assert SegmentStore(log_path).seal() is None
+        assert not backup.exists()
+        assert SegmentedEventRepository(log_path).get_by_id("legacy-1") is not None
+
+    def test_rotate_empty_log_is_noop(self, tmp_path):
+        """Rotating an empty log creates no segment."""
+        repo = SegmentedEventRepository(tmp_path / "events.jsonl")
+
+        assert repo.rotate() is None
+        assert repo.store.segments() == []
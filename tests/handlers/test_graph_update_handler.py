@@ -282,6 +282,101 @@ class TestProcess:
         assert result['count'] >= 1
         assert len(result['violations']) > 0
 
+    def test_process_appends_to_update_log(self, handler, temp_graphs_dir, sample_graph):
+        """Updates to an existing graph are logged, not rewritten in full."""
+        graph_file = temp_graphs_dir / 'test_graph.json'
+        graph_file.write_text(json.dumps(sample_graph))
+        text = """
+        [GRAPH_UPDATE]
+        type: update_node
+        node_id: node_001
+        triad: test
+        confidence: 0.5
+        [/GRAPH_UPDATE]
+        [GRAPH_UPDATE]
+        type: add_edge
+        triad: test
+        source: node_001
+        target: node_001
+        [/GRAPH_UPDATE]
+        """
+
+        result = handler.process(text, agent_name="test-agent")
+
+        assert result['graphs_updated'] == ['test']
+        assert json.loads(graph_file.read_text()) == sample_graph
+        assert (temp_graphs_dir / 'test_graph.wal').exists()
+
+        graph = handler.load_graph('test')
+        assert graph['nodes'][0]['confidence'] == 0.5
+        assert graph['nodes'][0]['updated_by'] == 'test-agent'
+        assert [(e['source'], e['key']) for e in graph['links']] == [('node_001', 'relates_to')]
+        assert graph['_meta']['edge_count'] == 1
+
+    def test_save_graph_supersedes_update_log(self, handler, temp_graphs_dir, sample_graph):
+        """A full save of the folded graph removes the log."""
+        (temp_graphs_dir / 'test_graph.json').write_text(json.dumps(sample_graph))
+        handler.process("""
+        [GRAPH_UPDATE]
+        type: add_node
+        node_id: node_002
+        triad: test
+        [/GRAPH_UPDATE]
+        """, agent_name="test-agent")
+
+        graph = handler.load_graph('test')
+        assert handler.save_graph(graph, 'test')
+
+        assert not (temp_graphs_dir / 'test_graph.wal').exists()
+        assert [n['id'] for n in handler.load_graph('test')['nodes']] == ['node_001', 'node_002']
+
+
+class TestApplyUpdatesBatch:
+    """Tests for apply_updates_batch (indexed batch application)."""
+
+    def test_batch_outcomes_in_order(self, handler, sample_graph):
+        """Later updates see nodes and edges added earlier in the batch."""
+        updates = [
+            {'type': 'add_node', 'node_id': 'node_002', 'label': 'Second'},
+            {'type': 'add_node', 'node_id': 'node_002'},
+            {'type': 'update_node', 'node_id': 'node_002', 'confidence': 0.7},
+            {'type': 'add_edge', 'source': 'node_001', 'target': 'node_002'},
+            {'type': 'update_edge', 'source': 'node_001', 'target': 'node_002', 'rationale': 'why'},
+            {'type': 'update_node', 'node_id': 'missing'},
+            {'type': 'delete_node', 'node_id': 'node_001'},
+        ]
+
+        outcomes = handler.apply_updates_batch(sample_graph, updates, 'test-agent')
+
+        assert [o['status'] for o in outcomes] == [
+            'applied', 'skipped', 'applied', 'applied', 'applied', 'skipped', 'skipped'
+        ]
+        assert outcomes[3]['target'] == 'node_001 -> node_002'
+        assert [n['id'] for n in sample_graph['nodes']] == ['node_001', 'node_002']
+        assert sample_graph['nodes'][1]['confidence'] == 0.7
+        assert sample_graph['links'][0]['rationale'] == 'why'
+
+    def test_process_reports_outcomes(self, handler):
+        text = """
+        [GRAPH_UPDATE]
+        type: add_node
+        node_id: node_002
+        triad: test
+        [/GRAPH_UPDATE]
+        [GRAPH_UPDATE]
+        type: add_node
+        node_id: node_002
+        triad: test
+        [/GRAPH_UPDATE]
+        """
+
+        result = handler.process(text, agent_name="test-agent")
+
+        assert [(o['triad'], o['status']) for o in result['outcomes']] == [
+            ('test', 'applied'), ('test', 'skipped')
+        ]
+        assert result['graphs_updated'] == ['test']
+
 
 # ==============================================================================
 # Edge Cases
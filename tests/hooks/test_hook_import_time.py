@@ -0,0 +1,114 @@
+"""
+Import-time regression tests for hook entry points.
+
+Hooks run as fresh processes on every event, so any import of the embedding
+stack (torch, sentence-transformers) or the anthropic SDK costs seconds per
+tool call. These tests import each hook registered in hooks.json in a clean
+interpreter with a meta path finder that records attempts to import heavy
+backends, so they catch regressions whether or not the packages are installed.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+HOOKS_DIR = REPO_ROOT / "hooks"
+SRC_DIR = REPO_ROOT / "src"
+
+# Top-level packages hooks must never import at start-up
+HEAVY_MODULES = ["torch", "sentence_transformers", "anthropic"]
+
+PROBE_SCRIPT = """
+import importlib
+import json
+import sys
+
+HEAVY = set({heavy!r})
+attempted = []
+
+
+class _HeavyImportRecorder:
+    def find_spec(self, name, path=None, target=None):
+        if name.split(".")[0] in HEAVY:
+            attempted.append(name)
+            raise ImportError("blocked heavy import: " + name)
+        return None
+
+
+sys.meta_path.insert(0, _HeavyImportRecorder())
+sys.path[:0] = [{hooks_dir!r}, {src_dir!r}]
+
+try:
+    {statement}
+except Exception:
+    # Only a blocked heavy import may fail the import (it is recorded);
+    # anything else is a broken hook, not a lazy one
+    if not attempted:
+        raise
+
+print(json.dumps(sorted(set(attempted))))
+"""
+
+
+def _hook_modules() -> list[str]:
+    """Hook module names registered in hooks.json."""
+    config = json.loads((HOOKS_DIR / "hooks.json").read_text())
+    modules = []
+    for entries in config["hooks"].values():
+        for entry in entries:
+            for hook in entry["hooks"]:
+                script = hook["command"].split("/hooks/")[-1]
+                modules.append(Path(script).stem)
+    return sorted(set(modules))
+
+
+def _heavy_imports_attempted(statement: str) -> list[str]:
+    """Run statement in a clean interpreter and return heavy imports attempted."""
+    script = PROBE_SCRIPT.format(
+        heavy=HEAVY_MODULES,
+        hooks_dir=str(HOOKS_DIR),
+        src_dir=str(SRC_DIR),
+        statement=statement,
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        cwd=str(REPO_ROOT),
+        env={"PATH": "/usr/bin:/bin", "TRIADS_NO_DAEMON": "1"},
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module_name", _hook_modules())
+def test_hook_entry_point_does_not_import_heavy_backends(module_name):
+    """Importing a hook entry point must not pull in torch/sentence-transformers/anthropic."""
+    attempted = _heavy_imports_attempted(f"importlib.import_module({module_name!r})")
+
+    assert attempted == [], f"{module_name}.py imports heavy backends at start-up: {attempted}"
+
+
+def test_router_package_keyword_matching_is_lightweight():
+    """Keyword routing and config must not load the embedding stack."""
+    attempted = _heavy_imports_attempted(
+        "from triads.tools.router import WorkflowMatcher, RouterConfig, RouterState"
+    )
+
+    assert attempted == []
+
+
+def test_router_package_lazy_names_still_resolve():
+    """Lazy attributes resolve without building an embedder."""
+    attempted = _heavy_imports_attempted(
+        "from triads.tools.router import TriadRouter, SemanticRouter, RouterEmbedder, "
+        "LLMDisambiguator, RouterCLI"
+    )
+
+    assert attempted == []
@@ -0,0 +1,209 @@
+"""Tests for the RouterEmbedder prompt embedding cache."""
+
+import hashlib
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from triads.tools.router._embedding_cache import PromptEmbeddingCache, normalize_prompt
+from triads.tools.router._telemetry import TelemetryLogger
+
+DIM = 384
+
+
+def _vector(text: str) -> np.ndarray:
+    seed = int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+    return np.random.default_rng(seed).random(DIM, dtype=np.float32)
+
+
+class FakeSentenceTransformer:
+    """Stand-in for SentenceTransformer that records encoded texts."""
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+        self.encoded = []
+
+    def encode(self, texts, convert_to_numpy=True):
+        if isinstance(texts, str):
+            self.encoded.append(texts)
+            return _vector(texts)
+        self.encoded.extend(texts)
+        return np.stack([_vector(text) for text in texts])
+
+
+@pytest.fixture
+def fake_sentence_transformers(monkeypatch):
+    """Install a fake sentence_transformers module."""
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = FakeSentenceTransformer
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    return module
+
+
+class TestPromptEmbeddingCache:
+    """Test PromptEmbeddingCache behaviour."""
+
+    def test_normalize_collapses_whitespace(self):
+        """Test whitespace-only differences share a key."""
+        assert normalize_prompt("  run   the\ntests ") == "run the tests"
+
+        cache = PromptEmbeddingCache("m", DIM)
+        assert cache.key("run the tests") == cache.key(" run  the tests\n")
+        assert cache.key("Run the tests") != cache.key("run the tests")
+
+    def test_lru_evicts_by_count(self):
+        """Test least recently used prompt is evicted first."""
+        cache = PromptEmbeddingCache("m", DIM, max_entries=2)
+        cache.put("a", _vector("a"))
+        cache.put("b", _vector("b"))
+        cache.get("a")
+        cache.put("c", _vector("c"))
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_byte_limit_caps_entries(self):
+        """Test max_bytes bounds the entry count."""
+        cache = PromptEmbeddingCache("m", DIM, max_entries=100, max_bytes=DIM * 4 * 3)
+
+        for text in "abcdef":
+            cache.put(text, _vector(text))
+
+        assert cache.stats()["entries"] == 3
+        assert cache.stats()["bytes"] == DIM * 4 * 3
+
+    def test_returns_copies(self):
+        """Test callers cannot mutate cached vectors."""
+        cache = PromptEmbeddingCache("m", DIM)
+        cache.put("a", _vector("a"))
+
+        cache.get("a")[:] = 0
+
+        np.testing.assert_array_equal(cache.get("a"), _vector("a"))
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test a new process (instance) hits entries written by another."""
+        path = tmp_path / "prompt_embeddings.mmap"
+        PromptEmbeddingCache("m", DIM, persist_path=path).put("yes", _vector("yes"))
+
+        reader = PromptEmbeddingCache("m", DIM, persist_path=path)
+
+        np.testing.assert_array_equal(reader.get("yes"), _vector("yes"))
+        assert reader.stats()["hits"] == 1
+
+    def test_persistent_file_isolated_by_model(self, tmp_path):
+        """Test entries never leak across models sharing a file."""
+        path = tmp_path / "prompt_embeddings.mmap"
+        PromptEmbeddingCache("model-a", DIM, persist_path=path).put("yes", _vector("yes"))
+
+        assert PromptEmbeddingCache("model-b", DIM, persist_path=path).get("yes") is None
+
+    def test_persistent_file_resized_on_limit_change(self, tmp_path):
+        """Test a file written with other limits is reset rather than misread."""
+        path = tmp_path / "prompt_embeddings.mmap"
+        PromptEmbeddingCache("m", DIM, max_entries=4, persist_path=path).put("a", _vector("a"))
+
+        cache = PromptEmbeddingCache("m", DIM, max_entries=8, persist_path=path)
+
+        assert cache.get("a") is None
+        assert path.stat().st_size == cache._slot_dtype().itemsize * 8
+
+    def test_persistent_table_stays_bounded(self, tmp_path):
+        """Test inserting many prompts evicts within the fixed-size file."""
+        path = tmp_path / "prompt_embeddings.mmap"
+        cache = PromptEmbeddingCache("m", DIM, max_entries=4, persist_path=path)
+        size = path.stat().st_size
+
+        for i in range(50):
+            cache.put(f"prompt {i}", _vector(f"prompt {i}"))
+
+        assert path.stat().st_size == size
+        reader = PromptEmbeddingCache("m", DIM, max_entries=4, persist_path=path)
+        np.testing.assert_array_equal(reader.get("prompt 49"), _vector("prompt 49"))
+
+    def test_unwritable_path_falls_back_to_memory(self, tmp_path):
+        """Test persistence failures degrade to an in-memory cache."""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+
+        cache = PromptEmbeddingCache("m", DIM, persist_path=blocker / "cache.mmap")
+        cache.put("a", _vector("a"))
+
+        assert cache.get("a") is not None
+
+    def test_disabled_cache(self):
+        """Test max_entries=0 caches nothing."""
+        cache = PromptEmbeddingCache("m", DIM, max_entries=0)
+        cache.put("a", _vector("a"))
+
+        assert cache.get("a") is None
+        assert cache.stats()["misses"] == 1
+
+
+class TestRouterEmbedderCache:
+    """Test RouterEmbedder serves repeated prompts from the cache."""
+
+    def test_repeated_prompt_encoded_once(self, fake_sentence_transformers):
+        """Test embed() only calls the model for the first occurrence."""
+        from triads.tools.router._embedder import RouterEmbedder
+
+        embedder = RouterEmbedder()
+        first = embedder.embed("continue")
+        second = embedder.embed("  continue ")
+
+        np.testing.assert_array_equal(first, second)
+        assert embedder.model.encoded == ["continue"]
+        assert embedder.cache_stats()["hits"] == 1
+        assert embedder.cache_stats()["misses"] == 1
+
+    def test_batch_encodes_only_misses(self, fake_sentence_transformers):
+        """Test embed_batch() encodes uncached texts in one call."""
+        from triads.tools.router._embedder import RouterEmbedder
+
+        embedder = RouterEmbedder()
+        embedder.embed("a")
+        result = embedder.embed_batch(["a", "b", "a"])
+
+        assert embedder.model.encoded == ["a", "b"]
+        assert result.shape == (3, DIM)
+        np.testing.assert_array_equal(result[0], result[2])
+
+    def test_cache_shared_through_file(self, fake_sentence_transformers, tmp_path):
+        """Test a second embedder (new hook process) reuses the mmap cache."""
+        from triads.tools.router._embedder import RouterEmbedder
+
+        path = tmp_path / "prompt_embeddings.mmap"
+        RouterEmbedder(cache_path=path).embed("run the tests")
+
+        embedder = RouterEmbedder(cache_path=path)
+        embedder.embed("run the tests")
+
+        assert embedder.model.encoded == []
+
+    def test_cache_size_zero_disables(self, fake_sentence_transformers):
+        """Test cache_size=0 always encodes."""
+        from triads.tools.router._embedder import RouterEmbedder
+
+        embedder = RouterEmbedder(cache_size=0)
+        embedder.embed("yes")
+        embedder.embed("yes")
+
+        assert embedder.model.encoded == ["yes", "yes"]
+
+
+class TestEmbeddingCacheTelemetry:
+    """Test cache counters reach telemetry."""
+
+    def test_log_and_stats(self, tmp_path):
+        """Test embedding_cache events are counted in get_stats()."""
+        logger = TelemetryLogger(log_path=tmp_path / "telemetry.jsonl")
+        logger.log_embedding_cache(hit=False, hits=0, misses=1, entries=1)
+        logger.log_embedding_cache(hit=True, hits=1, misses=1, entries=1)
+
+        stats = logger.get_stats()
+
+        assert stats["embedding_cache_hits"] == 1
+        assert stats["embedding_cache_misses"] == 1
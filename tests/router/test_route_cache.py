@@ -0,0 +1,133 @@
+"""Tests for the on-disk route embedding cache."""
+
+import hashlib
+import json
+
+import numpy as np
+import pytest
+
+from triads.tools.router._route_cache import RouteEmbeddingCache
+from triads.tools.router._semantic_router import SemanticRouter
+
+
+class FakeEmbedder:
+    """Deterministic embedder that counts how many texts it encodes."""
+
+    embedding_dim = 384
+
+    def __init__(self, model_name: str = "fake-model"):
+        self.model_name = model_name
+        self.encoded: list[str] = []
+
+    def embed(self, text: str) -> np.ndarray:
+        self.encoded.append(text)
+        seed = int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+        return np.random.default_rng(seed).random(self.embedding_dim, dtype=np.float32)
+
+    def embed_batch(self, texts: list[str]) -> np.ndarray:
+        return np.stack([self.embed(text) for text in texts])
+
+
+@pytest.fixture
+def routes_file(tmp_path):
+    """Routes file with two triads."""
+    routes_path = tmp_path / "triad_routes.json"
+    routes_path.write_text(
+        json.dumps(
+            {
+                "routes": [
+                    {
+                        "name": "design",
+                        "description": "Design solutions",
+                        "example_prompts": ["Design the auth system"],
+                        "keywords": ["design"],
+                    },
+                    {
+                        "name": "implementation",
+                        "description": "Write code",
+                        "example_prompts": ["Implement the feature"],
+                        "keywords": ["implement"],
+                    },
+                ]
+            }
+        )
+    )
+    return routes_path
+
+
+class TestRouteEmbeddingCache:
+    """Test RouteEmbeddingCache behaviour."""
+
+    def test_cold_start_encodes_all_and_persists(self, routes_file):
+        """Test first router build encodes every route in one batch and writes cache."""
+        embedder = FakeEmbedder()
+        router = SemanticRouter(embedder, routes_path=routes_file)
+
+        assert len(embedder.encoded) == 2
+        assert router.route_cache.misses == 2
+        assert (routes_file.parent / "triad_routes.embeddings.npy").exists()
+        assert (routes_file.parent / "triad_routes.embeddings.json").exists()
+
+    def test_warm_start_encodes_nothing(self, routes_file):
+        """Test second router build reuses cached embeddings."""
+        first = SemanticRouter(FakeEmbedder(), routes_path=routes_file)
+
+        embedder = FakeEmbedder()
+        second = SemanticRouter(embedder, routes_path=routes_file)
+
+        assert embedder.encoded == []
+        assert second.route_cache.hits == 2
+        for a, b in zip(first.routes, second.routes):
+            np.testing.assert_array_equal(a.embedding, b.embedding)
+
+    def test_only_changed_routes_reencoded(self, routes_file):
+        """Test editing one route re-encodes only that route."""
+        SemanticRouter(FakeEmbedder(), routes_path=routes_file)
+
+        data = json.loads(routes_file.read_text())
+        data["routes"][1]["example_prompts"].append("Write the endpoint")
+        routes_file.write_text(json.dumps(data))
+
+        embedder = FakeEmbedder()
+        router = SemanticRouter(embedder, routes_path=routes_file)
+
+        assert len(embedder.encoded) == 1
+        assert "Write the endpoint" in embedder.encoded[0]
+        assert [r.name for r in router.routes] == ["design", "implementation"]
+
+    def test_model_change_invalidates(self, routes_file):
+        """Test a different model name never reuses cached vectors."""
+        SemanticRouter(FakeEmbedder("model-a"), routes_path=routes_file)
+
+        embedder = FakeEmbedder("model-b")
+        SemanticRouter(embedder, routes_path=routes_file)
+
+        assert len(embedder.encoded) == 2
+
+    def test_corrupt_cache_treated_as_miss(self, routes_file):
+        """Test unreadable cache files fall back to encoding."""
+        SemanticRouter(FakeEmbedder(), routes_path=routes_file)
+        (routes_file.parent / "triad_routes.embeddings.npy").write_bytes(b"garbage")
+
+        embedder = FakeEmbedder()
+        router = SemanticRouter(embedder, routes_path=routes_file)
+
+        assert len(embedder.encoded) == 2
+        assert len(router.routes) == 2
+
+    def test_cache_disabled(self, routes_file):
+        """Test use_cache=False keeps the original per-route encoding."""
+        embedder = FakeEmbedder()
+        router = SemanticRouter(embedder, routes_path=routes_file, use_cache=False)
+
+        assert router.route_cache is None
+        assert len(embedder.encoded) == 2
+        assert not (routes_file.parent / "triad_routes.embeddings.npy").exists()
+
+    def test_route_key_depends_on_model_and_text(self):
+        """Test keys differ by model and by text."""
+        key = RouteEmbeddingCache.route_key("m", "text")
+
+        assert key == RouteEmbeddingCache.route_key("m", "text")
+        assert key != RouteEmbeddingCache.route_key("other", "text")
+        assert key != RouteEmbeddingCache.route_key("m", "other text")
@@ -305,3 +305,89 @@ class TestSemanticRouter:
 
         assert "SemanticRouter" in repr_str
         assert "routes=3" in repr_str
+
+
+class StubEmbedder:
+    """Embedder returning fixed vectors per text (no model download)."""
+
+    model_name = "stub"
+    embedding_dim = 4
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    def embed(self, text):
+        return np.asarray(self.vectors[text], dtype=np.float32)
+
+    def embed_batch(self, texts):
+        return np.stack([self.embed(text) for text in texts])
+
+
+class TestVectorizedScoring:
+    """Test matrix-based scoring against the per-route cosine formula."""
+
+    @pytest.fixture
+    def router(self, tmp_path):
+        """Router over four routes with known embeddings."""
+        names = ["a", "b", "c", "zero"]
+        routes_path = tmp_path / "triad_routes.json"
+        routes_path.write_text(json.dumps({
+            "routes": [
+                {"name": n, "description": n, "example_prompts": [], "keywords": []}
+                for n in names
+            ]
+        }))
+        vectors = {
+            "a ": [1, 0, 0, 0],
+            "b ": [0, 2, 0, 0],
+            "c ": [1, 1, 0, 0],
+            "zero ": [0, 0, 0, 0],
+            "p1": [3, 1, 0, 0],
+            "p2": [0, 1, 0, 0],
+            "p0": [0, 0, 0, 0],
+        }
+        return SemanticRouter(StubEmbedder(vectors), routes_path=routes_path, use_cache=False)
+
+    def test_route_matches_cosine_similarity(self, router):
+        """Test scores equal the reference cosine similarity, sorted descending."""
+        scores = router.route("p1")
+
+        prompt = router.embedder.embed("p1")
+        expected = sorted(
+            ((r.name, SemanticRouter._cosine_similarity(prompt, r.embedding)) for r in router.routes),
+            key=lambda x: x[1],
+            reverse=True,
+        )
+        assert [name for name, _ in scores] == [name for name, _ in expected]
+        for (_, got), (_, want) in zip(scores, expected):
+            assert got == pytest.approx(want, abs=1e-6)
+
+    def test_route_matrix_is_normalized(self, router):
+        """Test route matrix rows are unit length (zero rows stay zero)."""
+        norms = np.linalg.norm(router._route_matrix, axis=1)
+
+        assert router._route_matrix.dtype == np.float32
+        np.testing.assert_allclose(norms, [1, 1, 1, 0], atol=1e-6)
+
+    def test_route_top_k(self, router):
+        """Test top_k returns only the best k routes, in order."""
+        assert router.route("p1", top_k=2) == router.route("p1")[:2]
+
+    def test_zero_prompt_scores_zero(self, router):
+        """Test zero prompt vector yields 0.0 for every route."""
+        assert all(score == 0.0 for _, score in router.route("p0"))
+
+    def test_route_batch_matches_route(self, router):
+        """Test route_batch gives the same ranking as route per prompt."""
+        batch = router.route_batch(["p1", "p2"], top_k=3)
+
+        assert len(batch) == 2
+        for prompt, result in zip(["p1", "p2"], batch):
+            single = router.route(prompt, top_k=3)
+            assert [n for n, _ in result] == [n for n, _ in single]
+            for (_, got), (_, want) in zip(result, single):
+                assert got == pytest.approx(want, abs=1e-6)
+
+    def test_route_batch_empty(self, router):
+        """Test empty batch returns empty list."""
+        assert router.route_batch([]) == []
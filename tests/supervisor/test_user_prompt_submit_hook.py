@@ -5,44 +5,57 @@ Tests the hook that injects Supervisor instructions before each user message.
 """
 
 import json
+import os
 import subprocess
 from pathlib import Path
 
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+HOOK_PATH = REPO_ROOT / "hooks" / "user_prompt_submit.py"
+
+
+@pytest.fixture
+def run_hook(tmp_path):
+    """Run the hook from tmp_path so its events and rate limits stay out of the checkout."""
+
+    def run():
+        return subprocess.run(
+            ["python3", str(HOOK_PATH)],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            cwd=tmp_path,
+            env={**os.environ, "CLAUDE_PROJECT_DIR": str(REPO_ROOT)},
+        )
+
+    return run
+
 
 class TestUserPromptSubmitHook:
     """Test UserPromptSubmit hook functionality."""
 
     def test_hook_exists(self):
         """Test that hook file exists and is executable."""
-        hook_path = Path("hooks/user_prompt_submit.py")
+        assert HOOK_PATH.exists(), "Hook file should exist"
+        assert HOOK_PATH.stat().st_mode & 0o111, "Hook should be executable"
 
-        assert hook_path.exists(), "Hook file should exist"
-        assert hook_path.stat().st_mode & 0o111, "Hook should be executable"
-
-    def test_hook_executes(self):
+    def test_hook_executes(self, run_hook):
         """Test that hook executes without errors."""
-        hook_path = Path("hooks/user_prompt_submit.py")
-
-        result = subprocess.run(
-            ["python3", str(hook_path)],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = run_hook()
 
         assert result.returncode == 0, f"Hook should execute successfully: {result.stderr}"
         assert result.stdout, "Hook should produce output"
 
-    def test_hook_output_format(self):
-        """Test that hook output is valid JSON in correct format."""
-        hook_path = Path("hooks/user_prompt_submit.py")
+    def test_hook_rate_limits_kept_in_working_directory(self, run_hook, tmp_path):
+        """Test the hook's rate-limit bucket lands under its cwd, not the checkout."""
+        run_hook()
 
-        result = subprocess.run(
-            ["python3", str(hook_path)],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        assert (tmp_path / ".triads" / "rate_limits" / "user_prompt_submit.bucket").exists()
+
+    def test_hook_output_format(self, run_hook):
+        """Test that hook output is valid JSON in correct format."""
+        result = run_hook()
 
         # Parse JSON output
         try:
@@ -60,16 +73,9 @@ class TestUserPromptSubmitHook:
         assert "additionalContext" in hook_output, "Should have additionalContext"
         assert isinstance(hook_output["additionalContext"], str), "additionalContext should be string"
 
-    def test_hook_injects_supervisor_instructions(self):
+    def test_hook_injects_supervisor_instructions(self, run_hook):
         """Test that hook injects Supervisor instructions."""
-        hook_path = Path("hooks/user_prompt_submit.py")
-
-        result = subprocess.run(
-            ["python3", str(hook_path)],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = run_hook()
 
         output = json.loads(result.stdout)
         context = output["hookSpecificOutput"]["additionalContext"]
@@ -81,16 +87,9 @@ class TestUserPromptSubmitHook:
         assert "workflow" in context.lower(), "Should mention workflow routing"
         assert "ADR-007" in context or "Triad Atomicity" in context, "Should reference architecture"
 
-    def test_hook_includes_atomic_principle(self):
+    def test_hook_includes_atomic_principle(self, run_hook):
         """Test that hook includes triad atomicity principle."""
-        hook_path = Path("hooks/user_prompt_submit.py")
-
-        result = subprocess.run(
-            ["python3", str(hook_path)],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = run_hook()
 
         output = json.loads(result.stdout)
         context = output["hookSpecificOutput"]["additionalContext"]
@@ -99,16 +98,9 @@ class TestUserPromptSubmitHook:
         assert "atomic" in context.lower() or "ATOMIC" in context, "Should mention atomic triads"
         assert "NEVER" in context or "never" in context, "Should emphasize no decomposition"
 
-    def test_hook_includes_training_mode(self):
+    def test_hook_includes_training_mode(self, run_hook):
         """Test that hook includes training mode instructions."""
-        hook_path = Path("hooks/user_prompt_submit.py")
-
-        result = subprocess.run(
-            ["python3", str(hook_path)],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = run_hook()
 
         output = json.loads(result.stdout)
         context = output["hookSpecificOutput"]["additionalContext"]
@@ -117,16 +109,9 @@ class TestUserPromptSubmitHook:
         assert "training" in context.lower() or "Training Mode" in context, "Should mention training mode"
         assert "confirm" in context.lower(), "Should include confirmation requirement"
 
-    def test_hook_includes_emergency_bypass(self):
+    def test_hook_includes_emergency_bypass(self, run_hook):
         """Test that hook includes emergency bypass instructions."""
-        hook_path = Path("hooks/user_prompt_submit.py")
-
-        result = subprocess.run(
-            ["python3", str(hook_path)],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = run_hook()
 
         output = json.loads(result.stdout)
         context = output["hookSpecificOutput"]["additionalContext"]
@@ -0,0 +1,209 @@
+"""Tests for the persistent context discovery decision cache."""
+
+import json
+import os
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from triads.discovery_cache import (
+    DiscoveryCache,
+    compute_fingerprint,
+    prompt_hash,
+)
+from triads.llm_routing import discover_context
+
+
+BUG_BRIEF = """---
+name: bug-brief
+description: Transform vague bug report into complete BugBrief specification
+category: brief
+---
+# Bug Brief Skill
+"""
+
+DISCOVERY = {
+    "intent_type": "work",
+    "confidence": 0.9,
+    "recommended_action": "invoke_skill",
+    "brief_skill": "bug-brief",
+}
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Project directory with one brief skill, used as cwd."""
+    skills_dir = tmp_path / ".claude" / "skills" / "software-development"
+    skills_dir.mkdir(parents=True)
+    (skills_dir / "bug-brief.md").write_text(BUG_BRIEF)
+    monkeypatch.chdir(tmp_path)
+    return skills_dir
+
+
+def _claude_response(cost=0.004, duration=1800):
+    return Mock(
+        stdout=json.dumps({
+            "is_error": False,
+            "total_cost_usd": cost,
+            "duration_ms": duration,
+            "result": json.dumps(DISCOVERY),
+        }),
+        returncode=0,
+    )
+
+
+class TestDiscoveryCache:
+    """Tests for DiscoveryCache."""
+
+    def test_prompt_hash_normalizes(self):
+        """Whitespace and case differences share a key."""
+        assert prompt_hash("Fix  the\nbug ") == prompt_hash("fix the bug")
+        assert prompt_hash("fix the bug") != prompt_hash("fix the build")
+
+    def test_miss_then_hit_records_savings(self, tmp_path):
+        """Hits return the stored result and accumulate saved cost/duration."""
+        cache = DiscoveryCache(tmp_path / "cache.json")
+        assert cache.get("fix the bug", "fp") is None
+
+        cache.put("fix the bug", "fp", {**DISCOVERY, "cost_usd": 0.004, "duration_ms": 1800})
+        result = cache.get("Fix the bug", "fp")
+
+        assert result["brief_skill"] == "bug-brief"
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["saved_cost_usd"] == pytest.approx(0.004)
+        assert stats["saved_duration_ms"] == 1800
+
+    def test_lookups_do_not_rewrite_cache_file(self, tmp_path):
+        """get() only updates the stats sidecar; counts are shared by instances."""
+        path = tmp_path / "cache.json"
+        DiscoveryCache(path).put("fix the bug", "fp", DISCOVERY)
+        before = os.stat(path)
+
+        cache = DiscoveryCache(path)
+        assert cache.get("fix the bug", "fp") is not None
+        assert cache.get("fix the build", "fp") is None
+
+        after = os.stat(path)
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+        stats = DiscoveryCache(path).stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_fingerprint_mismatch_misses(self, tmp_path):
+        """Entries computed under other skills/config are not reused."""
+        cache = DiscoveryCache(tmp_path / "cache.json")
+        cache.put("fix the bug", "old", DISCOVERY)
+
+        assert cache.get("fix the bug", "new") is None
+
+    def test_ttl_expiry(self, tmp_path):
+        """Expired entries miss and are evicted on the next write."""
+        cache = DiscoveryCache(tmp_path / "cache.json", ttl_seconds=0.01)
+        cache.put("a", "fp", DISCOVERY)
+        time.sleep(0.02)
+
+        assert cache.get("a", "fp") is None
+        cache.put("b", "fp", DISCOVERY)
+        assert cache.stats()["entries"] == 1
+
+    def test_size_bound_evicts_least_recently_used(self, tmp_path):
+        """Oldest unused entries are evicted first."""
+        cache = DiscoveryCache(tmp_path / "cache.json", max_entries=2)
+        cache.put("a", "fp", DISCOVERY)
+        cache.put("b", "fp", DISCOVERY)
+        cache.get("a", "fp")
+        cache.put("c", "fp", DISCOVERY)
+
+        assert cache.get("a", "fp") is not None
+        assert cache.get("b", "fp") is None
+        assert cache.get("c", "fp") is not None
+
+    def test_corrupt_file_treated_as_empty(self, tmp_path):
+        """Unreadable cache files degrade to misses."""
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+        cache = DiscoveryCache(path)
+
+        assert cache.get("a", "fp") is None
+        cache.put("a", "fp", DISCOVERY)
+        assert cache.get("a", "fp") is not None
+
+    def test_fingerprint_tracks_skill_edits(self, project):
+        """Editing, adding or removing a skill file changes the fingerprint."""
+        before = compute_fingerprint(project)
+
+        skill = project / "bug-brief.md"
+        skill.write_text(BUG_BRIEF + "\nMore guidance\n")
+        edited = compute_fingerprint(project)
+        assert edited != before
+
+        (project / "coordinate-feature.md").write_text("---\ncategory: coordination\n---\n")
+        assert compute_fingerprint(project) != edited
+
+    def test_fingerprint_tracks_settings(self, project, tmp_path):
+        """Changing settings.json changes the fingerprint."""
+        before = compute_fingerprint(project)
+        (tmp_path / ".claude" / "settings.json").write_text("{}")
+
+        assert compute_fingerprint(project) != before
+
+
+class TestDiscoverContextCaching:
+    """Tests for discover_context() with the decision cache."""
+
+    def test_repeat_prompt_served_from_cache(self, project):
+        """Second identical prompt does not call Claude Code."""
+        with patch("triads.llm_routing.subprocess.run") as mock_run:
+            mock_run.return_value = _claude_response()
+
+            first = discover_context("fix the login bug", project)
+            second = discover_context("fix the login bug", project)
+
+        assert mock_run.call_count == 1
+        assert "cache_hit" not in first
+        assert second["cache_hit"] is True
+        assert second["cost_usd"] == 0.0
+        assert second["brief_skill"] == first["brief_skill"]
+        assert os.path.exists(".triads/discovery_cache.json")
+
+    def test_skill_edit_invalidates(self, project):
+        """Editing a skill file forces a fresh discovery."""
+        with patch("triads.llm_routing.subprocess.run") as mock_run:
+            mock_run.return_value = _claude_response()
+
+            discover_context("fix the login bug", project)
+            skill = project / "bug-brief.md"
+            skill.write_text(BUG_BRIEF + "\nUpdated\n")
+            os.utime(skill, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+            discover_context("fix the login bug", project)
+
+        assert mock_run.call_count == 2
+
+    def test_fallback_results_not_cached(self, project):
+        """Timeout fallbacks are never stored."""
+        import subprocess
+
+        with patch("triads.llm_routing.subprocess.run") as mock_run:
+            mock_run.side_effect = subprocess.TimeoutExpired("claude", 10)
+            discover_context("fix the login bug", project)
+
+            mock_run.side_effect = None
+            mock_run.return_value = _claude_response()
+            result = discover_context("fix the login bug", project)
+
+        assert "cache_hit" not in result
+        assert mock_run.call_count == 2
+
+    def test_cache_disabled(self, project):
+        """use_cache=False always calls Claude Code."""
+        with patch("triads.llm_routing.subprocess.run") as mock_run:
+            mock_run.return_value = _claude_response()
+
+            discover_context("fix the login bug", project, use_cache=False)
+            discover_context("fix the login bug", project, use_cache=False)
+
+        assert mock_run.call_count == 2
+        assert not os.path.exists(".triads/discovery_cache.json")
@@ -1,6 +1,7 @@
 """Tests for event_capture_utils module."""
 
 import json
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -12,13 +13,22 @@ sys.path.insert(0, str(hooks_dir))
 
 from event_capture_utils import (
     _check_rate_limit,
+    _count_events,
+    _rotate_file,
     _should_rotate_file,
     capture_hook_error,
     capture_hook_execution,
+    flush_events,
     safe_capture_event,
 )
 
 
+def _take_tokens(hook_name, count):
+    """Take count rate limit tokens (run in a child process)."""
+    for _ in range(count):
+        _check_rate_limit(hook_name)
+
+
 class TestSafeCaptureEvent:
     """Test safe_capture_event function."""
 
@@ -33,6 +43,7 @@ class TestSafeCaptureEvent:
         )
 
         assert result is True
+        flush_events()
 
         events_file = temp_events_dir / "events.jsonl"
         assert events_file.exists()
@@ -66,6 +77,7 @@ class TestSafeCaptureEvent:
         )
 
         assert result is True
+        flush_events()
 
         with open(temp_events_dir / "events.jsonl", 'r') as f:
             event = json.loads(f.read())
@@ -76,8 +88,10 @@ class TestSafeCaptureEvent:
 class TestRateLimiting:
     """Test rate limiting functionality."""
 
-    def test_rate_limit_enforcement(self):
+    def test_rate_limit_enforcement(self, tmp_path, monkeypatch):
         """Test rate limit is enforced."""
+        monkeypatch.setattr("event_capture_utils.EVENTS_FILE", str(tmp_path / "events.jsonl"))
+
         # First 100 events should pass
         for i in range(100):
             result = _check_rate_limit("test_hook")
@@ -87,6 +101,42 @@ class TestRateLimiting:
         result = _check_rate_limit("test_hook")
         assert result is False
 
+    def test_rate_limit_shared_across_processes(self, tmp_path, monkeypatch):
+        """Test tokens taken by another hook process count against the limit."""
+        monkeypatch.setattr("event_capture_utils.EVENTS_FILE", str(tmp_path / "events.jsonl"))
+
+        # fork keeps the patched EVENTS_FILE in the child
+        child = multiprocessing.get_context("fork").Process(
+            target=_take_tokens, args=("shared_hook", 60)
+        )
+        child.start()
+        child.join(timeout=30)
+        assert child.exitcode == 0
+
+        results = [_check_rate_limit("shared_hook") for _ in range(41)]
+        assert results == [True] * 40 + [False]
+
+    def test_rate_limit_refills(self, tmp_path, monkeypatch):
+        """Test the bucket refills at the per-minute limit."""
+        monkeypatch.setattr("event_capture_utils.EVENTS_FILE", str(tmp_path / "events.jsonl"))
+        now = [1000.0]
+        monkeypatch.setattr("event_capture_utils.time.time", lambda: now[0])
+
+        for _ in range(100):
+            assert _check_rate_limit("refill_hook") is True
+        assert _check_rate_limit("refill_hook") is False
+
+        now[0] += 1.2  # 100/min refills 2 tokens in 1.2s
+        assert [_check_rate_limit("refill_hook") for _ in range(3)] == [True, True, False]
+
+    def test_rate_limit_unavailable_allows(self, tmp_path, monkeypatch):
+        """Test events are allowed when the bucket file can't be created."""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        monkeypatch.setattr("event_capture_utils.EVENTS_FILE", str(blocker / "events.jsonl"))
+
+        assert all(_check_rate_limit("test_hook") for _ in range(150))
+
 
 class TestFileRotation:
     """Test file rotation functionality."""
@@ -122,6 +172,25 @@ class TestFileRotation:
 
         assert _should_rotate_file(events_file) is False
 
+    def test_rotate_file_seals_segment(self, tmp_path, monkeypatch):
+        """Test rotation seals the log into a segment listed in the manifest."""
+        events_file = tmp_path / "events.jsonl"
+        monkeypatch.setattr("event_capture_utils.EVENTS_FILE", str(events_file))
+        for i in range(3):
+            safe_capture_event("test_hook", "executed", {"i": i}, workspace_id="ws-1")
+        flush_events()
+
+        _rotate_file(events_file)
+
+        segments_dir = tmp_path / "events_segments"
+        manifest = json.loads((segments_dir / "manifest.json").read_text())
+        [entry] = manifest["segments"]
+        assert entry["count"] == 3
+        assert entry["workspace_ids"] == ["ws-1"]
+        assert (segments_dir / entry["file"]).exists()
+        assert not events_file.exists()
+        assert not list(tmp_path.glob("events.jsonl.backup_*"))
+
 
 class TestCaptureHookExecution:
     """Test capture_hook_execution convenience wrapper."""
@@ -140,6 +209,7 @@ class TestCaptureHookExecution:
         )
 
         assert result is True
+        flush_events()
 
         with open(temp_events_dir / "events.jsonl", 'r') as f:
             event = json.loads(f.read())
@@ -167,6 +237,7 @@ class TestCaptureHookError:
         )
 
         assert result is True
+        flush_events()
 
         with open(temp_events_dir / "events.jsonl", 'r') as f:
             event = json.loads(f.read())
@@ -174,3 +245,51 @@ class TestCaptureHookError:
         assert event["predicate"] == "failed"
         assert event["object"]["error_type"] == "ValueError"
         assert event["object"]["error_message"] == "Test error"
+
+
+class TestBufferedWrites:
+    """Test buffered, batched event writes."""
+
+    def test_events_buffered_until_flush(self, tmp_path, monkeypatch):
+        """Test events reach the file in one flush, in capture order."""
+        events_file = tmp_path / "events.jsonl"
+        monkeypatch.setattr("event_capture_utils.EVENTS_FILE", str(events_file))
+
+        for i in range(3):
+            assert safe_capture_event("buffer_hook", "executed", {"i": i})
+
+        assert not events_file.exists()
+        assert flush_events() == 3
+        assert flush_events() == 0
+
+        events = [json.loads(line) for line in events_file.read_text().splitlines()]
+        assert [event["object"]["i"] for event in events] == [0, 1, 2]
+
+    def test_flush_records_line_count(self, tmp_path, monkeypatch):
+        """Test the count sidecar tracks the log without re-reading it."""
+        events_file = tmp_path / "events.jsonl"
+        events_file.write_text('{"event": "old"}\n' * 5)
+        monkeypatch.setattr("event_capture_utils.EVENTS_FILE", str(events_file))
+
+        safe_capture_event("count_hook", "executed", {})
+        flush_events()
+
+        count = json.loads((tmp_path / "events.jsonl.count").read_text())
+        assert count["lines"] == 6
+        assert count["size"] == events_file.stat().st_size
+
+        # Appended by another writer: only the new bytes are counted
+        with open(events_file, "a") as f:
+            f.write('{"event": "other"}\n')
+        assert _count_events(events_file) == 7
+
+    def test_rotation_uses_recorded_count(self, tmp_path, monkeypatch):
+        """Test rotation triggers on the sidecar count alone."""
+        events_file = tmp_path / "events.jsonl"
+        events_file.write_text('{"event": "old"}\n')
+        stat = events_file.stat()
+        (tmp_path / "events.jsonl.count").write_text(
+            json.dumps({"inode": stat.st_ino, "size": stat.st_size, "lines": 10000})
+        )
+
+        assert _should_rotate_file(events_file) is True
@@ -0,0 +1,68 @@
+"""Tests for block_scanner module - single-pass tagged block scanning."""
+
+import random
+import re
+
+from triads.hooks.block_scanner import Block, scan_blocks
+
+
+TEXT = """Intro
+[PRE_FLIGHT_CHECK]
+node_id: n1
+[/PRE_FLIGHT_CHECK]
+[GRAPH_UPDATE]
+node_id: n1
+[/GRAPH_UPDATE]
+[HANDOFF_REQUEST]
+next_triad: implementation
+[/HANDOFF_REQUEST]
+"""
+
+
+def test_blocks_by_tag_with_offsets():
+    blocks = scan_blocks(TEXT, ["GRAPH_UPDATE", "HANDOFF_REQUEST", "WORKFLOW_COMPLETE"])
+
+    update = blocks["GRAPH_UPDATE"][0]
+    assert update.body == "\nnode_id: n1\n"
+    assert TEXT[update.start:update.end] == "[GRAPH_UPDATE]\nnode_id: n1\n[/GRAPH_UPDATE]"
+    assert [b.body.strip() for b in blocks["HANDOFF_REQUEST"]] == ["next_triad: implementation"]
+    assert blocks["WORKFLOW_COMPLETE"] == []
+    assert "PRE_FLIGHT_CHECK" not in blocks
+
+
+def test_all_tags_when_unspecified():
+    assert set(scan_blocks(TEXT)) == {"PRE_FLIGHT_CHECK", "GRAPH_UPDATE", "HANDOFF_REQUEST"}
+
+
+def test_unclosed_and_stray_markers():
+    text = "[/A] x [A] one [A] two [/A] [A] never closed"
+
+    assert scan_blocks(text, ["A"])["A"] == [Block("A", " one [A] two ", 7, 27)]
+
+
+def test_other_tags_inside_block_are_body():
+    text = "[PROCESS_KNOWLEDGE] [GRAPH_UPDATE]x[/GRAPH_UPDATE] [/PROCESS_KNOWLEDGE]"
+    blocks = scan_blocks(text, ["PROCESS_KNOWLEDGE", "GRAPH_UPDATE"])
+
+    assert blocks["GRAPH_UPDATE"][0].body == "x"
+    assert blocks["PROCESS_KNOWLEDGE"][0].body == " [GRAPH_UPDATE]x[/GRAPH_UPDATE] "
+
+
+def test_ignore_case():
+    text = "[graph_update]a[/GRAPH_UPDATE] [GRAPH_UPDATE]b[/graph_update]"
+
+    assert [b.body for b in scan_blocks(text, ["GRAPH_UPDATE"])["GRAPH_UPDATE"]] == []
+    blocks = scan_blocks(text, ["graph_update"], ignore_case=True)
+    assert [b.body for b in blocks["GRAPH_UPDATE"]] == ["a", "b"]
+
+
+def test_matches_per_tag_findall():
+    rng = random.Random(3)
+    pieces = ["[A]", "[/A]", "[B]", "[/B]", "[[A]", "x", "\n", "[C ]", "]"]
+
+    for _ in range(500):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 20)))
+        blocks = scan_blocks(text, ["A", "B"])
+        for tag in ("A", "B"):
+            expected = re.findall(rf"\[{tag}\](.*?)\[/{tag}\]", text, re.DOTALL)
+            assert [b.body for b in blocks[tag]] == expected, text
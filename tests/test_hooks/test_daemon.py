@@ -0,0 +1,236 @@
+"""Tests for the warm hook daemon and its client shim."""
+
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from triads.hooks.daemon import HookDaemon
+
+# Add hooks to path (daemon_client lives next to the hook scripts)
+hooks_dir = Path(__file__).parent.parent.parent / "hooks"
+sys.path.insert(0, str(hooks_dir))
+
+import daemon_client  # noqa: E402
+from constants import PLUGIN_VERSION  # noqa: E402
+
+ECHO_HOOK = '''
+import json
+import os
+import sys
+
+CALLS = []
+
+
+def main():
+    data = json.load(sys.stdin)
+    CALLS.append(data)
+    print(json.dumps({"echo": data, "mode": os.environ.get("TRIADS_TEST_MODE")}))
+    print("echo hook ran", file=sys.stderr)
+    sys.exit(data.get("exit_code", 0))
+'''
+
+
+@pytest.fixture
+def socket_path():
+    """Short socket path (AF_UNIX paths are limited to ~100 bytes)."""
+    tmpdir = tempfile.mkdtemp(prefix="hookd-")
+    yield Path(tmpdir) / "d.sock"
+    shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+@pytest.fixture
+def running_daemon(socket_path, tmp_path):
+    """Daemon serving a fake echo hook in a background thread."""
+    fake_hooks = tmp_path / "fake_hooks"
+    fake_hooks.mkdir()
+    (fake_hooks / "echo_hook_for_daemon_test.py").write_text(ECHO_HOOK)
+    (fake_hooks / "constants.py").write_text(f'PLUGIN_VERSION = "{PLUGIN_VERSION}"\n')
+
+    daemon = HookDaemon(
+        socket_path,
+        fake_hooks,
+        idle_timeout=10.0,
+        hook_modules={"echo": "echo_hook_for_daemon_test"},
+    )
+    assert daemon.bind()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+
+    yield daemon
+
+    daemon_client.request_daemon(
+        {"command": "shutdown", "version": PLUGIN_VERSION}, socket_path=socket_path
+    )
+    thread.join(timeout=5)
+    sys.path.remove(str(fake_hooks))
+    sys.modules.pop("echo_hook_for_daemon_test", None)
+
+
+def _run_request(socket_path, payload, env=None):
+    return daemon_client.request_daemon(
+        {
+            "command": "run",
+            "hook": "echo",
+            "version": PLUGIN_VERSION,
+            "stdin": json.dumps(payload),
+            "cwd": str(Path.cwd()),
+            "env": env or {},
+        },
+        socket_path=socket_path,
+    )
+
+
+def test_ping(running_daemon, socket_path):
+    """Test daemon answers ping with matching version."""
+    assert daemon_client.is_daemon_running(socket_path)
+
+
+def test_run_hook_relays_output_and_exit_code(running_daemon, socket_path):
+    """Test hook stdout, stderr and exit code are returned."""
+    response = _run_request(socket_path, {"tool_name": "Write", "exit_code": 2})
+
+    assert response["status"] == "ok"
+    assert response["exit_code"] == 2
+    assert json.loads(response["stdout"])["echo"]["tool_name"] == "Write"
+    assert "echo hook ran" in response["stderr"]
+
+
+def test_hook_module_stays_warm(running_daemon, socket_path):
+    """Test hook module is imported once and reused across requests."""
+    _run_request(socket_path, {"n": 1})
+    _run_request(socket_path, {"n": 2})
+
+    module = sys.modules["echo_hook_for_daemon_test"]
+    assert [call["n"] for call in module.CALLS] == [1, 2]
+    assert running_daemon.requests_served == 2
+
+
+def test_request_env_is_applied_and_restored(running_daemon, socket_path, monkeypatch):
+    """Test TRIADS_* env comes from the request, not the daemon process."""
+    monkeypatch.delenv("TRIADS_TEST_MODE", raising=False)
+
+    response = _run_request(socket_path, {}, env={"TRIADS_TEST_MODE": "strict"})
+    assert json.loads(response["stdout"])["mode"] == "strict"
+
+    response = _run_request(socket_path, {})
+    assert json.loads(response["stdout"])["mode"] is None
+
+
+def test_version_mismatch_refused(running_daemon, socket_path):
+    """Test daemon refuses clients from another plugin version."""
+    response = daemon_client.request_daemon(
+        {"command": "ping", "version": "0.0.0-other"}, socket_path=socket_path
+    )
+    assert response["status"] == "version_mismatch"
+
+
+def test_unknown_hook_refused(running_daemon, socket_path):
+    """Test only registered hooks can be run."""
+    response = daemon_client.request_daemon(
+        {"command": "run", "hook": "os", "version": PLUGIN_VERSION, "stdin": ""},
+        socket_path=socket_path,
+    )
+    assert response["status"] == "unknown_hook"
+
+
+def test_bind_refuses_live_socket(running_daemon, socket_path, tmp_path):
+    """Test a second daemon doesn't steal a live socket."""
+    second = HookDaemon(socket_path, tmp_path)
+    assert second.bind() is False
+
+
+def test_bind_refuses_shared_directory(tmp_path):
+    """Test the daemon won't listen in a directory other users can write to."""
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+
+    with pytest.raises(PermissionError):
+        HookDaemon(shared / "d.sock", tmp_path).bind()
+    assert not (shared / "d.sock").exists()
+
+
+def test_socket_owned_by_other_user_ignored(running_daemon, socket_path, monkeypatch):
+    """Test the client never talks to a socket another uid owns."""
+    other_uid = os.getuid() + 1
+    monkeypatch.setattr(daemon_client.os, "getuid", lambda: other_uid)
+
+    assert daemon_client.request_daemon(
+        {"command": "ping", "version": PLUGIN_VERSION}, socket_path=socket_path
+    ) is None
+    assert not daemon_client.is_daemon_running(socket_path)
+
+
+def test_socket_in_shared_directory_ignored(running_daemon, socket_path):
+    """Test the client ignores a socket whose directory others can write to."""
+    socket_path.parent.chmod(0o777)
+    try:
+        assert not daemon_client.is_daemon_running(socket_path)
+    finally:
+        socket_path.parent.chmod(0o700)
+    assert daemon_client.is_daemon_running(socket_path)
+
+
+def test_socket_path_in_private_directory(tmp_path, monkeypatch):
+    """Test sockets live in a per-user directory, not directly in /tmp."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+    path = daemon_client.get_socket_path(tmp_path / "project")
+
+    assert path.parent == tmp_path / f"triads-hookd-{os.getuid()}"
+
+
+def test_relay_falls_back_when_daemon_down(socket_path, monkeypatch):
+    """Test relay returns with stdin intact when no daemon is listening."""
+    socket_path.write_text("")  # Stale socket file, nothing listening
+    monkeypatch.setattr(daemon_client, "get_socket_path", lambda project_dir=None: socket_path)
+    monkeypatch.setattr(sys, "stdin", io.StringIO('{"tool_name": "Edit"}'))
+
+    daemon_client.relay_to_daemon("post_tool_use")
+
+    assert json.load(sys.stdin) == {"tool_name": "Edit"}
+
+
+def test_relay_disabled_by_env(socket_path, monkeypatch):
+    """Test TRIADS_NO_DAEMON=1 skips the daemon without consuming stdin."""
+    monkeypatch.setenv("TRIADS_NO_DAEMON", "1")
+    monkeypatch.setattr(daemon_client, "get_socket_path", lambda project_dir=None: socket_path)
+    stdin = io.StringIO("{}")
+    monkeypatch.setattr(sys, "stdin", stdin)
+
+    daemon_client.relay_to_daemon("post_tool_use")
+
+    assert sys.stdin is stdin
+    assert stdin.tell() == 0
+
+
+def test_relay_exits_with_daemon_result(running_daemon, socket_path, monkeypatch, capsys):
+    """Test relay writes daemon output and exits with the hook's code."""
+    monkeypatch.setattr(daemon_client, "get_socket_path", lambda project_dir=None: socket_path)
+    monkeypatch.setattr(sys, "stdin", io.StringIO('{"exit_code": 2}'))
+
+    with pytest.raises(SystemExit) as exc_info:
+        daemon_client.relay_to_daemon("echo")
+
+    assert exc_info.value.code == 2
+    captured = capsys.readouterr()
+    assert json.loads(captured.out)["echo"] == {"exit_code": 2}
+    assert "echo hook ran" in captured.err
+
+
+def test_query_engine_fingerprint_covers_graph_logs(tmp_path):
+    import on_pre_experience_injection as hook
+
+    (tmp_path / "design_graph.json").write_text('{"nodes": [], "links": []}')
+    before = hook._graphs_fingerprint(tmp_path)
+
+    (tmp_path / "design_graph.wal").write_text('{"seq": 1, "op": "meta"}\n')
+
+    assert hook._graphs_fingerprint(tmp_path) != before
@@ -0,0 +1,124 @@
+"""Tests for handler_scheduler module - concurrent hook handlers."""
+
+import sys
+import time
+
+import pytest
+
+from triads.hooks.handler_scheduler import HandlerScheduler
+
+
+def _sleep(delay, result=None):
+    def fn(*args):
+        time.sleep(delay)
+        return result
+
+    return fn
+
+
+def test_independent_handlers_run_concurrently():
+    scheduler = HandlerScheduler()
+    for name in ("a", "b", "c"):
+        scheduler.add(name, _sleep(0.3, name))
+
+    start = time.monotonic()
+    runs = scheduler.run()
+    elapsed = time.monotonic() - start
+
+    assert {name: run.result for name, run in runs.items()} == {"a": "a", "b": "b", "c": "c"}
+    assert all(run.status == "ok" and run.duration_ms >= 300 for run in runs.values())
+    assert elapsed < 0.6
+
+
+def test_dependency_receives_results_after_finish():
+    order = []
+    scheduler = HandlerScheduler()
+    scheduler.add("graph", lambda: order.append("graph") or {"triads": 2})
+    scheduler.add("pause", lambda: order.append("pause") or True)
+    scheduler.add("km", lambda graph, pause: order.append("km") or (graph["triads"], pause),
+                  depends_on=("graph", "pause"))
+
+    runs = scheduler.run()
+
+    assert runs["km"].result == (2, True)
+    assert order[-1] == "km"
+    assert list(runs) == ["graph", "pause", "km"]
+
+
+def test_slow_handler_times_out_without_blocking_others():
+    scheduler = HandlerScheduler()
+    scheduler.add("slow", _sleep(5), budget_seconds=0.2)
+    scheduler.add("after_slow", _sleep(0, "x"), depends_on=("slow",))
+    scheduler.add("fast", _sleep(0.05, "fast"))
+
+    start = time.monotonic()
+    runs = scheduler.run()
+
+    assert time.monotonic() - start < 1
+    assert runs["slow"].status == "timeout"
+    assert runs["after_slow"].status == "skipped"
+    assert runs["after_slow"].error == "dependency slow timeout"
+    assert runs["fast"].result == "fast"
+
+
+def test_error_recorded_and_dependents_skipped():
+    def fail():
+        print("working", file=sys.stderr)
+        raise RuntimeError("boom")
+
+    scheduler = HandlerScheduler()
+    scheduler.add("fail", fail)
+    scheduler.add("next", _sleep(0), depends_on=("fail",))
+
+    runs = scheduler.run()
+
+    assert runs["fail"].status == "error"
+    assert runs["fail"].error == "RuntimeError: boom"
+    assert runs["fail"].output.startswith("working\n")
+    assert "Traceback" in runs["fail"].output
+    assert runs["next"].status == "skipped"
+
+
+def test_output_captured_per_handler(capsys):
+    def noisy(label):
+        def fn():
+            for i in range(50):
+                print(f"{label}{i}", file=sys.stderr)
+                time.sleep(0.001)
+        return fn
+
+    scheduler = HandlerScheduler()
+    scheduler.add("a", noisy("a"))
+    scheduler.add("b", noisy("b"))
+    runs = scheduler.run()
+
+    assert runs["a"].output == "".join(f"a{i}\n" for i in range(50))
+    assert runs["b"].output == "".join(f"b{i}\n" for i in range(50))
+    assert capsys.readouterr().err == ""
+
+
+def test_add_validates_names():
+    scheduler = HandlerScheduler()
+    scheduler.add("a", _sleep(0))
+
+    with pytest.raises(ValueError):
+        scheduler.add("a", _sleep(0))
+    with pytest.raises(ValueError):
+        scheduler.add("b", _sleep(0), depends_on=("missing",))
+
+
+def test_join_waits_for_timed_out_handler():
+    scheduler = HandlerScheduler()
+    scheduler.add("slow", _sleep(0.4, "written"), budget_seconds=0.1)
+    scheduler.add("after_slow", _sleep(0), depends_on=("slow",))
+    scheduler.add("stuck", _sleep(5), budget_seconds=0.1)
+
+    runs = scheduler.run()
+    assert runs["slow"].status == "timeout"
+
+    assert scheduler.join(timeout=1) == ["stuck"]
+    assert runs["slow"].status == "ok"
+    assert runs["slow"].result == "written"
+    assert runs["slow"].error is None
+    assert runs["after_slow"].status == "skipped"
+    assert runs["stuck"].status == "timeout"
@@ -0,0 +1,210 @@
+"""Tests for transcript_cursor module - incremental transcript reads."""
+
+import json
+import os
+import time
+
+import pytest
+
+from triads.hooks.transcript_cursor import CURSOR_MAX_AGE_SECONDS, TranscriptCursor
+
+
+def _line(text):
+    return json.dumps({"type": "assistant", "message": {"content": text}}) + "\n"
+
+
+def _texts(entries):
+    return [entry["message"]["content"] for entry in entries]
+
+
+@pytest.fixture
+def transcript(tmp_path):
+    path = tmp_path / "session.jsonl"
+    path.write_text(_line("one") + _line("two"))
+    return path
+
+
+@pytest.fixture
+def cursor_dir(tmp_path):
+    return tmp_path / "cursors"
+
+
+def _read(transcript, cursor_dir, commit=True):
+    cursor = TranscriptCursor(transcript, cursor_dir=cursor_dir)
+    entries = cursor.read_new()
+    if commit:
+        cursor.commit()
+    return _texts(entries), cursor
+
+
+# ============================================================================
+# Incremental reads
+# ============================================================================
+
+def test_first_read_returns_everything(transcript, cursor_dir):
+    texts, cursor = _read(transcript, cursor_dir)
+
+    assert texts == ["one", "two"]
+    assert cursor.rescanned
+
+
+def test_only_appended_entries_returned(transcript, cursor_dir):
+    _read(transcript, cursor_dir)
+    with open(transcript, "a") as f:
+        f.write(_line("three"))
+
+    texts, cursor = _read(transcript, cursor_dir)
+
+    assert texts == ["three"]
+    assert not cursor.rescanned
+    assert _read(transcript, cursor_dir)[0] == []
+
+
+def test_partial_line_deferred(transcript, cursor_dir):
+    _read(transcript, cursor_dir)
+    partial = _line("three")
+    with open(transcript, "a") as f:
+        f.write(partial[:10])
+
+    assert _read(transcript, cursor_dir)[0] == []
+
+    with open(transcript, "a") as f:
+        f.write(partial[10:])
+
+    assert _read(transcript, cursor_dir)[0] == ["three"]
+
+
+def test_uncommitted_read_is_repeated(transcript, cursor_dir):
+    _read(transcript, cursor_dir)
+    with open(transcript, "a") as f:
+        f.write(_line("three"))
+
+    assert _read(transcript, cursor_dir, commit=False)[0] == ["three"]
+    assert _read(transcript, cursor_dir)[0] == ["three"]
+
+
+def test_malformed_lines_skipped(transcript, cursor_dir):
+    with open(transcript, "a") as f:
+        f.write("not json\n[1, 2]\n\n" + _line("three"))
+
+    assert _read(transcript, cursor_dir)[0] == ["one", "two", "three"]
+
+
+# ============================================================================
+# Per-handler progress
+# ============================================================================
+
+def test_failed_handler_retries_only_its_entries(transcript, cursor_dir):
+    _read(transcript, cursor_dir)
+    with open(transcript, "a") as f:
+        f.write(_line("three"))
+
+    cursor = TranscriptCursor(transcript, cursor_dir=cursor_dir)
+    cursor.read_new()
+    cursor.commit(failed=["km"])
+    with open(transcript, "a") as f:
+        f.write(_line("four"))
+
+    cursor = TranscriptCursor(transcript, cursor_dir=cursor_dir)
+    assert _texts(cursor.read_new()) == ["four"]
+    assert _texts(cursor.entries_for("graph")) == ["four"]
+    assert _texts(cursor.entries_for("km")) == ["three", "four"]
+    cursor.commit()
+
+    assert _read(transcript, cursor_dir)[1].entries_for("km") == []
+
+
+def test_lagging_handler_kept_when_nothing_new(transcript, cursor_dir):
+    _read(transcript, cursor_dir)
+    with open(transcript, "a") as f:
+        f.write(_line("three"))
+    cursor = TranscriptCursor(transcript, cursor_dir=cursor_dir)
+    cursor.read_new()
+    cursor.commit(failed=["km"])
+
+    # Fails again with no new entries: still behind at the same entry
+    cursor = TranscriptCursor(transcript, cursor_dir=cursor_dir)
+    assert cursor.read_new() == []
+    cursor.commit(failed=["km"])
+
+    cursor = TranscriptCursor(transcript, cursor_dir=cursor_dir)
+    cursor.read_new()
+    assert _texts(cursor.entries_for("km")) == ["three"]
+
+    # Succeeds: caught up
+    cursor.commit()
+    cursor = TranscriptCursor(transcript, cursor_dir=cursor_dir)
+    cursor.read_new()
+    assert cursor.entries_for("km") == []
+
+
+# ============================================================================
+# Rescan fallback
+# ============================================================================
+
+def test_truncated_transcript_rescanned(transcript, cursor_dir):
+    _read(transcript, cursor_dir)
+    with open(transcript, "r+") as f:
+        f.truncate(len(_line("one")))
+
+    texts, cursor = _read(transcript, cursor_dir)
+
+    assert texts == ["one"]
+    assert cursor.rescanned
+
+
+def test_replaced_transcript_rescanned(transcript, cursor_dir):
+    _read(transcript, cursor_dir)
+    replacement = transcript.with_suffix(".new")
+    replacement.write_text(_line("one") + _line("two") + _line("three"))
+    os.replace(replacement, transcript)
+
+    texts, cursor = _read(transcript, cursor_dir)
+
+    assert texts == ["one", "two", "three"]
+    assert cursor.rescanned
+
+
+def test_rewritten_transcript_rescanned(transcript, cursor_dir):
+    _read(transcript, cursor_dir)
+    # Same inode and no shorter, but the line before the cursor changed
+    with open(transcript, "r+") as f:
+        f.write(_line("ONE") + _line("TWO") + _line("six"))
+
+    texts, cursor = _read(transcript, cursor_dir)
+
+    assert texts == ["ONE", "TWO", "six"]
+    assert cursor.rescanned
+
+
+def test_corrupt_cursor_rescanned(transcript, cursor_dir):
+    _, cursor = _read(transcript, cursor_dir)
+    cursor.cursor_path.write_text("{")
+
+    assert _read(transcript, cursor_dir)[0] == ["one", "two"]
+
+
+# ============================================================================
+# Cursor files
+# ============================================================================
+
+def test_cursor_per_transcript(transcript, cursor_dir, tmp_path):
+    other = tmp_path / "other.jsonl"
+    other.write_text(_line("other"))
+
+    _read(transcript, cursor_dir)
+
+    assert _read(other, cursor_dir)[0] == ["other"]
+    assert len(list(cursor_dir.glob("*.json"))) == 2
+
+
+def test_stale_cursors_pruned(transcript, cursor_dir):
+    cursor_dir.mkdir()
+    stale = cursor_dir / "stale.json"
+    stale.write_text("{}")
+    old = time.time() - CURSOR_MAX_AGE_SECONDS - 60
+    os.utime(stale, (old, old))
+
+    _read(transcript, cursor_dir)
+
+    assert not stale.exists()
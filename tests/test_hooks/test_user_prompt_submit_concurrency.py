@@ -0,0 +1,135 @@
+"""Tests for concurrent prompt analysis in the UserPromptSubmit hook."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add hooks to path
+hooks_dir = Path(__file__).parent.parent.parent / "hooks"
+sys.path.insert(0, str(hooks_dir))
+
+import user_prompt_submit  # noqa: E402
+
+
+DISCOVERY = {"recommended_action": "invoke_skill", "confidence": 0.9}
+NO_SWITCH = {"should_block": False, "workspace_action": "none", "detection_result": {}}
+BLOCKING_SWITCH = {"should_block": True, "user_message": "Switch?", "detection_result": {}}
+
+
+DETECTION = {"classification": "stub", "confidence": 0.9}
+
+
+def _patch_switch(monkeypatch, analyze, result, applied=None):
+    """Patch context-switch analysis; applying it returns result."""
+
+    def apply(user_prompt, detection_result):
+        if applied is not None:
+            applied.append(threading.current_thread())
+        return result
+
+    monkeypatch.setattr(user_prompt_submit, "analyze_context_switch", analyze)
+    monkeypatch.setattr(user_prompt_submit, "apply_context_switch", apply)
+
+
+def _slow(result, delay, calls=None):
+    def fn(user_prompt, timeout=None):
+        if calls is not None:
+            calls.append(timeout)
+        time.sleep(delay)
+        return result
+
+    return fn
+
+
+class TestAnalyzePromptConcurrently:
+    """Test analyze_prompt_concurrently."""
+
+    def test_latency_is_max_not_sum(self, monkeypatch):
+        """Test both calls overlap instead of running back to back."""
+        _patch_switch(monkeypatch, _slow(DETECTION, 0.3), NO_SWITCH)
+        monkeypatch.setattr(
+            user_prompt_submit, "route_user_request_universal", _slow(DISCOVERY, 0.3)
+        )
+
+        start = time.monotonic()
+        switch, discovery = user_prompt_submit.analyze_prompt_concurrently("hello")
+        elapsed = time.monotonic() - start
+
+        assert switch == NO_SWITCH
+        assert discovery == DISCOVERY
+        assert elapsed < 0.55
+
+    def test_blocking_switch_drops_discovery(self, monkeypatch):
+        """Test a blocking context switch returns without waiting for discovery."""
+        _patch_switch(monkeypatch, _slow(DETECTION, 0.0), BLOCKING_SWITCH)
+        monkeypatch.setattr(
+            user_prompt_submit, "route_user_request_universal", _slow(DISCOVERY, 2.0)
+        )
+
+        start = time.monotonic()
+        switch, discovery = user_prompt_submit.analyze_prompt_concurrently("new task")
+
+        assert switch == BLOCKING_SWITCH
+        assert discovery is None
+        assert time.monotonic() - start < 1.0
+
+    def test_shared_deadline(self, monkeypatch):
+        """Test work still running at the deadline is dropped."""
+        applied = []
+        _patch_switch(monkeypatch, _slow(DETECTION, 2.0), NO_SWITCH, applied)
+        monkeypatch.setattr(
+            user_prompt_submit, "route_user_request_universal", _slow(DISCOVERY, 2.0)
+        )
+
+        start = time.monotonic()
+        switch, discovery = user_prompt_submit.analyze_prompt_concurrently(
+            "hello", deadline_seconds=0.2
+        )
+
+        assert (switch, discovery) == (None, None)
+        assert applied == []
+        assert time.monotonic() - start < 1.0
+
+    def test_deadline_passed_to_both_calls(self, monkeypatch):
+        """Test subprocess timeouts are bounded by the shared deadline."""
+        calls = []
+        _patch_switch(monkeypatch, _slow(DETECTION, 0.0, calls), NO_SWITCH)
+        monkeypatch.setattr(
+            user_prompt_submit,
+            "route_user_request_universal",
+            _slow(DISCOVERY, 0.0, calls),
+        )
+
+        user_prompt_submit.analyze_prompt_concurrently("hello", deadline_seconds=7)
+
+        assert sorted(calls) == [7, 7]
+
+    def test_exception_treated_as_missing_result(self, monkeypatch):
+        """Test a failing analysis degrades to None instead of raising."""
+
+        def boom(user_prompt, timeout=None):
+            raise RuntimeError("claude not found")
+
+        _patch_switch(monkeypatch, boom, None)
+        monkeypatch.setattr(
+            user_prompt_submit, "route_user_request_universal", _slow(DISCOVERY, 0.0)
+        )
+
+        switch, discovery = user_prompt_submit.analyze_prompt_concurrently("hello")
+
+        assert switch is None
+        assert discovery == DISCOVERY
+
+    def test_switch_applied_on_calling_thread(self, monkeypatch):
+        """Test workspace changes are made on the hook thread, not the worker."""
+        applied = []
+        _patch_switch(monkeypatch, _slow(DETECTION, 0.0), NO_SWITCH, applied)
+        monkeypatch.setattr(
+            user_prompt_submit, "route_user_request_universal", _slow(DISCOVERY, 0.0)
+        )
+
+        switch, _ = user_prompt_submit.analyze_prompt_concurrently("hello")
+
+        assert switch == NO_SWITCH
+        assert applied == [threading.current_thread()]
@@ -1,4 +1,5 @@
 """Tests for GraphSearcher class - search functionality."""
+import numpy as np
 import pytest
 from triads.km.graph_access import (
     GraphLoader,
@@ -406,3 +407,63 @@ def test_search_filter_excludes_low_confidence(searcher):
     # Verify low confidence node is excluded
     low_conf_found = any(r.confidence < 0.85 for r in high_conf_results)
     assert not low_conf_found
+
+
+def test_search_ranks_by_bm25_score(searcher):
+    """Results are ordered by score, not only by matched field."""
+    results = searcher.search("authentication")
+
+    assert {r.node_id for r in results} == {"auth_module", "oauth_decision"}
+    for i in range(len(results) - 1):
+        assert results[i].score >= results[i + 1].score
+
+
+def test_search_or_and_prefix(searcher):
+    """OR separates alternatives; terms match as prefixes."""
+    either = {r.node_id for r in searcher.search("jwt OR finding")}
+    prefix = {r.node_id for r in searcher.search("authen")}
+
+    assert either == {"jwt_entity", "test_finding"}
+    assert prefix == {"oauth_decision", "auth_module"}
+
+
+def test_search_index_refreshed_after_save(loader_with_graphs, searcher):
+    """Saving a graph makes new nodes searchable."""
+    searcher.search("kerberos")
+    graph = loader_with_graphs.load_graph("design")
+    updated = {
+        **graph,
+        "nodes": graph["nodes"] + [{
+            "id": "kerberos_decision",
+            "label": "Kerberos Fallback",
+            "type": "Decision",
+            "description": "Fallback for legacy systems",
+            "confidence": 0.9,
+        }],
+    }
+    assert loader_with_graphs.save_graph("design", updated)
+
+    assert [r.node_id for r in searcher.search("kerberos")] == ["kerberos_decision"]
+
+
+def test_search_semantic_hybrid(loader_with_graphs, searcher):
+    """Hybrid mode adds nodes related by meaning and keeps lexical matches."""
+    def embed(texts):
+        # "login" and "authentication" share a concept dimension
+        vectors = np.zeros((len(texts), 384), dtype=np.float32)
+        for row, text in enumerate(texts):
+            lowered = text.lower()
+            vectors[row, 0] = "login" in lowered or "authentication" in lowered
+            vectors[row, 1] = "jwt" in lowered
+            vectors[row, 2] = 0.1
+        return vectors
+
+    loader_with_graphs.vector_index(embed_batch=embed)
+
+    lexical = {r.node_id for r in searcher.search("login")}
+    hybrid = searcher.search("login", semantic=True)
+
+    assert lexical == set()
+    assert {r.node_id for r in hybrid} == {"oauth_decision", "auth_module"}
+    assert all(r.matched_field == "semantic" for r in hybrid)
+    assert searcher.search("jwt", semantic=True)[0].node_id == "jwt_entity"
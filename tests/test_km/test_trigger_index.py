@@ -0,0 +1,212 @@
+"""Tests for the process knowledge trigger index."""
+
+import json
+import random
+import time
+
+import pytest
+
+from triads.km.experience_query import (
+    RELEVANCE_THRESHOLD,
+    TARGET_P95_MS,
+    ExperienceQueryEngine,
+)
+from triads.km.trigger_index import (
+    CONTEXT_KEYWORD,
+    FILE,
+    TOOL_EXACT,
+    TOOL_WILDCARD,
+    KeywordAutomaton,
+    TriggerIndex,
+)
+
+
+def _node(node_id, priority="MEDIUM", confidence=1.0, description="", **triggers):
+    return {
+        "id": node_id,
+        "label": node_id,
+        "type": "Concept",
+        "process_type": "warning",
+        "priority": priority,
+        "confidence": confidence,
+        "description": description,
+        "trigger_conditions": triggers,
+    }
+
+
+def _write_graph(graphs_dir, triad, nodes):
+    graph = {"directed": True, "nodes": nodes, "links": []}
+    (graphs_dir / f"{triad}_graph.json").write_text(json.dumps(graph))
+
+
+@pytest.fixture
+def graphs_dir(tmp_path):
+    graphs_dir = tmp_path / ".claude" / "graphs"
+    graphs_dir.mkdir(parents=True)
+    return graphs_dir
+
+
+class TestKeywordAutomaton:
+    """Aho-Corasick keyword matching."""
+
+    def test_finds_overlapping_and_nested_keywords(self):
+        automaton = KeywordAutomaton(["version", "bump version", "sion", "he", "she", "hers"])
+
+        assert automaton.find_all("please bump version; ushers") == {
+            "version", "bump version", "sion", "he", "she", "hers"
+        }
+
+    def test_matches_substring_semantics(self):
+        keywords = ["ab", "abc", "bca", "c", "aab", "x"]
+        automaton = KeywordAutomaton(keywords)
+        rng = random.Random(7)
+
+        for _ in range(200):
+            text = "".join(rng.choice("abcx") for _ in range(rng.randint(0, 12)))
+            assert automaton.find_all(text) == {k for k in keywords if k in text}
+
+    def test_empty_keyword_ignored(self):
+        assert len(KeywordAutomaton(["", "a"])) == 1
+
+
+class TestTriggerIndex:
+    """Trigger flags per candidate node."""
+
+    def test_tool_and_file_triggers(self):
+        nodes = [
+            _node("a", tool_names=["Write"], file_patterns=["**/plugin.json"]),
+            _node("b", tool_names=["*"]),
+            _node("c", tool_names=["Bash"], file_patterns=["*.md"]),
+        ]
+        hits = TriggerIndex(nodes).match("Write", "/repo/.claude-plugin/plugin.json", "")
+
+        assert hits == {0: TOOL_EXACT | FILE, 1: TOOL_WILDCARD}
+
+    def test_context_keyword_in_description_always_fires(self):
+        nodes = [_node("a", description="Remember the Version bump", context_keywords=["version"])]
+
+        assert TriggerIndex(nodes).match("Read", "", "") == {0: CONTEXT_KEYWORD}
+
+    def test_malformed_triggers_left_unindexed(self):
+        nodes = [_node("a", tool_names="Write"), {"id": "b", "trigger_conditions": None}]
+        index = TriggerIndex(nodes)
+
+        assert index.unindexed == [0, 1]
+        assert index.needs_text
+
+
+class TestEngineWithIndex:
+    """Indexed queries return what scoring every node returns."""
+
+    TOOLS = ["Write", "Edit", "Bash", "Read", "*", "**"]
+    PATTERNS = [
+        "**/plugin.json", "**/*version*", "*.md", "**", "src/**/*.py",
+        "**/hooks/*.py", "*/README*", "**/[ab]*.txt", "docs/*",
+    ]
+    WORDS = ["deploy", "version", "release", "publish", "test", "", "migrate", "json"]
+
+    def _random_nodes(self, rng, prefix, count):
+        nodes = []
+        for i in range(count):
+            triggers = {}
+            if rng.random() < 0.8:
+                triggers["tool_names"] = rng.sample(self.TOOLS, rng.randint(1, 2))
+            if rng.random() < 0.6:
+                triggers["file_patterns"] = rng.sample(self.PATTERNS, rng.randint(1, 2))
+            if rng.random() < 0.5:
+                triggers["action_keywords"] = rng.sample(self.WORDS, rng.randint(1, 2))
+            if rng.random() < 0.5:
+                triggers["context_keywords"] = rng.sample(self.WORDS, rng.randint(1, 2))
+            nodes.append(_node(
+                f"{prefix}{i}",
+                priority=rng.choice(["CRITICAL", "HIGH", "MEDIUM", "LOW"]),
+                confidence=rng.choice([1.0, 0.9, 0.75, 0.5]),
+                description=rng.choice(["", "Before release, bump the version", "Run tests"]),
+                **triggers,
+            ))
+        return nodes
+
+    def _brute_force(self, engine, tool_name, file_path, tool_input):
+        text = json.dumps(tool_input, default=str).lower()
+        return [
+            (node["id"], engine._calculate_relevance(node, tool_name, file_path, text))
+            for nodes in engine._cache.values()
+            for node in nodes
+            if engine._calculate_relevance(node, tool_name, file_path, text) >= RELEVANCE_THRESHOLD
+        ]
+
+    def test_results_match_full_scoring(self, graphs_dir):
+        rng = random.Random(42)
+        _write_graph(graphs_dir, "alpha", self._random_nodes(rng, "a", 150))
+        _write_graph(graphs_dir, "beta", self._random_nodes(rng, "b", 150))
+        engine = ExperienceQueryEngine(graphs_dir=graphs_dir)
+
+        for _ in range(100):
+            tool_name = rng.choice(["Write", "Edit", "Bash", "Read", "Grep"])
+            file_path = rng.choice([
+                "/repo/.claude-plugin/plugin.json", "/repo/src/app/version.py",
+                "/repo/README.md", "/repo/hooks/run.py", "/repo/docs/a_notes.txt", "",
+            ])
+            tool_input = {"command": " ".join(rng.sample(self.WORDS, 3))}
+            if file_path:
+                tool_input["file_path"] = file_path
+
+            results = engine.query_for_tool_use(tool_name, tool_input, max_results=10_000)
+            expected = self._brute_force(engine, tool_name, file_path, tool_input)
+
+            assert {(r.node_id, r.relevance_score) for r in results} == set(expected)
+
+    def test_unreachable_nodes_not_indexed(self, graphs_dir):
+        # LOW priority tool-only node can score at most 0.4 * 0.5 = 0.2
+        _write_graph(graphs_dir, "alpha", [
+            _node("weak", priority="LOW", tool_names=["Write"]),
+            _node("strong", tool_names=["Write"]),
+        ])
+        engine = ExperienceQueryEngine(graphs_dir=graphs_dir)
+        results = engine.query_for_tool_use("Write", {"file_path": "/x.py"})
+
+        assert [r.node_id for r in results] == ["strong"]
+        assert [node["id"] for _, node in engine._index_nodes] == ["strong"]
+
+    def test_replaced_cache_rebuilds_index(self, graphs_dir):
+        triggers = {"tool_names": ["Write"], "file_patterns": ["*.py"]}
+        _write_graph(graphs_dir, "alpha", [_node("first", **triggers)])
+        engine = ExperienceQueryEngine(graphs_dir=graphs_dir)
+        results = engine.query_for_tool_use("Write", {"file_path": "/a.py"})
+        assert [r.node_id for r in results] == ["first"]
+
+        engine._cache = {"alpha": [_node("second", **triggers)]}
+
+        results = engine.query_for_tool_use("Write", {"file_path": "/a.py"})
+        assert [r.node_id for r in results] == ["second"]
+
+    def test_thousands_of_lessons_within_target(self, graphs_dir):
+        nodes = []
+        for i in range(5000):
+            nodes.append(_node(
+                f"lesson{i}",
+                priority="HIGH",
+                tool_names=[f"Tool{i % 50}"],
+                file_patterns=[f"**/module_{i}.py", f"**/*feature{i}*"],
+                action_keywords=[f"keyword{i}", f"deploy step {i}"],
+                context_keywords=[f"context{i}"],
+            ))
+        _write_graph(graphs_dir, "lessons", nodes)
+        engine = ExperienceQueryEngine(graphs_dir=graphs_dir)
+        tool_input = {
+            "file_path": "/repo/src/module_42.py",
+            "content": "def main():\n    run('keyword7', 'keyword42')\n" * 500,
+        }
+        engine.query_for_tool_use("Write", tool_input)  # Load graphs and build index
+
+        times = []
+        for _ in range(20):
+            start = time.perf_counter()
+            results = engine.query_for_tool_use("Write", tool_input)
+            times.append((time.perf_counter() - start) * 1000)
+
+        times.sort()
+        p95 = times[int(len(times) * 0.95) - 1]
+        # File (0.4) + action keyword (0.1) at HIGH (1.5x); keyword-only is 0.15
+        assert [(r.node_id, r.relevance_score) for r in results] == [("lesson42", 0.75)]
+        assert p95 < TARGET_P95_MS, f"P95 {p95:.1f}ms exceeds target {TARGET_P95_MS}ms"
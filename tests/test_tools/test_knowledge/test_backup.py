@@ -0,0 +1,129 @@
+"""Tests for content-addressed graph backups."""
+
+import json
+
+import pytest
+
+from triads.tools.knowledge.backup import BackupManager, split_chunks
+
+
+def _graph(node_count, label_prefix="Node"):
+    return {
+        "directed": True,
+        "nodes": [
+            {"id": f"n{i}", "label": f"{label_prefix} {i}", "type": "Concept",
+             "description": f"Description of node {i} " * 4}
+            for i in range(node_count)
+        ],
+        "links": [],
+    }
+
+
+@pytest.fixture
+def graphs_dir(tmp_path):
+    graphs_dir = tmp_path / "graphs"
+    graphs_dir.mkdir()
+    return graphs_dir
+
+
+def _write(graphs_dir, graph):
+    graph_file = graphs_dir / "design_graph.json"
+    graph_file.write_text(json.dumps(graph, indent=2))
+    return graph_file
+
+
+def _stored_bytes(manager):
+    return sum(p.stat().st_size for p in manager.objects_dir.glob("*/*"))
+
+
+class TestChunkedBackups:
+    """Deduplication, exact restore and pruning."""
+
+    def test_split_chunks_roundtrip(self):
+        data = json.dumps(_graph(2000), indent=2).encode()
+        chunks = split_chunks(data)
+
+        assert b"".join(chunks) == data
+        assert len(chunks) > 1
+
+    def test_restore_is_byte_exact(self, graphs_dir):
+        graph_file = graphs_dir / "design_graph.json"
+        original = b'{"nodes": [],   "links": []}\n'
+        graph_file.write_bytes(original)
+        manager = BackupManager(graphs_dir)
+        backup = manager.create_backup("design")
+
+        graph_file.write_text("{corrupt")
+
+        assert manager.restore_backup("design", backup.name)
+        assert graph_file.read_bytes() == original
+
+    def test_identical_state_adds_only_manifest(self, graphs_dir):
+        _write(graphs_dir, _graph(50))
+        manager = BackupManager(graphs_dir)
+        manager.create_backup("design")
+        stored = _stored_bytes(manager)
+
+        second = manager.create_backup("design")
+
+        assert len(manager.list_backups("design")) == 2
+        assert _stored_bytes(manager) == stored
+        assert second.stat().st_size < 1024
+        assert manager.load_backup("design", second.name) == _graph(50)
+
+    def test_small_change_stores_fraction_of_copy(self, graphs_dir):
+        graph = _graph(3000)
+        graph_file = _write(graphs_dir, graph)
+        manager = BackupManager(graphs_dir)
+        manager.create_backup("design")
+        stored = _stored_bytes(manager)
+
+        graph["nodes"][1500]["label"] = "Renamed"
+        _write(graphs_dir, graph)
+        backup = manager.create_backup("design")
+
+        assert _stored_bytes(manager) - stored < graph_file.stat().st_size / 10
+        assert manager.load_backup("design", backup.name) == graph
+
+    def test_prune_collects_unreferenced_chunks(self, graphs_dir):
+        manager = BackupManager(graphs_dir)
+        manager.GC_GRACE_SECONDS = 0
+        for prefix in ("A", "B", "C"):
+            _write(graphs_dir, _graph(200, prefix))
+            manager.create_backup("design")
+
+        manager.prune_backups("design", keep=1)
+
+        latest = manager.list_backups("design")[0]
+        assert manager.load_backup("design", latest) == _graph(200, "C")
+        assert _stored_bytes(manager) < (graphs_dir / "design_graph.json").stat().st_size
+
+    def test_full_copy_backups_still_readable(self, graphs_dir):
+        manager = BackupManager(graphs_dir)
+        legacy = manager.backups_dir / "design_graph_20240101_000000_000000.json.backup"
+        legacy.write_text(json.dumps(_graph(3), indent=2))
+
+        assert manager.load_backup("design", legacy.name) == _graph(3)
+        assert manager.get_backup_info("design", legacy.name)["nodes_count"] == 3
+
+    def test_corrupt_chunk_fails_restore(self, graphs_dir):
+        graph_file = _write(graphs_dir, _graph(5))
+        manager = BackupManager(graphs_dir)
+        backup = manager.create_backup("design")
+        for chunk_path in manager.objects_dir.glob("*/*"):
+            chunk_path.write_bytes(b"garbage")
+
+        assert manager.restore_backup("design", backup.name) is False
+        assert json.loads(graph_file.read_text()) == _graph(5)
+
+    def test_config_written_only_when_changed(self, graphs_dir):
+        BackupManager(graphs_dir, max_backups=3)
+        config_file = graphs_dir / "backups" / ".backup_config.json"
+        config_file.touch()
+        mtime = config_file.stat().st_mtime_ns
+
+        BackupManager(graphs_dir, max_backups=3)
+        assert config_file.stat().st_mtime_ns == mtime
+
+        BackupManager(graphs_dir, max_backups=4)
+        assert BackupManager.load_config(graphs_dir) == 4
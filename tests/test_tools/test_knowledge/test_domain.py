@@ -2,7 +2,7 @@
 
 import pytest
 
-from triads.tools.knowledge.domain import Node, Edge, KnowledgeGraph
+from triads.tools.knowledge.domain import Node, NodeMetadata, Edge, KnowledgeGraph
 from tests.test_tools.test_knowledge.test_data import (
     get_sample_design_graph,
     get_invalid_graph_missing_node,
@@ -45,6 +45,35 @@ class TestNode:
         assert node.evidence == ["evidence1", "evidence2"]
         assert node.metadata == {"author": "test"}
 
+    def test_node_has_no_instance_dict(self):
+        """Node uses __slots__ (no per-instance __dict__)."""
+        node = Node(id="n", label="N", type="concept", confidence=0.5)
+
+        assert not hasattr(node, "__dict__")
+
+
+class TestNodeMetadata:
+    """Tests for the read-only metadata view."""
+
+    def test_view_excludes_node_fields(self):
+        data = {"id": "n", "label": "N", "description": "d", "created_by": "qa", "tags": ["x"]}
+        meta = NodeMetadata(data)
+
+        assert meta == {"created_by": "qa", "tags": ["x"]}
+        assert len(meta) == 2
+        assert "label" not in meta
+        with pytest.raises(KeyError):
+            meta["id"]
+
+    def test_view_is_read_only_and_not_a_copy(self):
+        data = {"id": "n", "created_by": "qa"}
+        meta = NodeMetadata(data)
+
+        with pytest.raises(TypeError):
+            meta["created_by"] = "other"
+        data["created_by"] = "other"
+        assert meta["created_by"] == "other"
+
 
 class TestEdge:
     """Tests for Edge domain model."""
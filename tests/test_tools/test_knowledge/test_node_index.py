@@ -0,0 +1,106 @@
+"""Tests for the persistent node id/label index."""
+
+import json
+
+import pytest
+
+from triads.tools.knowledge.repository import AmbiguousNodeError, FileSystemGraphRepository
+
+
+def _write_graph(graphs_dir, triad, nodes):
+    (graphs_dir / f"{triad}_graph.json").write_text(json.dumps({"nodes": nodes, "links": []}))
+
+
+@pytest.fixture
+def graphs_dir(tmp_path):
+    graphs_dir = tmp_path / "graphs"
+    graphs_dir.mkdir()
+    _write_graph(graphs_dir, "design", [
+        {"id": "oauth_decision", "label": "OAuth2 Authentication", "type": "Decision"},
+        {"id": "shared", "label": "Shared Node", "type": "Concept"},
+    ])
+    _write_graph(graphs_dir, "implementation", [
+        {"id": "auth_module", "label": "Authentication Module", "type": "Entity"},
+        {"id": "shared", "label": "Shared Node", "type": "Concept"},
+    ])
+    _write_graph(graphs_dir, "research", [
+        {"id": "lesson_1", "label": "Version Bump Checklist", "type": "Concept"},
+    ])
+    return graphs_dir
+
+
+class TestNodeIndexLookups:
+    """get_node() and find_nodes() through the node index."""
+
+    def test_get_node_loads_only_matching_graph(self, graphs_dir):
+        """Once indexed, a lookup parses only the graph holding the id."""
+        FileSystemGraphRepository(graphs_dir).get_node("auth_module")
+        repo = FileSystemGraphRepository(graphs_dir)
+
+        node, triad = repo.get_node("auth_module")
+
+        assert (node["label"], triad) == ("Authentication Module", "implementation")
+        assert list(repo._cache) == ["implementation"]
+
+    def test_get_node_ambiguous_and_missing(self, graphs_dir):
+        repo = FileSystemGraphRepository(graphs_dir)
+
+        with pytest.raises(AmbiguousNodeError) as exc_info:
+            repo.get_node("shared")
+        assert exc_info.value.triads == ["design", "implementation"]
+        assert repo.get_node("missing") is None
+
+    def test_find_nodes_exact_and_partial(self, graphs_dir):
+        repo = FileSystemGraphRepository(graphs_dir)
+
+        exact = repo.find_nodes("version bump checklist")
+        by_id = repo.find_nodes("OAUTH_DECISION")
+        partial = repo.find_nodes("auth", partial=True)
+
+        assert [(n["id"], t) for n, t in exact] == [("lesson_1", "research")]
+        assert [n["id"] for n, _ in by_id] == ["oauth_decision"]
+        assert [n["id"] for n, _ in partial] == ["oauth_decision", "auth_module"]
+        assert repo.find_nodes("auth", triad="design", partial=True)[0][1] == "design"
+
+
+class TestNodeIndexInvalidation:
+    """The index follows graph file changes."""
+
+    def test_index_persisted(self, graphs_dir):
+        FileSystemGraphRepository(graphs_dir).get_node("lesson_1")
+
+        data = json.loads((graphs_dir / ".cache" / "node_index.json").read_text())
+        assert data["graphs"]["research"]["ids"] == {"lesson_1": [0]}
+
+    def test_external_edit_reindexed(self, graphs_dir):
+        """Rewriting a graph file outside the repository updates lookups."""
+        FileSystemGraphRepository(graphs_dir).get_node("lesson_1")
+        _write_graph(graphs_dir, "research", [
+            {"id": "lesson_0", "label": "New First Lesson", "type": "Concept"},
+            {"id": "lesson_1", "label": "Version Bump Checklist", "type": "Concept"},
+            {"id": "lesson_2", "label": "Release Notes", "type": "Concept"},
+        ])
+
+        repo = FileSystemGraphRepository(graphs_dir)
+        assert repo.get_node("lesson_2")[0]["label"] == "Release Notes"
+        assert repo.get_node("lesson_1")[0]["label"] == "Version Bump Checklist"
+
+    def test_removed_graph_dropped(self, graphs_dir):
+        repo = FileSystemGraphRepository(graphs_dir)
+        assert repo.get_node("lesson_1") is not None
+
+        (graphs_dir / "research_graph.json").unlink()
+        repo._cache.clear()
+
+        assert repo.get_node("lesson_1") is None
+
+    def test_save_graph_reindexed(self, graphs_dir):
+        repo = FileSystemGraphRepository(graphs_dir)
+        graph = repo.load_graph("research")
+        repo.get_node("lesson_1")
+
+        graph = {**graph, "nodes": [{"id": "lesson_9", "label": "Renamed", "type": "Concept", "confidence": 0.8}]}
+        assert repo.save_graph("research", graph)
+
+        assert repo.get_node("lesson_1") is None
+        assert repo.find_nodes("renamed")[0][0]["id"] == "lesson_9"
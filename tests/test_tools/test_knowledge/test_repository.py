@@ -1,8 +1,11 @@
 """Tests for knowledge tools repository layer."""
 
+import json
+
 import pytest
 
 from triads.tools.knowledge.repository import (
+    FileSystemGraphRepository,
     InMemoryGraphRepository,
     GraphNotFoundError,
 )
@@ -63,3 +66,30 @@ class TestFileSystemGraphRepository:
         # This test verifies integration with existing km.graph_access
         # Implementation will use GraphLoader from triads.km.graph_access
         pytest.skip("Will implement after repository implementation")
+
+    def test_filesystem_repo_reuses_domain_model_until_saved(self, tmp_path):
+        """get() and list_all() share one domain model per loaded graph."""
+        graph = {
+            "nodes": [
+                {"id": "a", "label": "A", "type": "Concept", "confidence": 0.9, "created_by": "qa"},
+                {"id": "b", "label": "B", "type": "Concept", "confidence": 0.8, "created_by": "qa"},
+            ],
+            "links": [{"source": "a", "target": "b", "key": "relates_to"}],
+        }
+        (tmp_path / "design_graph.json").write_text(json.dumps(graph))
+        repo = FileSystemGraphRepository(tmp_path)
+
+        first = repo.get("design")
+        assert repo.get("design") is first
+        assert repo.list_all()[0] is first
+        assert first.nodes[0].metadata == {"created_by": "qa"}
+        # Repeated strings are shared between nodes
+        assert first.nodes[0].type is first.nodes[1].type
+        assert first.nodes[0].metadata["created_by"] is first.nodes[1].metadata["created_by"]
+        assert first.edges[0].source is first.nodes[0].id
+
+        graph["nodes"][0]["label"] = "Renamed"
+        assert repo.save_graph("design", graph)
+        second = repo.get("design")
+        assert second is not first
+        assert second.nodes[0].label == "Renamed"
@@ -0,0 +1,76 @@
+"""Tests for the knowledge graph inverted search index."""
+
+import pytest
+
+from triads.tools.knowledge.search_index import NodeSearchIndex, parse_query, tokenize
+
+WEIGHTS = {"label": 1.0, "description": 0.7, "id": 0.5}
+
+NODES = [
+    {
+        "id": "oauth_decision",
+        "label": "OAuth2 Authentication",
+        "description": "Use OAuth2 for login",
+    },
+    {"id": "jwt_entity", "label": "JWT Tokens", "description": "Tokens for session management"},
+    {
+        "id": "auth_module",
+        "label": "Authentication Module",
+        "description": "Authentication authentication",
+    },
+    {"id": "notes", "label": "Notes", "description": None},
+]
+
+
+@pytest.fixture
+def index():
+    return NodeSearchIndex.from_nodes(NODES, WEIGHTS)
+
+
+class TestParsing:
+    """Tests for tokenize() and parse_query()."""
+
+    def test_tokenize_splits_on_punctuation_and_underscores(self):
+        assert tokenize("OAuth2 (test) oauth_decision") == ["oauth2", "test", "oauth", "decision"]
+        assert tokenize(None) == []
+
+    def test_parse_query_groups(self):
+        assert parse_query("jwt tokens OR oauth | auth") == [["jwt", "tokens"], ["oauth"], ["auth"]]
+        assert parse_query("  ( ) ") == []
+
+
+class TestNodeSearchIndex:
+    """Tests for NodeSearchIndex.search()."""
+
+    def test_terms_are_anded(self, index):
+        hits = index.search("session tokens", WEIGHTS)
+
+        assert [h.doc for h in hits] == [1]
+        assert hits[0].matched_field == "description"
+
+    def test_or_alternatives(self, index):
+        assert {h.doc for h in index.search("jwt OR notes", WEIGHTS)} == {1, 3}
+
+    def test_prefix_matching(self, index):
+        assert {h.doc for h in index.search("auth", WEIGHTS)} == {0, 2}
+
+    def test_bm25_prefers_label_and_frequency(self, index):
+        """A node with the term in label and repeatedly in description ranks first."""
+        hits = index.search("authentication", WEIGHTS)
+
+        assert [h.doc for h in hits] == [2, 0]
+        assert hits[0].score > hits[1].score > 0
+
+    def test_matched_field_prefers_field_with_all_terms(self, index):
+        """Terms spread over fields report the field that holds all of them."""
+        hit = index.search("oauth decision", WEIGHTS)[0]
+
+        assert hit.matched_field == "id"
+        assert hit.matched_term == "oauth"
+
+    def test_unweighted_fields_ignored(self, index):
+        assert index.search("oauth_decision", {"label": 1.0}) == []
+
+    def test_no_terms_no_hits(self, index):
+        assert index.search("", WEIGHTS) == []
+        assert index.search("missing", WEIGHTS) == []
@@ -0,0 +1,118 @@
+"""Tests for the cross-process parsed-graph snapshot cache."""
+
+import json
+import os
+
+import pytest
+
+from triads.tools.knowledge.repository import FileSystemGraphRepository
+from triads.tools.knowledge.snapshot import SNAPSHOT_ENV_VAR, GraphSnapshotCache
+
+GRAPH = {
+    "nodes": [{"id": "n1", "label": "Node One", "type": "Concept", "confidence": 0.9}],
+    "links": [],
+}
+
+
+@pytest.fixture
+def graphs_dir(tmp_path):
+    graphs_dir = tmp_path / "graphs"
+    graphs_dir.mkdir()
+    (graphs_dir / "design_graph.json").write_text(json.dumps(GRAPH))
+    return graphs_dir
+
+
+def _snapshot(graphs_dir):
+    return graphs_dir / ".cache" / "design_graph.snapshot"
+
+
+class TestGraphSnapshotCache:
+    """Snapshot use and invalidation."""
+
+    def test_disabled_by_default(self, graphs_dir, monkeypatch):
+        monkeypatch.delenv(SNAPSHOT_ENV_VAR, raising=False)
+        FileSystemGraphRepository(graphs_dir).load_graph("design")
+
+        assert not _snapshot(graphs_dir).exists()
+
+    def test_env_var_opts_in(self, graphs_dir, monkeypatch):
+        monkeypatch.setenv(SNAPSHOT_ENV_VAR, "1")
+        FileSystemGraphRepository(graphs_dir).load_graph("design")
+
+        assert _snapshot(graphs_dir).exists()
+
+    def test_next_process_loads_snapshot(self, graphs_dir, monkeypatch):
+        """A fresh repository reads the snapshot instead of parsing JSON."""
+        FileSystemGraphRepository(graphs_dir, snapshot_cache=True).load_graph("design")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("json.load should not run")
+
+        monkeypatch.setattr("triads.tools.knowledge.repository.json.load", fail)
+        graph = FileSystemGraphRepository(graphs_dir, snapshot_cache=True).load_graph("design")
+
+        assert graph == GRAPH
+
+    def test_rewritten_file_invalidates_snapshot(self, graphs_dir):
+        """Any change to the source file's stat makes the snapshot stale."""
+        FileSystemGraphRepository(graphs_dir, snapshot_cache=True).load_graph("design")
+        graph_file = graphs_dir / "design_graph.json"
+        updated = {**GRAPH, "nodes": GRAPH["nodes"] + [{"id": "n2", "label": "Two"}]}
+        graph_file.write_text(json.dumps(updated))
+
+        cache = GraphSnapshotCache(graphs_dir / ".cache")
+        assert cache.load(graph_file) is None
+        repo = FileSystemGraphRepository(graphs_dir, snapshot_cache=True)
+        assert repo.load_graph("design") == updated
+
+    def test_same_size_rewrite_with_old_mtime_invalidates(self, graphs_dir):
+        """Replacing the file (new inode) is detected even if mtime and size match."""
+        graph_file = graphs_dir / "design_graph.json"
+        FileSystemGraphRepository(graphs_dir, snapshot_cache=True).load_graph("design")
+        stat = graph_file.stat()
+
+        replacement = graphs_dir / "replacement.json"
+        replacement.write_text(json.dumps(GRAPH).replace("Node One", "Node Uno"))
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, graph_file)
+
+        graph = FileSystemGraphRepository(graphs_dir, snapshot_cache=True).load_graph("design")
+        assert graph["nodes"][0]["label"] == "Node Uno"
+
+    def test_file_replaced_while_parsing_not_stamped(self, graphs_dir, monkeypatch):
+        """The snapshot is stamped with the file that was read, not its replacement."""
+        graph_file = graphs_dir / "design_graph.json"
+        updated = {**GRAPH, "nodes": [{**GRAPH["nodes"][0], "label": "Replaced"}]}
+        json_load = json.load
+
+        def load_then_replace(f):
+            data = json_load(f)
+            replacement = graphs_dir / "replacement.json"
+            replacement.write_text(json.dumps(updated))
+            os.replace(replacement, graph_file)
+            return data
+
+        target = "triads.tools.knowledge.repository.json.load"
+        monkeypatch.setattr(target, load_then_replace)
+        repo = FileSystemGraphRepository(graphs_dir, snapshot_cache=True)
+        assert repo.load_graph("design") == GRAPH
+        monkeypatch.setattr(target, json_load)
+
+        assert GraphSnapshotCache(graphs_dir / ".cache").load(graph_file) is None
+        repo = FileSystemGraphRepository(graphs_dir, snapshot_cache=True)
+        assert repo.load_graph("design") == updated
+
+    def test_save_graph_updates_snapshot(self, graphs_dir):
+        repo = FileSystemGraphRepository(graphs_dir, snapshot_cache=True)
+        updated = {**GRAPH, "nodes": [{**GRAPH["nodes"][0], "label": "Renamed"}]}
+        assert repo.save_graph("design", updated)
+
+        cache = GraphSnapshotCache(graphs_dir / ".cache")
+        assert cache.load(graphs_dir / "design_graph.json") == updated
+
+    def test_corrupt_snapshot_ignored(self, graphs_dir):
+        FileSystemGraphRepository(graphs_dir, snapshot_cache=True).load_graph("design")
+        _snapshot(graphs_dir).write_bytes(b"\x01\x00")
+
+        repo = FileSystemGraphRepository(graphs_dir, snapshot_cache=True)
+        assert repo.load_graph("design") == GRAPH
@@ -0,0 +1,207 @@
+"""Tests for the SQLite knowledge graph repository."""
+
+import json
+import multiprocessing
+import sqlite3
+
+import pytest
+
+from triads.tools.knowledge.repository import (
+    AmbiguousNodeError,
+    FileSystemGraphRepository,
+    GraphNotFoundError,
+    InvalidTriadNameError,
+)
+from triads.tools.knowledge.sqlite_repository import SQLiteGraphRepository
+
+
+GRAPH = {
+    "directed": True,
+    "multigraph": False,
+    "graph": {},
+    "nodes": [
+        {
+            "id": "oauth_decision",
+            "label": "Use OAuth2",
+            "type": "Decision",
+            "confidence": 0.9,
+            "description": "Refresh tokens rotate on every use",
+        },
+        {"id": "jwt", "label": "JWT tokens", "type": "Concept", "confidence": 0.6},
+        {"id": "session", "label": "Session store", "type": "Entity", "confidence": 0.95},
+    ],
+    "links": [{"source": "oauth_decision", "target": "jwt", "key": "uses"}],
+    "_meta": {"wal_seq": 7},
+}
+
+
+@pytest.fixture
+def repo(tmp_path):
+    with SQLiteGraphRepository(tmp_path / "graphs.db") as repo:
+        assert repo.save_graph("design", GRAPH)
+        yield repo
+
+
+def _increment(db_path, count):
+    repo = SQLiteGraphRepository(db_path)
+    for _ in range(count):
+        with repo._transaction(write=True) as conn:
+            value = conn.execute("SELECT attrs FROM graphs WHERE triad = 'counter'").fetchone()[0]
+            attrs = json.loads(value)
+            attrs["graph"]["n"] += 1
+            conn.execute(
+                "UPDATE graphs SET attrs = ? WHERE triad = 'counter'", (json.dumps(attrs),)
+            )
+    repo.close()
+
+
+class TestGraphOperations:
+    """Whole-graph storage."""
+
+    def test_round_trip_is_exact(self, repo):
+        loaded = repo.load_graph("design")
+
+        assert loaded == GRAPH
+        assert list(loaded) == list(GRAPH)
+
+    def test_edges_key_preserved(self, repo):
+        graph = {**{k: v for k, v in GRAPH.items() if k != "links"}, "edges": GRAPH["links"]}
+        assert repo.save_graph("legacy", graph)
+
+        assert repo.load_graph("legacy") == graph
+
+    def test_get_and_list(self, repo):
+        assert repo.list_triads() == ["design"]
+        assert {n.id for n in repo.get("design").nodes} == {"oauth_decision", "jwt", "session"}
+        assert [g.triad for g in repo.list_all()] == ["design"]
+        with pytest.raises(GraphNotFoundError):
+            repo.get("missing")
+
+    def test_invalid_graph_rejected(self, repo):
+        bad = {**GRAPH, "nodes": [{"id": "x", "label": "X", "type": "Nope"}], "links": []}
+
+        assert repo.save_graph("design", bad) is False
+        assert repo.load_graph("design") == GRAPH
+
+    def test_invalid_triad_name(self, repo):
+        with pytest.raises(InvalidTriadNameError):
+            repo.load_graph("../etc")
+
+    def test_delete_graph_drops_rows(self, repo):
+        assert repo.delete_graph("design")
+
+        assert repo.load_graph("design") is None
+        assert repo.search("oauth") == []
+        assert repo.filter_nodes() == []
+
+
+class TestRowOperations:
+    """Indexed lookups and single-row updates."""
+
+    def test_get_node(self, repo):
+        assert repo.get_node("jwt") == (GRAPH["nodes"][1], "design")
+        assert repo.get_node("missing") is None
+
+    def test_get_node_ambiguous(self, repo):
+        repo.save_graph("implementation", GRAPH)
+
+        with pytest.raises(AmbiguousNodeError):
+            repo.get_node("jwt")
+        assert repo.get_node("jwt", triad="implementation")[1] == "implementation"
+
+    def test_filter_nodes(self, repo):
+        found = repo.filter_nodes(min_confidence=0.85)
+        assert [node["id"] for node, _ in found] == ["oauth_decision", "session"]
+
+        found = repo.filter_nodes(node_type="Concept", triad="design")
+        assert [node["id"] for node, _ in found] == ["jwt"]
+
+    def test_search_prefix_and_filters(self, repo):
+        assert [n["id"] for n, _, _ in repo.search("refr")] == ["oauth_decision"]
+        assert {n["id"] for n, _, _ in repo.search("oauth OR jwt")} == {"oauth_decision", "jwt"}
+        assert repo.search("tokens", node_type="Concept")[0][0]["id"] == "jwt"
+        assert repo.search("tokens", min_confidence=0.95) == []
+
+    def test_upsert_node_updates_search(self, repo):
+        assert repo.upsert_node("design", {"id": "jwt", "label": "PASETO", "type": "Concept"})
+        assert repo.upsert_node("design", {"id": "new", "label": "New node", "type": "Task"})
+
+        assert repo.search("jwt") == []
+        assert repo.search("paseto")[0][0]["id"] == "jwt"
+        assert [n["id"] for n in repo.load_graph("design")["nodes"]] == [
+            "oauth_decision", "jwt", "session", "new"
+        ]
+
+    def test_upsert_invalid_node_rejected(self, repo):
+        assert repo.upsert_node("design", {"id": "x"}) is False
+
+    def test_add_edge(self, repo):
+        edge = {"source": "session", "target": "jwt", "key": "stores"}
+
+        assert repo.add_edge("design", edge)
+        assert not repo.add_edge("design", edge)
+        assert not repo.add_edge("design", {"source": "session", "target": "missing"})
+        assert repo.load_graph("design")["links"][-1] == edge
+
+    def test_failed_transaction_rolls_back(self, repo):
+        with pytest.raises(RuntimeError):
+            with repo._transaction(write=True) as conn:
+                conn.execute("DELETE FROM nodes")
+                raise RuntimeError("boom")
+
+        assert repo.load_graph("design") == GRAPH
+
+
+class TestJsonImportExport:
+    """Interoperation with *_graph.json files."""
+
+    def test_import_then_export(self, tmp_path):
+        graphs_dir = tmp_path / "graphs"
+        graphs_dir.mkdir()
+        (graphs_dir / "design_graph.json").write_text(json.dumps(GRAPH))
+
+        with SQLiteGraphRepository(tmp_path / "graphs.db") as repo:
+            assert repo.import_json(graphs_dir) == ["design"]
+            repo.upsert_node("design", {"id": "jwt", "label": "JWT", "type": "Concept"})
+            assert repo.export_json(graphs_dir) == ["design"]
+
+        exported = FileSystemGraphRepository(graphs_dir).load_graph("design")
+        assert exported["nodes"][1] == {"id": "jwt", "label": "JWT", "type": "Concept"}
+        assert exported["_meta"] == GRAPH["_meta"]
+        # Export goes through save_graph, which backs up the replaced file
+        assert list((graphs_dir / "backups").glob("design_graph_*.json.backup"))
+
+
+class TestConcurrency:
+    """Transactions across processes."""
+
+    def test_concurrent_writers_serialize(self, tmp_path):
+        db_path = tmp_path / "graphs.db"
+        with SQLiteGraphRepository(db_path) as repo:
+            repo.save_graph("counter", {"nodes": [], "links": [], "graph": {"n": 0}})
+
+        workers = [
+            multiprocessing.Process(target=_increment, args=(db_path, 25))
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+
+        with SQLiteGraphRepository(db_path) as repo:
+            assert repo.load_graph("counter")["graph"]["n"] == 100
+
+    def test_reader_sees_snapshot_during_write(self, repo):
+        reader = SQLiteGraphRepository(repo.db_path)
+        with repo._transaction(write=True) as conn:
+            conn.execute("DELETE FROM nodes WHERE id = 'jwt'")
+            # Uncommitted delete is invisible to another connection
+            assert reader.get_node("jwt") is not None
+        assert reader.get_node("jwt") is None
+        reader.close()
+
+    def test_wal_mode(self, repo):
+        conn = sqlite3.connect(repo.db_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
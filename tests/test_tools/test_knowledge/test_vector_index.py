@@ -0,0 +1,152 @@
+"""Tests for the semantic node vector index."""
+
+import json
+import re
+
+import numpy as np
+import pytest
+
+from triads.tools.knowledge.repository import FileSystemGraphRepository
+from triads.tools.knowledge.vector_index import NodeVectorIndex
+
+DIM = 384
+
+# Words sharing a concept get the same dimension, standing in for a real model
+_CONCEPTS = {"token": 0, "oauth": 0, "refresh": 1, "renewal": 1, "database": 2, "schema": 2}
+
+
+class FakeEmbedder:
+    """Deterministic bag-of-concepts embedder that counts texts embedded."""
+
+    def __init__(self):
+        self.embedded = []
+
+    def __call__(self, texts):
+        self.embedded.extend(texts)
+        vectors = np.zeros((len(texts), DIM), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in re.findall(r"\w+", text.lower()):
+                vectors[row, _CONCEPTS.get(word, 3 + sum(map(ord, word)) % (DIM - 3))] += 1
+        return vectors
+
+
+def _write_graph(graphs_dir, triad, nodes):
+    (graphs_dir / f"{triad}_graph.json").write_text(json.dumps({"nodes": nodes, "links": []}))
+
+
+@pytest.fixture
+def graphs_dir(tmp_path):
+    graphs_dir = tmp_path / "graphs"
+    graphs_dir.mkdir()
+    _write_graph(graphs_dir, "design", [
+        {
+            "id": "oauth_renewal",
+            "label": "OAuth renewal",
+            "description": "Renew access before expiry",
+        },
+        {"id": "db_schema", "label": "Database schema", "description": "Tables and indexes"},
+    ])
+    _write_graph(graphs_dir, "implementation", [
+        {"id": "refresh_job", "label": "Token refresh job", "description": ""},
+    ])
+    return graphs_dir
+
+
+class TestNodeVectorIndex:
+    """Top-k search and incremental updates."""
+
+    def test_search_ranks_by_similarity(self, graphs_dir):
+        embedder = FakeEmbedder()
+        repo = FileSystemGraphRepository(graphs_dir)
+        index = repo.vector_index(embed_batch=embedder)
+
+        hits = index.search("token refresh", k=2)
+
+        assert [node_id for _, node_id, _ in hits] == ["refresh_job", "oauth_renewal"]
+        assert hits[0][2] >= hits[1][2] > 0
+        design_hits = index.search("token refresh", triads=["design"])
+        assert [h[1] for h in design_hits][0] == "oauth_renewal"
+
+    def test_persisted_index_reused(self, graphs_dir):
+        FileSystemGraphRepository(graphs_dir).vector_index(embed_batch=FakeEmbedder())
+        embedder = FakeEmbedder()
+
+        index = FileSystemGraphRepository(graphs_dir).vector_index(embed_batch=embedder)
+
+        assert embedder.embedded == []
+        assert len(index) == 3
+        assert index.search("schema", k=1)[0][1] == "db_schema"
+
+    def test_save_graph_embeds_only_changed_nodes(self, graphs_dir):
+        embedder = FakeEmbedder()
+        repo = FileSystemGraphRepository(graphs_dir)
+        repo.vector_index(embed_batch=embedder)
+        embedder.embedded.clear()
+
+        graph = repo.load_graph("design")
+        nodes = [dict(n) for n in graph["nodes"]]
+        nodes[1]["description"] = "Tables, indexes and migrations"
+        nodes.append({"id": "new_node", "label": "Refresh cadence"})
+        del nodes[0]
+        for node in nodes:
+            node.setdefault("type", "Concept")
+            node.setdefault("confidence", 0.9)
+        assert repo.save_graph("design", {**graph, "nodes": nodes})
+
+        index = repo.vector_index()
+
+        assert embedder.embedded == [
+            "Database schema. Tables, indexes and migrations",
+            "Refresh cadence",
+        ]
+        hits = index.search("oauth", k=10)
+        assert {h[1] for h in hits} == {"db_schema", "new_node", "refresh_job"}
+
+    def test_removed_graph_dropped(self, graphs_dir):
+        repo = FileSystemGraphRepository(graphs_dir)
+        repo.vector_index(embed_batch=FakeEmbedder())
+        (graphs_dir / "implementation_graph.json").unlink()
+
+        index = NodeVectorIndex(graphs_dir, embed_batch=FakeEmbedder())
+        index.refresh(["design"], repo.load_graph)
+
+        assert {h[1] for h in index.search("token refresh")} == {"oauth_renewal", "db_schema"}
+
+    def test_model_change_rebuilds(self, graphs_dir):
+        repo = FileSystemGraphRepository(graphs_dir)
+        repo.vector_index(embed_batch=FakeEmbedder())
+        embedder = FakeEmbedder()
+
+        index = NodeVectorIndex(graphs_dir, embed_batch=embedder, model_name="other-model")
+        index.refresh(repo.list_triads(), repo.load_graph)
+
+        assert len(embedder.embedded) == 3
+
+    def test_concurrent_updates_kept(self, graphs_dir):
+        triads = ["design", "implementation", "testing"]
+
+        def load_graph(triad):
+            return FileSystemGraphRepository(graphs_dir).load_graph(triad)
+
+        first = NodeVectorIndex(graphs_dir, embed_batch=FakeEmbedder())
+        first.refresh(triads[:2], load_graph)
+        second_embedder = FakeEmbedder()
+        second = NodeVectorIndex(graphs_dir, embed_batch=second_embedder)
+        len(second)
+
+        # Each instance stands in for a hook process holding a stale row map
+        _write_graph(graphs_dir, "testing", [{"id": "schema_test", "label": "Schema test"}])
+        first.refresh(triads, load_graph)
+        _write_graph(graphs_dir, "design", [{"id": "oauth_flow", "label": "OAuth flow"}])
+        second.refresh(triads, load_graph)
+
+        # The row map is re-read under the lock, so first's rows are not redone
+        assert second_embedder.embedded == ["OAuth flow"]
+        embedder = FakeEmbedder()
+        index = NodeVectorIndex(graphs_dir, embed_batch=embedder)
+        index.refresh(triads, load_graph)
+
+        assert embedder.embedded == []
+        assert {h[1] for h in index.search("oauth schema", k=10)} == {
+            "oauth_flow", "refresh_job", "schema_test"
+        }
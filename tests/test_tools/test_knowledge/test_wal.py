@@ -0,0 +1,171 @@
+"""Tests for the knowledge graph write-ahead log."""
+
+import json
+
+import pytest
+
+from triads.tools.integrity.checker import IntegrityChecker
+from triads.tools.knowledge.backup import BackupManager
+from triads.tools.knowledge.repository import FileSystemGraphRepository
+from triads.tools.knowledge.wal import GraphWAL
+
+GRAPH = {
+    "directed": True,
+    "nodes": [{"id": "n1", "label": "Node One", "type": "Concept", "confidence": 0.9}],
+    "links": [],
+}
+
+
+@pytest.fixture
+def graph_file(tmp_path):
+    graphs_dir = tmp_path / "graphs"
+    graphs_dir.mkdir()
+    graph_file = graphs_dir / "design_graph.json"
+    graph_file.write_text(json.dumps(GRAPH))
+    return graph_file
+
+
+def _read(graph_file):
+    return json.loads(graph_file.read_text())
+
+
+class TestGraphWAL:
+    """Append, fold and compaction."""
+
+    def test_append_leaves_base_untouched(self, graph_file):
+        wal = GraphWAL(graph_file)
+        wal.append([
+            {"op": "add_node", "node": {"id": "n2", "label": "Two"}},
+            {"op": "update_node", "id": "n1", "fields": {"confidence": 0.5}},
+            {"op": "add_edge", "edge": {"source": "n1", "target": "n2", "key": "uses"}},
+            {
+                "op": "update_edge", "source": "n1", "target": "n2", "key": "uses",
+                "fields": {"weight": 2},
+            },
+        ])
+
+        assert _read(graph_file) == GRAPH
+        graph = wal.fold(_read(graph_file))
+        assert [n["id"] for n in graph["nodes"]] == ["n1", "n2"]
+        assert graph["nodes"][0]["confidence"] == 0.5
+        assert graph["links"] == [{"source": "n1", "target": "n2", "key": "uses", "weight": 2}]
+
+    def test_records_are_idempotent(self, graph_file):
+        """Replaying records already in the base changes nothing."""
+        wal = GraphWAL(graph_file)
+        wal.append([{"op": "add_node", "node": {"id": "n1", "label": "Duplicate"}}])
+
+        assert wal.fold(_read(graph_file))["nodes"] == GRAPH["nodes"]
+
+    def test_compaction_after_threshold(self, graph_file):
+        wal = GraphWAL(graph_file, compact_records=3)
+        for i in range(3):
+            wal.append([{"op": "add_node", "node": {"id": f"x{i}"}}])
+
+        assert not wal.wal_path.exists()
+        base = _read(graph_file)
+        assert [n["id"] for n in base["nodes"]] == ["n1", "x0", "x1", "x2"]
+        assert base["_meta"]["wal_seq"] > 0
+
+    def test_torn_trailing_record_ignored(self, graph_file):
+        wal = GraphWAL(graph_file)
+        wal.append([{"op": "add_node", "node": {"id": "n2"}}])
+        with open(wal.wal_path, "a") as f:
+            f.write('{"seq": 9, "op": "add_no')
+
+        assert [n["id"] for n in wal.fold(_read(graph_file))["nodes"]] == ["n1", "n2"]
+
+    def test_crash_before_log_removal_recovers(self, graph_file):
+        """A base already holding the log's records is not altered by replay."""
+        wal = GraphWAL(graph_file)
+        wal.append([{"op": "update_node", "id": "n1", "fields": {"confidence": 0.5}}])
+        folded = wal.fold(_read(graph_file))
+        graph_file.write_text(json.dumps(folded))
+
+        # A later full write of the folded graph is not overridden by old records
+        folded["nodes"][0]["confidence"] = 0.7
+        graph_file.write_text(json.dumps(folded))
+
+        assert wal.fold(_read(graph_file))["nodes"][0]["confidence"] == 0.7
+
+    def test_corrupt_base_keeps_log(self, graph_file):
+        wal = GraphWAL(graph_file)
+        wal.append([{"op": "add_node", "node": {"id": "n2"}}])
+        graph_file.write_text("{not json")
+
+        assert wal.compact() is False
+        assert wal.records()
+
+
+class TestRepositoryWithWAL:
+    """FileSystemGraphRepository reads base + log and supersedes it on save."""
+
+    def test_load_graph_folds_log(self, graph_file):
+        GraphWAL(graph_file).append([{"op": "add_node", "node": {"id": "n2", "label": "Two"}}])
+        repo = FileSystemGraphRepository(graph_file.parent)
+
+        assert repo.get_node("n2")[0]["label"] == "Two"
+        assert [n["id"] for n in repo.load_graph("design")["nodes"]] == ["n1", "n2"]
+
+    def test_snapshot_combined_with_log(self, graph_file):
+        FileSystemGraphRepository(graph_file.parent, snapshot_cache=True).load_graph("design")
+        GraphWAL(graph_file).append([{"op": "add_node", "node": {"id": "n2"}}])
+
+        repo = FileSystemGraphRepository(graph_file.parent, snapshot_cache=True)
+        graph = repo.load_graph("design")
+        assert [n["id"] for n in graph["nodes"]] == ["n1", "n2"]
+
+    def test_save_graph_clears_log(self, graph_file):
+        wal = GraphWAL(graph_file)
+        node = {"id": "n2", "label": "Two", "type": "Concept", "confidence": 0.8}
+        wal.append([{"op": "add_node", "node": node}])
+        repo = FileSystemGraphRepository(graph_file.parent)
+
+        assert repo.save_graph("design", repo.load_graph("design"))
+
+        assert not wal.wal_path.exists()
+        assert [n["id"] for n in _read(graph_file)["nodes"]] == ["n1", "n2"]
+
+    def test_save_graph_keeps_append_made_after_load(self, graph_file):
+        """A record appended between load and save is written, not dropped."""
+        node = {"type": "Concept", "confidence": 0.8}
+        repo = FileSystemGraphRepository(graph_file.parent)
+        wal = GraphWAL(graph_file)
+        wal.append([{"op": "add_node", "node": {"id": "n2", "label": "Two", **node}}])
+        data = repo.load_graph("design")
+
+        # Another process appends while data is being edited
+        wal.append([{"op": "add_node", "node": {"id": "n3", "label": "Three", **node}}])
+        data["nodes"][0]["label"] = "Renamed"
+        assert repo.save_graph("design", data)
+
+        graph = FileSystemGraphRepository(graph_file.parent).load_graph("design")
+        assert [n["id"] for n in graph["nodes"]] == ["n1", "n2", "n3"]
+        assert graph["nodes"][0]["label"] == "Renamed"
+
+    def test_backup_includes_log(self, graph_file):
+        GraphWAL(graph_file).append([{"op": "add_node", "node": {"id": "n2", "label": "Two"}}])
+        backup_mgr = BackupManager(graphs_dir=graph_file.parent)
+
+        backup = backup_mgr.create_backup("design")
+
+        graph = backup_mgr.load_backup("design", backup.name)
+        assert [n["id"] for n in graph["nodes"]] == ["n1", "n2"]
+        # Restoring then folding the log again changes nothing
+        assert backup_mgr.restore_backup("design", backup.name)
+        assert GraphWAL(graph_file).fold(_read(graph_file)) == graph
+
+    def test_integrity_checker_reads_log(self, graph_file):
+        GraphWAL(graph_file).append([
+            {
+                "op": "add_node",
+                "node": {"id": "n2", "label": "Two", "type": "Concept", "confidence": 7},
+            },
+        ])
+        checker = IntegrityChecker(graph_file.parent)
+
+        assert not checker.check_graph("design").valid
+        assert checker.repair_graph("design").success
+
+        graph = FileSystemGraphRepository(graph_file.parent).load_graph("design")
+        assert [n["id"] for n in graph["nodes"]] == ["n1"]